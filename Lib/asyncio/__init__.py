@@ -20,6 +20,7 @@ if sys.platform == 'win32':
 # This relies on each of the submodules having an __all__ variable.
 from .futures import *
 from .events import *
+from .instrument import *
 from .locks import *
 from .transports import *
 from .protocols import *
@@ -34,6 +35,7 @@ else:
 
 __all__ = (futures.__all__ +
            events.__all__ +
+           instrument.__all__ +
            locks.__all__ +
            transports.__all__ +
            protocols.__all__ +
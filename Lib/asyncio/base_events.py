@@ -36,6 +36,13 @@ __all__ = ['BaseEventLoop', 'Server']
 # Argument for default thread pool executor creation.
 _MAX_WORKERS = 5
 
+# Cancelled timers are left in the _scheduled heap, since removing one
+# from the middle of a heap costs O(n).  Once they make up more than
+# this fraction of a heap of at least _MIN_SCHEDULED_TIMER_HANDLES
+# entries, they are all removed at once and the heap is rebuilt.
+_MIN_SCHEDULED_TIMER_HANDLES = 100
+_MIN_CANCELLED_TIMER_HANDLES_FRACTION = 0.5
+
 
 class _StopError(BaseException):
     """Raised to stop the event loop."""
@@ -93,9 +100,11 @@ class BaseEventLoop(events.AbstractEventLoop):
     def __init__(self):
         self._ready = collections.deque()
         self._scheduled = []
+        self._timer_cancelled_count = 0  # Cancelled handles in _scheduled.
         self._default_executor = None
         self._internal_fds = 0
         self._running = False
+        self._instrument = None
 
     def _make_socket_transport(self, sock, protocol, waiter=None, *,
                                extra=None, server=None):
@@ -192,7 +201,10 @@ class BaseEventLoop(events.AbstractEventLoop):
         but does not wait for the executor to finish.
         """
         self._ready.clear()
+        for handle in self._scheduled:
+            handle._scheduled = False
         self._scheduled.clear()
+        self._timer_cancelled_count = 0
         executor = self._default_executor
         if executor is not None:
             self._default_executor = None
@@ -206,6 +218,19 @@ class BaseEventLoop(events.AbstractEventLoop):
         """Return the time according to the event loop's clock."""
         return time.monotonic()
 
+    def set_instrument(self, instrument):
+        """Attach an instrument to the event loop, or detach it if None.
+
+        The instrument is a LoopInstrument (see asyncio.instrument),
+        which is notified about the time spent in select() and in each
+        callback.
+        """
+        self._instrument = instrument
+
+    def get_instrument(self):
+        """Return the instrument attached to the event loop, or None."""
+        return self._instrument
+
     def call_later(self, delay, callback, *args):
         """Arrange for a callback to be called at a given time.
 
@@ -226,10 +251,20 @@ class BaseEventLoop(events.AbstractEventLoop):
 
     def call_at(self, when, callback, *args):
         """Like call_later(), but uses an absolute time."""
-        timer = events.TimerHandle(when, callback, args)
-        heapq.heappush(self._scheduled, timer)
+        timer = events.TimerHandle(when, callback, args, self)
+        self._schedule_timer(timer)
         return timer
 
+    def _schedule_timer(self, timer):
+        """Push a TimerHandle onto the _scheduled heap."""
+        timer._loop = self
+        timer._scheduled = True
+        heapq.heappush(self._scheduled, timer)
+
+    def _timer_handle_cancelled(self, handle):
+        """Notification that a TimerHandle in _scheduled was cancelled."""
+        self._timer_cancelled_count += 1
+
     def call_soon(self, callback, *args):
         """Arrange for a callback to be called as soon as possible.
 
@@ -577,7 +612,7 @@ class BaseEventLoop(events.AbstractEventLoop):
         if handle._cancelled:
             return
         if isinstance(handle, events.TimerHandle):
-            heapq.heappush(self._scheduled, handle)
+            self._schedule_timer(handle)
         else:
             self._ready.append(handle)
 
@@ -586,6 +621,18 @@ class BaseEventLoop(events.AbstractEventLoop):
         self._add_callback(handle)
         self._write_to_self()
 
+    def _remove_cancelled_timers(self):
+        """Remove all cancelled handles from _scheduled in O(n)."""
+        scheduled = []
+        for handle in self._scheduled:
+            if handle._cancelled:
+                handle._scheduled = False
+            else:
+                scheduled.append(handle)
+        heapq.heapify(scheduled)
+        self._scheduled = scheduled
+        self._timer_cancelled_count = 0
+
     def _run_once(self):
         """Run one full iteration of the event loop.
 
@@ -593,9 +640,19 @@ class BaseEventLoop(events.AbstractEventLoop):
         schedules the resulting callbacks, and finally schedules
         'call_later' callbacks.
         """
-        # Remove delayed calls that were cancelled from head of queue.
-        while self._scheduled and self._scheduled[0]._cancelled:
-            heapq.heappop(self._scheduled)
+        sched_count = len(self._scheduled)
+        if (sched_count > _MIN_SCHEDULED_TIMER_HANDLES and
+            self._timer_cancelled_count >
+                sched_count * _MIN_CANCELLED_TIMER_HANDLES_FRACTION):
+            # Too many cancelled delayed calls; remove all of them, so
+            # that the heap doesn't grow without bound under churn.
+            self._remove_cancelled_timers()
+        else:
+            # Remove delayed calls that were cancelled from head of queue.
+            while self._scheduled and self._scheduled[0]._cancelled:
+                self._timer_cancelled_count -= 1
+                handle = heapq.heappop(self._scheduled)
+                handle._scheduled = False
 
         timeout = None
         if self._ready:
@@ -613,6 +670,9 @@ class BaseEventLoop(events.AbstractEventLoop):
         t0 = self.time()
         event_list = self._selector.select(timeout)
         t1 = self.time()
+        instrument = self._instrument
+        if instrument is not None:
+            instrument.select_finished(timeout, t1-t0, len(event_list))
         argstr = '' if timeout is None else ' {:.3f}'.format(timeout)
         if t1-t0 >= 1:
             level = logging.INFO
@@ -628,7 +688,11 @@ class BaseEventLoop(events.AbstractEventLoop):
             if handle._when > now:
                 break
             handle = heapq.heappop(self._scheduled)
-            self._ready.append(handle)
+            handle._scheduled = False
+            if handle._cancelled:
+                self._timer_cancelled_count -= 1
+            else:
+                self._ready.append(handle)
 
         # This is the only place where callbacks are actually *called*.
         # All other places just add them to ready.
@@ -637,8 +701,22 @@ class BaseEventLoop(events.AbstractEventLoop):
         # they will be run the next time (after another I/O poll).
         # Use an idiom that is threadsafe without using locks.
         ntodo = len(self._ready)
+        if instrument is not None:
+            self._run_ready_instrumented(ntodo, instrument)
+            return
+        for i in range(ntodo):
+            handle = self._ready.popleft()
+            if not handle._cancelled:
+                handle._run()
+        handle = None  # Needed to break cycles when an exception occurs.
+
+    def _run_ready_instrumented(self, ntodo, instrument):
+        """Like the end of _run_once(), but reporting to the instrument."""
+        instrument.callbacks_started(ntodo)
         for i in range(ntodo):
             handle = self._ready.popleft()
             if not handle._cancelled:
+                t0 = self.time()
                 handle._run()
+                instrument.callback_finished(handle, self.time() - t0)
         handle = None  # Needed to break cycles when an exception occurs.
@@ -51,11 +51,13 @@ def make_handle(callback, args):
 class TimerHandle(Handle):
     """Object returned by timed callback registration methods."""
 
-    def __init__(self, when, callback, args):
+    def __init__(self, when, callback, args, loop=None):
         assert when is not None
         super().__init__(callback, args)
 
         self._when = when
+        self._loop = loop
+        self._scheduled = False  # Set while in the loop's _scheduled heap.
 
     def __repr__(self):
         res = 'TimerHandle({}, {}, {})'.format(self._when,
@@ -97,6 +99,11 @@ class TimerHandle(Handle):
         equal = self.__eq__(other)
         return NotImplemented if equal is NotImplemented else not equal
 
+    def cancel(self):
+        if not self._cancelled and self._scheduled:
+            self._loop._timer_handle_cancelled(self)
+        super().cancel()
+
 
 class AbstractServer:
     """Abstract server returned by create_server()."""
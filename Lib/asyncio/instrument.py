@@ -0,0 +1,177 @@
+"""Event loop instrumentation.
+
+An instrument is attached to an event loop with its set_instrument()
+method.  The loop then reports how long it waits in select(), how many
+callbacks are ready in each iteration and how long each of them runs.
+When no instrument is attached, the loop skips all of this.
+"""
+
+__all__ = ['LoopInstrument', 'LoopStatistics', 'Histogram']
+
+import collections
+import functools
+import math
+
+from .log import logger
+
+
+class LoopInstrument:
+    """Base class for event loop instruments.
+
+    All methods are called from the thread running the event loop and
+    do nothing by default; override the ones you are interested in.
+    """
+
+    def select_finished(self, timeout, duration, nevents):
+        """Called when the selector's select() returns.
+
+        timeout is the timeout passed to select() (None means no
+        timeout), duration the time spent in it, in seconds, and
+        nevents the number of I/O events it returned.
+        """
+
+    def callbacks_started(self, count):
+        """Called before the ready callbacks of an iteration are run.
+
+        count is the depth of the ready queue, including callbacks that
+        were cancelled and will be skipped.
+        """
+
+    def callback_finished(self, handle, duration):
+        """Called after the callback of handle ran for duration seconds."""
+
+
+class Histogram:
+    """Histogram of durations with logarithmic buckets.
+
+    Bucket i counts the durations d with resolution * 2**(i-1) < d <=
+    resolution * 2**i; the first bucket counts all durations up to
+    resolution and the last one all durations above the previous
+    bucket's bound.
+    """
+
+    def __init__(self, resolution=1e-5, nbuckets=24):
+        self.resolution = resolution
+        self.counts = [0] * nbuckets
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, duration):
+        """Record one duration, in seconds."""
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+        if duration <= self.resolution:
+            index = 0
+        else:
+            index = math.ceil(math.log2(duration / self.resolution))
+            index = min(index, len(self.counts) - 1)
+        self.counts[index] += 1
+
+    def buckets(self):
+        """Return a list of (upper bound, count) pairs.
+
+        The upper bound of the last bucket is infinity.
+        """
+        bounds = [self.resolution * 2**i for i in range(len(self.counts))]
+        bounds[-1] = float('inf')
+        return list(zip(bounds, self.counts))
+
+    def percentile(self, percent):
+        """Return the upper bound of the bucket holding the percentile.
+
+        Return 0.0 if no duration was recorded.
+        """
+        if not self.count:
+            return 0.0
+        rank = self.count * percent / 100
+        seen = 0
+        for bound, count in self.buckets():
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def __repr__(self):
+        mean = self.total / self.count if self.count else 0.0
+        return '<%s count=%d mean=%.6f max=%.6f>' % (
+            self.__class__.__name__, self.count, mean, self.max)
+
+
+def _format_callback(callback):
+    """Return a description of callback naming where it comes from.
+
+    Steps of a Task are reported as the coroutine it runs, together
+    with the line at which the coroutine is suspended.
+    """
+    while isinstance(callback, functools.partial):
+        callback = callback.func
+    owner = getattr(callback, '__self__', None)
+    coro = getattr(owner, '_coro', None)  # Task._step() or Task._wakeup().
+    coro = getattr(coro, 'gen', coro)  # Unwrap tasks.CoroWrapper.
+    code = getattr(coro, 'gi_code', None)
+    if code is not None:
+        frame = coro.gi_frame
+        where = (' suspended at line %s' % frame.f_lineno
+                 if frame is not None else '')
+        return 'coroutine %s at %s:%s%s' % (
+            code.co_name, code.co_filename, code.co_firstlineno, where)
+    func = getattr(callback, '__func__', callback)
+    code = getattr(func, '__code__', None)
+    if code is None:
+        return repr(callback)
+    name = getattr(func, '__qualname__', code.co_name)
+    return '%s at %s:%s' % (name, code.co_filename, code.co_firstlineno)
+
+
+class LoopStatistics(LoopInstrument):
+    """Instrument collecting statistics about an event loop.
+
+    select_times and callback_times are Histograms of the time spent in
+    select() and in individual callbacks.  Callbacks running longer
+    than slow_callback_duration seconds are logged and the most recent
+    ones are kept in slow_callbacks as (description, duration) pairs.
+    """
+
+    def __init__(self, slow_callback_duration=0.1, max_slow_callbacks=100):
+        self.slow_callback_duration = slow_callback_duration
+        self.select_times = Histogram()
+        self.callback_times = Histogram()
+        self.slow_callbacks = collections.deque(maxlen=max_slow_callbacks)
+        self.iterations = 0
+        self.events = 0
+        self.max_ready = 0
+
+    def select_finished(self, timeout, duration, nevents):
+        self.iterations += 1
+        self.events += nevents
+        self.select_times.add(duration)
+
+    def callbacks_started(self, count):
+        if count > self.max_ready:
+            self.max_ready = count
+
+    def callback_finished(self, handle, duration):
+        self.callback_times.add(duration)
+        if duration >= self.slow_callback_duration:
+            description = _format_callback(handle._callback)
+            self.slow_callbacks.append((description, duration))
+            logger.warning('Executing %s took %.3f seconds',
+                           description, duration)
+
+    def report(self):
+        """Return a multi-line summary of the statistics."""
+        lines = ['iterations: %d, I/O events: %d, max ready queue: %d' % (
+                     self.iterations, self.events, self.max_ready)]
+        for name, hist in (('select', self.select_times),
+                           ('callbacks', self.callback_times)):
+            lines.append('%s: count=%d total=%.3fs p50<=%.6fs p99<=%.6fs '
+                         'max=%.6fs' % (
+                             name, hist.count, hist.total,
+                             hist.percentile(50), hist.percentile(99),
+                             hist.max))
+        for description, duration in self.slow_callbacks:
+            lines.append('slow callback (%.3fs): %s' % (duration, description))
+        return '\n'.join(lines)
@@ -153,6 +153,20 @@ class Queue:
         else:
             self._put(item)
 
+    @coroutine
+    def put_many(self, items):
+        """Put all the items of an iterable into the queue, in order.
+
+        If you yield from put_many(), wait whenever the queue is full
+        until a free slot is available for the next item.  The items are
+        handed to the waiting getters within a single call.
+        """
+        for item in items:
+            try:
+                self.put_nowait(item)
+            except Full:
+                yield from self.put(item)
+
     @coroutine
     def get(self):
         """Remove and return an item from the queue.
@@ -181,6 +195,23 @@ class Queue:
             self._getters.append(waiter)
             return (yield from waiter)
 
+    @coroutine
+    def get_many(self, max_items):
+        """Remove and return a list of up to max_items items from the queue.
+
+        If you yield from get_many(), wait until an item is available;
+        the list then holds all the items available, up to max_items.
+        """
+        if max_items < 1:
+            raise ValueError('max_items must be a positive integer')
+        items = [(yield from self.get())]
+        while len(items) < max_items:
+            try:
+                items.append(self.get_nowait())
+            except Empty:
+                break
+        return items
+
     def get_nowait(self):
         """Remove and return an item from the queue.
 
@@ -6,7 +6,11 @@ also includes support for signal handling, see the unix_events sub-module.
 
 import collections
 import errno
+import io
+import itertools
+import os
 import socket
+import stat
 try:
     import ssl
 except ImportError:  # pragma: no cover
@@ -21,6 +25,62 @@ from . import transports
 from .log import logger
 
 
+# Maximum number of buffers passed to a single sendmsg() call.
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = -1
+if _IOV_MAX <= 0:
+    _IOV_MAX = 16  # _XOPEN_IOV_MAX, the minimum allowed by POSIX.
+
+_HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')
+_HAS_SENDFILE = hasattr(os, 'sendfile')
+
+
+def _buffer_view(data, offset=0):
+    """Return a flat memoryview of the bytes of data, starting at offset.
+
+    Immutable data is wrapped without copying.  Mutable buffers are
+    copied, since the caller is free to modify or reuse them once
+    write() has returned.
+    """
+    view = memoryview(data)
+    if view.format != 'B' or view.ndim != 1:
+        view = view.cast('B')
+    if offset:
+        view = view[offset:]
+    if not view.readonly:
+        view = memoryview(bytes(view))
+    return view
+
+
+class _FileSegment:
+    """A range of a file queued in a write buffer, sent with sendfile().
+
+    The segment owns a duplicate of the file descriptor, so the caller
+    may close the file as soon as it has been queued.
+    """
+
+    __slots__ = ('fd', 'offset', 'count')
+
+    def __init__(self, fd, offset, count):
+        self.fd = os.dup(fd)
+        self.offset = offset
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def advance(self, n):
+        self.offset += n
+        self.count -= n
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
 class BaseSelectorEventLoop(base_events.BaseEventLoop):
     """Selector event loop.
 
@@ -447,9 +507,18 @@ class _SelectorTransport(transports.Transport):
 
 class _SelectorSocketTransport(_SelectorTransport):
 
+    # The write buffer is a queue of read-only memoryviews.  A partial
+    # send only slices the head view, so no payload is copied, and
+    # several queued views are flushed at once using sendmsg().  Files
+    # passed to sendfile() are queued as _FileSegments, sent in turn
+    # with os.sendfile().
+    _buffer_factory = collections.deque
+
     def __init__(self, loop, sock, protocol, waiter=None,
                  extra=None, server=None):
         super().__init__(loop, sock, protocol, extra, server)
+        self._buffer_size = 0  # Total number of bytes in self._buffer.
+        self._segments = 0  # Number of _FileSegments in self._buffer.
         self._eof = False
         self._paused = False
 
@@ -509,6 +578,7 @@ class _SelectorSocketTransport(_SelectorTransport):
             self._conn_lost += 1
             return
 
+        n = 0
         if not self._buffer:
             # Optimization: try to send now.
             try:
@@ -519,30 +589,125 @@ class _SelectorSocketTransport(_SelectorTransport):
                 self._fatal_error(exc)
                 return
             else:
-                data = data[n:]
-                if not data:
+                if n == memoryview(data).nbytes:
                     return
             # Not all was written; register write handler.
             self._loop.add_writer(self._sock_fd, self._write_ready)
 
-        # Add it to the buffer.
-        self._buffer.extend(data)
+        # Add the unsent part to the buffer.
+        view = _buffer_view(data, n)
+        self._buffer.append(view)
+        self._buffer_size += len(view)
+        self._maybe_pause_protocol()
+
+    def writelines(self, list_of_data):
+        """Write an iterable of data bytes to the transport.
+
+        Unlike the default implementation, the chunks are never joined:
+        each one is queued as a separate buffer and all of them are
+        passed to the kernel with a single sendmsg() call if possible.
+        """
+        if self._eof:
+            raise RuntimeError('Cannot call writelines() after write_eof()')
+
+        if self._conn_lost:
+            if self._conn_lost >= constants.LOG_THRESHOLD_FOR_CONNLOST_WRITES:
+                logger.warning('socket.send() raised exception.')
+            self._conn_lost += 1
+            return
+
+        views = []
+        for data in list_of_data:
+            if not isinstance(data, (bytes, bytearray, memoryview)):
+                raise TypeError('data argument must be byte-ish (%r)',
+                                type(data))
+            if data:
+                views.append(_buffer_view(data))
+        if not views:
+            return
+
+        was_empty = not self._buffer
+        self._buffer.extend(views)
+        self._buffer_size += sum(map(len, views))
+        if was_empty:
+            # Optimization: try to send now.
+            self._write_ready()
+            if self._buffer:
+                self._loop.add_writer(self._sock_fd, self._write_ready)
+        self._maybe_pause_protocol()
+
+    def sendfile(self, file, offset=0, count=None):
+        """Write count bytes of a binary file, starting at offset.
+
+        A regular file is not read: a range of it is queued and the
+        kernel copies it to the socket with os.sendfile() when its turn
+        comes.  Other files are read and written as with write().
+        """
+        try:
+            fileno = file.fileno()
+            st = os.fstat(fileno)
+        except (AttributeError, io.UnsupportedOperation, OSError):
+            fileno = None
+        if (not _HAS_SENDFILE or fileno is None or
+                not stat.S_ISREG(st.st_mode)):
+            return super().sendfile(file, offset, count)
+        if self._eof:
+            raise RuntimeError('Cannot call sendfile() after write_eof()')
+
+        if self._conn_lost:
+            if self._conn_lost >= constants.LOG_THRESHOLD_FOR_CONNLOST_WRITES:
+                logger.warning('socket.send() raised exception.')
+            self._conn_lost += 1
+            return
+
+        if count is None:
+            count = st.st_size - offset
+        if count <= 0:
+            return
+
+        was_empty = not self._buffer
+        self._buffer.append(_FileSegment(fileno, offset, count))
+        self._buffer_size += count
+        self._segments += 1
+        if was_empty:
+            # Optimization: try to send now.
+            self._write_ready()
+            if self._buffer:
+                self._loop.add_writer(self._sock_fd, self._write_ready)
         self._maybe_pause_protocol()
 
     def _write_ready(self):
         assert self._buffer, 'Data should not be empty'
 
         try:
-            n = self._sock.send(self._buffer)
+            head = self._buffer[0]
+            if isinstance(head, _FileSegment):
+                n = os.sendfile(self._sock_fd, head.fd, head.offset,
+                                head.count)
+                if not n:
+                    # The file was truncated, drop the rest of the range.
+                    n = head.count
+            elif _HAS_SENDMSG and len(self._buffer) > 1:
+                buffers = itertools.islice(self._buffer, _IOV_MAX)
+                if self._segments:
+                    # Stop at the first file segment.
+                    buffers = itertools.takewhile(
+                        lambda item: not isinstance(item, _FileSegment),
+                        buffers)
+                n = self._sock.sendmsg(buffers)
+            else:
+                n = self._sock.send(head)
         except (BlockingIOError, InterruptedError):
             pass
         except Exception as exc:
             self._loop.remove_writer(self._sock_fd)
+            self._close_segments()
             self._buffer.clear()
+            self._buffer_size = 0
             self._fatal_error(exc)
         else:
             if n:
-                del self._buffer[:n]
+                self._consume_buffer(n)
             self._maybe_resume_protocol()  # May append to buffer.
             if not self._buffer:
                 self._loop.remove_writer(self._sock_fd)
@@ -551,6 +716,43 @@ class _SelectorSocketTransport(_SelectorTransport):
                 elif self._eof:
                     self._sock.shutdown(socket.SHUT_WR)
 
+    def _consume_buffer(self, n):
+        # Drop the first n bytes from the buffer.  A partially sent view
+        # is replaced by a slice of itself, which does not copy the data.
+        self._buffer_size -= n
+        buffer = self._buffer
+        while n:
+            item = buffer[0]
+            size = len(item)
+            if size > n:
+                if isinstance(item, _FileSegment):
+                    item.advance(n)
+                else:
+                    buffer[0] = item[n:]
+                break
+            buffer.popleft()
+            if isinstance(item, _FileSegment):
+                item.close()
+                self._segments -= 1
+            n -= size
+
+    def _close_segments(self):
+        # Release the file descriptors of the queued file segments.
+        if self._segments:
+            for item in self._buffer:
+                if isinstance(item, _FileSegment):
+                    item.close()
+            self._segments = 0
+
+    def _force_close(self, exc):
+        if not self._conn_lost:
+            self._close_segments()
+            self._buffer_size = 0
+        super()._force_close(exc)
+
+    def get_write_buffer_size(self):
+        return self._buffer_size
+
     def write_eof(self):
         if self._eof:
             return
@@ -697,8 +899,25 @@ class _SelectorSslTransport(_SelectorTransport):
             if self._buffer:
                 self._loop.add_writer(self._sock_fd, self._write_ready)
 
+        # Each recv() only returns the data of one SSL record: keep
+        # reading until no record is pending, and pass all the data to the
+        # protocol at once.  Past max_size bytes, stop as soon as OpenSSL
+        # has no decrypted data left: data buffered there would not wake
+        # up the selector again.
+        chunks = []
+        size = 0
+        eof = False
+        error = None
         try:
-            data = self._sock.recv(self.max_size)
+            while True:
+                data = self._sock.recv(self.max_size)
+                if not data:
+                    eof = True
+                    break
+                chunks.append(data)
+                size += len(data)
+                if size >= self.max_size and not self._sock.pending():
+                    break
         except (BlockingIOError, InterruptedError, ssl.SSLWantReadError):
             pass
         except ssl.SSLWantWriteError:
@@ -706,18 +925,21 @@ class _SelectorSslTransport(_SelectorTransport):
             self._loop.remove_reader(self._sock_fd)
             self._loop.add_writer(self._sock_fd, self._write_ready)
         except Exception as exc:
-            self._fatal_error(exc)
-        else:
-            if data:
-                self._protocol.data_received(data)
-            else:
-                try:
-                    keep_open = self._protocol.eof_received()
-                    if keep_open:
-                        logger.warning('returning true from eof_received() '
-                                       'has no effect when using ssl')
-                finally:
-                    self.close()
+            error = exc
+
+        if chunks:
+            data = chunks[0] if len(chunks) == 1 else b''.join(chunks)
+            self._protocol.data_received(data)
+        if error is not None:
+            self._fatal_error(error)
+        elif eof and not self._closing:
+            try:
+                keep_open = self._protocol.eof_received()
+                if keep_open:
+                    logger.warning('returning true from eof_received() '
+                                   'has no effect when using ssl')
+            finally:
+                self.close()
 
     def _write_ready(self):
         if self._read_wants_write:
@@ -727,24 +949,27 @@ class _SelectorSslTransport(_SelectorTransport):
             if not (self._paused or self._closing):
                 self._loop.add_reader(self._sock_fd, self._read_ready)
 
-        if self._buffer:
+        # The writes are accumulated in the buffer; send() only writes one
+        # SSL record at a time, so keep sending until the socket is full.
+        while self._buffer:
             try:
                 n = self._sock.send(self._buffer)
             except (BlockingIOError, InterruptedError,
                     ssl.SSLWantWriteError):
-                n = 0
+                break
             except ssl.SSLWantReadError:
-                n = 0
                 self._loop.remove_writer(self._sock_fd)
                 self._write_wants_read = True
+                break
             except Exception as exc:
                 self._loop.remove_writer(self._sock_fd)
                 self._buffer.clear()
                 self._fatal_error(exc)
                 return
 
-            if n:
-                del self._buffer[:n]
+            if not n:
+                break
+            del self._buffer[:n]
 
         self._maybe_resume_protocol()  # May append to buffer.
 
@@ -4,8 +4,6 @@ __all__ = ['StreamReader', 'StreamWriter', 'StreamReaderProtocol',
            'open_connection', 'start_server',
            ]
 
-import collections
-
 from . import events
 from . import futures
 from . import protocols
@@ -171,6 +169,9 @@ class StreamWriter:
     def writelines(self, data):
         self._transport.writelines(data)
 
+    def sendfile(self, file, offset=0, count=None):
+        self._transport.sendfile(file, offset, count)
+
     def write_eof(self):
         return self._transport.write_eof()
 
@@ -220,9 +221,10 @@ class StreamReader:
         if loop is None:
             loop = events.get_event_loop()
         self._loop = loop
-        # TODO: Use a bytearray for a buffer, like the transport.
-        self._buffer = collections.deque()  # Deque of bytes objects.
-        self._byte_count = 0  # Bytes in buffer.
+        # Received data.  Consumed bytes are deleted from the front of
+        # the bytearray, which only moves its internal start offset, so
+        # reading from the buffer never copies the remaining data.
+        self._buffer = bytearray()
         self._eof = False  # Whether we're done.
         self._waiter = None  # A future.
         self._exception = None
@@ -246,7 +248,7 @@ class StreamReader:
         self._transport = transport
 
     def _maybe_resume_transport(self):
-        if self._paused and self._byte_count <= self._limit:
+        if self._paused and len(self._buffer) <= self._limit:
             self._paused = False
             self._transport.resume_reading()
 
@@ -262,8 +264,7 @@ class StreamReader:
         if not data:
             return
 
-        self._buffer.append(data)
-        self._byte_count += len(data)
+        self._buffer.extend(data)
 
         waiter = self._waiter
         if waiter is not None:
@@ -273,7 +274,7 @@ class StreamReader:
 
         if (self._transport is not None and
             not self._paused and
-            self._byte_count > 2*self._limit):
+            len(self._buffer) > 2*self._limit):
             try:
                 self._transport.pause_reading()
             except NotImplementedError:
@@ -284,52 +285,62 @@ class StreamReader:
             else:
                 self._paused = True
 
+    @tasks.coroutine
+    def _wait_for_data(self):
+        """Wait until feed_data() or feed_eof() is called."""
+        assert self._waiter is None
+        self._waiter = futures.Future(loop=self._loop)
+        try:
+            yield from self._waiter
+        finally:
+            self._waiter = None
+
+    def _consume(self, n):
+        """Remove the first n bytes from the buffer and return them."""
+        with memoryview(self._buffer) as view:
+            data = view[:n].tobytes()
+        del self._buffer[:n]
+        self._maybe_resume_transport()
+        return data
+
     @tasks.coroutine
     def readline(self):
+        return (yield from self.readuntil(b'\n'))
+
+    @tasks.coroutine
+    def readuntil(self, separator=b'\n'):
+        """Read data up to and including separator.
+
+        If EOF is reached before the separator is found, the remaining
+        data is returned.  ValueError is raised (and the data read so
+        far is discarded) if no separator is found within the stream
+        limit.
+        """
         if self._exception is not None:
             raise self._exception
-
-        parts = []
-        parts_size = 0
-        not_enough = True
-
-        while not_enough:
-            while self._buffer and not_enough:
-                data = self._buffer.popleft()
-                ichar = data.find(b'\n')
-                if ichar < 0:
-                    parts.append(data)
-                    parts_size += len(data)
-                else:
-                    ichar += 1
-                    head, tail = data[:ichar], data[ichar:]
-                    if tail:
-                        self._buffer.appendleft(tail)
-                    not_enough = False
-                    parts.append(head)
-                    parts_size += len(head)
-
-                if parts_size > self._limit:
-                    self._byte_count -= parts_size
-                    self._maybe_resume_transport()
-                    raise ValueError('Line is too long')
-
-            if self._eof:
+        if not separator:
+            raise ValueError('Separator should be at least one-byte string')
+
+        # Only the newly received data needs to be searched after a
+        # wait, plus enough overlap to find a separator spanning it.
+        start = 0
+        while True:
+            isep = self._buffer.find(separator, start)
+            if isep >= 0:
+                end = isep + len(separator)
                 break
+            end = len(self._buffer)
+            if end > self._limit or self._eof:
+                break
+            start = max(end - len(separator) + 1, 0)
+            yield from self._wait_for_data()
 
-            if not_enough:
-                assert self._waiter is None
-                self._waiter = futures.Future(loop=self._loop)
-                try:
-                    yield from self._waiter
-                finally:
-                    self._waiter = None
-
-        line = b''.join(parts)
-        self._byte_count -= parts_size
-        self._maybe_resume_transport()
+        if end > self._limit:
+            del self._buffer[:end]
+            self._maybe_resume_transport()
+            raise ValueError('Line is too long')
 
-        return line
+        return self._consume(end)
 
     @tasks.coroutine
     def read(self, n=-1):
@@ -341,67 +352,72 @@ class StreamReader:
 
         if n < 0:
             while not self._eof:
-                assert not self._waiter
-                self._waiter = futures.Future(loop=self._loop)
-                try:
-                    yield from self._waiter
-                finally:
-                    self._waiter = None
+                yield from self._wait_for_data()
         else:
-            if not self._byte_count and not self._eof:
-                assert not self._waiter
-                self._waiter = futures.Future(loop=self._loop)
-                try:
-                    yield from self._waiter
-                finally:
-                    self._waiter = None
-
-        if n < 0 or self._byte_count <= n:
-            data = b''.join(self._buffer)
+            if not self._buffer and not self._eof:
+                yield from self._wait_for_data()
+
+        if n < 0 or len(self._buffer) <= n:
+            data = bytes(self._buffer)
             self._buffer.clear()
-            self._byte_count = 0
             self._maybe_resume_transport()
             return data
 
-        parts = []
-        parts_bytes = 0
-        while self._buffer and parts_bytes < n:
-            data = self._buffer.popleft()
-            data_bytes = len(data)
-            if n < parts_bytes + data_bytes:
-                data_bytes = n - parts_bytes
-                data, rest = data[:data_bytes], data[data_bytes:]
-                self._buffer.appendleft(rest)
-
-            parts.append(data)
-            parts_bytes += data_bytes
-            self._byte_count -= data_bytes
-            self._maybe_resume_transport()
+        return self._consume(n)
+
+    @tasks.coroutine
+    def readinto(self, buffer):
+        """Read up to len(buffer) bytes into buffer.
 
-        return b''.join(parts)
+        Like read(n), this waits until at least one byte is available
+        and returns the number of bytes copied, which is 0 only at EOF.
+        """
+        if self._exception is not None:
+            raise self._exception
+
+        with memoryview(buffer) as view:
+            size = view.nbytes
+        if not size:
+            return 0
+
+        if not self._buffer and not self._eof:
+            yield from self._wait_for_data()
+
+        n = min(size, len(self._buffer))
+        with memoryview(buffer) as view, memoryview(self._buffer) as data:
+            view.cast('B')[:n] = data[:n]
+        del self._buffer[:n]
+        self._maybe_resume_transport()
+        return n
 
     @tasks.coroutine
     def readexactly(self, n):
         if self._exception is not None:
             raise self._exception
 
-        # There used to be "optimized" code here.  It created its own
-        # Future and waited until self._buffer had at least the n
-        # bytes, then called read(n).  Unfortunately, this could pause
-        # the transport if the argument was larger than the pause
-        # limit (which is twice self._limit).  So now we just read()
-        # into a local buffer.
-
-        blocks = []
-        while n > 0:
-            block = yield from self.read(n)
-            if not block:
-                break
-            blocks.append(block)
-            n -= len(block)
+        if n <= 0:
+            return b''
+
+        # Wait for all n bytes in the buffer, unless that could pause
+        # the transport (the pause limit is twice self._limit); in that
+        # case read into a local buffer instead.
+        if n <= 2*self._limit:
+            while len(self._buffer) < n and not self._eof:
+                yield from self._wait_for_data()
+            return self._consume(min(n, len(self._buffer)))
+
+        data = bytearray(n)
+        nread = 0
+        with memoryview(data) as view:
+            while nread < n:
+                count = yield from self.readinto(view[nread:])
+                if not count:
+                    break
+                nread += count
+        del data[nread:]
 
         # TODO: Raise EOFError if we break before n == 0?  (That would
         # be a change in specification, but I've always had to add an
         # explicit size check to the caller.)
 
-        return b''.join(blocks)
+        return bytes(data)
@@ -101,6 +101,25 @@ class WriteTransport(BaseTransport):
                 for data in list_of_data)
         self.write(b''.join(list_of_data))
 
+    def sendfile(self, file, offset=0, count=None):
+        """Write count bytes of a binary file, starting at offset.
+
+        If count is None, write the file up to its end.  The file
+        position is left unchanged and the file may be closed as soon
+        as this returns.
+
+        The default implementation reads the data and calls write()
+        on it; transports may instead let the kernel copy the file
+        straight to the socket.
+        """
+        position = file.tell()
+        try:
+            file.seek(offset)
+            data = file.read() if count is None else file.read(count)
+        finally:
+            file.seek(position)
+        self.write(data)
+
     def write_eof(self):
         """Close the write end after flushing buffered data.
 
@@ -513,7 +513,19 @@ class Executor(object):
         """
         raise NotImplementedError()
 
-    def map(self, fn, *iterables, timeout=None):
+    def submit_many(self, fn, *iterables):
+        """Submits a callable to be executed once for each set of arguments.
+
+        Schedules fn(*args) for each args in zip(*iterables), like map(), but
+        returns the list of the Futures representing the calls. Executors may
+        implement it more efficiently than repeated calls to submit().
+
+        Returns:
+            A list of Futures, in the order of the arguments.
+        """
+        return [self.submit(fn, *args) for args in zip(*iterables)]
+
+    def map(self, fn, *iterables, timeout=None, chunksize=1):
         """Returns a iterator equivalent to map(fn, iter).
 
         Args:
@@ -521,6 +533,10 @@ class Executor(object):
                 passed iterables.
             timeout: The maximum number of seconds to wait. If None, then there
                 is no limit on the wait time.
+            chunksize: The size of the chunks the iterable will be broken into
+                before being passed to a child process. This argument is only
+                used by ProcessPoolExecutor; it is ignored by
+                ThreadPoolExecutor.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
@@ -534,7 +550,7 @@ class Executor(object):
         if timeout is not None:
             end_time = timeout + time.time()
 
-        fs = [self.submit(fn, *args) for args in zip(*iterables)]
+        fs = self.submit_many(fn, *iterables)
 
         # Yield must be hidden in closure so that the futures are submitted
         # before the first iterator value is required.
@@ -6,6 +6,7 @@
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
 import atexit
+import collections
 from concurrent.futures import _base
 import queue
 import threading
@@ -40,6 +41,8 @@ def _python_exit():
 atexit.register(_python_exit)
 
 class _WorkItem(object):
+    __slots__ = ('future', 'fn', 'args', 'kwargs')
+
     def __init__(self, future, fn, args, kwargs):
         self.future = future
         self.fn = fn
@@ -79,16 +82,92 @@ def _worker(executor_reference, work_queue):
     except BaseException:
         _base.LOGGER.critical('Exception in worker', exc_info=True)
 
+# In work stealing mode, each worker thread has its own deque of work items
+# instead of sharing a single queue.Queue, so that workers never contend on
+# a lock to get work. Appending to and popping from a deque are atomic. A
+# worker takes the oldest item of its own deque; when that is empty, it
+# steals the newest item of another worker's deque. A worker finding no work
+# at all registers itself in the executor's deque of idle workers and sleeps
+# on its own Event until a submitter hands it an item.
+
+class _StealingWorker(object):
+    def __init__(self):
+        self.work = collections.deque()
+        self.wakeup = threading.Event()
+        self.idle = False
+
+    def put(self, item):
+        # Only used by _python_exit(), which puts None to wake up workers.
+        assert item is None
+        self.wakeup.set()
+
+def _get_work_item(worker, workers):
+    try:
+        return worker.work.popleft()
+    except IndexError:
+        pass
+    for other in workers:
+        if other is not worker:
+            try:
+                return other.work.pop()
+            except IndexError:
+                pass
+    return None
+
+def _stealing_worker(executor_reference, worker, workers, idle_workers, local):
+    local.worker = worker
+    try:
+        while True:
+            work_item = _get_work_item(worker, workers)
+            if work_item is None:
+                worker.idle = True
+                idle_workers.append(worker)
+                # Look again: an item submitted before this worker was
+                # registered as idle would not have woken it up.
+                work_item = _get_work_item(worker, workers)
+            if work_item is not None:
+                worker.idle = False
+                work_item.run()
+                # Delete references to object. See issue16284
+                del work_item
+                continue
+            executor = executor_reference()
+            # Exit if:
+            #   - The interpreter is shutting down OR
+            #   - The executor that owns the worker has been collected OR
+            #   - The executor that owns the worker has been shutdown.
+            if _shutdown or executor is None or executor._shutdown:
+                # Notice other workers
+                for other in workers:
+                    other.wakeup.set()
+                return
+            del executor
+            worker.wakeup.wait()
+            worker.wakeup.clear()
+            worker.idle = False
+    except BaseException:
+        _base.LOGGER.critical('Exception in worker', exc_info=True)
+
 class ThreadPoolExecutor(_base.Executor):
-    def __init__(self, max_workers):
+    def __init__(self, max_workers, work_stealing=False):
         """Initializes a new ThreadPoolExecutor instance.
 
         Args:
             max_workers: The maximum number of threads that can be used to
                 execute the given calls.
+            work_stealing: If true, give each thread its own queue of calls
+                and let idle threads steal calls from the other queues,
+                instead of sharing a single queue between all threads.
         """
         self._max_workers = max_workers
-        self._work_queue = queue.Queue()
+        self._work_stealing = work_stealing
+        if work_stealing:
+            self._workers = []
+            self._idle_workers = collections.deque()
+            self._next_worker = 0
+            self._local = threading.local()
+        else:
+            self._work_queue = queue.Queue()
         self._threads = set()
         self._shutdown = False
         self._shutdown_lock = threading.Lock()
@@ -101,31 +180,91 @@ class ThreadPoolExecutor(_base.Executor):
             f = _base.Future()
             w = _WorkItem(f, fn, args, kwargs)
 
-            self._work_queue.put(w)
             self._adjust_thread_count()
+            self._put_work_item(w)
             return f
     submit.__doc__ = _base.Executor.submit.__doc__
 
+    def submit_many(self, fn, *iterables):
+        with self._shutdown_lock:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+
+            fs = []
+            for args in zip(*iterables):
+                f = _base.Future()
+                fs.append(f)
+                if len(self._threads) < self._max_workers:
+                    self._adjust_thread_count()
+                self._put_work_item(_WorkItem(f, fn, args, {}))
+            return fs
+    submit_many.__doc__ = _base.Executor.submit_many.__doc__
+
+    def _put_work_item(self, work_item):
+        # Must be called with self._shutdown_lock held.
+        if not self._work_stealing:
+            self._work_queue.put(work_item)
+            return
+        # Hand the item to an idle worker if there is one.
+        idle_workers = self._idle_workers
+        while idle_workers:
+            try:
+                worker = idle_workers.popleft()
+            except IndexError:
+                break
+            if worker.idle:
+                worker.idle = False
+                worker.work.append(work_item)
+                worker.wakeup.set()
+                return
+        # Otherwise, calls submitted from a worker thread go to the deque of
+        # that worker, and other calls are spread over all the workers.
+        worker = getattr(self._local, 'worker', None)
+        if worker is None:
+            worker = self._workers[self._next_worker % len(self._workers)]
+            self._next_worker += 1
+        worker.work.append(work_item)
+
     def _adjust_thread_count(self):
         # When the executor gets lost, the weakref callback will wake up
         # the worker threads.
-        def weakref_cb(_, q=self._work_queue):
-            q.put(None)
+        if self._work_stealing:
+            def weakref_cb(_, workers=self._workers):
+                for worker in workers:
+                    worker.wakeup.set()
+        else:
+            def weakref_cb(_, q=self._work_queue):
+                q.put(None)
         # TODO(bquinlan): Should avoid creating new threads if there are more
         # idle threads than items in the work queue.
         if len(self._threads) < self._max_workers:
-            t = threading.Thread(target=_worker,
-                                 args=(weakref.ref(self, weakref_cb),
-                                       self._work_queue))
+            if self._work_stealing:
+                worker = _StealingWorker()
+                self._workers.append(worker)
+                t = threading.Thread(target=_stealing_worker,
+                                     args=(weakref.ref(self, weakref_cb),
+                                           worker,
+                                           self._workers,
+                                           self._idle_workers,
+                                           self._local))
+            else:
+                worker = self._work_queue
+                t = threading.Thread(target=_worker,
+                                     args=(weakref.ref(self, weakref_cb),
+                                           self._work_queue))
             t.daemon = True
             t.start()
             self._threads.add(t)
-            _threads_queues[t] = self._work_queue
+            _threads_queues[t] = worker
 
     def shutdown(self, wait=True):
         with self._shutdown_lock:
             self._shutdown = True
-            self._work_queue.put(None)
+            if self._work_stealing:
+                for worker in self._workers:
+                    worker.wakeup.set()
+            else:
+                self._work_queue.put(None)
         if wait:
             for t in self._threads:
                 t.join()
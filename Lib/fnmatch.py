@@ -8,13 +8,16 @@ expression.  They cache the compiled regular expressions for speed.
 
 The function translate(PATTERN) returns a regular expression
 corresponding to PATTERN.  (It does not compile it.)
+
+The class MultiPattern(PATTERNS) matches names against many patterns
+at once.
 """
 import os
 import posixpath
 import re
 import functools
 
-__all__ = ["filter", "fnmatch", "fnmatchcase", "translate"]
+__all__ = ["filter", "fnmatch", "fnmatchcase", "translate", "MultiPattern"]
 
 def fnmatch(name, pat):
     """Test whether FILENAME matches PATTERN.
@@ -61,6 +64,126 @@ def filter(names, pat):
                 result.append(name)
     return result
 
+# The re module limits a pattern to 100 groups, group 0 included.
+_MAXGROUPS = 99
+
+class MultiPattern:
+    """A sequence of shell patterns matched against names together.
+
+    Literal patterns and patterns of the form 'prefix*' or '*suffix'
+    are looked up in dicts; the other ones are compiled into a few
+    regular expressions, each an alternation of up to 99 patterns.
+    Matching a name is thus not proportional to the number of patterns.
+
+    Like filter(), names and patterns are case-normalized if the
+    operating system requires it.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = tuple(patterns)
+        self._matchall = None  # index of the first '*' pattern
+        self._literals = {}
+        prefixes = {}  # length -> {prefix: index}
+        suffixes = {}  # length -> {suffix: index}
+        regexes = []   # (index, regular expression)
+        types = {type(pat) for pat in self.patterns}
+        if len(types) > 1:
+            raise TypeError("can't mix str and bytes patterns")
+        isbytes = bytes in types
+        for index, pat in enumerate(self.patterns):
+            pat = os.path.normcase(pat)
+            if isbytes:
+                pat = str(pat, 'ISO-8859-1')
+            stars = pat.count('*')
+            if '?' in pat or '[' in pat or stars > 1 or (
+                    stars == 1 and pat[0] != '*' and pat[-1] != '*'):
+                # Strip the trailing '\Z(?ms)'.
+                regexes.append((index, translate(pat)[:-7]))
+                continue
+            if not stars:
+                table, key = self._literals, pat
+            elif pat == '*':
+                if self._matchall is None:
+                    self._matchall = index
+                continue
+            elif pat[0] == '*':
+                table, key = suffixes.setdefault(len(pat) - 1, {}), pat[1:]
+            else:
+                table, key = prefixes.setdefault(len(pat) - 1, {}), pat[:-1]
+            if isbytes:
+                key = bytes(key, 'ISO-8859-1')
+            table.setdefault(key, index)
+        self._prefixes = sorted(prefixes.items())
+        self._suffixes = sorted(suffixes.items())
+        # Each alternative is a group; the index of the group that matched
+        # tells which pattern it was.
+        self._regexes = []
+        for i in range(0, len(regexes), _MAXGROUPS):
+            chunk = regexes[i:i+_MAXGROUPS]
+            res = '(?ms)(?:%s)' % '|'.join('(%s)\\Z' % res
+                                           for index, res in chunk)
+            if isbytes:
+                res = bytes(res, 'ISO-8859-1')
+            indexes = [index for index, res in chunk]
+            self._regexes.append((re.compile(res).match, indexes))
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, list(self.patterns))
+
+    def _match(self, name):
+        # Return the index of the first pattern matching name, or None.
+        best = self._matchall
+        index = self._literals.get(name)
+        if index is not None and (best is None or index < best):
+            best = index
+        for length, table in self._prefixes:
+            index = table.get(name[:length])
+            if index is not None and (best is None or index < best):
+                best = index
+        for length, table in self._suffixes:
+            index = table.get(name[-length:])
+            if index is not None and (best is None or index < best):
+                best = index
+        for match, indexes in self._regexes:
+            if best is not None and indexes[0] > best:
+                break
+            m = match(name)
+            if m is not None:
+                index = indexes[m.lastindex - 1]
+                if best is None or index < best:
+                    best = index
+                break
+        return best
+
+    def _matchany(self, name):
+        if self._matchall is not None or name in self._literals:
+            return True
+        for length, table in self._prefixes:
+            if name[:length] in table:
+                return True
+        for length, table in self._suffixes:
+            if name[-length:] in table:
+                return True
+        for match, indexes in self._regexes:
+            if match(name) is not None:
+                return True
+        return False
+
+    def match(self, name):
+        """Return the first of the patterns that NAME matches, or None."""
+        index = self._match(os.path.normcase(name))
+        if index is None:
+            return None
+        return self.patterns[index]
+
+    def filter(self, names):
+        """Return the subset of the list NAMES that match any pattern."""
+        matchany = self._matchany
+        if os.path is posixpath:
+            # normcase on posix is NOP. Optimize it away from the loop.
+            return [name for name in names if matchany(name)]
+        return [name for name in names if matchany(os.path.normcase(name))]
+
 def fnmatchcase(name, pat):
     """Test whether FILENAME matches PATTERN, including case.
 
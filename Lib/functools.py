@@ -366,7 +366,7 @@ def _make_key(args, kwds, typed,
         return key[0]
     return _HashedSeq(key)
 
-def lru_cache(maxsize=128, typed=False):
+def lru_cache(maxsize=128, typed=False, *, ttl=None, sizeof=None):
     """Least-recently-used cache decorator.
 
     If *maxsize* is set to None, the LRU features are disabled and the cache
@@ -376,6 +376,13 @@ def lru_cache(maxsize=128, typed=False):
     For example, f(3.0) and f(3) will be treated as distinct calls with
     distinct results.
 
+    If *ttl* is set, results expire *ttl* seconds after they were computed.
+
+    If *sizeof* is set, it is called with each result to estimate its size
+    and *maxsize* bounds the total size of the cached results instead of
+    their number.  For example, sizeof=sys.getsizeof bounds the cache by
+    bytes.  Results larger than *maxsize* are not cached.
+
     Arguments to the cached function must be hashable.
 
     View the cache statistics named tuple (hits, misses, maxsize, currsize)
@@ -391,120 +398,190 @@ def lru_cache(maxsize=128, typed=False):
     # The internals of the lru_cache are encapsulated for thread safety and
     # to allow the implementation to change (including a possible C version).
 
-    # Constants shared by all lru cache instances:
-    sentinel = object()          # unique object used to signal cache misses
-    make_key = _make_key         # build a key from the function arguments
-    PREV, NEXT, KEY, RESULT = 0, 1, 2, 3   # names for the link fields
+    if ttl is not None:
+        if ttl <= 0:
+            raise ValueError('ttl must be positive')
+        from time import monotonic as timer
+    else:
+        timer = None
 
     def decorating_function(user_function):
-        cache = {}
-        hits = misses = 0
-        full = False
-        cache_get = cache.get    # bound method to lookup a key or return None
-        lock = RLock()           # because linkedlist updates aren't threadsafe
-        root = []                # root of the circular doubly linked list
-        root[:] = [root, root, None, None]     # initialize by pointing to self
-
-        if maxsize == 0:
-
-            def wrapper(*args, **kwds):
-                # No caching -- just a statistics update after a successful call
-                nonlocal misses
-                result = user_function(*args, **kwds)
-                misses += 1
-                return result
+        wrapper = _lru_cache_wrapper(user_function, maxsize, typed, ttl,
+                                     sizeof, timer, _CacheInfo)
+        return update_wrapper(wrapper, user_function)
 
-        elif maxsize is None:
+    return decorating_function
 
-            def wrapper(*args, **kwds):
-                # Simple caching without ordering or size limit
-                nonlocal hits, misses
-                key = make_key(args, kwds, typed)
-                result = cache_get(key, sentinel)
-                if result is not sentinel:
-                    hits += 1
-                    return result
-                result = user_function(*args, **kwds)
-                cache[key] = result
-                misses += 1
-                return result
+def _lru_cache_wrapper(user_function, maxsize, typed, ttl, sizeof, timer,
+                       _CacheInfo):
+    # Constants shared by all lru cache instances:
+    sentinel = object()          # unique object used to signal cache misses
+    make_key = _make_key         # build a key from the function arguments
+    PREV, NEXT, KEY, RESULT, SIZE, EXPIRES = 0, 1, 2, 3, 4, 5   # link fields
+
+    cache = {}
+    hits = misses = 0
+    currsize = 0
+    full = False
+    cache_get = cache.get    # bound method to lookup a key or return None
+    lock = RLock()           # because linkedlist updates aren't threadsafe
+    root = []                # root of the circular doubly linked list
+    root[:] = [root, root, None, None]     # initialize by pointing to self
+
+    if maxsize is not None and maxsize <= 0:
+
+        def wrapper(*args, **kwds):
+            # No caching -- just a statistics update after a successful call
+            nonlocal misses
+            result = user_function(*args, **kwds)
+            misses += 1
+            return result
 
-        else:
+    elif ttl is not None or sizeof is not None:
 
-            def wrapper(*args, **kwds):
-                # Size limited caching that tracks accesses by recency
-                nonlocal root, hits, misses, full
-                key = make_key(args, kwds, typed)
-                with lock:
-                    link = cache_get(key)
-                    if link is not None:
+        def wrapper(*args, **kwds):
+            # Caching bounded by the total size of the results, which expire
+            nonlocal hits, misses, currsize
+            key = make_key(args, kwds, typed)
+            now = timer() if ttl is not None else None
+            with lock:
+                link = cache_get(key)
+                if link is not None:
+                    link_prev, link_next, _key, result, size, expires = link
+                    link_prev[NEXT] = link_next
+                    link_next[PREV] = link_prev
+                    if ttl is None or now < expires:
                         # Move the link to the front of the circular queue
-                        link_prev, link_next, _key, result = link
-                        link_prev[NEXT] = link_next
-                        link_next[PREV] = link_prev
                         last = root[PREV]
                         last[NEXT] = root[PREV] = link
                         link[PREV] = last
                         link[NEXT] = root
                         hits += 1
                         return result
-                result = user_function(*args, **kwds)
-                with lock:
-                    if key in cache:
-                        # Getting here means that this same key was added to the
-                        # cache while the lock was released.  Since the link
-                        # update is already done, we need only return the
-                        # computed result and update the count of misses.
-                        pass
-                    elif full:
-                        # Use the old root to store the new key and result.
-                        oldroot = root
-                        oldroot[KEY] = key
-                        oldroot[RESULT] = result
-                        # Empty the oldest link and make it the new root.
-                        # Keep a reference to the old key and old result to
-                        # prevent their ref counts from going to zero during the
-                        # update. That will prevent potentially arbitrary object
-                        # clean-up code (i.e. __del__) from running while we're
-                        # still adjusting the links.
-                        root = oldroot[NEXT]
-                        oldkey = root[KEY]
-                        oldresult = root[RESULT]
-                        root[KEY] = root[RESULT] = None
-                        # Now update the cache dictionary.
-                        del cache[oldkey]
-                        # Save the potentially reentrant cache[key] assignment
-                        # for last, after the root and links have been put in
-                        # a consistent state.
-                        cache[key] = oldroot
-                    else:
-                        # Put result in a new link at the front of the queue.
-                        last = root[PREV]
-                        link = [last, root, key, result]
-                        last[NEXT] = root[PREV] = cache[key] = link
-                        full = (len(cache) >= maxsize)
-                    misses += 1
+                    # The result expired, drop it
+                    del cache[key]
+                    currsize -= size
+            result = user_function(*args, **kwds)
+            size = sizeof(result) if sizeof is not None else 1
+            if size < 0:
+                raise ValueError('sizeof() returned a negative size')
+            expires = timer() + ttl if ttl is not None else None
+            with lock:
+                misses += 1
+                if key in cache or (maxsize is not None and size > maxsize):
+                    # The key was added to the cache while the lock was
+                    # released, or the result would evict everything else.
+                    return result
+                last = root[PREV]
+                link = [last, root, key, result, size, expires]
+                last[NEXT] = root[PREV] = cache[key] = link
+                currsize += size
+                while maxsize is not None and currsize > maxsize:
+                    # Evict the least recently used results.
+                    oldest = root[NEXT]
+                    oldest_next = oldest[NEXT]
+                    root[NEXT] = oldest_next
+                    oldest_next[PREV] = root
+                    del cache[oldest[KEY]]
+                    currsize -= oldest[SIZE]
+            return result
+
+    elif maxsize is None:
+
+        def wrapper(*args, **kwds):
+            # Simple caching without ordering or size limit
+            nonlocal hits, misses
+            key = make_key(args, kwds, typed)
+            result = cache_get(key, sentinel)
+            if result is not sentinel:
+                hits += 1
                 return result
+            result = user_function(*args, **kwds)
+            cache[key] = result
+            misses += 1
+            return result
 
-        def cache_info():
-            """Report cache statistics"""
-            with lock:
-                return _CacheInfo(hits, misses, maxsize, len(cache))
+    else:
 
-        def cache_clear():
-            """Clear the cache and cache statistics"""
-            nonlocal hits, misses, full
+        def wrapper(*args, **kwds):
+            # Size limited caching that tracks accesses by recency
+            nonlocal root, hits, misses, full
+            key = make_key(args, kwds, typed)
+            with lock:
+                link = cache_get(key)
+                if link is not None:
+                    # Move the link to the front of the circular queue
+                    link_prev, link_next, _key, result = link
+                    link_prev[NEXT] = link_next
+                    link_next[PREV] = link_prev
+                    last = root[PREV]
+                    last[NEXT] = root[PREV] = link
+                    link[PREV] = last
+                    link[NEXT] = root
+                    hits += 1
+                    return result
+            result = user_function(*args, **kwds)
             with lock:
-                cache.clear()
-                root[:] = [root, root, None, None]
-                hits = misses = 0
-                full = False
+                if key in cache:
+                    # Getting here means that this same key was added to the
+                    # cache while the lock was released.  Since the link
+                    # update is already done, we need only return the
+                    # computed result and update the count of misses.
+                    pass
+                elif full:
+                    # Use the old root to store the new key and result.
+                    oldroot = root
+                    oldroot[KEY] = key
+                    oldroot[RESULT] = result
+                    # Empty the oldest link and make it the new root.
+                    # Keep a reference to the old key and old result to
+                    # prevent their ref counts from going to zero during the
+                    # update. That will prevent potentially arbitrary object
+                    # clean-up code (i.e. __del__) from running while we're
+                    # still adjusting the links.
+                    root = oldroot[NEXT]
+                    oldkey = root[KEY]
+                    oldresult = root[RESULT]
+                    root[KEY] = root[RESULT] = None
+                    # Now update the cache dictionary.
+                    del cache[oldkey]
+                    # Save the potentially reentrant cache[key] assignment
+                    # for last, after the root and links have been put in
+                    # a consistent state.
+                    cache[key] = oldroot
+                else:
+                    # Put result in a new link at the front of the queue.
+                    last = root[PREV]
+                    link = [last, root, key, result]
+                    last[NEXT] = root[PREV] = cache[key] = link
+                    full = (len(cache) >= maxsize)
+                misses += 1
+            return result
 
-        wrapper.cache_info = cache_info
-        wrapper.cache_clear = cache_clear
-        return update_wrapper(wrapper, user_function)
+    def cache_info():
+        """Report cache statistics"""
+        with lock:
+            if ttl is None and sizeof is None:
+                return _CacheInfo(hits, misses, maxsize, len(cache))
+            return _CacheInfo(hits, misses, maxsize, currsize)
+
+    def cache_clear():
+        """Clear the cache and cache statistics"""
+        nonlocal hits, misses, currsize, full
+        with lock:
+            cache.clear()
+            root[:] = [root, root, None, None]
+            hits = misses = currsize = 0
+            full = False
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    return wrapper
 
-    return decorating_function
+try:
+    from _functools import _lru_cache_wrapper
+except ImportError:
+    pass
 
 
 ################################################################################
@@ -6,7 +6,7 @@ import fnmatch
 
 __all__ = ["glob", "iglob"]
 
-def glob(pathname):
+def glob(pathname, *, recursive=False):
     """Return a list of paths matching a pathname pattern.
 
     The pattern may contain simple shell-style wildcards a la
@@ -14,10 +14,15 @@ def glob(pathname):
     dot are special cases that are not matched by '*' and '?'
     patterns.
 
+    If recursive is true, the pattern '**' will match any files and
+    zero or more directories and subdirectories.
+
+    pathname may also be a list of patterns; each matching path is then
+    returned once.
     """
-    return list(iglob(pathname))
+    return list(iglob(pathname, recursive=recursive))
 
-def iglob(pathname):
+def iglob(pathname, *, recursive=False):
     """Return an iterator which yields the paths matching a pathname pattern.
 
     The pattern may contain simple shell-style wildcards a la
@@ -25,59 +30,358 @@ def iglob(pathname):
     dot are special cases that are not matched by '*' and '?'
     patterns.
 
+    If recursive is true, the pattern '**' will match any files and
+    zero or more directories and subdirectories.
+
+    pathname may also be a list of patterns; each matching path is then
+    yielded once.
     """
-    if not has_magic(pathname):
-        if os.path.lexists(pathname):
-            yield pathname
-        return
-    dirname, basename = os.path.split(pathname)
-    if not dirname:
-        yield from glob1(None, basename)
-        return
-    # `os.path.split()` returns the argument itself as a dirname if it is a
-    # drive or UNC path.  Prevent an infinite recursion if a drive or UNC path
-    # contains magic characters (i.e. r'\\?\C:').
-    if dirname != pathname and has_magic(dirname):
-        dirs = iglob(dirname)
+    if isinstance(pathname, (str, bytes)):
+        pathnames = [pathname]
     else:
-        dirs = [dirname]
-    if has_magic(basename):
-        glob_in_dir = glob1
-    else:
-        glob_in_dir = glob0
-    for dirname in dirs:
-        for name in glob_in_dir(dirname, basename):
-            yield os.path.join(dirname, name)
+        pathnames = list(pathname)
+    return _iglob(pathnames, recursive)
+
+def _iglob(pathnames, recursive):
+    # The patterns are grouped by their anchor (the root or drive, or
+    # nothing for relative patterns) and all the patterns of a group are
+    # matched in a single traversal.
+    seen = set() if len(pathnames) > 1 else None
+    groups = {}
+    for pathname in pathnames:
+        if not has_magic(pathname):
+            if os.path.lexists(pathname):
+                if seen is None:
+                    yield pathname
+                elif pathname not in seen:
+                    seen.add(pathname)
+                    yield pathname
+            continue
+        anchor, parts = _split(pathname)
+        groups.setdefault(anchor, []).append(parts)
+    for anchor, patterns in groups.items():
+        for path in _Selector(patterns, recursive).select_from(anchor):
+            if seen is None:
+                yield path
+            elif path not in seen:
+                seen.add(path)
+                yield path
+
+def _split(pathname):
+    # Split pathname into its anchor and the list of its components.
+    parts = []
+    while True:
+        dirname, basename = os.path.split(pathname)
+        # `os.path.split()` returns the argument itself as a dirname if it
+        # is a drive or UNC path.  Such a path is kept literally even if it
+        # contains magic characters (i.e. r'\\?\C:').
+        if dirname == pathname:
+            break
+        parts.append(basename)
+        pathname = dirname
+        if not pathname:
+            break
+    parts.reverse()
+    return pathname, parts
+
+
+class _Node:
+    """A node in the tree of the path components of several patterns.
+
+    The children of a node match the component following it: literal
+    names, wildcard patterns and '**' (the recursive child, whose
+    node loops on itself for each directory level).
+    """
+
+    def __init__(self):
+        self.literals = {}
+        self.wildcards = {}
+        self.recursive = None
+        self.loop = False
+        self.terminal = False
+        self.matchers = []
+
+    def has_children(self):
+        return bool(self.literals or self.wildcards or
+                    self.recursive is not None or self.loop)
+
+
+class _Selector:
+    """Select the paths matching a set of patterns.
+
+    Each pattern is a sequence of path components.  The patterns are
+    merged in a tree which is matched against the directory tree in a
+    single traversal: each directory is listed at most once, and only
+    if a wildcard or '**' needs its names, and a subdirectory is only
+    entered if some pattern can match below it.
+
+    Subclasses adapt the paths and the file system tests; pathlib uses
+    it for Path.glob() and Path.rglob().
+    """
+
+    # Whether names starting with a dot are only matched by patterns
+    # starting with a dot, and skipped by '**'.
+    hide_dotfiles = True
+    # Whether a trailing '**' matches files as well as directories.
+    recursive_files = True
+    # Whether a name matched by a literal final component is checked with
+    # _exists() even when it was found by listing its directory.
+    check_literals = False
+
+    def __init__(self, patterns, recursive):
+        self.root = root = _Node()
+        for parts in patterns:
+            node = root
+            for part in parts:
+                if recursive and _isrecursive(part):
+                    if node.loop:
+                        # '**/**' is the same as '**'.
+                        continue
+                    if node.recursive is None:
+                        node.recursive = _Node()
+                        node.recursive.loop = True
+                    node = node.recursive
+                elif has_magic(part):
+                    node = node.wildcards.setdefault(part, _Node())
+                else:
+                    node = node.literals.setdefault(part, _Node())
+            node.terminal = True
+        todo = [root]
+        while todo:
+            node = todo.pop()
+            todo.extend(node.literals.values())
+            todo.extend(node.wildcards.values())
+            if node.recursive is not None:
+                todo.append(node.recursive)
+            self._compile(node)
+
+    def _compile(self, node):
+        # Split the wildcards of node between those matching hidden names
+        # and the other ones, and compile each set in a MultiPattern.
+        if not node.wildcards:
+            return
+        items = list(node.wildcards.items())
+        if self.hide_dotfiles:
+            groups = [(False, [i for i in items if not _ishidden(i[0])]),
+                      (True, [i for i in items if _ishidden(i[0])])]
+        else:
+            groups = [(None, items)]
+        for hidden, items in groups:
+            if not items:
+                continue
+            matcher = fnmatch.MultiPattern(p for p, c in items)
+            if len(items) == 1:
+                single = items[0][1]
+            elif not any(c.has_children() for p, c in items):
+                # These are all terminal leaves: any match has the same
+                # result.
+                single = items[0][1]
+            else:
+                single = None
+            node.matchers.append((hidden, matcher, single, items))
+
+    # Hooks adapting the paths and the file system tests.
+
+    def _join(self, path, name):
+        return os.path.join(path, name)
+
+    def _fspath(self, path):
+        if path:
+            return path
+        if isinstance(path, bytes):
+            return bytes(os.curdir, 'ASCII')
+        return os.curdir
+
+    def _exists(self, path):
+        return os.path.lexists(path)
+
+    def _isdir(self, path):
+        return os.path.isdir(path)
+
+    def _dirpath(self, path):
+        # The path to yield for a directory matched by a trailing '**'
+        # itself, or None.
+        if not path:
+            return None
+        return os.path.join(path, path[:0])
+
+    def select_from(self, top):
+        """Iterate over the paths under top matching the patterns."""
+        nodes = {self.root}
+        if self.root.recursive is not None:
+            nodes.add(self.root.recursive)
+        if self.root.terminal and self._exists(top):
+            yield top
+        elif (self.root.recursive is not None and
+              self.root.recursive.terminal and self._isdir(top)):
+            path = self._dirpath(top)
+            if path is not None:
+                yield path
+        stack = [(top, nodes)]
+        while stack:
+            path, nodes = stack.pop()
+            subdirs = []
+            yield from self._select_in(path, nodes, subdirs)
+            subdirs.reverse()
+            stack.extend(subdirs)
+
+    def _select_in(self, dirpath, nodes, subdirs):
+        # Yield the paths in dirpath matched by the nodes, and append the
+        # subdirectories to enter to subdirs, with the nodes active there.
+        hide = self.hide_dotfiles
+        targets = {}
+        entries = {}
+        names = []
+        if any(node.matchers or node.loop for node in nodes):
+            try:
+                with os.scandir(self._fspath(dirpath)) as scandir_it:
+                    for entry in scandir_it:
+                        entries[entry.name] = entry
+                        names.append(entry.name)
+            except OSError:
+                pass
+            if hide:
+                visible = [x for x in names if not _ishidden(x)]
+                hidden = [x for x in names if _ishidden(x)]
+            for node in nodes:
+                for ishidden, matcher, single, items in node.matchers:
+                    if ishidden is None:
+                        candidates = names
+                    elif ishidden:
+                        candidates = hidden
+                    else:
+                        candidates = visible
+                    for name in matcher.filter(candidates):
+                        children = targets.setdefault(name, set())
+                        if single is not None:
+                            children.add(single)
+                            continue
+                        for pattern, child in items:
+                            if fnmatch.fnmatch(name, pattern):
+                                children.add(child)
+                if node.loop:
+                    for name in (visible if hide else names):
+                        targets.setdefault(name, set()).add(node)
+        literals = []
+        checked = set()
+        for node in nodes:
+            for name, child in node.literals.items():
+                if name not in targets and name not in entries:
+                    literals.append(name)
+                elif child.terminal and self.check_literals:
+                    checked.add(name)
+                targets.setdefault(name, set()).add(child)
+        for name in names + literals:
+            children = targets.pop(name, None)
+            if children is None:
+                continue
+            path = self._join(dirpath, name)
+            entry = entries.get(name)
+            isdir = None
+            if entry is not None:
+                try:
+                    isdir = entry.is_dir()
+                except OSError:
+                    isdir = False
+                if (name in checked and not isdir and
+                    not self._exists(path)):
+                    continue
+            elif not name:
+                # A trailing separator only matches directories.
+                if not dirpath:
+                    continue
+                isdir = self._isdir(dirpath)
+                if not isdir:
+                    continue
+            elif any(child.terminal for child in children):
+                if not self._exists(path):
+                    continue
+            else:
+                # Only a directory can match the following components.
+                isdir = self._isdir(path)
+                if not isdir:
+                    continue
+            yielded = False
+            for child in children:
+                if child.terminal:
+                    if not child.loop or self.recursive_files:
+                        yielded = True
+                        break
+                    if isdir is None:
+                        isdir = self._isdir(path)
+                    if isdir:
+                        yielded = True
+                        break
+            if yielded:
+                yield path
+            # The '**' following a component also matches no directory.
+            for child in list(children):
+                recursive = child.recursive
+                if recursive is not None and recursive not in children:
+                    children.add(recursive)
+                    if recursive.terminal and not yielded:
+                        if isdir is None:
+                            isdir = self._isdir(path)
+                        if isdir:
+                            yielded = True
+                            selfpath = self._dirpath(path)
+                            if selfpath is not None:
+                                yield selfpath
+            if any(child.has_children() for child in children):
+                if isdir is None:
+                    isdir = self._isdir(path)
+                if isdir:
+                    subdirs.append((path, children))
+
 
 # These 2 helper functions non-recursively glob inside a literal directory.
 # They return a list of basenames. `glob1` accepts a pattern while `glob0`
 # takes a literal basename (so it only has to check for its existence).
+# If `dironly` is true, only the names of directories are returned.
 
-def glob1(dirname, pattern):
+def glob1(dirname, pattern, dironly=False):
     if not dirname:
         if isinstance(pattern, bytes):
             dirname = bytes(os.curdir, 'ASCII')
         else:
             dirname = os.curdir
     try:
-        names = os.listdir(dirname)
+        names = _listdir(dirname, dironly)
     except OSError:
         return []
     if not _ishidden(pattern):
         names = [x for x in names if not _ishidden(x)]
     return fnmatch.filter(names, pattern)
 
-def glob0(dirname, basename):
+def glob0(dirname, basename, dironly=False):
     if not basename:
         # `os.path.split()` returns an empty basename for paths ending with a
         # directory separator.  'q*x/' should match only directories.
         if os.path.isdir(dirname):
             return [basename]
+    elif dironly:
+        if os.path.isdir(os.path.join(dirname, basename)):
+            return [basename]
     else:
         if os.path.lexists(os.path.join(dirname, basename)):
             return [basename]
     return []
 
+def _listdir(dirname, dironly):
+    if not dironly:
+        return os.listdir(dirname)
+    # The entries usually know whether they are directories without a
+    # stat() call.
+    names = []
+    with os.scandir(dirname) as scandir_it:
+        for entry in scandir_it:
+            try:
+                if entry.is_dir():
+                    names.append(entry.name)
+            except OSError:
+                pass
+    return names
+
 
 magic_check = re.compile('([*?[])')
 magic_check_bytes = re.compile(b'([*?[])')
@@ -89,6 +393,9 @@ def has_magic(s):
         match = magic_check.search(s)
     return match is not None
 
+def _isrecursive(pattern):
+    return pattern in ('**', b'**')
+
 def _ishidden(path):
     return path[0] in ('.', b'.'[0])
 
@@ -1,7 +1,7 @@
 """Functions that read and write gzipped files.
 
 The user of the file doesn't have to worry about the compression,
-but random access is not allowed."""
+but random access is slow unless the file was written with an index."""
 
 # based on Andrew Kuchling's minigzip.py distributed with the zlib module
 
@@ -9,6 +9,8 @@ import struct, sys, time, os
 import zlib
 import builtins
 import io
+import bisect
+import collections
 
 __all__ = ["GzipFile", "open", "compress", "decompress"]
 
@@ -89,41 +91,43 @@ class _PaddedFile:
             return self._buffer[read:] + \
                    self.file.read(size-self._length+read)
 
-    def prepend(self, prepend=b'', readprevious=False):
+    def prepend(self, prepend=b''):
+        # prepend is always the end of the data returned by the last read()
         if self._read is None:
             self._buffer = prepend
-        elif readprevious and len(prepend) <= self._read:
+        else:
             self._read -= len(prepend)
             return
-        else:
-            self._buffer = self._buffer[read:] + prepend
         self._length = len(self._buffer)
         self._read = 0
 
-    def unused(self):
-        if self._read is None:
-            return b''
-        return self._buffer[self._read:]
-
-    def seek(self, offset, whence=0):
-        # This is only ever called with offset=whence=0
-        if whence == 1 and self._read is not None:
-            if 0 <= offset + self._read <= self._length:
-                self._read += offset
-                return
-            else:
-                offset += self._length - self._read
+    def seek(self, offset):
         self._read = None
         self._buffer = None
-        return self.file.seek(offset, whence)
+        return self.file.seek(offset)
 
     def __getattr__(self, name):
         return getattr(self.file, name)
 
 
+def _compress_block(compresslevel, data, zdict):
+    # Compress a block of data as a part of a raw deflate stream, in a
+    # worker thread.  The block may refer to zdict, the data preceding it,
+    # and ends on a byte boundary, so that the compressed blocks can be
+    # concatenated.
+    if zdict:
+        compress = zlib.compressobj(compresslevel, zlib.DEFLATED,
+                                    -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL, 0,
+                                    zdict)
+    else:
+        compress = zlib.compressobj(compresslevel, zlib.DEFLATED,
+                                    -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL, 0)
+    return compress.compress(data) + compress.flush(zlib.Z_SYNC_FLUSH)
+
+
 class GzipFile(io.BufferedIOBase):
     """The GzipFile class simulates most of the methods of a file object with
-    the exception of the readinto() and truncate() methods.
+    the exception of the truncate() method.
 
     This class only supports opening files in binary mode. If you need to open a
     compressed file in text mode, use the gzip.open() function.
@@ -132,9 +136,11 @@ class GzipFile(io.BufferedIOBase):
 
     myfileobj = None
     max_read_chunk = 10 * 1024 * 1024   # 10Mb
+    block_size = 128 * 1024     # Compressed by a thread when threads > 1
 
     def __init__(self, filename=None, mode=None,
-                 compresslevel=9, fileobj=None, mtime=None):
+                 compresslevel=9, fileobj=None, mtime=None,
+                 *, threads=1, index_interval=None, index=None):
         """Constructor for the GzipFile class.
 
         At least one of fileobj and filename must be given a
@@ -171,6 +177,20 @@ class GzipFile(io.BufferedIOBase):
         return value of time.time() and of the st_mtime member of the
         object returned by os.stat().
 
+        When writing, threads is the number of threads compressing the
+        data; if greater than 1, the data is cut in blocks of block_size
+        bytes which are compressed in parallel, each block using the end
+        of the previous one as a preset dictionary.  The result is still a
+        single gzip member.
+
+        If index_interval is given when writing, the compressor is reset
+        about every index_interval bytes of data, so that decompression
+        can start there, and the index attribute is the list of these
+        access points, as (offset, position in fileobj) pairs.  Giving
+        that list as the index argument when reading the file makes
+        seek() jump to the access point preceding the target offset,
+        instead of decompressing everything before it.
+
         """
 
         if mode and ('t' in mode or 'U' in mode):
@@ -188,36 +208,50 @@ class GzipFile(io.BufferedIOBase):
 
         if mode.startswith('r'):
             self.mode = READ
-            # Set flag indicating start of a new member
-            self._new_member = True
-            # Buffer data read from gzip file. extrastart is offset in
-            # stream where buffer starts. extrasize is number of
-            # bytes remaining in buffer from current stream position.
-            self.extrabuf = b""
-            self.extrasize = 0
-            self.extrastart = 0
+            raw = _GzipReader(fileobj, index)
+            self._buffer = io.BufferedReader(raw)
             self.name = filename
-            # Starts small, scales exponentially
-            self.min_readsize = 100
-            fileobj = _PaddedFile(fileobj)
 
         elif mode.startswith(('w', 'a', 'x')):
+            if threads < 1:
+                raise ValueError("threads must be at least 1")
+            if index_interval is not None and index_interval < 1:
+                raise ValueError("index_interval must be at least 1")
             self.mode = WRITE
             self._init_write(filename)
+            self.compresslevel = compresslevel
             self.compress = zlib.compressobj(compresslevel,
                                              zlib.DEFLATED,
                                              -zlib.MAX_WBITS,
                                              zlib.DEF_MEM_LEVEL,
                                              0)
+            self._index_interval = index_interval
+            # Offset of the next access point, or None
+            self._next_access = None
+            self._executor = None
+            if threads > 1:
+                from concurrent.futures import ThreadPoolExecutor
+                self._executor = ThreadPoolExecutor(threads)
+                self._max_pending = 2 * threads
+                # Blocks being compressed, as (future, offset) pairs where
+                # offset is None unless the block starts an access point
+                self._pending = collections.deque()
+                self._blockbuf = bytearray()
+                self._blockstart = 0    # Offset of the data in _blockbuf
+                self._zdict = b""
         else:
             raise ValueError("Invalid mode: {!r}".format(mode))
 
         self.fileobj = fileobj
         self.offset = 0
-        self.mtime = mtime
+        self._write_mtime = mtime
 
         if self.mode == WRITE:
             self._write_gzip_header()
+            self.index = None
+            if index_interval is not None:
+                self.index = [(0, self.fileobj.tell())]
+                self._next_access = index_interval
 
     @property
     def filename(self):
@@ -227,11 +261,16 @@ class GzipFile(io.BufferedIOBase):
             return self.name + ".gz"
         return self.name
 
+    @property
+    def mtime(self):
+        """Last modification time read from the stream when reading, or
+        the mtime argument when writing."""
+        if self.mode == READ:
+            return self._buffer.raw._last_mtime
+        return self._write_mtime
+
     def __repr__(self):
-        fileobj = self.fileobj
-        if isinstance(fileobj, _PaddedFile):
-            fileobj = fileobj.file
-        s = repr(fileobj)
+        s = repr(self.fileobj)
         return '<gzip ' + s[1:-1] + ' ' + hex(id(self)) + '>'
 
     def _check_closed(self):
@@ -265,7 +304,7 @@ class GzipFile(io.BufferedIOBase):
         if fname:
             flags = FNAME
         self.fileobj.write(chr(flags).encode('latin-1'))
-        mtime = self.mtime
+        mtime = self._write_mtime
         if mtime is None:
             mtime = time.time()
         write32u(self.fileobj, int(mtime))
@@ -274,57 +313,6 @@ class GzipFile(io.BufferedIOBase):
         if fname:
             self.fileobj.write(fname + b'\000')
 
-    def _init_read(self):
-        self.crc = zlib.crc32(b"") & 0xffffffff
-        self.size = 0
-
-    def _read_exact(self, n):
-        data = self.fileobj.read(n)
-        while len(data) < n:
-            b = self.fileobj.read(n - len(data))
-            if not b:
-                raise EOFError("Compressed file ended before the "
-                               "end-of-stream marker was reached")
-            data += b
-        return data
-
-    def _read_gzip_header(self):
-        magic = self.fileobj.read(2)
-        if magic == b'':
-            return False
-
-        if magic != b'\037\213':
-            raise OSError('Not a gzipped file')
-
-        method, flag, self.mtime = struct.unpack("<BBIxx", self._read_exact(8))
-        if method != 8:
-            raise OSError('Unknown compression method')
-
-        if flag & FEXTRA:
-            # Read & discard the extra field, if present
-            extra_len, = struct.unpack("<H", self._read_exact(2))
-            self._read_exact(extra_len)
-        if flag & FNAME:
-            # Read and discard a null-terminated string containing the filename
-            while True:
-                s = self.fileobj.read(1)
-                if not s or s==b'\000':
-                    break
-        if flag & FCOMMENT:
-            # Read and discard a null-terminated string containing a comment
-            while True:
-                s = self.fileobj.read(1)
-                if not s or s==b'\000':
-                    break
-        if flag & FHCRC:
-            self._read_exact(2)     # Read & discard the 16-bit header CRC
-
-        unused = self.fileobj.unused()
-        if unused:
-            uncompress = self.decompress.decompress(unused)
-            self._add_read_data(uncompress)
-        return True
-
     def write(self,data):
         self._check_closed()
         if self.mode != WRITE:
@@ -341,159 +329,128 @@ class GzipFile(io.BufferedIOBase):
         if len(data) > 0:
             self.size = self.size + len(data)
             self.crc = zlib.crc32(data, self.crc) & 0xffffffff
-            self.fileobj.write( self.compress.compress(data) )
+            if self._executor is not None:
+                self._write_blocks(data)
+            elif self._next_access is None:
+                self.fileobj.write( self.compress.compress(data) )
+            else:
+                # Cut the data at the access points
+                view = memoryview(data)
+                offset = self.offset
+                while view:
+                    if offset == self._next_access:
+                        self.fileobj.write(
+                            self.compress.flush(zlib.Z_FULL_FLUSH))
+                        self._add_access_point(offset)
+                    n = len(view)
+                    if self._next_access is not None:
+                        n = min(n, self._next_access - offset)
+                    self.fileobj.write(self.compress.compress(view[:n]))
+                    offset += n
+                    view = view[n:]
             self.offset += len(data)
 
         return len(data)
 
+    def _add_access_point(self, offset):
+        # Record an access point at offset, the compressor having just
+        # been reset
+        if self.index is not None and self.index[-1][0] != offset:
+            self.index.append((offset, self.fileobj.tell()))
+        if self._index_interval is not None:
+            self._next_access = offset + self._index_interval
+        else:
+            self._next_access = None
+
+    def _write_blocks(self, data):
+        # Buffer data and hand the complete blocks to the threads
+        buf = self._blockbuf
+        buf += data
+        while True:
+            start = self._blockstart
+            n = self.block_size
+            end = self._next_access
+            if end == start and self._index_interval is not None:
+                end = start + self._index_interval
+            if end is not None and end > start:
+                n = min(n, end - start)
+            if len(buf) < n:
+                break
+            self._submit_block(start, bytes(buf[:n]))
+            del buf[:n]
+            self._blockstart += n
+
+    def _submit_block(self, start, block):
+        # Start compressing a block beginning at offset start
+        access = None
+        zdict = self._zdict
+        if start == self._next_access:
+            # The block starts an access point
+            access = start
+            zdict = b""
+            if self._index_interval is not None:
+                self._next_access = start + self._index_interval
+            else:
+                self._next_access = None
+        future = self._executor.submit(_compress_block, self.compresslevel,
+                                       block, zdict)
+        self._pending.append((future, access))
+        self._zdict = block[-(1 << zlib.MAX_WBITS):]
+        while len(self._pending) > self._max_pending:
+            self._write_pending()
+
+    def _write_pending(self):
+        # Write the compressed data of the oldest block
+        future, access = self._pending.popleft()
+        data = future.result()
+        if access is not None and self.index is not None:
+            if self.index[-1][0] != access:
+                self.index.append((access, self.fileobj.tell()))
+        self.fileobj.write(data)
+
+    def _flush_blocks(self):
+        # Compress the buffered data and write all the pending blocks
+        if self._blockbuf:
+            self._submit_block(self._blockstart, bytes(self._blockbuf))
+            self._blockstart += len(self._blockbuf)
+            del self._blockbuf[:]
+        while self._pending:
+            self._write_pending()
+
     def read(self, size=-1):
         self._check_closed()
         if self.mode != READ:
             import errno
             raise OSError(errno.EBADF, "read() on write-only GzipFile object")
-
-        if self.extrasize <= 0 and self.fileobj is None:
-            return b''
-
-        readsize = 1024
-        if size < 0:        # get the whole thing
-            while self._read(readsize):
-                readsize = min(self.max_read_chunk, readsize * 2)
-            size = self.extrasize
-        else:               # just get some more of it
-            while size > self.extrasize:
-                if not self._read(readsize):
-                    if size > self.extrasize:
-                        size = self.extrasize
-                    break
-                readsize = min(self.max_read_chunk, readsize * 2)
-
-        offset = self.offset - self.extrastart
-        chunk = self.extrabuf[offset: offset + size]
-        self.extrasize = self.extrasize - size
-
-        self.offset += size
-        return chunk
+        return self._buffer.read(size)
 
     def read1(self, size=-1):
+        """Implements BufferedIOBase.read1()
+
+        Reads up to a buffer's worth of data if size is negative."""
         self._check_closed()
         if self.mode != READ:
             import errno
             raise OSError(errno.EBADF, "read1() on write-only GzipFile object")
 
-        if self.extrasize <= 0 and self.fileobj is None:
-            return b''
-
-        # For certain input data, a single call to _read() may not return
-        # any data. In this case, retry until we get some data or reach EOF.
-        while self.extrasize <= 0 and self._read():
-            pass
-        if size < 0 or size > self.extrasize:
-            size = self.extrasize
+        if size < 0:
+            size = io.DEFAULT_BUFFER_SIZE
+        return self._buffer.read1(size)
 
-        offset = self.offset - self.extrastart
-        chunk = self.extrabuf[offset: offset + size]
-        self.extrasize -= size
-        self.offset += size
-        return chunk
+    def readinto(self, b):
+        self._check_closed()
+        if self.mode != READ:
+            import errno
+            raise OSError(errno.EBADF,
+                          "readinto() on write-only GzipFile object")
+        return self._buffer.readinto(b)
 
     def peek(self, n):
+        self._check_closed()
         if self.mode != READ:
             import errno
             raise OSError(errno.EBADF, "peek() on write-only GzipFile object")
-
-        # Do not return ridiculously small buffers, for one common idiom
-        # is to call peek(1) and expect more bytes in return.
-        if n < 100:
-            n = 100
-        if self.extrasize == 0:
-            if self.fileobj is None:
-                return b''
-            # Ensure that we don't return b"" if we haven't reached EOF.
-            # 1024 is the same buffering heuristic used in read()
-            while self.extrasize == 0 and self._read(max(n, 1024)):
-                pass
-        offset = self.offset - self.extrastart
-        remaining = self.extrasize
-        assert remaining == len(self.extrabuf) - offset
-        return self.extrabuf[offset:offset + n]
-
-    def _unread(self, buf):
-        self.extrasize = len(buf) + self.extrasize
-        self.offset -= len(buf)
-
-    def _read(self, size=1024):
-        if self.fileobj is None:
-            return False
-
-        if self._new_member:
-            # If the _new_member flag is set, we have to
-            # jump to the next member, if there is one.
-            self._init_read()
-            if not self._read_gzip_header():
-                return False
-            self.decompress = zlib.decompressobj(-zlib.MAX_WBITS)
-            self._new_member = False
-
-        # Read a chunk of data from the file
-        buf = self.fileobj.read(size)
-
-        # If the EOF has been reached, flush the decompression object
-        # and mark this object as finished.
-
-        if buf == b"":
-            uncompress = self.decompress.flush()
-            # Prepend the already read bytes to the fileobj to they can be
-            # seen by _read_eof()
-            self.fileobj.prepend(self.decompress.unused_data, True)
-            self._read_eof()
-            self._add_read_data( uncompress )
-            return False
-
-        uncompress = self.decompress.decompress(buf)
-        self._add_read_data( uncompress )
-
-        if self.decompress.unused_data != b"":
-            # Ending case: we've come to the end of a member in the file,
-            # so seek back to the start of the unused data, finish up
-            # this member, and read a new gzip header.
-            # Prepend the already read bytes to the fileobj to they can be
-            # seen by _read_eof() and _read_gzip_header()
-            self.fileobj.prepend(self.decompress.unused_data, True)
-            # Check the CRC and file size, and set the flag so we read
-            # a new member on the next call
-            self._read_eof()
-            self._new_member = True
-        return True
-
-    def _add_read_data(self, data):
-        self.crc = zlib.crc32(data, self.crc) & 0xffffffff
-        offset = self.offset - self.extrastart
-        self.extrabuf = self.extrabuf[offset:] + data
-        self.extrasize = self.extrasize + len(data)
-        self.extrastart = self.offset
-        self.size = self.size + len(data)
-
-    def _read_eof(self):
-        # We've read to the end of the file
-        # We check the that the computed CRC and size of the
-        # uncompressed data matches the stored values.  Note that the size
-        # stored is the true file size mod 2**32.
-        crc32, isize = struct.unpack("<II", self._read_exact(8))
-        if crc32 != self.crc:
-            raise OSError("CRC check failed %s != %s" % (hex(crc32),
-                                                         hex(self.crc)))
-        elif isize != (self.size & 0xffffffff):
-            raise OSError("Incorrect length of data produced")
-
-        # Gzip files can be padded with zeroes and still have archives.
-        # Consume all zero bytes and set the file position to the first
-        # non-zero byte. See http://www.gzip.org/#faq8
-        c = b"\x00"
-        while c == b"\x00":
-            c = self.fileobj.read(1)
-        if c:
-            self.fileobj.prepend(c, True)
+        return self._buffer.peek(n)
 
     @property
     def closed(self):
@@ -503,12 +460,23 @@ class GzipFile(io.BufferedIOBase):
         if self.fileobj is None:
             return
         if self.mode == WRITE:
-            self.fileobj.write(self.compress.flush())
+            if self._executor is not None:
+                try:
+                    self._flush_blocks()
+                finally:
+                    self._executor.shutdown()
+                # An empty final block ends the deflate stream
+                self.fileobj.write(zlib.compressobj(self.compresslevel,
+                                                    zlib.DEFLATED,
+                                                    -zlib.MAX_WBITS).flush())
+            else:
+                self.fileobj.write(self.compress.flush())
             write32u(self.fileobj, self.crc)
             # self.size may exceed 2GB, or even 4GB
             write32u(self.fileobj, self.size & 0xffffffff)
             self.fileobj = None
         elif self.mode == READ:
+            self._buffer.close()
             self.fileobj = None
         if self.myfileobj:
             self.myfileobj.close()
@@ -518,7 +486,15 @@ class GzipFile(io.BufferedIOBase):
         self._check_closed()
         if self.mode == WRITE:
             # Ensure the compressor's buffer is flushed
-            self.fileobj.write(self.compress.flush(zlib_mode))
+            if self._executor is not None:
+                self._flush_blocks()
+                if zlib_mode == zlib.Z_FULL_FLUSH:
+                    # The next block is compressed without dictionary
+                    self._next_access = self.offset
+            else:
+                self.fileobj.write(self.compress.flush(zlib_mode))
+                if zlib_mode == zlib.Z_FULL_FLUSH and self.index is not None:
+                    self._add_access_point(self.offset)
             self.fileobj.flush()
 
     def fileno(self):
@@ -534,12 +510,7 @@ class GzipFile(io.BufferedIOBase):
         beginning of the file'''
         if self.mode != READ:
             raise OSError("Can't rewind in write mode")
-        self.fileobj.seek(0)
-        self._new_member = True
-        self.extrabuf = b""
-        self.extrasize = 0
-        self.extrastart = 0
-        self.offset = 0
+        self._buffer.seek(0)
 
     def readable(self):
         return self.mode == READ
@@ -553,7 +524,7 @@ class GzipFile(io.BufferedIOBase):
     def seek(self, offset, whence=0):
         if whence:
             if whence == 1:
-                offset = self.offset + offset
+                offset = self.tell() + offset
             else:
                 raise ValueError('Seek from end not supported')
         if self.mode == WRITE:
@@ -565,54 +536,245 @@ class GzipFile(io.BufferedIOBase):
                 self.write(chunk)
             self.write(bytes(count % 1024))
         elif self.mode == READ:
-            if offset < self.offset:
-                # for negative seek, rewind and do positive seek
-                self.rewind()
-            count = offset - self.offset
-            for i in range(count // 1024):
-                self.read(1024)
-            self.read(count % 1024)
+            self._check_closed()
+            return self._buffer.seek(offset)
 
         return self.offset
 
+    def tell(self):
+        self._check_closed()
+        if self.mode == READ:
+            return self._buffer.tell()
+        return self.offset
+
     def readline(self, size=-1):
+        self._check_closed()
+        if self.mode != READ:
+            import errno
+            raise OSError(errno.EBADF,
+                          "readline() on write-only GzipFile object")
+        return self._buffer.readline(size)
+
+    def __next__(self):
+        self._check_closed()
+        if self.mode != READ:
+            return super().__next__()
+        # Skip readline() and its checks for each line
+        line = self._buffer.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+
+class _GzipReader(io.RawIOBase):
+    """Raw stream of the data decompressed from a gzip file, read by the
+    io.BufferedReader of a GzipFile.
+
+    The decompressor is never asked for more data than the caller wants,
+    so no decompressed data has to be kept between calls.
+    """
+
+    def __init__(self, fp, index=None):
+        self._fp = _PaddedFile(fp)
+        # Access points of an index built when writing, see GzipFile
+        self._index = sorted(index) if index else []
+        self._new_member = True
+        self._last_mtime = None
+        self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        self._pos = 0           # Offset in the decompressed data
+        self._init_read()
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def close(self):
+        self._fp = None
+        self._decompressor = None
+        super().close()
+
+    def tell(self):
+        return self._pos
+
+    def _init_read(self):
+        self._crc = zlib.crc32(b"") & 0xffffffff
+        self._stream_size = 0   # Decompressed size of the current member
+        # Cleared when the data is read from an access point of the index
+        self._check_crc = True
+
+    def _read_exact(self, n):
+        data = self._fp.read(n)
+        while len(data) < n:
+            b = self._fp.read(n - len(data))
+            if not b:
+                raise EOFError("Compressed file ended before the "
+                               "end-of-stream marker was reached")
+            data += b
+        return data
+
+    def _read_gzip_header(self):
+        magic = self._fp.read(2)
+        if magic == b'':
+            return False
+
+        if magic != b'\037\213':
+            raise OSError('Not a gzipped file')
+
+        method, flag, self._last_mtime = struct.unpack(
+            "<BBIxx", self._read_exact(8))
+        if method != 8:
+            raise OSError('Unknown compression method')
+
+        if flag & FEXTRA:
+            # Read & discard the extra field, if present
+            extra_len, = struct.unpack("<H", self._read_exact(2))
+            self._read_exact(extra_len)
+        if flag & FNAME:
+            # Read and discard a null-terminated string containing the filename
+            while True:
+                s = self._fp.read(1)
+                if not s or s==b'\000':
+                    break
+        if flag & FCOMMENT:
+            # Read and discard a null-terminated string containing a comment
+            while True:
+                s = self._fp.read(1)
+                if not s or s==b'\000':
+                    break
+        if flag & FHCRC:
+            self._read_exact(2)     # Read & discard the 16-bit header CRC
+        return True
+
+    def readinto(self, b):
+        with memoryview(b) as view, view.cast("B") as byte_view:
+            data = self.read(len(byte_view))
+            byte_view[:len(data)] = data
+        return len(data)
+
+    def read(self, size=-1):
         if size < 0:
-            # Shortcut common case - newline found in buffer.
-            offset = self.offset - self.extrastart
-            i = self.extrabuf.find(b'\n', offset) + 1
-            if i > 0:
-                self.extrasize -= i - offset
-                self.offset += i - offset
-                return self.extrabuf[offset: i]
-
-            size = sys.maxsize
-            readsize = self.min_readsize
-        else:
-            readsize = size
-        bufs = []
-        while size != 0:
-            c = self.read(readsize)
-            i = c.find(b'\n')
-
-            # We set i=size to break out of the loop under two
-            # conditions: 1) there's no newline, and the chunk is
-            # larger than size, or 2) there is a newline, but the
-            # resulting line would be longer than 'size'.
-            if (size <= i) or (i == -1 and len(c) > size):
-                i = size - 1
-
-            if i >= 0 or c == b'':
-                bufs.append(c[:i + 1])    # Add portion of last chunk
-                self._unread(c[i + 1:])   # Push back rest of chunk
+            return self.readall()
+        # decompress() does not support a max_length of 0
+        if not size:
+            return b""
+
+        # For certain input data, a single call to decompress() may not
+        # return any data. In this case, retry until we get some data or
+        # reach EOF.
+        while True:
+            if self._decompressor.eof:
+                # Ending case: we've come to the end of a member in the file,
+                # so finish up this member, and read a new gzip header.
+                # Check the CRC and file size, and set the flag so we read
+                # a new member
+                self._read_eof()
+                self._new_member = True
+                self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+
+            if self._new_member:
+                # If the _new_member flag is set, we have to
+                # jump to the next member, if there is one.
+                self._init_read()
+                if not self._read_gzip_header():
+                    return b""
+                self._new_member = False
+
+            # Read a chunk of data from the file
+            buf = self._fp.read(io.DEFAULT_BUFFER_SIZE)
+
+            uncompress = self._decompressor.decompress(buf, size)
+            if self._decompressor.unconsumed_tail != b"":
+                self._fp.prepend(self._decompressor.unconsumed_tail)
+            elif self._decompressor.unused_data != b"":
+                # Prepend the already read bytes to the fileobj so they can
+                # be seen by _read_eof() and _read_gzip_header()
+                self._fp.prepend(self._decompressor.unused_data)
+
+            if uncompress != b"":
+                break
+            if buf == b"":
+                raise EOFError("Compressed file ended before the "
+                               "end-of-stream marker was reached")
+
+        self._crc = zlib.crc32(uncompress, self._crc) & 0xffffffff
+        self._stream_size += len(uncompress)
+        self._pos += len(uncompress)
+        return uncompress
+
+    def readall(self):
+        chunks = []
+        while True:
+            data = self.read(GzipFile.max_read_chunk)
+            if not data:
                 break
+            chunks.append(data)
+        return b"".join(chunks)
 
-            # Append chunk to list, decrease 'size',
-            bufs.append(c)
-            size = size - len(c)
-            readsize = min(size, readsize * 2)
-        if readsize > self.min_readsize:
-            self.min_readsize = min(readsize, self.min_readsize * 2, 512)
-        return b''.join(bufs) # Return resulting line
+    def _read_eof(self):
+        # We've read to the end of the file
+        # We check the that the computed CRC and size of the
+        # uncompressed data matches the stored values.  Note that the size
+        # stored is the true file size mod 2**32.
+        crc32, isize = struct.unpack("<II", self._read_exact(8))
+        if not self._check_crc:
+            # Only a part of the member was read
+            pass
+        elif crc32 != self._crc:
+            raise OSError("CRC check failed %s != %s" % (hex(crc32),
+                                                         hex(self._crc)))
+        elif isize != (self._stream_size & 0xffffffff):
+            raise OSError("Incorrect length of data produced")
+
+        # Gzip files can be padded with zeroes and still have archives.
+        # Consume all zero bytes and set the file position to the first
+        # non-zero byte. See http://www.gzip.org/#faq8
+        c = b"\x00"
+        while c == b"\x00":
+            c = self._fp.read(1)
+        if c:
+            self._fp.prepend(c)
+
+    def _rewind(self):
+        self._fp.seek(0)
+        self._new_member = True
+        self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        self._pos = 0
+
+    def seek(self, offset, whence=0):
+        if whence == 1:
+            offset = self._pos + offset
+        elif whence != 0:
+            raise ValueError('Seek from end not supported')
+
+        if self._index:
+            self._seek_index(offset)
+        if offset < self._pos:
+            # for negative seek, rewind and do positive seek
+            self._rewind()
+
+        # Read and discard data until we reach the desired position
+        while self._pos < offset:
+            if not self.read(min(io.DEFAULT_BUFFER_SIZE, offset - self._pos)):
+                break
+        return self._pos
+
+    def _seek_index(self, offset):
+        # Jump to the access point of the index preceding offset, unless
+        # reading forward from the current offset is shorter
+        i = bisect.bisect_right(self._index, (offset, float('inf'))) - 1
+        if i < 0:
+            return
+        start, position = self._index[i]
+        if self._pos <= offset and start <= self._pos:
+            return
+        self._fp.seek(position)
+        self._init_read()
+        self._check_crc = False
+        self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        self._new_member = False
+        self._pos = start
 
 
 def compress(data, compresslevel=9):
@@ -816,8 +816,16 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
         -- note however that this the default server uses this
         to copy binary data as well.
 
+        Data written to self.wfile is sent with the sendfile() method
+        of the connection, which lets the kernel copy regular files
+        to the socket directly.
+
         """
-        shutil.copyfileobj(source, outputfile)
+        if outputfile is self.wfile and hasattr(self.connection, 'sendfile'):
+            outputfile.flush()
+            self.connection.sendfile(source)
+        else:
+            shutil.copyfileobj(source, outputfile)
 
     def guess_type(self, path):
         """Guess the type of a file.
@@ -97,7 +97,7 @@ Using json.tool from the shell to validate and pretty-print::
 """
 __version__ = '2.0.9'
 __all__ = [
-    'dump', 'dumps', 'load', 'loads',
+    'dump', 'dumps', 'load', 'loads', 'iterload',
     'JSONDecoder', 'JSONEncoder',
 ]
 
@@ -105,6 +105,14 @@ __author__ = 'Bob Ippolito <bob@redivi.com>'
 
 from .decoder import JSONDecoder
 from .encoder import JSONEncoder
+import functools
+import itertools
+
+# Number of encoder chunks written at once by dump().
+_DUMP_BATCH_SIZE = 1024
+
+# Number of characters read at once by iterload().
+_LOAD_CHUNK_SIZE = 65536
 
 _default_encoder = JSONEncoder(
     skipkeys=False,
@@ -173,10 +181,14 @@ def dump(obj, fp, skipkeys=False, ensure_ascii=True, check_circular=True,
             check_circular=check_circular, allow_nan=allow_nan, indent=indent,
             separators=separators,
             default=default, sort_keys=sort_keys, **kw).iterencode(obj)
-    # could accelerate with writelines in some versions of Python, at
-    # a debuggability cost
-    for chunk in iterable:
-        fp.write(chunk)
+    # The encoder produces many small chunks: join them in batches to
+    # write them with fewer calls.
+    iterable = iter(iterable)
+    while True:
+        chunks = list(itertools.islice(iterable, _DUMP_BATCH_SIZE))
+        if not chunks:
+            break
+        fp.write(''.join(chunks))
 
 
 def dumps(obj, skipkeys=False, ensure_ascii=True, check_circular=True,
@@ -268,6 +280,37 @@ def load(fp, cls=None, object_hook=None, parse_float=None,
         parse_constant=parse_constant, object_pairs_hook=object_pairs_hook, **kw)
 
 
+def iterload(fp, *, items=False, cls=None, object_hook=None, parse_float=None,
+        parse_int=None, parse_constant=None, object_pairs_hook=None, **kw):
+    """Deserialize the JSON documents of ``fp`` (a ``.read()``-supporting
+    file-like object, e.g. a file in JSON Lines format or a socket's
+    ``makefile()``) and return an iterator over their Python
+    representations.
+
+    The documents are separated by optional whitespace.  If ``items`` is
+    true, ``fp`` must contain a single JSON array and the iterator yields
+    its elements instead.  ``fp`` is read in chunks and only the data of
+    the document being decoded is kept in memory.
+
+    The other arguments have the same meaning as in ``load()``.
+
+    """
+    if cls is None:
+        cls = JSONDecoder
+    if object_hook is not None:
+        kw['object_hook'] = object_hook
+    if object_pairs_hook is not None:
+        kw['object_pairs_hook'] = object_pairs_hook
+    if parse_float is not None:
+        kw['parse_float'] = parse_float
+    if parse_int is not None:
+        kw['parse_int'] = parse_int
+    if parse_constant is not None:
+        kw['parse_constant'] = parse_constant
+    chunks = iter(functools.partial(fp.read, _LOAD_CHUNK_SIZE), '')
+    return cls(**kw).iterdecode(chunks, items=items)
+
+
 def loads(s, encoding=None, cls=None, object_hook=None, parse_float=None,
         parse_int=None, parse_constant=None, object_pairs_hook=None, **kw):
     """Deserialize ``s`` (a ``str`` instance containing a JSON
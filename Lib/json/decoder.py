@@ -45,6 +45,21 @@ def errmsg(msg, doc, pos, end=None):
     #return fmt % (msg, lineno, colno, endlineno, endcolno, pos, end)
 
 
+class _DecodeError(ValueError):
+    # The ValueError raised for invalid JSON, which also knows the message
+    # and the position of the error, as passed to errmsg().  iterdecode()
+    # uses them to tell truncated documents from invalid ones.
+
+    def __init__(self, msg, doc, pos, end=None):
+        ValueError.__init__(self, errmsg(msg, doc, pos, end))
+        self.msg = msg
+        self.pos = pos
+        self.end = end
+
+    def __reduce__(self):
+        return ValueError, self.args
+
+
 _CONSTANTS = {
     '-Infinity': NegInf,
     'Infinity': PosInf,
@@ -52,6 +67,9 @@ _CONSTANTS = {
 }
 
 
+# Matches the rest of the data if a number decoded from it may be truncated.
+NUMBER_TAIL = re.compile(r'[0-9.eE+-]*\Z', FLAGS)
+
 STRINGCHUNK = re.compile(r'(.*?)(["\\\x00-\x1f])', FLAGS)
 BACKSLASH = {
     '"': '"', '\\': '\\', '/': '/',
@@ -66,7 +84,7 @@ def _decode_uXXXX(s, pos):
         except ValueError:
             pass
     msg = "Invalid \\uXXXX escape"
-    raise ValueError(errmsg(msg, s, pos))
+    raise _DecodeError(msg, s, pos)
 
 def py_scanstring(s, end, strict=True,
         _b=BACKSLASH, _m=STRINGCHUNK.match):
@@ -84,8 +102,7 @@ def py_scanstring(s, end, strict=True,
     while 1:
         chunk = _m(s, end)
         if chunk is None:
-            raise ValueError(
-                errmsg("Unterminated string starting at", s, begin))
+            raise _DecodeError("Unterminated string starting at", s, begin)
         end = chunk.end()
         content, terminator = chunk.groups()
         # Content is contains zero or more unescaped string characters
@@ -99,22 +116,21 @@ def py_scanstring(s, end, strict=True,
             if strict:
                 #msg = "Invalid control character %r at" % (terminator,)
                 msg = "Invalid control character {0!r} at".format(terminator)
-                raise ValueError(errmsg(msg, s, end))
+                raise _DecodeError(msg, s, end)
             else:
                 _append(terminator)
                 continue
         try:
             esc = s[end]
         except IndexError:
-            raise ValueError(
-                errmsg("Unterminated string starting at", s, begin))
+            raise _DecodeError("Unterminated string starting at", s, begin)
         # If not a unicode escape sequence, must be in the lookup table
         if esc != 'u':
             try:
                 char = _b[esc]
             except KeyError:
                 msg = "Invalid \\escape: {0!r}".format(esc)
-                raise ValueError(errmsg(msg, s, end))
+                raise _DecodeError(msg, s, end)
             end += 1
         else:
             uni = _decode_uXXXX(s, end)
@@ -163,8 +179,8 @@ def JSONObject(s_and_end, strict, scan_once, object_hook, object_pairs_hook,
                 pairs = object_hook(pairs)
             return pairs, end + 1
         elif nextchar != '"':
-            raise ValueError(errmsg(
-                "Expecting property name enclosed in double quotes", s, end))
+            raise _DecodeError(
+                "Expecting property name enclosed in double quotes", s, end)
     end += 1
     while True:
         key, end = scanstring(s, end, strict)
@@ -174,7 +190,7 @@ def JSONObject(s_and_end, strict, scan_once, object_hook, object_pairs_hook,
         if s[end:end + 1] != ':':
             end = _w(s, end).end()
             if s[end:end + 1] != ':':
-                raise ValueError(errmsg("Expecting ':' delimiter", s, end))
+                raise _DecodeError("Expecting ':' delimiter", s, end)
         end += 1
 
         try:
@@ -188,7 +204,7 @@ def JSONObject(s_and_end, strict, scan_once, object_hook, object_pairs_hook,
         try:
             value, end = scan_once(s, end)
         except StopIteration as err:
-            raise ValueError(errmsg("Expecting value", s, err.value)) from None
+            raise _DecodeError("Expecting value", s, err.value) from None
         pairs_append((key, value))
         try:
             nextchar = s[end]
@@ -202,13 +218,13 @@ def JSONObject(s_and_end, strict, scan_once, object_hook, object_pairs_hook,
         if nextchar == '}':
             break
         elif nextchar != ',':
-            raise ValueError(errmsg("Expecting ',' delimiter", s, end - 1))
+            raise _DecodeError("Expecting ',' delimiter", s, end - 1)
         end = _w(s, end).end()
         nextchar = s[end:end + 1]
         end += 1
         if nextchar != '"':
-            raise ValueError(errmsg(
-                "Expecting property name enclosed in double quotes", s, end - 1))
+            raise _DecodeError(
+                "Expecting property name enclosed in double quotes", s, end - 1)
     if object_pairs_hook is not None:
         result = object_pairs_hook(pairs)
         return result, end
@@ -232,7 +248,7 @@ def JSONArray(s_and_end, scan_once, _w=WHITESPACE.match, _ws=WHITESPACE_STR):
         try:
             value, end = scan_once(s, end)
         except StopIteration as err:
-            raise ValueError(errmsg("Expecting value", s, err.value)) from None
+            raise _DecodeError("Expecting value", s, err.value) from None
         _append(value)
         nextchar = s[end:end + 1]
         if nextchar in _ws:
@@ -242,7 +258,7 @@ def JSONArray(s_and_end, scan_once, _w=WHITESPACE.match, _ws=WHITESPACE_STR):
         if nextchar == ']':
             break
         elif nextchar != ',':
-            raise ValueError(errmsg("Expecting ',' delimiter", s, end - 1))
+            raise _DecodeError("Expecting ',' delimiter", s, end - 1)
         try:
             if s[end] in _ws:
                 end += 1
@@ -343,7 +359,7 @@ class JSONDecoder(object):
         obj, end = self.raw_decode(s, idx=_w(s, 0).end())
         end = _w(s, end).end()
         if end != len(s):
-            raise ValueError(errmsg("Extra data", s, end, len(s)))
+            raise _DecodeError("Extra data", s, end, len(s))
         return obj
 
     def raw_decode(self, s, idx=0):
@@ -358,5 +374,148 @@ class JSONDecoder(object):
         try:
             obj, end = self.scan_once(s, idx)
         except StopIteration as err:
-            raise ValueError(errmsg("Expecting value", s, err.value)) from None
+            raise _DecodeError("Expecting value", s, err.value) from None
         return obj, end
+
+    def iterdecode(self, chunks, items=False, _w=WHITESPACE.match,
+                   _tail=NUMBER_TAIL.match):
+        """Decode the JSON documents of ``chunks`` (an iterable of ``str``
+        instances, e.g. read from a file or a socket) and yield their
+        Python representations one at a time.
+
+        The documents are separated by optional whitespace, as in the JSON
+        Lines format.  If ``items`` is true, the chunks instead make up a
+        single JSON array whose elements are yielded.
+
+        Only the data of the document being decoded is kept in memory; a
+        document split between chunks is decoded once enough of it has
+        been read.
+
+        """
+        chunks = iter(chunks)
+        scan_once = self.scan_once
+        buf = ''
+        pos = 0
+        eof = False
+        # The number of characters dropped from the start of buf, of
+        # newlines among them, and of characters after the last one.
+        dropped = lines = column = 0
+
+        def read(size):
+            # Make at least size characters available after pos, unless
+            # the end of the chunks is reached, and drop the data before pos.
+            nonlocal buf, pos, eof, dropped, lines, column
+            count = buf.count('\n', 0, pos)
+            if count:
+                lines += count
+                column = pos - buf.rindex('\n', 0, pos) - 1
+            else:
+                column += pos
+            dropped += pos
+            pieces = [buf[pos:]]
+            length = len(pieces[0])
+            while length < size and not eof:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    eof = True
+                elif not isinstance(chunk, str):
+                    raise TypeError('the JSON object must be str, not {!r}'
+                                    .format(chunk.__class__.__name__))
+                else:
+                    pieces.append(chunk)
+                    length += len(chunk)
+            buf = ''.join(pieces)
+            pos = 0
+
+        def linecol(index):
+            # The line and column of buf[index] in the whole data.
+            count = buf.count('\n', 0, index)
+            if count:
+                return lines + count + 1, index - buf.rindex('\n', 0, index)
+            return lines + 1, column + index + 1
+
+        def error(msg, start, end=None):
+            # Like errmsg(), with positions relative to the whole data.
+            lineno, colno = linecol(start)
+            if end is None:
+                fmt = '{0}: line {1} column {2} (char {3})'
+                return ValueError(fmt.format(msg, lineno, colno,
+                                             dropped + start))
+            endlineno, endcolno = linecol(end)
+            fmt = ('{0}: line {1} column {2} - line {3} column {4} '
+                   '(char {5} - {6})')
+            return ValueError(fmt.format(msg, lineno, colno, endlineno,
+                                         endcolno, dropped + start,
+                                         dropped + end))
+
+        def skip():
+            # Skip whitespace, reading more data as needed.
+            nonlocal pos
+            while True:
+                pos = _w(buf, pos).end()
+                if pos < len(buf) or eof:
+                    return
+                read(1)
+
+        def truncated(index):
+            # Whether an error at index may be due to the end of the data:
+            # the scanner looks at most a surrogate pair escape ahead.
+            return len(buf) - index < 12
+
+        def scan():
+            # Decode the value at pos.  If it fails at the end of the data
+            # or may be truncated (a number running to the end of the data),
+            # try again with twice as much data, so that a large document is
+            # decoded in linear time.  Other errors are raised at once.
+            nonlocal pos
+            while True:
+                try:
+                    obj, end = scan_once(buf, pos)
+                except StopIteration as err:
+                    if eof or not truncated(err.value):
+                        raise error("Expecting value", err.value) from None
+                except ValueError as err:
+                    # Only the errors of the scanners know their position
+                    # (the C scanner may use another json.decoder module).
+                    if getattr(err, 'pos', None) is None:
+                        raise
+                    # An unterminated string is reported at its start.
+                    if (eof or not (truncated(err.pos) or
+                                    err.msg.startswith('Unterminated'))):
+                        raise error(err.msg, err.pos, err.end) from None
+                else:
+                    if (eof or buf[pos] not in '-0123456789' or
+                            not _tail(buf, end)):
+                        pos = end
+                        return obj
+                read(2 * (len(buf) - pos))
+
+        skip()
+        if not items:
+            while pos < len(buf):
+                yield scan()
+                skip()
+            return
+
+        if buf[pos:pos + 1] != '[':
+            raise error("Expecting '['", pos)
+        pos += 1
+        skip()
+        if buf[pos:pos + 1] == ']':
+            pos += 1
+        else:
+            while True:
+                if buf[pos:pos + 1] == ']':
+                    raise error("Expecting value", pos)
+                yield scan()
+                skip()
+                nextchar = buf[pos:pos + 1]
+                pos += 1
+                if nextchar == ']':
+                    break
+                elif nextchar != ',':
+                    raise error("Expecting ',' delimiter", pos - 1)
+                skip()
+        skip()
+        if pos != len(buf):
+            raise error("Extra data", pos, len(buf))
@@ -258,20 +258,14 @@ class LogRecord(object):
         self.levelname = getLevelName(level)
         self.levelno = level
         self.pathname = pathname
-        try:
-            self.filename = os.path.basename(pathname)
-            self.module = os.path.splitext(self.filename)[0]
-        except (TypeError, ValueError, AttributeError):
-            self.filename = pathname
-            self.module = "Unknown module"
+        # filename, module, msecs and relativeCreated are derived from the
+        # other attributes when they are first looked up: see __getattr__().
         self.exc_info = exc_info
         self.exc_text = None      # used to cache the traceback text
         self.stack_info = sinfo
         self.lineno = lineno
         self.funcName = func
         self.created = ct
-        self.msecs = (ct - int(ct)) * 1000
-        self.relativeCreated = (self.created - _startTime) * 1000
         if logThreads and threading:
             self.thread = threading.get_ident()
             self.threadName = threading.current_thread().name
@@ -301,6 +295,18 @@ class LogRecord(object):
         return '<LogRecord: %s, %s, %s, %s, "%s">'%(self.name, self.levelno,
             self.pathname, self.lineno, self.msg)
 
+    def __getattr__(self, name):
+        # Compute a lazy attribute the first time it is looked up.
+        try:
+            compute = _lazyRecordAttributes[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        value = self.__dict__[name] = compute(self)
+        return value
+
+    def __getstate__(self):
+        return _recordAttributes(self)
+
     def getMessage(self):
         """
         Return the message for this LogRecord.
@@ -313,6 +319,37 @@ class LogRecord(object):
             msg = msg % self.args
         return msg
 
+def _recordFilename(record):
+    try:
+        return os.path.basename(record.pathname)
+    except (TypeError, ValueError, AttributeError):
+        return record.pathname
+
+def _recordModule(record):
+    try:
+        return os.path.splitext(os.path.basename(record.pathname))[0]
+    except (TypeError, ValueError, AttributeError):
+        return "Unknown module"
+
+_lazyRecordAttributes = {
+    'filename': _recordFilename,
+    'module': _recordModule,
+    'msecs': lambda record: (record.created - int(record.created)) * 1000,
+    'relativeCreated': lambda record: (record.created - _startTime) * 1000,
+}
+
+def _recordAttributes(record):
+    """
+    Return the attribute dictionary of a LogRecord, after computing its lazy
+    attributes.
+    """
+    d = record.__dict__
+    if isinstance(record, LogRecord):
+        for name in _lazyRecordAttributes:
+            if name not in d:
+                getattr(record, name)
+    return d
+
 #
 #   Determine which class to use when instantiating log records.
 #
@@ -362,8 +399,18 @@ class PercentStyle(object):
     def usesTime(self):
         return self._fmt.find(self.asctime_search) >= 0
 
+    def _fields(self, record):
+        # Return the attributes of record, computing the lazy ones which
+        # may be used by the format.
+        d = record.__dict__
+        fmt = self._fmt
+        for name in _lazyRecordAttributes:
+            if name not in d and name in fmt:
+                getattr(record, name)
+        return d
+
     def format(self, record):
-        return self._fmt % record.__dict__
+        return self._fmt % self._fields(record)
 
 class StrFormatStyle(PercentStyle):
     default_format = '{message}'
@@ -371,7 +418,7 @@ class StrFormatStyle(PercentStyle):
     asctime_search = '{asctime'
 
     def format(self, record):
-        return self._fmt.format(**record.__dict__)
+        return self._fmt.format(**self._fields(record))
 
 
 class StringTemplateStyle(PercentStyle):
@@ -388,7 +435,7 @@ class StringTemplateStyle(PercentStyle):
         return fmt.find('$asctime') >= 0 or fmt.find(self.asctime_format) >= 0
 
     def format(self, record):
-        return self._tpl.substitute(**record.__dict__)
+        return self._tpl.substitute(**self._fields(record))
 
 _STYLES = {
     '%': PercentStyle,
@@ -819,6 +866,16 @@ class Handler(Filterer):
         raise NotImplementedError('emit must be implemented '
                                   'by Handler subclasses')
 
+    def emitBatch(self, records):
+        """
+        Do whatever it takes to actually log the specified logging records.
+
+        The default implementation calls emit() for each record. Subclasses
+        may override it to write the records at once.
+        """
+        for record in records:
+            self.emit(record)
+
     def handle(self, record):
         """
         Conditionally emit the specified logging record.
@@ -837,6 +894,24 @@ class Handler(Filterer):
                 self.release()
         return rv
 
+    def handleBatch(self, records):
+        """
+        Conditionally emit the specified logging records.
+
+        This is like calling handle() for each record, except that the I/O
+        thread lock is acquired once and the records which pass the filters
+        are emitted together by emitBatch(). Returns the list of these
+        records.
+        """
+        records = [record for record in records if self.filter(record)]
+        if records:
+            self.acquire()
+            try:
+                self.emitBatch(records)
+            finally:
+                self.release()
+        return records
+
     def setFormatter(self, fmt):
         """
         Set the formatter for this handler.
@@ -958,6 +1033,34 @@ class StreamHandler(Handler):
         except Exception:
             self.handleError(record)
 
+    def emitBatch(self, records):
+        """
+        Emit records.
+
+        The formatted records are written to the stream with a single call
+        to its write() method, and the stream is flushed once. If a subclass
+        overrides emit(), it is called for each record instead.
+        """
+        if type(self).emit is not StreamHandler.emit:
+            Handler.emitBatch(self, records)
+        else:
+            self._writeBatch(records)
+
+    def _writeBatch(self, records):
+        msgs = []
+        for record in records:
+            try:
+                msgs.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+        if msgs:
+            try:
+                msgs.append('')
+                self.stream.write(self.terminator.join(msgs))
+                self.flush()
+            except Exception:
+                self.handleError(records[-1])
+
 class FileHandler(StreamHandler):
     """
     A handler class which writes formatted logging records to disk files.
@@ -1015,6 +1118,20 @@ class FileHandler(StreamHandler):
             self.stream = self._open()
         StreamHandler.emit(self, record)
 
+    def emitBatch(self, records):
+        """
+        Emit records.
+
+        If the stream was not opened because 'delay' was specified in the
+        constructor, open it before writing the records at once.
+        """
+        if type(self).emit is not FileHandler.emit:
+            Handler.emitBatch(self, records)
+        else:
+            if self.stream is None:
+                self.stream = self._open()
+            self._writeBatch(records)
+
 class _StderrHandler(StreamHandler):
     """
     This class is like a StreamHandler using sys.stderr, but always uses
@@ -1093,7 +1210,7 @@ class Manager(object):
         Initialize the manager with the root node of the logger hierarchy.
         """
         self.root = rootnode
-        self.disable = 0
+        self._disable = 0
         self.emittedNoHandlerWarning = False
         self.loggerDict = {}
         self.loggerClass = None
@@ -1124,6 +1241,8 @@ class Manager(object):
                     self.loggerDict[name] = rv
                     self._fixupChildren(ph, rv)
                     self._fixupParents(rv)
+                    # The new logger may give a level to its descendants.
+                    self._clear_cache()
             else:
                 rv = (self.loggerClass or _loggerClass)(name)
                 rv.manager = self
@@ -1150,6 +1269,30 @@ class Manager(object):
         """
         self.logRecordFactory = factory
 
+    @property
+    def disable(self):
+        return self._disable
+
+    @disable.setter
+    def disable(self, value):
+        self._disable = value
+        self._clear_cache()
+
+    def _clear_cache(self):
+        """
+        Clear the caches of the loggers' isEnabledFor() answers.
+
+        This is called whenever the effective levels may change.
+        """
+        _acquireLock()
+        try:
+            for logger in self.loggerDict.values():
+                if isinstance(logger, Logger):
+                    logger._cache.clear()
+            self.root._cache.clear()
+        finally:
+            _releaseLock()
+
     def _fixupParents(self, alogger):
         """
         Ensure that there are either loggers or placeholders all the way
@@ -1217,12 +1360,14 @@ class Logger(Filterer):
         self.propagate = True
         self.handlers = []
         self.disabled = False
+        self._cache = {}
 
     def setLevel(self, level):
         """
         Set the logging level of this logger.  level must be an int or a str.
         """
         self.level = _checkLevel(level)
+        self.manager._clear_cache()
 
     def debug(self, msg, *args, **kwargs):
         """
@@ -1355,7 +1500,8 @@ class Logger(Filterer):
                              sinfo)
         if extra is not None:
             for key in extra:
-                if (key in ["message", "asctime"]) or (key in rv.__dict__):
+                if ((key in ["message", "asctime"]) or (key in rv.__dict__) or
+                    (key in _lazyRecordAttributes)):
                     raise KeyError("Attempt to overwrite %r in LogRecord" % key)
                 rv.__dict__[key] = extra[key]
         return rv
@@ -1484,10 +1630,23 @@ class Logger(Filterer):
     def isEnabledFor(self, level):
         """
         Is this logger enabled for level 'level'?
+
+        The answer is cached until the level of a logger or the level passed
+        to disable() changes.
         """
-        if self.manager.disable >= level:
-            return False
-        return level >= self.getEffectiveLevel()
+        try:
+            return self._cache[level]
+        except KeyError:
+            _acquireLock()
+            try:
+                if self.manager.disable >= level:
+                    is_enabled = self._cache[level] = False
+                else:
+                    is_enabled = self._cache[level] = (
+                        level >= self.getEffectiveLevel())
+            finally:
+                _releaseLock()
+            return is_enabled
 
     def getChild(self, suffix):
         """
@@ -1613,9 +1772,7 @@ class LoggerAdapter(object):
         """
         Is this logger enabled for level 'level'?
         """
-        if self.logger.manager.disable >= level:
-            return False
-        return level >= self.getEffectiveLevel()
+        return self.logger.isEnabledFor(level)
 
     def setLevel(self, level):
         """
@@ -177,6 +177,8 @@ def _handle_existing_loggers(existing, child_loggers, disable_existing):
             logger.propagate = True
         else:
             logger.disabled = disable_existing
+    # The levels were changed behind the loggers' backs.
+    root.manager._clear_cache()
 
 def _install_loggers(cp, handlers, disable_existing):
     """Create and install loggers"""
@@ -24,6 +24,7 @@ To use, simply 'import logging.handlers' and log away!
 """
 
 import errno, logging, socket, os, pickle, struct, time, re
+import collections
 from codecs import BOM_UTF8
 from stat import ST_DEV, ST_INO, ST_MTIME
 import queue
@@ -584,7 +585,7 @@ class SocketHandler(logging.Handler):
         # See issue #14436: If msg or args are objects, they may not be
         # available on the receiving end. So we convert the msg % args
         # to a string, save it as msg and zap the args.
-        d = dict(record.__dict__)
+        d = dict(logging._recordAttributes(record))
         d['msg'] = record.getMessage()
         d['args'] = None
         d['exc_info'] = None
@@ -1110,7 +1111,7 @@ class HTTPHandler(logging.Handler):
         that is sent as the CGI data. Overwrite in your class.
         Contributed by Franz Glasner.
         """
-        return record.__dict__
+        return logging._recordAttributes(record)
 
     def emit(self, record):
         """
@@ -1450,3 +1451,177 @@ if threading:
             self.enqueue_sentinel()
             self._thread.join()
             self._thread = None
+
+    class AsyncHandler(logging.Handler):
+        """
+        This handler passes records on to other handlers from a background
+        thread, so that threads which log are not held up by slow handlers.
+
+        Records are appended to a bounded buffer and taken out by a worker
+        thread in batches, which are passed to the handleBatch() method of
+        the handlers whose level they reach. When the buffer is full, a
+        thread logging a record waits for some room if overflow is 'block',
+        and the record is dropped (and counted in the dropped attribute) if
+        overflow is 'drop'.
+
+        Records are formatted by the worker thread, so objects passed as
+        arguments to the logging calls should not be modified afterwards.
+        """
+
+        def __init__(self, *handlers, capacity=10000, batch_size=100,
+                     overflow='block'):
+            """
+            Initialise an instance with the specified handlers and start
+            the worker thread.
+            """
+            if capacity <= 0:
+                raise ValueError("capacity must be positive")
+            if batch_size <= 0:
+                raise ValueError("batch_size must be positive")
+            if overflow not in ('block', 'drop'):
+                raise ValueError("overflow must be 'block' or 'drop'")
+            logging.Handler.__init__(self)
+            self.handlers = handlers
+            self.capacity = capacity
+            self.batch_size = batch_size
+            self.overflow = overflow
+            self.dropped = 0
+            self.max_pending = 0
+            self._buffer = collections.deque()
+            self._in_flight = 0
+            # The numbers of records appended to the buffer and handled
+            # by the worker thread since the start
+            self._appended = 0
+            self._handled = 0
+            self._closed = False
+            self._mutex = threading.Lock()
+            self._not_empty = threading.Condition(self._mutex)
+            self._not_full = threading.Condition(self._mutex)
+            self._all_handled = threading.Condition(self._mutex)
+            self._thread = t = threading.Thread(target=self._monitor)
+            t.setDaemon(True)
+            t.start()
+
+        @property
+        def pending(self):
+            """
+            The number of records waiting to be handled.
+            """
+            return len(self._buffer) + self._in_flight
+
+        def handle(self, record):
+            """
+            Conditionally emit the specified logging record.
+
+            Unlike the base implementation, this does not acquire the I/O
+            thread lock, as emit() is safe to call from several threads.
+            """
+            rv = self.filter(record)
+            if rv:
+                self.emit(record)
+            return rv
+
+        def emit(self, record):
+            """
+            Emit a record.
+
+            Append the record to the buffer, to be handled by the worker
+            thread. Once the handler is closed, records are handled by the
+            calling thread, and so are the records logged by the handlers
+            themselves while the buffer is full.
+            """
+            worker = threading.current_thread() is self._thread
+            with self._mutex:
+                buffer = self._buffer
+                while len(buffer) >= self.capacity and not self._closed:
+                    if self.overflow == 'drop':
+                        self.dropped += 1
+                        return
+                    if worker:
+                        # Waiting for the worker thread would never end
+                        break
+                    self._not_full.wait()
+                if len(buffer) < self.capacity and not self._closed:
+                    buffer.append(record)
+                    self._appended += 1
+                    if len(buffer) > self.max_pending:
+                        self.max_pending = len(buffer)
+                    self._not_empty.notify()
+                    return
+            self.handleRecords([record])
+
+        def handleRecords(self, records):
+            """
+            Pass a batch of records to the handlers.
+
+            This is called by the worker thread. Each handler gets the
+            records whose level reaches the handler's level.
+            """
+            for handler in self.handlers:
+                batch = [record for record in records
+                         if record.levelno >= handler.level]
+                if not batch:
+                    continue
+                try:
+                    handler.handleBatch(batch)
+                except Exception:
+                    self.handleError(batch[-1])
+
+        def _monitor(self):
+            """
+            Take batches of records out of the buffer and handle them.
+
+            This method runs on a separate, internal thread, which exits
+            once the handler is closed and the buffer is empty.
+            """
+            buffer = self._buffer
+            while True:
+                with self._mutex:
+                    while not buffer and not self._closed:
+                        self._not_empty.wait()
+                    if not buffer:
+                        break
+                    count = min(len(buffer), self.batch_size)
+                    records = [buffer.popleft() for i in range(count)]
+                    self._in_flight = count
+                    self._not_full.notify_all()
+                try:
+                    self.handleRecords(records)
+                finally:
+                    with self._mutex:
+                        self._in_flight = 0
+                        self._handled += count
+                        self._all_handled.notify_all()
+
+        def flush(self):
+            """
+            Wait until the records logged before the call have been
+            handled, then flush the handlers.
+
+            Records logged meanwhile by other threads are not waited for.
+            """
+            if threading.current_thread() is not self._thread:
+                with self._mutex:
+                    target = self._appended
+                    while self._handled < target:
+                        # Don't wait forever if the worker thread died
+                        if not self._thread.is_alive():
+                            break
+                        self._all_handled.wait(1.0)
+            for handler in self.handlers:
+                handler.flush()
+
+        def close(self):
+            """
+            Close the handler.
+
+            The records in the buffer are handled before the worker thread
+            exits. The handlers are not closed.
+            """
+            with self._mutex:
+                self._closed = True
+                self._not_empty.notify_all()
+                self._not_full.notify_all()
+            if threading.current_thread() is not self._thread:
+                self._thread.join()
+            logging.Handler.close(self)
@@ -95,27 +95,30 @@ class BaseContext(object):
         from .synchronize import Barrier
         return Barrier(parties, action, timeout, ctx=self.get_context())
 
-    def Queue(self, maxsize=0):
+    def Queue(self, maxsize=0, shared_memory=0):
         '''Returns a queue object'''
         from .queues import Queue
-        return Queue(maxsize, ctx=self.get_context())
+        return Queue(maxsize, ctx=self.get_context(),
+                     shared_memory=shared_memory)
 
-    def JoinableQueue(self, maxsize=0):
+    def JoinableQueue(self, maxsize=0, shared_memory=0):
         '''Returns a queue object'''
         from .queues import JoinableQueue
-        return JoinableQueue(maxsize, ctx=self.get_context())
+        return JoinableQueue(maxsize, ctx=self.get_context(),
+                             shared_memory=shared_memory)
 
-    def SimpleQueue(self):
+    def SimpleQueue(self, shared_memory=0):
         '''Returns a queue object'''
         from .queues import SimpleQueue
-        return SimpleQueue(ctx=self.get_context())
+        return SimpleQueue(ctx=self.get_context(),
+                           shared_memory=shared_memory)
 
     def Pool(self, processes=None, initializer=None, initargs=(),
-             maxtasksperchild=None):
+             maxtasksperchild=None, shared_memory=0):
         '''Returns a process pool object'''
         from .pool import Pool
         return Pool(processes, initializer, initargs, maxtasksperchild,
-                    context=self.get_context())
+                    context=self.get_context(), shared_memory=shared_memory)
 
     def RawValue(self, typecode_or_type, *args):
         '''Returns a shared object'''
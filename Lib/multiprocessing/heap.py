@@ -8,9 +8,11 @@
 #
 
 import bisect
+import io
 import itertools
 import mmap
 import os
+import pickle
 import sys
 import tempfile
 import threading
@@ -20,7 +22,7 @@ from . import context
 from . import reduction
 from . import util
 
-__all__ = ['BufferWrapper']
+__all__ = ['BufferWrapper', 'SharedBuffers']
 
 #
 # Inheritable class which wraps an mmap, and from which blocks can be allocated
@@ -249,3 +251,162 @@ class BufferWrapper(object):
     def create_memoryview(self):
         (arena, start, stop), size = self._state
         return memoryview(arena.buffer)[start:start+size]
+
+#
+# Arena used to pass large buffers between processes without copying
+# them through a pipe
+#
+
+class _SharedBuffersPickler(reduction.ForkingPickler):
+
+    def __init__(self, file, protocol, buffers):
+        super().__init__(file, protocol)
+        self._buffers = buffers
+        self._stored = {}
+
+    def persistent_id(self, obj):
+        if type(obj) not in (bytes, bytearray):
+            return None
+        if len(obj) < self._buffers.threshold:
+            return None
+        key = id(obj)
+        try:
+            return self._stored[key][1]
+        except KeyError:
+            pass
+        handle = self._buffers._store(obj)
+        if handle is not None:
+            # keep obj alive so that its id cannot be reused
+            self._stored[key] = (obj, handle)
+        return handle
+
+
+class _SharedBuffersUnpickler(pickle.Unpickler):
+
+    def __init__(self, file, buffers):
+        super().__init__(file)
+        self._buffers = buffers
+        self._loaded = {}
+
+    def persistent_load(self, handle):
+        try:
+            return self._loaded[handle]
+        except KeyError:
+            pass
+        obj = self._loaded[handle] = self._buffers._load(handle)
+        return obj
+
+
+class SharedBuffers(object):
+    '''
+    Arena of shared memory used to transfer large buffers between processes.
+
+    dumps() pickles an object, copying each bytes or bytearray object of
+    at least `threshold` bytes found in it into the arena: only a handle
+    for the buffer is written to the pickle.  loads() copies the buffers
+    back out of the arena and releases their space.  Buffers which do not
+    fit in the free space of the arena are pickled as usual.  The data is
+    still copied twice, but not through the kernel.
+
+    A pickle returned by dumps() which will never be loaded must be passed
+    to discard() to release the space used by its buffers.
+
+    Like the lock it uses, the arena is shared with child processes by
+    inheritance.
+    '''
+
+    slot_size = 64 * 1024
+    threshold = 64 * 1024
+
+    def __init__(self, size, *, ctx):
+        nslots = max(size // self.slot_size, 1)
+        header = Heap._roundup(nslots, mmap.PAGESIZE)
+        self._nslots = nslots
+        self._header = header
+        self._arena = Arena(header + nslots * self.slot_size)
+        self._lock = ctx.Lock()
+        self._setup()
+
+    def _setup(self):
+        view = memoryview(self._arena.buffer)
+        # the header holds one byte per slot, non-zero if it is in use
+        self._map = view[:self._nslots]
+        self._data = view[self._header:]
+
+    def __getstate__(self):
+        context.assert_spawning(self)
+        return (self._arena, self._lock, self._nslots, self._header)
+
+    def __setstate__(self, state):
+        self._arena, self._lock, self._nslots, self._header = state
+        self._setup()
+
+    def _store(self, data):
+        # copy data to a free run of slots and return a handle for it,
+        # or return None if there is no room for it
+        size = len(data)
+        count = -(-size // self.slot_size)
+        with self._lock:
+            slot = bytes(self._map).find(b'\0' * count)
+            if slot < 0:
+                return None
+            self._map[slot:slot + count] = b'\1' * count
+        start = slot * self.slot_size
+        self._data[start:start + size] = data
+        return (type(data) is bytearray, slot, count, size)
+
+    def _load(self, handle):
+        is_bytearray, slot, count, size = handle
+        start = slot * self.slot_size
+        data = self._data[start:start + size]
+        obj = bytearray(data) if is_bytearray else data.tobytes()
+        self._release(handle)
+        return obj
+
+    def _release(self, handle):
+        # the lock also makes sure that copying the data out of the slots
+        # is complete before another process can reuse them
+        is_bytearray, slot, count, size = handle
+        with self._lock:
+            self._map[slot:slot + count] = b'\0' * count
+
+    def free_space(self):
+        '''Return the number of bytes of the arena not in use.'''
+        with self._lock:
+            return bytes(self._map).count(0) * self.slot_size
+
+    def dumps(self, obj):
+        '''Pickle obj, storing its large buffers in the arena.'''
+        body = io.BytesIO()
+        pickler = _SharedBuffersPickler(body, None, self)
+        try:
+            pickler.dump(obj)
+        except:
+            for data, handle in pickler._stored.values():
+                self._release(handle)
+            raise
+        # the handles are listed ahead of the pickle of obj so that they
+        # can be released without unpickling obj
+        handles = [handle for data, handle in pickler._stored.values()]
+        buf = io.BytesIO()
+        pickle.dump(handles, buf, pickle.HIGHEST_PROTOCOL)
+        buf.write(body.getbuffer())
+        return buf.getbuffer()
+
+    def loads(self, buf):
+        '''Unpickle an object pickled by dumps().'''
+        file = io.BytesIO(buf)
+        handles = pickle.load(file)
+        unpickler = _SharedBuffersUnpickler(file, self)
+        try:
+            return unpickler.load()
+        except:
+            for handle in handles:
+                if handle not in unpickler._loaded:
+                    self._release(handle)
+            raise
+
+    def discard(self, buf):
+        '''Release the space used by a pickle which will not be loaded.'''
+        for handle in pickle.loads(buf):
+            self._release(handle)
@@ -141,8 +141,9 @@ class Pool(object):
         return self._ctx.Process(*args, **kwds)
 
     def __init__(self, processes=None, initializer=None, initargs=(),
-                 maxtasksperchild=None, context=None):
+                 maxtasksperchild=None, context=None, shared_memory=0):
         self._ctx = context or get_context()
+        self._shared_memory = shared_memory
         self._setup_queues()
         self._taskqueue = queue.Queue()
         self._cache = {}
@@ -235,10 +236,14 @@ class Pool(object):
             self._repopulate_pool()
 
     def _setup_queues(self):
-        self._inqueue = self._ctx.SimpleQueue()
-        self._outqueue = self._ctx.SimpleQueue()
-        self._quick_put = self._inqueue._writer.send
-        self._quick_get = self._outqueue._reader.recv
+        self._inqueue = self._ctx.SimpleQueue(self._shared_memory)
+        self._outqueue = self._ctx.SimpleQueue(self._shared_memory)
+        if self._shared_memory:
+            self._quick_put = self._inqueue.put
+            self._quick_get = self._outqueue.get
+        else:
+            self._quick_put = self._inqueue._writer.send
+            self._quick_get = self._outqueue._reader.recv
 
     def apply(self, func, args=(), kwds={}):
         '''
@@ -254,13 +259,40 @@ class Pool(object):
         '''
         return self._map_async(func, iterable, mapstar, chunksize).get()
 
-    def starmap(self, func, iterable, chunksize=None):
+    def starmap(self, func, iterable, chunksize=None, max_inflight=None):
         '''
         Like `map()` method but the elements of the `iterable` are expected to
         be iterables as well and will be unpacked as arguments. Hence
         `func` and (a, b) becomes func(a, b).
+
+        If `max_inflight` is given, `iterable` is consumed lazily as for
+        `imap()` instead of being turned into a list first.
         '''
-        return self._map_async(func, iterable, starmapstar, chunksize).get()
+        if max_inflight is None:
+            return self._map_async(func, iterable, starmapstar,
+                                   chunksize).get()
+        chunksize = chunksize or 1
+        result = self._imap(IMapIterator, func, iterable, chunksize,
+                            max_inflight, star=True)
+        values = []
+        error = None
+        # Like map(), wait for all tasks before raising the first error.
+        while 1:
+            try:
+                value = result.next()
+            except StopIteration:
+                break
+            except Exception as e:
+                if error is None:
+                    error = e
+                continue
+            if chunksize == 1:
+                values.append(value)
+            else:
+                values.extend(value)
+        if error is not None:
+            raise error
+        return values
 
     def starmap_async(self, func, iterable, chunksize=None, callback=None,
             error_callback=None):
@@ -270,43 +302,58 @@ class Pool(object):
         return self._map_async(func, iterable, starmapstar, chunksize,
                                callback, error_callback)
 
-    def imap(self, func, iterable, chunksize=1):
+    def imap(self, func, iterable, chunksize=1, max_inflight=None):
         '''
         Equivalent of `map()` -- can be MUCH slower than `Pool.map()`.
+
+        If `max_inflight` is given, at most that many tasks (chunks of
+        `chunksize` elements) are taken from `iterable` ahead of the results
+        consumed from the returned iterator.
         '''
-        if self._state != RUN:
-            raise ValueError("Pool not running")
+        result = self._imap(IMapIterator, func, iterable, chunksize,
+                            max_inflight)
         if chunksize == 1:
-            result = IMapIterator(self._cache)
-            self._taskqueue.put((((result._job, i, func, (x,), {})
-                         for i, x in enumerate(iterable)), result._set_length))
             return result
-        else:
-            assert chunksize > 1
-            task_batches = Pool._get_tasks(func, iterable, chunksize)
-            result = IMapIterator(self._cache)
-            self._taskqueue.put((((result._job, i, mapstar, (x,), {})
-                     for i, x in enumerate(task_batches)), result._set_length))
-            return (item for chunk in result for item in chunk)
+        return (item for chunk in result for item in chunk)
 
-    def imap_unordered(self, func, iterable, chunksize=1):
+    def imap_unordered(self, func, iterable, chunksize=1, max_inflight=None):
         '''
         Like `imap()` method but ordering of results is arbitrary.
         '''
+        result = self._imap(IMapUnorderedIterator, func, iterable, chunksize,
+                            max_inflight)
+        if chunksize == 1:
+            return result
+        return (item for chunk in result for item in chunk)
+
+    def _imap(self, iterator_class, func, iterable, chunksize, max_inflight,
+              star=False):
+        '''
+        Helper function to implement imap, imap_unordered and starmap with
+        max_inflight.
+        '''
         if self._state != RUN:
             raise ValueError("Pool not running")
+        if max_inflight is not None and max_inflight < 1:
+            raise ValueError("max_inflight must be at least 1")
         if chunksize == 1:
-            result = IMapUnorderedIterator(self._cache)
-            self._taskqueue.put((((result._job, i, func, (x,), {})
-                         for i, x in enumerate(iterable)), result._set_length))
-            return result
+            if star:
+                tasks = ((func, tuple(args)) for args in iterable)
+            else:
+                tasks = ((func, (x,)) for x in iterable)
         else:
             assert chunksize > 1
+            mapper = starmapstar if star else mapstar
             task_batches = Pool._get_tasks(func, iterable, chunksize)
-            result = IMapUnorderedIterator(self._cache)
-            self._taskqueue.put((((result._job, i, mapstar, (x,), {})
-                     for i, x in enumerate(task_batches)), result._set_length))
-            return (item for chunk in result for item in chunk)
+            tasks = ((mapper, (x,)) for x in task_batches)
+        result = iterator_class(self._cache)
+        if max_inflight is not None:
+            result._feed_from(tasks, self._taskqueue, max_inflight)
+            return result
+        self._taskqueue.put((((result._job, i, f, args, {})
+                              for i, (f, args) in enumerate(tasks)),
+                             result._set_length))
+        return result
 
     def apply_async(self, func, args=(), kwds={}, callback=None,
             error_callback=None):
@@ -483,6 +530,7 @@ class Pool(object):
         if self._state == RUN:
             self._state = CLOSE
             self._worker_handler._state = CLOSE
+            self._stop_feeding(self._cache)
 
     def terminate(self):
         util.debug('terminating pool')
@@ -490,6 +538,14 @@ class Pool(object):
         self._worker_handler._state = TERMINATE
         self._terminate()
 
+    @staticmethod
+    def _stop_feeding(cache):
+        # No task can be submitted any more: stop taking tasks from the
+        # iterables of imap() with max_inflight
+        for result in list(cache.values()):
+            if isinstance(result, IMapIterator):
+                result._stop_feeding()
+
     def join(self):
         util.debug('joining pool')
         assert self._state in (CLOSE, TERMINATE)
@@ -505,7 +561,7 @@ class Pool(object):
         util.debug('removing tasks from inqueue until task handler finished')
         inqueue._rlock.acquire()
         while task_handler.is_alive() and inqueue._reader.poll():
-            inqueue._reader.recv()
+            inqueue._loads(inqueue._reader.recv_bytes())
             time.sleep(0)
 
     @classmethod
@@ -517,6 +573,8 @@ class Pool(object):
         worker_handler._state = TERMINATE
         task_handler._state = TERMINATE
 
+        cls._stop_feeding(cache)
+
         util.debug('helping task handler/workers to finish')
         cls._help_stuff_finish(inqueue, task_handler, len(pool))
 
@@ -655,6 +713,7 @@ class IMapIterator(object):
         self._index = 0
         self._length = None
         self._unsorted = {}
+        self._tasks = None
         cache[self._job] = self
 
     def __iter__(self):
@@ -678,6 +737,9 @@ class IMapIterator(object):
         finally:
             self._cond.release()
 
+        if self._tasks is not None:
+            # Submit a new task for the result consumed
+            self._feed(1)
         success, value = item
         if success:
             return value
@@ -704,6 +766,48 @@ class IMapIterator(object):
         finally:
             self._cond.release()
 
+    def _feed_from(self, tasks, taskqueue, count):
+        # Used by imap() with max_inflight: submit count tasks now, and a
+        # new one each time a result is consumed.  The tasks are taken from
+        # the iterable by the consumer, so that the task handler thread is
+        # never held up by a job.
+        self._feed_lock = threading.Lock()
+        self._taskqueue = taskqueue
+        self._submitted = 0
+        self._tasks = iter(tasks)
+        self._feed(count)
+
+    def _feed(self, count):
+        with self._feed_lock:
+            if self._tasks is None:
+                return
+            batch = []
+            try:
+                for i in range(count):
+                    try:
+                        func, args = next(self._tasks)
+                    except StopIteration:
+                        self._tasks = None
+                        break
+                    batch.append((self._job, self._submitted, func, args, {}))
+                    self._submitted += 1
+            except:
+                self._tasks = None
+                raise
+            finally:
+                if batch:
+                    self._taskqueue.put((batch, None))
+                if self._tasks is None:
+                    self._set_length(self._submitted)
+
+    def _stop_feeding(self):
+        if self._tasks is None:
+            return
+        with self._feed_lock:
+            if self._tasks is not None:
+                self._tasks = None
+                self._set_length(self._submitted)
+
     def _set_length(self, length):
         self._cond.acquire()
         try:
@@ -16,6 +16,7 @@ import collections
 import time
 import weakref
 import errno
+import select
 
 from queue import Empty, Full
 
@@ -23,6 +24,7 @@ import _multiprocessing
 
 from . import connection
 from . import context
+from . import heap
 
 from .util import debug, info, Finalize, register_after_fork, is_exiting
 from .reduction import ForkingPickler
@@ -33,7 +35,7 @@ from .reduction import ForkingPickler
 
 class Queue(object):
 
-    def __init__(self, maxsize=0, *, ctx):
+    def __init__(self, maxsize=0, *, ctx, shared_memory=0):
         if maxsize <= 0:
             maxsize = _multiprocessing.SemLock.SEM_VALUE_MAX
         self._maxsize = maxsize
@@ -45,6 +47,10 @@ class Queue(object):
         else:
             self._wlock = ctx.Lock()
         self._sem = ctx.BoundedSemaphore(maxsize)
+        if shared_memory:
+            self._buffers = heap.SharedBuffers(shared_memory, ctx=ctx)
+        else:
+            self._buffers = None
         # For use by concurrent.futures
         self._ignore_epipe = False
 
@@ -56,11 +62,13 @@ class Queue(object):
     def __getstate__(self):
         context.assert_spawning(self)
         return (self._ignore_epipe, self._maxsize, self._reader, self._writer,
-                self._rlock, self._wlock, self._sem, self._opid)
+                self._rlock, self._wlock, self._sem, self._opid,
+                self._buffers)
 
     def __setstate__(self, state):
         (self._ignore_epipe, self._maxsize, self._reader, self._writer,
-         self._rlock, self._wlock, self._sem, self._opid) = state
+         self._rlock, self._wlock, self._sem, self._opid,
+         self._buffers) = state
         self._after_fork()
 
     def _after_fork(self):
@@ -75,6 +83,14 @@ class Queue(object):
         self._send_bytes = self._writer.send_bytes
         self._recv_bytes = self._reader.recv_bytes
         self._poll = self._reader.poll
+        if self._buffers is None:
+            self._dumps = ForkingPickler.dumps
+            self._loads = ForkingPickler.loads
+            self._discard = None
+        else:
+            self._dumps = self._buffers.dumps
+            self._loads = self._buffers.loads
+            self._discard = self._buffers.discard
 
     def put(self, obj, block=True, timeout=None):
         assert not self._closed
@@ -90,6 +106,36 @@ class Queue(object):
         finally:
             self._notempty.release()
 
+    def put_many(self, objs, block=True, timeout=None):
+        assert not self._closed
+        objs = list(objs)
+        if block and timeout is not None:
+            deadline = time.time() + timeout
+        i = 0
+        while i < len(objs):
+            # Wait for a free slot, then take all the other free ones.
+            if block and timeout is not None:
+                remaining = max(deadline - time.time(), 0)
+            else:
+                remaining = timeout
+            if not self._sem.acquire(block, remaining):
+                raise Full
+            j = i + 1
+            while j < len(objs) and self._sem.acquire(False):
+                j += 1
+            self._extend(objs[i:j])
+            i = j
+
+    def _extend(self, objs):
+        self._notempty.acquire()
+        try:
+            if self._thread is None:
+                self._start_thread()
+            self._buffer.extend(objs)
+            self._notempty.notify()
+        finally:
+            self._notempty.release()
+
     def get(self, block=True, timeout=None):
         if block and timeout is None:
             with self._rlock:
@@ -112,7 +158,63 @@ class Queue(object):
             finally:
                 self._rlock.release()
         # unserialize the data after having released the lock
-        return ForkingPickler.loads(res)
+        return self._loads(res)
+
+    def get_many(self, max_items, block=True, timeout=None):
+        if max_items < 1:
+            raise ValueError("'max_items' must be a positive integer")
+        if block and timeout is None:
+            with self._rlock:
+                res = [self._recv_bytes()]
+                self._sem.release()
+                self._recv_pending(res, max_items)
+        else:
+            if block:
+                deadline = time.time() + timeout
+            if not self._rlock.acquire(block, timeout):
+                raise Empty
+            try:
+                if block:
+                    timeout = deadline - time.time()
+                    if timeout < 0 or not self._poll(timeout):
+                        raise Empty
+                elif not self._poll():
+                    raise Empty
+                res = [self._recv_bytes()]
+                self._sem.release()
+                self._recv_pending(res, max_items)
+            finally:
+                self._rlock.release()
+        # unserialize the data after having released the lock
+        objs = []
+        try:
+            for data in res:
+                objs.append(self._loads(data))
+        except:
+            # the remaining items are lost
+            if self._discard is not None:
+                for data in res[len(objs) + 1:]:
+                    self._discard(data)
+            raise
+        return objs
+
+    def _recv_pending(self, res, max_items):
+        # Receive the messages already in the pipe, up to max_items.
+        # Connection.poll() sets up a selector for each call, so a poll
+        # object is kept for the reader when available.
+        if hasattr(select, 'poll'):
+            poller = select.poll()
+            poller.register(self._reader, select.POLLIN)
+            def ready():
+                try:
+                    return bool(poller.poll(0))
+                except InterruptedError:
+                    return False
+        else:
+            ready = self._poll
+        while len(res) < max_items and ready():
+            res.append(self._recv_bytes())
+            self._sem.release()
 
     def qsize(self):
         # Raises NotImplementedError on Mac OSX because of broken sem_getvalue()
@@ -158,7 +260,8 @@ class Queue(object):
         self._thread = threading.Thread(
             target=Queue._feed,
             args=(self._buffer, self._notempty, self._send_bytes,
-                  self._wlock, self._writer.close, self._ignore_epipe),
+                  self._wlock, self._writer.close, self._ignore_epipe,
+                  self._dumps, self._discard),
             name='QueueFeederThread'
             )
         self._thread.daemon = True
@@ -209,7 +312,8 @@ class Queue(object):
             notempty.release()
 
     @staticmethod
-    def _feed(buffer, notempty, send_bytes, writelock, close, ignore_epipe):
+    def _feed(buffer, notempty, send_bytes, writelock, close, ignore_epipe,
+              dumps=ForkingPickler.dumps, discard=None):
         debug('starting thread to feed data to pipe')
         nacquire = notempty.acquire
         nrelease = notempty.release
@@ -239,15 +343,21 @@ class Queue(object):
                             return
 
                         # serialize the data before acquiring the lock
-                        obj = ForkingPickler.dumps(obj)
-                        if wacquire is None:
-                            send_bytes(obj)
-                        else:
-                            wacquire()
-                            try:
+                        obj = dumps(obj)
+                        try:
+                            if wacquire is None:
                                 send_bytes(obj)
-                            finally:
-                                wrelease()
+                            else:
+                                wacquire()
+                                try:
+                                    send_bytes(obj)
+                                finally:
+                                    wrelease()
+                        except:
+                            # the item will never be received
+                            if discard is not None:
+                                discard(obj)
+                            raise
                 except IndexError:
                     pass
         except Exception as e:
@@ -278,8 +388,8 @@ _sentinel = object()
 
 class JoinableQueue(Queue):
 
-    def __init__(self, maxsize=0, *, ctx):
-        Queue.__init__(self, maxsize, ctx=ctx)
+    def __init__(self, maxsize=0, *, ctx, shared_memory=0):
+        Queue.__init__(self, maxsize, ctx=ctx, shared_memory=shared_memory)
         self._unfinished_tasks = ctx.Semaphore(0)
         self._cond = ctx.Condition()
 
@@ -307,6 +417,20 @@ class JoinableQueue(Queue):
             self._cond.release()
             self._notempty.release()
 
+    def _extend(self, objs):
+        self._notempty.acquire()
+        self._cond.acquire()
+        try:
+            if self._thread is None:
+                self._start_thread()
+            self._buffer.extend(objs)
+            for obj in objs:
+                self._unfinished_tasks.release()
+            self._notempty.notify()
+        finally:
+            self._cond.release()
+            self._notempty.release()
+
     def task_done(self):
         self._cond.acquire()
         try:
@@ -331,37 +455,60 @@ class JoinableQueue(Queue):
 
 class SimpleQueue(object):
 
-    def __init__(self, *, ctx):
+    def __init__(self, *, ctx, shared_memory=0):
         self._reader, self._writer = connection.Pipe(duplex=False)
         self._rlock = ctx.Lock()
-        self._poll = self._reader.poll
         if sys.platform == 'win32':
             self._wlock = None
         else:
             self._wlock = ctx.Lock()
+        if shared_memory:
+            self._buffers = heap.SharedBuffers(shared_memory, ctx=ctx)
+        else:
+            self._buffers = None
+        self._setup()
+
+    def _setup(self):
+        self._poll = self._reader.poll
+        if self._buffers is None:
+            self._dumps = ForkingPickler.dumps
+            self._loads = ForkingPickler.loads
+            self._discard = None
+        else:
+            self._dumps = self._buffers.dumps
+            self._loads = self._buffers.loads
+            self._discard = self._buffers.discard
 
     def empty(self):
         return not self._poll()
 
     def __getstate__(self):
         context.assert_spawning(self)
-        return (self._reader, self._writer, self._rlock, self._wlock)
+        return (self._reader, self._writer, self._rlock, self._wlock,
+                self._buffers)
 
     def __setstate__(self, state):
-        (self._reader, self._writer, self._rlock, self._wlock) = state
+        (self._reader, self._writer, self._rlock, self._wlock,
+         self._buffers) = state
+        self._setup()
 
     def get(self):
         with self._rlock:
             res = self._reader.recv_bytes()
         # unserialize the data after having released the lock
-        return ForkingPickler.loads(res)
+        return self._loads(res)
 
     def put(self, obj):
         # serialize the data before acquiring the lock
-        obj = ForkingPickler.dumps(obj)
-        if self._wlock is None:
-            # writes to a message oriented win32 pipe are atomic
-            self._writer.send_bytes(obj)
-        else:
-            with self._wlock:
+        obj = self._dumps(obj)
+        try:
+            if self._wlock is None:
+                # writes to a message oriented win32 pipe are atomic
                 self._writer.send_bytes(obj)
+            else:
+                with self._wlock:
+                    self._writer.send_bytes(obj)
+        except:
+            if self._discard is not None:
+                self._discard(obj)
+            raise
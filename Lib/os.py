@@ -146,6 +146,8 @@ if _exists("_have_functions"):
     _add("HAVE_FCHMOD",     "chmod")
     _add("HAVE_FCHOWN",     "chown")
     _add("HAVE_FDOPENDIR",  "listdir")
+    if "HAVE_FSTATAT" in _have_functions:
+        _add("HAVE_FDOPENDIR",  "scandir")
     _add("HAVE_FEXECVE",    "execve")
     _set.add(stat) # fstat always works
     _add("HAVE_FTRUNCATE",  "truncate")
@@ -338,7 +340,7 @@ def walk(top, topdown=True, onerror=None, followlinks=False):
     dirnames have already been generated by the time dirnames itself is
     generated.
 
-    By default errors from the os.listdir() call are ignored.  If
+    By default errors from the os.scandir() call are ignored.  If
     optional arg 'onerror' is specified, it should be a function; it
     will be called with one argument, an OSError instance.  It can
     report the error to continue with the walk, or raise the exception
@@ -366,41 +368,69 @@ def walk(top, topdown=True, onerror=None, followlinks=False):
             dirs.remove('CVS')  # don't visit CVS directories
     """
 
-    islink, join, isdir = path.islink, path.join, path.isdir
-
     # We may not have read permission for top, in which case we can't
     # get a list of the files the directory contains.  os.walk
     # always suppressed the exception then, rather than blow up for a
     # minor reason when (say) a thousand readable directories are still
     # left to visit.  That logic is copied here.
     try:
-        # Note that listdir is global in this module due
+        # Note that scandir is global in this module due
         # to earlier import-*.
-        names = listdir(top)
+        scandir_it = scandir(top)
     except OSError as err:
         if onerror is not None:
             onerror(err)
         return
 
-    dirs, nondirs = [], []
-    for name in names:
-        if isdir(join(top, name)):
-            dirs.append(name)
-        else:
-            nondirs.append(name)
+    # The entries usually know their type, so that sorting them out
+    # doesn't need a stat() call per name.
+    dirs, nondirs, walk_dirs = [], [], []
+    with scandir_it:
+        while True:
+            try:
+                entry = next(scandir_it)
+            except StopIteration:
+                break
+            except OSError as err:
+                if onerror is not None:
+                    onerror(err)
+                return
+
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                # Like os.path.isdir().
+                is_dir = False
+            if is_dir:
+                dirs.append(entry.name)
+            else:
+                nondirs.append(entry.name)
+
+            if not topdown and is_dir:
+                try:
+                    walk_into = followlinks or not entry.is_symlink()
+                except OSError:
+                    walk_into = True
+                if walk_into:
+                    walk_dirs.append(entry.path)
 
     if topdown:
         yield top, dirs, nondirs
-    for name in dirs:
-        new_path = join(top, name)
-        if followlinks or not islink(new_path):
+        # The caller may have changed dirs, and the entries with them:
+        # check the links again.
+        islink, join = path.islink, path.join
+        for name in dirs:
+            new_path = join(top, name)
+            if followlinks or not islink(new_path):
+                yield from walk(new_path, topdown, onerror, followlinks)
+    else:
+        for new_path in walk_dirs:
             yield from walk(new_path, topdown, onerror, followlinks)
-    if not topdown:
         yield top, dirs, nondirs
 
 __all__.append("walk")
 
-if {open, stat} <= supports_dir_fd and {listdir, stat} <= supports_fd:
+if {open, stat} <= supports_dir_fd and {scandir, stat} <= supports_fd:
 
     def fwalk(top=".", topdown=True, onerror=None, *, follow_symlinks=False, dir_fd=None):
         """Directory tree generator.
@@ -451,26 +481,26 @@ if {open, stat} <= supports_dir_fd and {listdir, stat} <= supports_fd:
         # necessary, it can be adapted to only require O(1) FDs, see issue
         # #13734.
 
-        names = listdir(topfd)
         dirs, nondirs = [], []
-        for name in names:
-            try:
+        with scandir(topfd) as scandir_it:
+            for entry in scandir_it:
                 # Here, we don't use AT_SYMLINK_NOFOLLOW to be consistent with
                 # walk() which reports symlinks to directories as directories.
                 # We do however check for symlinks before recursing into
-                # a subdirectory.
-                if st.S_ISDIR(stat(name, dir_fd=topfd).st_mode):
-                    dirs.append(name)
+                # a subdirectory.  Dangling symlinks are not directories.
+                if entry.is_dir():
+                    dirs.append(entry.name)
+                elif entry.is_file(follow_symlinks=False):
+                    nondirs.append(entry.name)
                 else:
-                    nondirs.append(name)
-            except FileNotFoundError:
-                try:
-                    # Add dangling symlinks, ignore disappeared files
-                    if st.S_ISLNK(stat(name, dir_fd=topfd, follow_symlinks=False)
-                                .st_mode):
-                        nondirs.append(name)
-                except FileNotFoundError:
-                    continue
+                    # The type of symlinks, special files and entries
+                    # without a type in the listing is checked with a stat():
+                    # add dangling symlinks, ignore disappeared files
+                    try:
+                        entry.stat(follow_symlinks=False)
+                    except FileNotFoundError:
+                        continue
+                    nondirs.append(entry.name)
 
         if topdown:
             yield toppath, dirs, nondirs, topfd
@@ -178,6 +178,75 @@ class Queue:
             self.not_full.notify()
             return item
 
+    def put_many(self, items, block=True, timeout=None):
+        '''Put all the items of an iterable into the queue, in order.
+
+        The mutex is acquired once and waiting consumers are notified once
+        per batch of items rather than once per item.  If the queue is
+        bounded, 'block' and 'timeout' apply whenever it is full, as for
+        put(); if the Full exception is raised, the items preceding the
+        first one that did not fit have been put into the queue.
+        '''
+        items = list(items)
+        with self.not_full:
+            if block and timeout is not None:
+                if timeout < 0:
+                    raise ValueError("'timeout' must be a non-negative number")
+                endtime = time() + timeout
+            i = 0
+            n = len(items)
+            while i < n:
+                if self.maxsize > 0:
+                    while self._qsize() >= self.maxsize:
+                        if not block:
+                            raise Full
+                        elif timeout is None:
+                            self.not_full.wait()
+                        else:
+                            remaining = endtime - time()
+                            if remaining <= 0.0:
+                                raise Full
+                            self.not_full.wait(remaining)
+                    j = min(n, i + self.maxsize - self._qsize())
+                else:
+                    j = n
+                for k in range(i, j):
+                    self._put(items[k])
+                self.unfinished_tasks += j - i
+                self.not_empty.notify(j - i)
+                i = j
+
+    def get_many(self, max_items, block=True, timeout=None):
+        '''Remove and return a list of up to 'max_items' items from the queue.
+
+        'block' and 'timeout' have the same meaning as for get() and apply
+        to the first item only: the list holds the items available at that
+        point, up to 'max_items'.  The mutex is acquired once and waiting
+        producers are notified once for the whole batch.
+        '''
+        if max_items < 1:
+            raise ValueError("'max_items' must be a positive integer")
+        with self.not_empty:
+            if not block:
+                if not self._qsize():
+                    raise Empty
+            elif timeout is None:
+                while not self._qsize():
+                    self.not_empty.wait()
+            elif timeout < 0:
+                raise ValueError("'timeout' must be a non-negative number")
+            else:
+                endtime = time() + timeout
+                while not self._qsize():
+                    remaining = endtime - time()
+                    if remaining <= 0.0:
+                        raise Empty
+                    self.not_empty.wait(remaining)
+            n = min(max_items, self._qsize())
+            items = [self._get() for i in range(n)]
+            self.not_full.notify(n)
+            return items
+
     def put_nowait(self, item):
         '''Put an item into the queue without blocking.
 
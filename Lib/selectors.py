@@ -240,20 +240,31 @@ class _BaseSelectorImpl(BaseSelector):
         return key
 
     def modify(self, fileobj, events, data=None):
-        # TODO: Subclasses can probably optimize this even further.
         try:
             key = self._fd_to_key[self._fileobj_lookup(fileobj)]
         except KeyError:
             raise KeyError("{!r} is not registered".format(fileobj)) from None
         if events != key.events:
-            self.unregister(fileobj)
-            key = self.register(fileobj, events, data)
+            if (not events) or (events & ~(EVENT_READ | EVENT_WRITE)):
+                raise ValueError("Invalid events: {!r}".format(events))
+            self._modify(key, events)
+            key = key._replace(events=events, data=data)
+            self._fd_to_key[key.fd] = key
         elif data != key.data:
             # Use a shortcut to update the data.
             key = key._replace(data=data)
             self._fd_to_key[key.fd] = key
         return key
 
+    def _modify(self, key, events):
+        """Change the events monitored for a registered key.
+
+        The key is replaced in the map by the caller.  Subclasses
+        override this to update the registration in place.
+        """
+        self.unregister(key.fileobj)
+        self.register(key.fileobj, events, key.data)
+
     def close(self):
         self._fd_to_key.clear()
 
@@ -297,6 +308,16 @@ class SelectSelector(_BaseSelectorImpl):
         self._writers.discard(key.fd)
         return key
 
+    def _modify(self, key, events):
+        if events & EVENT_READ:
+            self._readers.add(key.fd)
+        else:
+            self._readers.discard(key.fd)
+        if events & EVENT_WRITE:
+            self._writers.add(key.fd)
+        else:
+            self._writers.discard(key.fd)
+
     if sys.platform == 'win32':
         def _select(self, r, w, _, timeout=None):
             r, w, x = select.select(r, w, w, timeout)
@@ -335,14 +356,17 @@ if hasattr(select, 'poll'):
             super().__init__()
             self._poll = select.poll()
 
-        def register(self, fileobj, events, data=None):
-            key = super().register(fileobj, events, data)
+        def _poll_events(self, events):
             poll_events = 0
             if events & EVENT_READ:
                 poll_events |= select.POLLIN
             if events & EVENT_WRITE:
                 poll_events |= select.POLLOUT
-            self._poll.register(key.fd, poll_events)
+            return poll_events
+
+        def register(self, fileobj, events, data=None):
+            key = super().register(fileobj, events, data)
+            self._poll.register(key.fd, self._poll_events(events))
             return key
 
         def unregister(self, fileobj):
@@ -350,6 +374,9 @@ if hasattr(select, 'poll'):
             self._poll.unregister(key.fd)
             return key
 
+        def _modify(self, key, events):
+            self._poll.modify(key.fd, self._poll_events(events))
+
         def select(self, timeout=None):
             timeout = None if timeout is None else max(int(1000 * timeout), 0)
             ready = []
@@ -357,6 +384,7 @@ if hasattr(select, 'poll'):
                 fd_event_list = self._poll.poll(timeout)
             except InterruptedError:
                 return ready
+            fd_to_key = self._fd_to_key
             for fd, event in fd_event_list:
                 events = 0
                 if event & ~select.POLLIN:
@@ -364,7 +392,7 @@ if hasattr(select, 'poll'):
                 if event & ~select.POLLOUT:
                     events |= EVENT_READ
 
-                key = self._key_from_fd(fd)
+                key = fd_to_key.get(fd)
                 if key:
                     ready.append((key, events & key.events))
             return ready
@@ -373,23 +401,34 @@ if hasattr(select, 'poll'):
 if hasattr(select, 'epoll'):
 
     class EpollSelector(_BaseSelectorImpl):
-        """Epoll-based selector."""
+        """Epoll-based selector.
 
-        def __init__(self):
+        If edge_triggered is true, the file objects are registered with
+        EPOLLET: a file object is only reported again once new data has
+        arrived or buffer space has been freed since it was last
+        reported, so it must be read or written until the operation
+        would block.
+        """
+
+        def __init__(self, edge_triggered=False):
             super().__init__()
             self._epoll = select.epoll()
+            self.edge_triggered = edge_triggered
 
         def fileno(self):
             return self._epoll.fileno()
 
-        def register(self, fileobj, events, data=None):
-            key = super().register(fileobj, events, data)
-            epoll_events = 0
+        def _epoll_events(self, events):
+            epoll_events = select.EPOLLET if self.edge_triggered else 0
             if events & EVENT_READ:
                 epoll_events |= select.EPOLLIN
             if events & EVENT_WRITE:
                 epoll_events |= select.EPOLLOUT
-            self._epoll.register(key.fd, epoll_events)
+            return epoll_events
+
+        def register(self, fileobj, events, data=None):
+            key = super().register(fileobj, events, data)
+            self._epoll.register(key.fd, self._epoll_events(events))
             return key
 
         def unregister(self, fileobj):
@@ -402,6 +441,9 @@ if hasattr(select, 'epoll'):
                 pass
             return key
 
+        def _modify(self, key, events):
+            self._epoll.modify(key.fd, self._epoll_events(events))
+
         def select(self, timeout=None):
             timeout = -1 if timeout is None else max(timeout, 0)
             max_ev = len(self._fd_to_key)
@@ -410,6 +452,7 @@ if hasattr(select, 'epoll'):
                 fd_event_list = self._epoll.poll(timeout, max_ev)
             except InterruptedError:
                 return ready
+            fd_to_key = self._fd_to_key
             for fd, event in fd_event_list:
                 events = 0
                 if event & ~select.EPOLLIN:
@@ -417,7 +460,7 @@ if hasattr(select, 'epoll'):
                 if event & ~select.EPOLLOUT:
                     events |= EVENT_READ
 
-                key = self._key_from_fd(fd)
+                key = fd_to_key.get(fd)
                 if key:
                     ready.append((key, events & key.events))
             return ready
@@ -430,25 +473,38 @@ if hasattr(select, 'epoll'):
 if hasattr(select, 'kqueue'):
 
     class KqueueSelector(_BaseSelectorImpl):
-        """Kqueue-based selector."""
+        """Kqueue-based selector.
 
-        def __init__(self):
+        If edge_triggered is true, the events are registered with
+        EV_CLEAR: a file object is only reported again once its state
+        has changed since it was last reported.
+        """
+
+        def __init__(self, edge_triggered=False):
             super().__init__()
             self._kqueue = select.kqueue()
+            self.edge_triggered = edge_triggered
 
         def fileno(self):
             return self._kqueue.fileno()
 
+        def _add_flags(self):
+            flags = select.KQ_EV_ADD
+            if self.edge_triggered:
+                flags |= select.KQ_EV_CLEAR
+            return flags
+
         def register(self, fileobj, events, data=None):
             key = super().register(fileobj, events, data)
+            flags = self._add_flags()
+            kev_list = []
             if events & EVENT_READ:
-                kev = select.kevent(key.fd, select.KQ_FILTER_READ,
-                                    select.KQ_EV_ADD)
-                self._kqueue.control([kev], 0, 0)
+                kev_list.append(select.kevent(key.fd, select.KQ_FILTER_READ,
+                                              flags))
             if events & EVENT_WRITE:
-                kev = select.kevent(key.fd, select.KQ_FILTER_WRITE,
-                                    select.KQ_EV_ADD)
-                self._kqueue.control([kev], 0, 0)
+                kev_list.append(select.kevent(key.fd, select.KQ_FILTER_WRITE,
+                                              flags))
+            self._kqueue.control(kev_list, 0, 0)
             return key
 
         def unregister(self, fileobj):
@@ -472,6 +528,19 @@ if hasattr(select, 'kqueue'):
                     pass
             return key
 
+        def _modify(self, key, events):
+            # Add and delete the filters that change in a single call.
+            flags = self._add_flags()
+            kev_list = []
+            for event, kq_filter in ((EVENT_READ, select.KQ_FILTER_READ),
+                                     (EVENT_WRITE, select.KQ_FILTER_WRITE)):
+                if events & event and not key.events & event:
+                    kev_list.append(select.kevent(key.fd, kq_filter, flags))
+                elif key.events & event and not events & event:
+                    kev_list.append(select.kevent(key.fd, kq_filter,
+                                                  select.KQ_EV_DELETE))
+            self._kqueue.control(kev_list, 0, 0)
+
         def select(self, timeout=None):
             timeout = None if timeout is None else max(timeout, 0)
             max_ev = len(self._fd_to_key)
@@ -480,6 +549,7 @@ if hasattr(select, 'kqueue'):
                 kev_list = self._kqueue.control(None, max_ev, timeout)
             except InterruptedError:
                 return ready
+            fd_to_key = self._fd_to_key
             for kev in kev_list:
                 fd = kev.ident
                 flag = kev.filter
@@ -489,7 +559,7 @@ if hasattr(select, 'kqueue'):
                 if flag == select.KQ_FILTER_WRITE:
                     events |= EVENT_WRITE
 
-                key = self._key_from_fd(fd)
+                key = fd_to_key.get(fd)
                 if key:
                     ready.append((key, events & key.events))
             return ready
@@ -60,6 +60,62 @@ class RegistryError(Exception):
     and unpacking registeries fails"""
 
 
+class _GiveupOnFastCopy(Exception):
+    """Raised as a signal to fallback on using raw read()/write()
+    file copy when fast-copy functions fail to do so.
+    """
+
+
+# sendfile() can copy between regular files since Linux 2.6.33.
+_USE_CP_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+
+
+def _fastcopy_sendfile(fsrc, fdst):
+    """Copy data from one regular file to another with os.sendfile(),
+    without going through user space.
+    """
+    global _USE_CP_SENDFILE
+    try:
+        infd = fsrc.fileno()
+        outfd = fdst.fileno()
+    except Exception as err:
+        raise _GiveupOnFastCopy(err)  # not a regular file
+
+    # Copy the file in as few calls as possible, in blocks of at least
+    # 8 MiB in case the source grows while being copied.
+    try:
+        blocksize = max(os.fstat(infd).st_size, 2 ** 23)
+    except OSError:
+        blocksize = 2 ** 27  # 128 MiB
+    # On 32-bit architectures truncate to 1 GiB to avoid OverflowError.
+    if sys.maxsize < 2 ** 32:
+        blocksize = min(blocksize, 2 ** 30)
+
+    offset = 0
+    while True:
+        try:
+            sent = os.sendfile(outfd, infd, offset, blocksize)
+        except OSError as err:
+            err.filename = fsrc.name
+            err.filename2 = fdst.name
+            if err.errno == errno.ENOTSOCK:
+                # sendfile() on this platform (probably Linux < 2.6.33)
+                # does not support copies between regular files (only
+                # sockets).
+                _USE_CP_SENDFILE = False
+                raise _GiveupOnFastCopy(err)
+            if err.errno == errno.ENOSPC:  # filesystem is full
+                raise err from None
+            # Give up on the first call if no data was copied.
+            if offset == 0 and os.lseek(outfd, 0, os.SEEK_CUR) == 0:
+                raise _GiveupOnFastCopy(err)
+            raise err
+        else:
+            if sent == 0:
+                break  # EOF
+            offset += sent
+
+
 def copyfileobj(fsrc, fdst, length=16*1024):
     """copy data from file-like object fsrc to file-like object fdst"""
     while 1:
@@ -106,6 +162,12 @@ def copyfile(src, dst, *, follow_symlinks=True):
     else:
         with open(src, 'rb') as fsrc:
             with open(dst, 'wb') as fdst:
+                if _USE_CP_SENDFILE:
+                    try:
+                        _fastcopy_sendfile(fsrc, fdst)
+                        return dst
+                    except _GiveupOnFastCopy:
+                        pass
                 copyfileobj(fsrc, fdst)
     return dst
 
@@ -250,11 +312,9 @@ def ignore_patterns(*patterns):
 
     Patterns is a sequence of glob-style patterns
     that are used to exclude files"""
+    matcher = fnmatch.MultiPattern(patterns)
     def _ignore_patterns(path, names):
-        ignored_names = []
-        for pattern in patterns:
-            ignored_names.extend(fnmatch.filter(names, pattern))
-        return set(ignored_names)
+        return set(matcher.filter(names))
     return _ignore_patterns
 
 def copytree(src, dst, symlinks=False, ignore=None, copy_function=copy2,
@@ -293,21 +353,24 @@ def copytree(src, dst, symlinks=False, ignore=None, copy_function=copy2,
     function that supports the same signature (like copy()) can be used.
 
     """
-    names = os.listdir(src)
+    with os.scandir(src) as scandir_it:
+        entries = list(scandir_it)
     if ignore is not None:
-        ignored_names = ignore(src, names)
+        ignored_names = ignore(src, [entry.name for entry in entries])
     else:
         ignored_names = set()
 
     os.makedirs(dst)
     errors = []
-    for name in names:
+    for entry in entries:
+        name = entry.name
         if name in ignored_names:
             continue
         srcname = os.path.join(src, name)
         dstname = os.path.join(dst, name)
         try:
-            if os.path.islink(srcname):
+            # The entries usually know their type without a stat() call.
+            if entry.is_symlink():
                 linkto = os.readlink(srcname)
                 if symlinks:
                     # We can't just leave it to `copy_function` because legacy
@@ -321,7 +384,7 @@ def copytree(src, dst, symlinks=False, ignore=None, copy_function=copy2,
                         continue
                     # otherwise let the copy occurs. copy2 will raise an error
                     copy_function(srcname, dstname)
-            elif os.path.isdir(srcname):
+            elif entry.is_dir():
                 copytree(srcname, dstname, symlinks, ignore, copy_function)
             else:
                 # Will raise a SpecialFileError for unsupported file types
@@ -352,18 +415,20 @@ def _rmtree_unsafe(path, onerror):
         onerror(os.path.islink, path, sys.exc_info())
         # can't continue even if onerror hook returns
         return
-    names = []
+    entries = []
     try:
-        names = os.listdir(path)
+        with os.scandir(path) as scandir_it:
+            entries = list(scandir_it)
     except OSError:
+        # Report the listing failure as os.listdir, as documented.
         onerror(os.listdir, path, sys.exc_info())
-    for name in names:
-        fullname = os.path.join(path, name)
+    for entry in entries:
+        fullname = entry.path
         try:
-            mode = os.lstat(fullname).st_mode
+            is_dir = entry.is_dir(follow_symlinks=False)
         except OSError:
-            mode = 0
-        if stat.S_ISDIR(mode):
+            is_dir = False
+        if is_dir:
             _rmtree_unsafe(fullname, onerror)
         else:
             try:
@@ -377,20 +442,25 @@ def _rmtree_unsafe(path, onerror):
 
 # Version using fd-based APIs to protect against races
 def _rmtree_safe_fd(topfd, path, onerror):
-    names = []
+    entries = []
     try:
-        names = os.listdir(topfd)
+        with os.scandir(topfd) as scandir_it:
+            entries = list(scandir_it)
     except OSError as err:
         err.filename = path
         onerror(os.listdir, path, sys.exc_info())
-    for name in names:
+    for entry in entries:
+        name = entry.name
         fullname = os.path.join(path, name)
+        # Only directories need a stat() call, for the check below.
         try:
-            orig_st = os.stat(name, dir_fd=topfd, follow_symlinks=False)
-            mode = orig_st.st_mode
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if is_dir:
+                orig_st = entry.stat(follow_symlinks=False)
+                is_dir = stat.S_ISDIR(orig_st.st_mode)
         except OSError:
-            mode = 0
-        if stat.S_ISDIR(mode):
+            is_dir = False
+        if is_dir:
             try:
                 dirfd = os.open(name, os.O_RDONLY, dir_fd=topfd)
             except OSError:
@@ -422,7 +492,7 @@ def _rmtree_safe_fd(topfd, path, onerror):
 
 _use_fd_functions = ({os.open, os.stat, os.unlink, os.rmdir} <=
                      os.supports_dir_fd and
-                     os.listdir in os.supports_fd and
+                     os.scandir in os.supports_fd and
                      os.stat in os.supports_follow_symlinks)
 
 def rmtree(path, ignore_errors=False, onerror=None):
@@ -59,6 +59,14 @@ The Mix-in class must come first, since it overrides a method defined
 in UDPServer! Setting the various member variables also changes
 the behavior of the underlying server mechanism.
 
+ThreadPoolMixIn handles the requests in a bounded pool of reused
+threads instead, and PreForkingMixIn in a fixed number of processes
+forked when serve_forever() starts, which all accept requests on the
+listening socket.  They can be combined:
+
+        class PreForkingThreadPoolTCPServer(PreForkingMixIn,
+                                            ThreadPoolMixIn, TCPServer): pass
+
 To implement a service, you must derive a class from
 BaseRequestHandler and redefine its handle() method.  You can then run
 various versions of the service by combining one of the server classes
@@ -134,6 +142,8 @@ import select
 import sys
 import os
 import errno
+import queue
+import signal
 try:
     import threading
 except ImportError:
@@ -142,7 +152,9 @@ except ImportError:
 __all__ = ["TCPServer","UDPServer","ForkingUDPServer","ForkingTCPServer",
            "ThreadingUDPServer","ThreadingTCPServer","BaseRequestHandler",
            "StreamRequestHandler","DatagramRequestHandler",
-           "ThreadingMixIn", "ForkingMixIn"]
+           "ThreadingMixIn", "ForkingMixIn", "ThreadPoolMixIn",
+           "PreForkingMixIn", "ThreadPoolUDPServer", "ThreadPoolTCPServer",
+           "PreForkingUDPServer", "PreForkingTCPServer"]
 if hasattr(socket, "AF_UNIX"):
     __all__.extend(["UnixStreamServer","UnixDatagramServer",
                     "ThreadingUnixStreamServer",
@@ -621,12 +633,199 @@ class ThreadingMixIn:
         t.start()
 
 
+class ThreadPoolMixIn(ThreadingMixIn):
+    """Mix-in class to handle requests in a bounded pool of threads."""
+
+    # Maximum number of worker threads.  They are started on demand and
+    # then reused for the following requests.
+    max_threads = 16
+
+    # Maximum number of accepted requests waiting for a free worker;
+    # when it is reached the server stops accepting new requests until
+    # one is taken.  0 means no limit.
+    max_queued_requests = 64
+
+    # Idle workers would otherwise keep the interpreter alive; use
+    # server_close() to wait for the pending requests.
+    daemon_threads = True
+
+    _request_queue = None
+    _workers = None
+
+    def process_request_worker(self):
+        """Run process_request_thread() for the queued requests."""
+        while True:
+            item = self._request_queue.get()
+            if item is None:
+                return
+            self.process_request_thread(*item)
+
+    def process_request(self, request, client_address):
+        """Queue the request for a worker thread."""
+        if self._request_queue is None:
+            self._request_queue = queue.Queue(self.max_queued_requests)
+            self._workers = []
+        self._request_queue.put((request, client_address))
+        if len(self._workers) < self.max_threads:
+            t = threading.Thread(target = self.process_request_worker)
+            t.daemon = self.daemon_threads
+            t.start()
+            self._workers.append(t)
+
+    def server_close(self):
+        """Close the server, then wait for the queued requests."""
+        super().server_close()
+        workers, self._workers = self._workers, None
+        if workers:
+            for t in workers:
+                self._request_queue.put(None)
+            for t in workers:
+                t.join()
+        self._request_queue = None
+
+
+class PreForkingMixIn:
+    """Mix-in class to handle requests in a fixed set of processes.
+
+    serve_forever() forks num_children processes which all accept
+    requests on the listening socket, and replaces those which exit.
+    Each child handles the requests itself with process_request(), so
+    that the mix-in may be combined with ThreadPoolMixIn.
+    """
+
+    num_children = 4
+    active_children = None
+
+    def __init__(self, *args, **kwargs):
+        self.__shutdown_request = threading.Event()
+        self.__is_shut_down = threading.Event()
+        super().__init__(*args, **kwargs)
+
+    def serve_forever(self, poll_interval=0.5):
+        """Fork the children and supervise them until shutdown.
+
+        Children are polled every poll_interval seconds, which is also
+        how often they check for their own termination.
+        """
+        self.__is_shut_down.clear()
+        if self.active_children is None:
+            self.active_children = []
+        try:
+            while not self.__shutdown_request.is_set():
+                self.collect_children()
+                while len(self.active_children) < self.num_children:
+                    self.fork_child(poll_interval)
+                self.__shutdown_request.wait(poll_interval)
+        finally:
+            self.stop_children()
+            # The children switched the shared socket to non-blocking
+            # mode; restore the mode used by this process.
+            self.socket.settimeout(self.socket.gettimeout())
+            self.__shutdown_request.clear()
+            self.__is_shut_down.set()
+
+    def shutdown(self):
+        """Stops the serve_forever loop and the children.
+
+        Blocks until the children have finished their requests and
+        exited.
+        """
+        self.__shutdown_request.set()
+        self.__is_shut_down.wait()
+
+    def collect_children(self):
+        """Internal routine to wait for children that have exited."""
+        for child in self.active_children[:]:
+            try:
+                pid, status = os.waitpid(child, os.WNOHANG)
+            except ChildProcessError:
+                pid = child
+            if pid:
+                self.active_children.remove(child)
+
+    def stop_children(self):
+        """Ask the children to exit and wait for them."""
+        for child in self.active_children:
+            try:
+                os.kill(child, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for child in self.active_children:
+            try:
+                _eintr_retry(os.waitpid, child, 0)
+            except ChildProcessError:
+                pass
+        self.active_children = []
+
+    def fork_child(self, poll_interval):
+        """Fork a new child process accepting requests."""
+        pid = os.fork()
+        if pid:
+            # Parent process
+            self.active_children.append(pid)
+            return
+        # Child process.
+        # This must never return, hence os._exit()!
+        status = 1
+        try:
+            self.active_children = None
+            self.serve_child(poll_interval)
+            status = 0
+        except:
+            import traceback
+            traceback.print_exc()
+        finally:
+            os._exit(status)
+
+    def serve_child(self, poll_interval):
+        """Handle requests in a child process until SIGTERM.
+
+        The request being handled, if any, is completed first.
+        """
+        stopping = False
+        def stop(signum, frame):
+            nonlocal stopping
+            stopping = True
+        signal.signal(signal.SIGTERM, stop)
+        # The parent stops the children on KeyboardInterrupt.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        # Another child may accept the request first: get_request()
+        # must not block then.
+        self.socket.setblocking(False)
+        try:
+            while not stopping:
+                r, w, e = _eintr_retry(select.select, [self], [], [],
+                                       poll_interval)
+                if self in r:
+                    self._handle_request_noblock()
+                self.service_actions()
+        finally:
+            self.server_close()
+
+    def get_request(self):
+        """Get the request and client address from the socket.
+
+        Accepted sockets are made blocking again: some platforms let
+        them inherit the non-blocking mode of the listening socket.
+        """
+        request, client_address = super().get_request()
+        if isinstance(request, socket.socket):
+            request.settimeout(socket.getdefaulttimeout())
+        return request, client_address
+
+
 class ForkingUDPServer(ForkingMixIn, UDPServer): pass
 class ForkingTCPServer(ForkingMixIn, TCPServer): pass
 
 class ThreadingUDPServer(ThreadingMixIn, UDPServer): pass
 class ThreadingTCPServer(ThreadingMixIn, TCPServer): pass
 
+class ThreadPoolUDPServer(ThreadPoolMixIn, UDPServer): pass
+class ThreadPoolTCPServer(ThreadPoolMixIn, TCPServer): pass
+
+class PreForkingUDPServer(PreForkingMixIn, UDPServer): pass
+class PreForkingTCPServer(PreForkingMixIn, TCPServer): pass
+
 if hasattr(socket, 'AF_UNIX'):
 
     class UnixStreamServer(TCPServer):
@@ -20,6 +20,7 @@ import random
 import logging
 import struct
 import operator
+import pickle
 import test.support
 import test.script_helper
 
@@ -718,6 +719,44 @@ class _TestQueue(BaseTestCase):
         for p in workers:
             p.join()
 
+    @classmethod
+    def _test_put_many(cls, queue):
+        queue.put_many(range(10))
+
+    def test_put_get_many(self):
+        queue = self.Queue(maxsize=4)
+        proc = self.Process(target=self._test_put_many, args=(queue,))
+        proc.daemon = True
+        proc.start()
+        items = []
+        while len(items) < 10:
+            got = queue.get_many(3, True, 10)
+            self.assertTrue(1 <= len(got) <= 3)
+            items.extend(got)
+        self.assertEqual(items, list(range(10)))
+        proc.join()
+
+        self.assertRaises(pyqueue.Empty, queue.get_many, 3, False)
+        self.assertRaises(pyqueue.Empty, queue.get_many, 3, True, TIMEOUT1)
+
+        queue = self.Queue(maxsize=2)
+        self.assertRaises(pyqueue.Full, queue.put_many, [1, 2, 3], False)
+        self.assertRaises(pyqueue.Full, queue.put_many, [3], True, TIMEOUT1)
+        items = []
+        while len(items) < 2:
+            items.extend(queue.get_many(5, True, 10))
+        self.assertEqual(items, [1, 2])
+
+    def test_task_done_many(self):
+        queue = self.JoinableQueue()
+        queue.put_many(range(3))
+        items = []
+        while len(items) < 3:
+            items.extend(queue.get_many(5, True, 10))
+        for item in items:
+            queue.task_done()
+        queue.join()
+
     def test_timeout(self):
         q = multiprocessing.Queue()
         start = time.time()
@@ -1675,6 +1714,10 @@ class _TestPool(BaseTestCase):
         tuples = list(zip(range(100), range(99,-1, -1)))
         self.assertEqual(psmap(mul, tuples, chunksize=20),
                          list(itertools.starmap(mul, tuples)))
+        self.assertEqual(psmap(mul, tuples, max_inflight=3),
+                         list(itertools.starmap(mul, tuples)))
+        self.assertEqual(psmap(mul, tuples, chunksize=7, max_inflight=3),
+                         list(itertools.starmap(mul, tuples)))
 
     def test_starmap_async(self):
         tuples = list(zip(range(100), range(99,-1, -1)))
@@ -1747,6 +1790,57 @@ class _TestPool(BaseTestCase):
         it = self.pool.imap_unordered(sqr, list(range(1000)), chunksize=53)
         self.assertEqual(sorted(it), list(map(sqr, list(range(1000)))))
 
+    def test_imap_max_inflight(self):
+        it = self.pool.imap(sqr, list(range(100)), max_inflight=3)
+        self.assertEqual(list(it), list(map(sqr, list(range(100)))))
+
+        it = self.pool.imap(sqr, list(range(100)), chunksize=7,
+                            max_inflight=2)
+        self.assertEqual(list(it), list(map(sqr, list(range(100)))))
+
+        it = self.pool.imap_unordered(sqr, list(range(100)), max_inflight=1)
+        self.assertEqual(sorted(it), list(map(sqr, list(range(100)))))
+
+        self.assertRaises(ValueError, self.pool.imap, sqr, [], max_inflight=0)
+
+    def test_imap_max_inflight_lazy(self):
+        if self.TYPE == 'manager':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        pulled = []
+        def gen():
+            for i in range(1000):
+                pulled.append(i)
+                yield i
+
+        it = self.pool.imap(sqr, gen(), max_inflight=5)
+        for i in range(10):
+            self.assertEqual(next(it), i*i)
+        self.assertLessEqual(len(pulled), 15)
+
+        # the input is only consumed as the results are
+        del it
+        self.assertEqual(self.pool.map(sqr, range(3)), [0, 1, 4])
+        self.assertLessEqual(len(pulled), 16)
+
+        del pulled[:]
+        it = self.pool.imap_unordered(sqr, gen(), chunksize=10,
+                                      max_inflight=2)
+        for i in range(20):
+            next(it)
+        self.assertLessEqual(len(pulled), 40)
+        it.close()
+        self.assertEqual(self.pool.map(sqr, range(3)), [0, 1, 4])
+
+    def test_imap_max_inflight_other_jobs(self):
+        # a throttled imap() doesn't hold up the other jobs of the pool
+        it = self.pool.imap(sqr, itertools.count(), max_inflight=2)
+        self.assertEqual(next(it), 0)
+        self.assertEqual(self.pool.apply_async(sqr, (7,)).get(timeout=5), 49)
+        for i in range(1, 5):
+            self.assertEqual(next(it), i*i)
+            self.assertEqual(self.pool.apply(sqr, (i,)), i*i)
+        self.assertEqual(it.next(timeout=5), 25)
+
     def test_make_pool(self):
         self.assertRaises(ValueError, multiprocessing.Pool, -1)
         self.assertRaises(ValueError, multiprocessing.Pool, 0)
@@ -2719,6 +2813,112 @@ class _TestHeap(BaseTestCase):
 #
 #
 
+def _raise_zero_division():
+    1/0
+
+class _Unpicklable(object):
+    def __reduce__(self):
+        return (_raise_zero_division, ())
+
+class _TestSharedBuffers(BaseTestCase):
+
+    ALLOWED_TYPES = ('processes',)
+
+    def test_dumps_loads(self):
+        size = 16 * multiprocessing.heap.SharedBuffers.slot_size
+        buffers = multiprocessing.heap.SharedBuffers(
+            size, ctx=multiprocessing.get_context())
+        self.assertEqual(buffers.free_space(), size)
+        big = b'x' * (3 * buffers.slot_size)
+        obj = [big, bytearray(big), b'small', big]
+        data = buffers.dumps(obj)
+        # the large buffers are not part of the pickle
+        self.assertLess(len(data), buffers.slot_size)
+        self.assertEqual(buffers.free_space(), size - 6 * buffers.slot_size)
+        res = buffers.loads(data)
+        self.assertEqual(res, obj)
+        self.assertIs(type(res[1]), bytearray)
+        self.assertIs(res[0], res[3])
+        self.assertEqual(buffers.free_space(), size)
+
+    def test_arena_full(self):
+        size = 2 * multiprocessing.heap.SharedBuffers.slot_size
+        buffers = multiprocessing.heap.SharedBuffers(
+            size, ctx=multiprocessing.get_context())
+        big = b'x' * (3 * buffers.slot_size)
+        data = buffers.dumps(big)
+        self.assertGreater(len(data), len(big))
+        self.assertEqual(buffers.free_space(), size)
+        self.assertEqual(buffers.loads(data), big)
+
+    def test_unpicklable(self):
+        size = 2 * multiprocessing.heap.SharedBuffers.slot_size
+        buffers = multiprocessing.heap.SharedBuffers(
+            size, ctx=multiprocessing.get_context())
+        big = b'x' * buffers.slot_size
+        with self.assertRaises(pickle.PicklingError):
+            buffers.dumps([big, lambda: None])
+        self.assertEqual(buffers.free_space(), size)
+
+    def test_discard(self):
+        size = 4 * multiprocessing.heap.SharedBuffers.slot_size
+        buffers = multiprocessing.heap.SharedBuffers(
+            size, ctx=multiprocessing.get_context())
+        big = b'x' * buffers.slot_size
+        data = buffers.dumps([big, bytearray(big)])
+        self.assertEqual(buffers.free_space(), size - 2 * buffers.slot_size)
+        buffers.discard(data)
+        self.assertEqual(buffers.free_space(), size)
+
+    def test_unpickling_error(self):
+        size = 4 * multiprocessing.heap.SharedBuffers.slot_size
+        buffers = multiprocessing.heap.SharedBuffers(
+            size, ctx=multiprocessing.get_context())
+        big = b'x' * buffers.slot_size
+        data = buffers.dumps([big, _Unpicklable(), bytearray(big)])
+        with self.assertRaises(ZeroDivisionError):
+            buffers.loads(data)
+        self.assertEqual(buffers.free_space(), size)
+
+    def test_send_error(self):
+        size = 4 * multiprocessing.heap.SharedBuffers.slot_size
+        queue = multiprocessing.SimpleQueue(shared_memory=size)
+        queue._writer.close()
+        with self.assertRaises(OSError):
+            queue.put(b'x' * size)
+        self.assertEqual(queue._buffers.free_space(), size)
+
+    @classmethod
+    def _echo(cls, inq, outq):
+        for obj in iter(inq.get, None):
+            outq.put(obj)
+
+    def test_queue(self):
+        inq = self.Queue(shared_memory=2**20)
+        outq = self.Queue(shared_memory=2**20)
+        p = self.Process(target=self._echo, args=(inq, outq))
+        p.daemon = True
+        p.start()
+        objs = [b'x' * 100000, (bytearray(b'y' * 300000), 42), b'small']
+        for obj in objs:
+            inq.put(obj)
+        for obj in objs:
+            self.assertEqual(outq.get(), obj)
+        inq.put(None)
+        p.join()
+        self.assertEqual(inq._buffers.free_space(), 2**20)
+        self.assertEqual(outq._buffers.free_space(), 2**20)
+
+    def test_pool(self):
+        with self.Pool(2, shared_memory=2**20) as pool:
+            res = pool.map(bytes, [200000] * 10)
+            self.assertEqual(res, [bytes(200000)] * 10)
+            self.assertEqual(pool.map(len, res), [200000] * 10)
+
+#
+#
+#
+
 class _Foo(Structure):
     _fields_ = [
         ('x', c_int),
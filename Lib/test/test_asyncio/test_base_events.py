@@ -231,6 +231,50 @@ class BaseEventLoopTests(unittest.TestCase):
         self.assertTrue(processed)
         self.assertEqual([handle], list(self.loop._ready))
 
+    def test_timer_cancel_count(self):
+        h1 = self.loop.call_later(10.0, lambda: True)
+        h2 = self.loop.call_later(20.0, lambda: True)
+        self.assertTrue(h1._scheduled)
+        self.assertEqual(0, self.loop._timer_cancelled_count)
+
+        h2.cancel()
+        h2.cancel()
+        self.assertEqual(1, self.loop._timer_cancelled_count)
+
+        self.loop._process_events = unittest.mock.Mock()
+        h1.cancel()
+        self.loop._run_once()
+        self.assertEqual([], self.loop._scheduled)
+        self.assertEqual(0, self.loop._timer_cancelled_count)
+        self.assertFalse(h1._scheduled)
+        self.assertFalse(h2._scheduled)
+
+    def test__run_once_remove_cancelled_timers(self):
+        n = base_events._MIN_SCHEDULED_TIMER_HANDLES
+        handles = [self.loop.call_later(10.0 + i, lambda: True)
+                   for i in range(2 * n)]
+        # Cancel all handles except the first one, so that none of the
+        # cancelled handles is at the head of the heap.
+        for handle in handles[1:]:
+            handle.cancel()
+
+        self.loop._process_events = unittest.mock.Mock()
+        self.loop._run_once()
+        self.assertEqual([handles[0]], self.loop._scheduled)
+        self.assertEqual(0, self.loop._timer_cancelled_count)
+        self.assertTrue(all(not h._scheduled for h in handles[1:]))
+
+    def test__run_once_keep_few_cancelled_timers(self):
+        handles = [self.loop.call_later(10.0 + i, lambda: True)
+                   for i in range(10)]
+        for handle in handles[1:]:
+            handle.cancel()
+
+        self.loop._process_events = unittest.mock.Mock()
+        self.loop._run_once()
+        self.assertEqual(10, len(self.loop._scheduled))
+        self.assertEqual(9, self.loop._timer_cancelled_count)
+
     def test_run_until_complete_type_error(self):
         self.assertRaises(
             TypeError, self.loop.run_until_complete, 'blah')
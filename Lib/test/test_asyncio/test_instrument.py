@@ -0,0 +1,142 @@
+"""Tests for instrument.py"""
+
+import functools
+import unittest
+import unittest.mock
+
+from asyncio import events
+from asyncio import instrument
+from asyncio import tasks
+from asyncio import test_utils
+
+
+class HistogramTests(unittest.TestCase):
+
+    def test_empty(self):
+        hist = instrument.Histogram()
+        self.assertEqual(0, hist.count)
+        self.assertEqual(0.0, hist.percentile(50))
+        self.assertIn('count=0', repr(hist))
+
+    def test_add(self):
+        hist = instrument.Histogram(resolution=1.0, nbuckets=4)
+        for duration in (0.5, 1.0, 1.5, 3.0, 100.0):
+            hist.add(duration)
+        self.assertEqual(5, hist.count)
+        self.assertEqual(106.0, hist.total)
+        self.assertEqual(100.0, hist.max)
+        self.assertEqual([(1.0, 2), (2.0, 1), (4.0, 1), (float('inf'), 1)],
+                         hist.buckets())
+
+    def test_percentile(self):
+        hist = instrument.Histogram(resolution=1.0, nbuckets=4)
+        for duration in (0.5, 0.5, 0.5, 3.0):
+            hist.add(duration)
+        self.assertEqual(1.0, hist.percentile(50))
+        self.assertEqual(3.0, hist.percentile(100))
+
+
+class FormatCallbackTests(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = test_utils.TestLoop()
+        events.set_event_loop(None)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_function(self):
+        def callback():
+            pass
+
+        description = instrument._format_callback(callback)
+        self.assertIn('callback', description)
+        self.assertIn(__file__.rstrip('c'), description)
+
+    def test_partial(self):
+        description = instrument._format_callback(
+            functools.partial(self.test_partial, 1))
+        self.assertIn('FormatCallbackTests.test_partial at ', description)
+
+    def test_builtin(self):
+        self.assertEqual(repr(print), instrument._format_callback(print))
+
+    def test_task_step(self):
+        @tasks.coroutine
+        def stalling_coro():
+            yield from []
+
+        task = tasks.Task(stalling_coro(), loop=self.loop)
+        description = instrument._format_callback(task._step)
+        self.assertTrue(description.startswith('coroutine stalling_coro at '),
+                        description)
+        test_utils.run_briefly(self.loop)
+        self.assertTrue(task.done())
+
+
+class LoopStatisticsTests(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = events.new_event_loop()
+        events.set_event_loop(None)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_set_instrument(self):
+        self.assertIsNone(self.loop.get_instrument())
+        stats = instrument.LoopStatistics()
+        self.loop.set_instrument(stats)
+        self.assertIs(stats, self.loop.get_instrument())
+        self.loop.set_instrument(None)
+        self.assertIsNone(self.loop.get_instrument())
+
+    def test_run(self):
+        stats = instrument.LoopStatistics()
+        self.loop.set_instrument(stats)
+        for i in range(3):
+            self.loop.call_soon(lambda: None)
+        self.loop.call_soon(lambda: None).cancel()
+        test_utils.run_briefly(self.loop)
+
+        self.assertGreaterEqual(stats.iterations, 1)
+        self.assertEqual(stats.iterations, stats.select_times.count)
+        # run_briefly() schedules one more callback.
+        self.assertEqual(5, stats.max_ready)
+        self.assertGreaterEqual(stats.callback_times.count, 3)
+        self.assertFalse(stats.slow_callbacks)
+        self.assertIn('max ready queue: 5', stats.report())
+
+    @unittest.mock.patch('asyncio.instrument.logger')
+    def test_slow_callback(self, m_logger):
+        stats = instrument.LoopStatistics(slow_callback_duration=0.5)
+
+        def slow_callback():
+            pass
+        handle = events.Handle(slow_callback, ())
+
+        stats.callback_finished(handle, 0.1)
+        self.assertFalse(stats.slow_callbacks)
+        self.assertFalse(m_logger.warning.called)
+
+        stats.callback_finished(handle, 0.75)
+        self.assertEqual(1, len(stats.slow_callbacks))
+        description, duration = stats.slow_callbacks[0]
+        self.assertIn('slow_callback', description)
+        self.assertEqual(0.75, duration)
+        m_logger.warning.assert_called_with(
+            'Executing %s took %.3f seconds', description, 0.75)
+        self.assertIn('slow callback (0.750s)', stats.report())
+
+    def test_max_slow_callbacks(self):
+        stats = instrument.LoopStatistics(slow_callback_duration=0.0,
+                                          max_slow_callbacks=2)
+        handle = events.Handle(lambda: None, ())
+        with unittest.mock.patch('asyncio.instrument.logger'):
+            for i in range(5):
+                stats.callback_finished(handle, float(i))
+        self.assertEqual([3.0, 4.0], [d for _, d in stats.slow_callbacks])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -287,6 +287,48 @@ class QueueGetTests(_QueueTestBase):
         self.assertEqual(self.loop.run_until_complete(q.get()), 'b')
 
 
+    def test_get_many(self):
+        q = queues.Queue(loop=self.loop)
+        for i in range(5):
+            q.put_nowait(i)
+
+        res = self.loop.run_until_complete(q.get_many(3))
+        self.assertEqual([0, 1, 2], res)
+        res = self.loop.run_until_complete(q.get_many(3))
+        self.assertEqual([3, 4], res)
+        self.assertTrue(q.empty())
+        self.assertRaises(ValueError,
+                          self.loop.run_until_complete, q.get_many(0))
+
+    def test_get_many_wait(self):
+        q = queues.Queue(loop=self.loop)
+
+        @tasks.coroutine
+        def queue_get_many():
+            return (yield from q.get_many(10))
+
+        t = tasks.Task(queue_get_many(), loop=self.loop)
+        test_utils.run_briefly(self.loop)
+        self.assertFalse(t.done())
+        q.put_nowait(1)
+        q.put_nowait(2)
+        self.assertEqual([1, 2], self.loop.run_until_complete(t))
+
+    def test_get_many_with_putters(self):
+        q = queues.Queue(1, loop=self.loop)
+        q.put_nowait(1)
+
+        @tasks.coroutine
+        def queue_put_many():
+            yield from q.put_many([2, 3])
+
+        t = tasks.Task(queue_put_many(), loop=self.loop)
+        test_utils.run_briefly(self.loop)
+        self.assertEqual([1, 2], self.loop.run_until_complete(q.get_many(5)))
+        self.assertEqual([3], self.loop.run_until_complete(q.get_many(5)))
+        self.loop.run_until_complete(t)
+
+
 class QueuePutTests(_QueueTestBase):
 
     def test_blocking_put(self):
@@ -333,6 +375,39 @@ class QueuePutTests(_QueueTestBase):
         loop.run_until_complete(queue_get())
         self.assertAlmostEqual(0.01, loop.time())
 
+    def test_put_many(self):
+        q = queues.Queue(loop=self.loop)
+        self.loop.run_until_complete(q.put_many([1, 2, 3]))
+        self.assertEqual([1, 2, 3], [q.get_nowait() for i in range(3)])
+
+    def test_put_many_with_waiting_getters(self):
+        q = queues.Queue(loop=self.loop)
+        t1 = tasks.Task(q.get(), loop=self.loop)
+        t2 = tasks.Task(q.get(), loop=self.loop)
+        test_utils.run_briefly(self.loop)
+        self.loop.run_until_complete(q.put_many([1, 2, 3]))
+        self.assertEqual(1, self.loop.run_until_complete(t1))
+        self.assertEqual(2, self.loop.run_until_complete(t2))
+        self.assertEqual(3, q.get_nowait())
+
+    def test_put_many_wait(self):
+        q = queues.Queue(maxsize=2, loop=self.loop)
+        t = tasks.Task(q.put_many(range(5)), loop=self.loop)
+        test_utils.run_briefly(self.loop)
+        self.assertFalse(t.done())
+        self.assertEqual(2, q.qsize())
+
+        @tasks.coroutine
+        def consume():
+            items = []
+            while len(items) < 5:
+                items.extend((yield from q.get_many(5)))
+            return items
+
+        self.assertEqual([0, 1, 2, 3, 4],
+                         self.loop.run_until_complete(consume()))
+        self.loop.run_until_complete(t)
+
     def test_nonblocking_put(self):
         q = queues.Queue(loop=self.loop)
         q.put_nowait(1)
@@ -445,6 +520,14 @@ class JoinableQueueTests(_QueueTestBase):
         for i in range(2):
             q.put_nowait(0)
 
+    def test_task_done_many(self):
+        q = queues.JoinableQueue(loop=self.loop)
+        self.loop.run_until_complete(q.put_many(range(3)))
+        self.assertEqual(3, q._unfinished_tasks)
+        for item in self.loop.run_until_complete(q.get_many(3)):
+            q.task_done()
+        self.loop.run_until_complete(q.join())
+
     def test_join_empty_queue(self):
         q = queues.JoinableQueue(loop=self.loop)
 
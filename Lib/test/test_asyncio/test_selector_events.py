@@ -3,9 +3,12 @@
 import collections
 import errno
 import gc
+import io
+import os
 import pprint
 import socket
 import sys
+import tempfile
 import unittest
 import unittest.mock
 try:
@@ -14,6 +17,7 @@ except ImportError:
     ssl = None
 
 from asyncio import futures
+from asyncio import selector_events
 from asyncio import selectors
 from asyncio import test_utils
 from asyncio.protocols import DatagramProtocol, Protocol
@@ -36,6 +40,10 @@ def list_to_buffer(l=()):
     return bytearray().join(l)
 
 
+def list_to_queue(l=()):
+    return collections.deque(l)
+
+
 class BaseSelectorEventLoopTests(unittest.TestCase):
 
     def setUp(self):
@@ -809,18 +817,18 @@ class SelectorSocketTransportTests(unittest.TestCase):
     def test_write_no_data(self):
         transport = _SelectorSocketTransport(
             self.loop, self.sock, self.protocol)
-        transport._buffer.extend(b'data')
+        transport._buffer.append(b'data')
         transport.write(b'')
         self.assertFalse(self.sock.send.called)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_queue([b'data']), transport._buffer)
 
     def test_write_buffer(self):
         transport = _SelectorSocketTransport(
             self.loop, self.sock, self.protocol)
-        transport._buffer.extend(b'data1')
+        transport._buffer.append(b'data1')
         transport.write(b'data2')
         self.assertFalse(self.sock.send.called)
-        self.assertEqual(list_to_buffer([b'data1', b'data2']),
+        self.assertEqual(list_to_queue([b'data1', b'data2']),
                          transport._buffer)
 
     def test_write_partial(self):
@@ -832,7 +840,7 @@ class SelectorSocketTransportTests(unittest.TestCase):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_queue([b'ta']), transport._buffer)
 
     def test_write_partial_bytearray(self):
         data = bytearray(b'data')
@@ -843,7 +851,7 @@ class SelectorSocketTransportTests(unittest.TestCase):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_queue([b'ta']), transport._buffer)
         self.assertEqual(data, bytearray(b'data'))  # Hasn't been mutated.
 
     def test_write_partial_memoryview(self):
@@ -855,7 +863,7 @@ class SelectorSocketTransportTests(unittest.TestCase):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_queue([b'ta']), transport._buffer)
 
     def test_write_partial_none(self):
         data = b'data'
@@ -867,7 +875,7 @@ class SelectorSocketTransportTests(unittest.TestCase):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_queue([b'data']), transport._buffer)
 
     def test_write_tryagain(self):
         self.sock.send.side_effect = BlockingIOError
@@ -878,7 +886,7 @@ class SelectorSocketTransportTests(unittest.TestCase):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_queue([b'data']), transport._buffer)
 
     @unittest.mock.patch('asyncio.selector_events.logger')
     def test_write_exception(self, m_log):
@@ -921,7 +929,7 @@ class SelectorSocketTransportTests(unittest.TestCase):
 
         transport = _SelectorSocketTransport(
             self.loop, self.sock, self.protocol)
-        transport._buffer.extend(data)
+        transport._buffer.append(data)
         self.loop.add_writer(7, transport._write_ready)
         transport._write_ready()
         self.assertTrue(self.sock.send.called)
@@ -934,7 +942,7 @@ class SelectorSocketTransportTests(unittest.TestCase):
         transport = _SelectorSocketTransport(
             self.loop, self.sock, self.protocol)
         transport._closing = True
-        transport._buffer.extend(data)
+        transport._buffer.append(data)
         self.loop.add_writer(7, transport._write_ready)
         transport._write_ready()
         self.assertTrue(self.sock.send.called)
@@ -954,11 +962,11 @@ class SelectorSocketTransportTests(unittest.TestCase):
 
         transport = _SelectorSocketTransport(
             self.loop, self.sock, self.protocol)
-        transport._buffer.extend(data)
+        transport._buffer.append(data)
         self.loop.add_writer(7, transport._write_ready)
         transport._write_ready()
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_queue([b'ta']), transport._buffer)
 
     def test_write_ready_partial_none(self):
         data = b'data'
@@ -966,23 +974,173 @@ class SelectorSocketTransportTests(unittest.TestCase):
 
         transport = _SelectorSocketTransport(
             self.loop, self.sock, self.protocol)
-        transport._buffer.extend(data)
+        transport._buffer.append(data)
         self.loop.add_writer(7, transport._write_ready)
         transport._write_ready()
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_queue([b'data']), transport._buffer)
 
     def test_write_ready_tryagain(self):
         self.sock.send.side_effect = BlockingIOError
+        self.sock.sendmsg.side_effect = BlockingIOError
 
         transport = _SelectorSocketTransport(
             self.loop, self.sock, self.protocol)
-        transport._buffer = list_to_buffer([b'data1', b'data2'])
+        transport._buffer = list_to_queue([b'data1', b'data2'])
         self.loop.add_writer(7, transport._write_ready)
         transport._write_ready()
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data1data2']), transport._buffer)
+        self.assertEqual(list_to_queue([b'data1', b'data2']),
+                         transport._buffer)
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'needs sendmsg()')
+    def test_write_ready_sendmsg(self):
+        self.sock.sendmsg.return_value = 7
+
+        transport = _SelectorSocketTransport(
+            self.loop, self.sock, self.protocol)
+        transport.writelines([b'data1', b'data2', b'data3'])
+        self.assertFalse(self.sock.send.called)
+        self.assertEqual(1, self.sock.sendmsg.call_count)
+        self.loop.assert_writer(7, transport._write_ready)
+        self.assertEqual(list_to_queue([b'ta2', b'data3']), transport._buffer)
+        self.assertEqual(8, transport.get_write_buffer_size())
+
+        self.sock.sendmsg.return_value = 8
+        transport._write_ready()
+        self.assertFalse(self.loop.writers)
+        self.assertEqual(list_to_queue(), transport._buffer)
+        self.assertEqual(0, transport.get_write_buffer_size())
+
+    def test_write_ready_partial_no_copy(self):
+        data = b'data'
+        self.sock.send.return_value = 2
+
+        transport = _SelectorSocketTransport(
+            self.loop, self.sock, self.protocol)
+        transport.write(data)
+        self.assertIs(data, transport._buffer[0].obj)
+
+    def test_writelines(self):
+        self.sock.send.return_value = 4
+
+        transport = _SelectorSocketTransport(
+            self.loop, self.sock, self.protocol)
+        transport.writelines([b'', bytearray(b'data')])
+        self.sock.send.assert_called_with(b'data')
+        self.assertFalse(self.loop.writers)
+
+    def test_writelines_buffer(self):
+        data = bytearray(b'data2')
+        transport = _SelectorSocketTransport(
+            self.loop, self.sock, self.protocol)
+        transport._buffer.append(b'data1')
+        transport.writelines([data, memoryview(b'data3')])
+        self.assertFalse(self.sock.send.called)
+        self.assertFalse(self.sock.sendmsg.called)
+        data[:] = b'xxxxx'  # Buffered data is not affected.
+        self.assertEqual(list_to_queue([b'data1', b'data2', b'data3']),
+                         transport._buffer)
+
+    def test_writelines_str(self):
+        transport = _SelectorSocketTransport(
+            self.loop, self.sock, self.protocol)
+        self.assertRaises(TypeError, transport.writelines, [b'data', 'str'])
+        self.assertEqual(list_to_queue(), transport._buffer)
+
+    def test_writelines_after_eof(self):
+        transport = _SelectorSocketTransport(
+            self.loop, self.sock, self.protocol)
+        transport.write_eof()
+        self.assertRaises(RuntimeError, transport.writelines, [b'data'])
+
+    @unittest.skipUnless(hasattr(os, 'sendfile'), 'requires os.sendfile()')
+    @unittest.mock.patch('asyncio.selector_events.os.sendfile')
+    def test_sendfile(self, m_sendfile):
+        m_sendfile.return_value = 3
+        transport = _SelectorSocketTransport(
+            self.loop, self.sock, self.protocol)
+        with tempfile.TemporaryFile() as file:
+            file.write(b'0123456789')
+            file.flush()
+            transport.sendfile(file, 2)
+            self.assertEqual(file.tell(), 10)
+        m_sendfile.assert_called_with(7, unittest.mock.ANY, 2, 8)
+        self.assertFalse(self.sock.send.called)
+        self.assertEqual(transport.get_write_buffer_size(), 5)
+        self.loop.assert_writer(7, transport._write_ready)
+
+        m_sendfile.return_value = 5
+        transport._write_ready()
+        m_sendfile.assert_called_with(7, unittest.mock.ANY, 5, 5)
+        self.assertFalse(transport._buffer)
+        self.assertEqual(transport._segments, 0)
+        self.assertFalse(self.loop.writers)
+
+    @unittest.skipUnless(hasattr(os, 'sendfile'), 'requires os.sendfile()')
+    @unittest.mock.patch('asyncio.selector_events.os.sendfile')
+    def test_sendfile_between_data(self, m_sendfile):
+        sent = []
+        def sendmsg(buffers):
+            buffers = [bytes(data) for data in buffers]
+            sent.append(buffers)
+            return sum(map(len, buffers))
+        self.sock.sendmsg.side_effect = sendmsg
+        m_sendfile.return_value = 4
+
+        transport = _SelectorSocketTransport(
+            self.loop, self.sock, self.protocol)
+        transport._buffer.append(memoryview(b'head'))
+        transport._buffer_size = 4
+        with tempfile.TemporaryFile() as file:
+            file.write(b'file')
+            file.flush()
+            transport.sendfile(file)
+        transport.writelines([b'tail1', b'tail2'])
+        self.assertFalse(m_sendfile.called)
+        self.assertEqual(transport.get_write_buffer_size(), 18)
+
+        transport._write_ready()
+        self.assertEqual(sent, [[b'head']])
+        transport._write_ready()
+        m_sendfile.assert_called_with(7, unittest.mock.ANY, 0, 4)
+        transport._write_ready()
+        self.assertEqual(sent, [[b'head'], [b'tail1', b'tail2']])
+        self.assertFalse(transport._buffer)
+        self.assertEqual(transport.get_write_buffer_size(), 0)
+
+    def test_sendfile_not_regular_file(self):
+        self.sock.send.return_value = 4
+        transport = _SelectorSocketTransport(
+            self.loop, self.sock, self.protocol)
+        transport.sendfile(io.BytesIO(b'xxdata'), 2)
+        self.sock.send.assert_called_with(b'data')
+        self.assertFalse(transport._buffer)
+
+    @unittest.skipUnless(hasattr(os, 'sendfile'), 'requires os.sendfile()')
+    @unittest.mock.patch('asyncio.selector_events.os.sendfile')
+    def test_sendfile_abort(self, m_sendfile):
+        m_sendfile.side_effect = BlockingIOError
+        transport = _SelectorSocketTransport(
+            self.loop, self.sock, self.protocol)
+        with tempfile.TemporaryFile() as file:
+            file.write(b'data')
+            file.flush()
+            transport.sendfile(file)
+        segment = transport._buffer[0]
+        self.assertGreaterEqual(segment.fd, 0)
+        transport.abort()
+        self.assertEqual(segment.fd, -1)
+        self.assertFalse(transport._buffer)
+        self.assertEqual(transport.get_write_buffer_size(), 0)
+
+    def test_sendfile_after_eof(self):
+        transport = _SelectorSocketTransport(
+            self.loop, self.sock, self.protocol)
+        transport.write_eof()
+        with tempfile.TemporaryFile() as file:
+            self.assertRaises(RuntimeError, transport.sendfile, file)
 
     def test_write_ready_exception(self):
         err = self.sock.send.side_effect = OSError()
@@ -990,7 +1148,7 @@ class SelectorSocketTransportTests(unittest.TestCase):
         transport = _SelectorSocketTransport(
             self.loop, self.sock, self.protocol)
         transport._fatal_error = unittest.mock.Mock()
-        transport._buffer.extend(b'data')
+        transport._buffer.append(b'data')
         transport._write_ready()
         transport._fatal_error.assert_called_with(err)
 
@@ -1002,7 +1160,7 @@ class SelectorSocketTransportTests(unittest.TestCase):
         transport = _SelectorSocketTransport(
             self.loop, self.sock, self.protocol)
         transport.close()
-        transport._buffer.extend(b'data')
+        transport._buffer.append(b'data')
         transport._write_ready()
         remove_writer.assert_called_with(self.sock_fd)
 
@@ -1022,7 +1180,7 @@ class SelectorSocketTransportTests(unittest.TestCase):
         self.sock.send.side_effect = BlockingIOError
         tr.write(b'data')
         tr.write_eof()
-        self.assertEqual(tr._buffer, list_to_buffer([b'data']))
+        self.assertEqual(tr._buffer, list_to_queue([b'data']))
         self.assertTrue(tr._eof)
         self.assertFalse(self.sock.shutdown.called)
         self.sock.send.side_effect = lambda _: 4
@@ -1042,6 +1200,7 @@ class SelectorSslTransportTests(unittest.TestCase):
         self.sock.fileno.return_value = 7
         self.sslsock = unittest.mock.Mock()
         self.sslsock.fileno.return_value = 1
+        self.sslsock.pending.return_value = 0
         self.sslcontext = unittest.mock.Mock()
         self.sslcontext.wrap_socket.return_value = self.sslsock
 
@@ -1160,12 +1319,54 @@ class SelectorSslTransportTests(unittest.TestCase):
         m_log.warning.assert_called_with('socket.send() raised exception.')
 
     def test_read_ready_recv(self):
-        self.sslsock.recv.return_value = b'data'
+        self.sslsock.recv.side_effect = [b'data', ssl.SSLWantReadError]
         transport = self._make_one()
         transport._read_ready()
         self.assertTrue(self.sslsock.recv.called)
         self.assertEqual((b'data',), self.protocol.data_received.call_args[0])
 
+    def test_read_ready_recv_many(self):
+        self.sslsock.recv.side_effect = [b'data1', b'data2', b'data3',
+                                         ssl.SSLWantReadError]
+        transport = self._make_one()
+        transport._read_ready()
+        self.assertEqual(4, self.sslsock.recv.call_count)
+        self.protocol.data_received.assert_called_once_with(
+            b'data1data2data3')
+
+    def test_read_ready_recv_max_size(self):
+        # Past max_size, keep reading while OpenSSL still holds decrypted
+        # data: the selector would not report it as readable
+        records = [b'data1', b'data2', b'data3', b'data4']
+        self.sslsock.recv.side_effect = lambda n: records.pop(0)
+        self.sslsock.pending.side_effect = lambda: sum(map(len, records))
+        transport = self._make_one()
+        transport.max_size = 10
+        transport._read_ready()
+        self.assertEqual([unittest.mock.call(10)] * 4,
+                         self.sslsock.recv.call_args_list)
+        self.protocol.data_received.assert_called_once_with(
+            b'data1data2data3data4')
+        self.assertEqual(0, self.sslsock.pending())
+
+    def test_read_ready_recv_data_eof(self):
+        self.sslsock.recv.side_effect = [b'data', b'']
+        transport = self._make_one()
+        transport.close = unittest.mock.Mock()
+        transport._read_ready()
+        self.protocol.data_received.assert_called_once_with(b'data')
+        self.protocol.eof_received.assert_called_with()
+        transport.close.assert_called_with()
+
+    def test_read_ready_recv_data_exc(self):
+        err = OSError()
+        self.sslsock.recv.side_effect = [b'data', err]
+        transport = self._make_one()
+        transport._fatal_error = unittest.mock.Mock()
+        transport._read_ready()
+        self.protocol.data_received.assert_called_once_with(b'data')
+        transport._fatal_error.assert_called_with(err)
+
     def test_read_ready_write_wants_read(self):
         self.loop.add_writer = unittest.mock.Mock()
         self.sslsock.recv.side_effect = BlockingIOError
@@ -1247,13 +1448,21 @@ class SelectorSslTransportTests(unittest.TestCase):
         self.assertEqual(list_to_buffer([b'data1data2']), transport._buffer)
 
     def test_write_ready_send_partial(self):
-        self.sslsock.send.return_value = 2
+        self.sslsock.send.side_effect = [2, ssl.SSLWantWriteError]
         transport = self._make_one()
         transport._buffer = list_to_buffer([b'data1', b'data2'])
         transport._write_ready()
         self.assertTrue(self.sslsock.send.called)
         self.assertEqual(list_to_buffer([b'ta1data2']), transport._buffer)
 
+    def test_write_ready_send_many(self):
+        self.sslsock.send.side_effect = [5, 5, ssl.SSLWantWriteError]
+        transport = self._make_one()
+        transport._buffer = list_to_buffer([b'data1', b'data2', b'data3'])
+        transport._write_ready()
+        self.assertEqual(3, self.sslsock.send.call_count)
+        self.assertEqual(list_to_buffer([b'data3']), transport._buffer)
+
     def test_write_ready_send_closing_partial(self):
         self.sslsock.send.return_value = 2
         transport = self._make_one()
@@ -81,13 +81,13 @@ class StreamReaderTests(unittest.TestCase):
         stream = streams.StreamReader(loop=self.loop)
 
         stream.feed_data(b'')
-        self.assertEqual(0, stream._byte_count)
+        self.assertEqual(0, len(stream._buffer))
 
     def test_feed_data_byte_count(self):
         stream = streams.StreamReader(loop=self.loop)
 
         stream.feed_data(self.DATA)
-        self.assertEqual(len(self.DATA), stream._byte_count)
+        self.assertEqual(len(self.DATA), len(stream._buffer))
 
     def test_read_zero(self):
         # Read zero bytes.
@@ -96,7 +96,7 @@ class StreamReaderTests(unittest.TestCase):
 
         data = self.loop.run_until_complete(stream.read(0))
         self.assertEqual(b'', data)
-        self.assertEqual(len(self.DATA), stream._byte_count)
+        self.assertEqual(len(self.DATA), len(stream._buffer))
 
     def test_read(self):
         # Read bytes.
@@ -109,7 +109,7 @@ class StreamReaderTests(unittest.TestCase):
 
         data = self.loop.run_until_complete(read_task)
         self.assertEqual(self.DATA, data)
-        self.assertFalse(stream._byte_count)
+        self.assertFalse(stream._buffer)
 
     def test_read_line_breaks(self):
         # Read bytes without line breaks.
@@ -120,7 +120,7 @@ class StreamReaderTests(unittest.TestCase):
         data = self.loop.run_until_complete(stream.read(5))
 
         self.assertEqual(b'line1', data)
-        self.assertEqual(5, stream._byte_count)
+        self.assertEqual(5, len(stream._buffer))
 
     def test_read_eof(self):
         # Read bytes, stop at eof.
@@ -133,7 +133,7 @@ class StreamReaderTests(unittest.TestCase):
 
         data = self.loop.run_until_complete(read_task)
         self.assertEqual(b'', data)
-        self.assertFalse(stream._byte_count)
+        self.assertFalse(stream._buffer)
 
     def test_read_until_eof(self):
         # Read all bytes until eof.
@@ -149,7 +149,7 @@ class StreamReaderTests(unittest.TestCase):
         data = self.loop.run_until_complete(read_task)
 
         self.assertEqual(b'chunk1\nchunk2', data)
-        self.assertFalse(stream._byte_count)
+        self.assertFalse(stream._buffer)
 
     def test_read_exception(self):
         stream = streams.StreamReader(loop=self.loop)
@@ -176,7 +176,7 @@ class StreamReaderTests(unittest.TestCase):
 
         line = self.loop.run_until_complete(read_task)
         self.assertEqual(b'chunk1 chunk2 chunk3 \n', line)
-        self.assertEqual(len(b'\n chunk4')-1, stream._byte_count)
+        self.assertEqual(len(b'\n chunk4')-1, len(stream._buffer))
 
     def test_readline_limit_with_existing_data(self):
         stream = streams.StreamReader(3, loop=self.loop)
@@ -185,7 +185,7 @@ class StreamReaderTests(unittest.TestCase):
 
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readline())
-        self.assertEqual([b'line2\n'], list(stream._buffer))
+        self.assertEqual(b'line2\n', stream._buffer)
 
         stream = streams.StreamReader(3, loop=self.loop)
         stream.feed_data(b'li')
@@ -194,8 +194,7 @@ class StreamReaderTests(unittest.TestCase):
 
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readline())
-        self.assertEqual([b'li'], list(stream._buffer))
-        self.assertEqual(2, stream._byte_count)
+        self.assertEqual(b'', stream._buffer)
 
     def test_readline_limit(self):
         stream = streams.StreamReader(7, loop=self.loop)
@@ -209,8 +208,7 @@ class StreamReaderTests(unittest.TestCase):
 
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readline())
-        self.assertEqual([b'chunk3\n'], list(stream._buffer))
-        self.assertEqual(7, stream._byte_count)
+        self.assertEqual(b'', stream._buffer)
 
     def test_readline_line_byte_count(self):
         stream = streams.StreamReader(loop=self.loop)
@@ -220,7 +218,8 @@ class StreamReaderTests(unittest.TestCase):
         line = self.loop.run_until_complete(stream.readline())
 
         self.assertEqual(b'line1\n', line)
-        self.assertEqual(len(self.DATA) - len(b'line1\n'), stream._byte_count)
+        self.assertEqual(len(self.DATA) - len(b'line1\n'),
+                         len(stream._buffer))
 
     def test_readline_eof(self):
         stream = streams.StreamReader(loop=self.loop)
@@ -248,7 +247,7 @@ class StreamReaderTests(unittest.TestCase):
         self.assertEqual(b'line2\nl', data)
         self.assertEqual(
             len(self.DATA) - len(b'line1\n') - len(b'line2\nl'),
-            stream._byte_count)
+            len(stream._buffer))
 
     def test_readline_exception(self):
         stream = streams.StreamReader(loop=self.loop)
@@ -261,6 +260,68 @@ class StreamReaderTests(unittest.TestCase):
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readline())
 
+    def test_readuntil(self):
+        stream = streams.StreamReader(loop=self.loop)
+        stream.feed_data(b'chunk1\r')
+        read_task = tasks.Task(stream.readuntil(b'\r\n'), loop=self.loop)
+
+        def cb():
+            stream.feed_data(b'\nchunk2\r\n')
+        self.loop.call_soon(cb)
+
+        line = self.loop.run_until_complete(read_task)
+        self.assertEqual(b'chunk1\r\n', line)
+        self.assertEqual(b'chunk2\r\n', stream._buffer)
+
+    def test_readuntil_eof(self):
+        stream = streams.StreamReader(loop=self.loop)
+        stream.feed_data(b'some\r data')
+        stream.feed_eof()
+
+        data = self.loop.run_until_complete(stream.readuntil(b'\r\n'))
+        self.assertEqual(b'some\r data', data)
+        self.assertFalse(stream._buffer)
+
+    def test_readuntil_limit(self):
+        stream = streams.StreamReader(3, loop=self.loop)
+        stream.feed_data(b'line1||line2||')
+
+        self.assertRaises(
+            ValueError, self.loop.run_until_complete, stream.readuntil(b'||'))
+        self.assertEqual(b'line2||', stream._buffer)
+
+    def test_readuntil_empty_separator(self):
+        stream = streams.StreamReader(loop=self.loop)
+        self.assertRaises(
+            ValueError, self.loop.run_until_complete, stream.readuntil(b''))
+
+    def test_readinto(self):
+        stream = streams.StreamReader(loop=self.loop)
+        buf = bytearray(8)
+        read_task = tasks.Task(stream.readinto(buf), loop=self.loop)
+
+        def cb():
+            stream.feed_data(self.DATA)
+        self.loop.call_soon(cb)
+
+        n = self.loop.run_until_complete(read_task)
+        self.assertEqual(8, n)
+        self.assertEqual(self.DATA[:8], buf)
+        self.assertEqual(self.DATA[8:], stream._buffer)
+
+    def test_readinto_partial_and_eof(self):
+        stream = streams.StreamReader(loop=self.loop)
+        stream.feed_data(b'data')
+        stream.feed_eof()
+        buf = bytearray(8)
+
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(4, n)
+        self.assertEqual(b'data\0\0\0\0', buf)
+
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(0, n)
+
     def test_readexactly_zero_or_less(self):
         # Read exact number of bytes (zero or less).
         stream = streams.StreamReader(loop=self.loop)
@@ -268,11 +329,11 @@ class StreamReaderTests(unittest.TestCase):
 
         data = self.loop.run_until_complete(stream.readexactly(0))
         self.assertEqual(b'', data)
-        self.assertEqual(len(self.DATA), stream._byte_count)
+        self.assertEqual(len(self.DATA), len(stream._buffer))
 
         data = self.loop.run_until_complete(stream.readexactly(-1))
         self.assertEqual(b'', data)
-        self.assertEqual(len(self.DATA), stream._byte_count)
+        self.assertEqual(len(self.DATA), len(stream._buffer))
 
     def test_readexactly(self):
         # Read exact number of bytes.
@@ -289,7 +350,7 @@ class StreamReaderTests(unittest.TestCase):
 
         data = self.loop.run_until_complete(read_task)
         self.assertEqual(self.DATA + self.DATA, data)
-        self.assertEqual(len(self.DATA), stream._byte_count)
+        self.assertEqual(len(self.DATA), len(stream._buffer))
 
     def test_readexactly_eof(self):
         # Read exact number of bytes (eof).
@@ -304,7 +365,22 @@ class StreamReaderTests(unittest.TestCase):
 
         data = self.loop.run_until_complete(read_task)
         self.assertEqual(self.DATA, data)
-        self.assertFalse(stream._byte_count)
+        self.assertFalse(stream._buffer)
+
+    def test_readexactly_above_limit(self):
+        # Reads larger than the pause limit don't stall the transport.
+        stream = streams.StreamReader(limit=4, loop=self.loop)
+        stream.set_transport(unittest.mock.Mock())
+        n = 3 * len(self.DATA)
+        read_task = tasks.Task(stream.readexactly(n), loop=self.loop)
+
+        for i in range(4):
+            test_utils.run_briefly(self.loop)
+            stream.feed_data(self.DATA)
+
+        data = self.loop.run_until_complete(read_task)
+        self.assertEqual(self.DATA * 3, data)
+        self.assertEqual(self.DATA, stream._buffer)
 
     def test_readexactly_exception(self):
         stream = streams.StreamReader(loop=self.loop)
@@ -11,6 +11,10 @@ from random import randrange, shuffle
 import keyword
 import re
 import sys
+import types
+import gc
+import weakref
+import _collections
 from collections import UserDict
 from collections import ChainMap
 from collections.abc import Hashable, Iterable, Iterator
@@ -20,6 +24,14 @@ from collections.abc import Mapping, MutableMapping, KeysView, ItemsView
 from collections.abc import Sequence, MutableSequence
 from collections.abc import ByteString
 
+# collections imported with a _collections module lacking OrderedDict, to
+# test the pure Python implementation.
+_py_collections = types.ModuleType('_collections')
+for _name in ('deque', 'defaultdict', '_count_elements'):
+    setattr(_py_collections, _name, getattr(_collections, _name))
+with support.swap_item(sys.modules, '_collections', _py_collections):
+    py_coll = support.import_fresh_module('collections')
+
 
 ################################################################################
 ### ChainMap (helper class for configparser and the string module)
@@ -1090,9 +1102,10 @@ class TestCounter(unittest.TestCase):
 ### OrderedDict
 ################################################################################
 
-class TestOrderedDict(unittest.TestCase):
+class OrderedDictTests:
 
     def test_init(self):
+        OrderedDict = self.OrderedDict
         with self.assertRaises(TypeError):
             OrderedDict([('a', 1), ('b', 2)], None)                                 # too many args
         pairs = [('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', 5)]
@@ -1103,8 +1116,7 @@ class TestOrderedDict(unittest.TestCase):
                                           c=3, e=5).items()), pairs)                # mixed input
 
         # make sure no positional args conflict with possible kwdargs
-        self.assertEqual(inspect.getargspec(OrderedDict.__dict__['__init__']).args,
-                         ['self'])
+        self.assertEqual(list(OrderedDict(other=42).items()), [('other', 42)])
 
         # Make sure that direct calls to __init__ do not clear previous contents
         d = OrderedDict([('a', 1), ('b', 2), ('c', 3), ('d', 44), ('e', 55)])
@@ -1113,6 +1125,7 @@ class TestOrderedDict(unittest.TestCase):
             [('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', 5), ('f', 6), ('g', 7)])
 
     def test_update(self):
+        OrderedDict = self.OrderedDict
         with self.assertRaises(TypeError):
             OrderedDict().update([('a', 1), ('b', 2)], None)                        # too many args
         pairs = [('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', 5)]
@@ -1150,10 +1163,12 @@ class TestOrderedDict(unittest.TestCase):
             [('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', 5), ('f', 6), ('g', 7)])
 
     def test_abc(self):
+        OrderedDict = self.OrderedDict
         self.assertIsInstance(OrderedDict(), MutableMapping)
         self.assertTrue(issubclass(OrderedDict, MutableMapping))
 
     def test_clear(self):
+        OrderedDict = self.OrderedDict
         pairs = [('c', 1), ('b', 2), ('a', 3), ('d', 4), ('e', 5), ('f', 6)]
         shuffle(pairs)
         od = OrderedDict(pairs)
@@ -1162,6 +1177,7 @@ class TestOrderedDict(unittest.TestCase):
         self.assertEqual(len(od), 0)
 
     def test_delitem(self):
+        OrderedDict = self.OrderedDict
         pairs = [('c', 1), ('b', 2), ('a', 3), ('d', 4), ('e', 5), ('f', 6)]
         od = OrderedDict(pairs)
         del od['a']
@@ -1171,6 +1187,7 @@ class TestOrderedDict(unittest.TestCase):
         self.assertEqual(list(od.items()), pairs[:2] + pairs[3:])
 
     def test_setitem(self):
+        OrderedDict = self.OrderedDict
         od = OrderedDict([('d', 1), ('b', 2), ('c', 3), ('a', 4), ('e', 5)])
         od['c'] = 10           # existing element
         od['f'] = 20           # new element
@@ -1178,6 +1195,7 @@ class TestOrderedDict(unittest.TestCase):
                          [('d', 1), ('b', 2), ('c', 10), ('a', 4), ('e', 5), ('f', 20)])
 
     def test_iterators(self):
+        OrderedDict = self.OrderedDict
         pairs = [('c', 1), ('b', 2), ('a', 3), ('d', 4), ('e', 5), ('f', 6)]
         shuffle(pairs)
         od = OrderedDict(pairs)
@@ -1189,6 +1207,7 @@ class TestOrderedDict(unittest.TestCase):
                          [t[0] for t in reversed(pairs)])
 
     def test_popitem(self):
+        OrderedDict = self.OrderedDict
         pairs = [('c', 1), ('b', 2), ('a', 3), ('d', 4), ('e', 5), ('f', 6)]
         shuffle(pairs)
         od = OrderedDict(pairs)
@@ -1199,6 +1218,7 @@ class TestOrderedDict(unittest.TestCase):
         self.assertEqual(len(od), 0)
 
     def test_pop(self):
+        OrderedDict = self.OrderedDict
         pairs = [('c', 1), ('b', 2), ('a', 3), ('d', 4), ('e', 5), ('f', 6)]
         shuffle(pairs)
         od = OrderedDict(pairs)
@@ -1223,6 +1243,7 @@ class TestOrderedDict(unittest.TestCase):
             m.pop('a')
 
     def test_equality(self):
+        OrderedDict = self.OrderedDict
         pairs = [('c', 1), ('b', 2), ('a', 3), ('d', 4), ('e', 5), ('f', 6)]
         shuffle(pairs)
         od1 = OrderedDict(pairs)
@@ -1238,6 +1259,7 @@ class TestOrderedDict(unittest.TestCase):
         self.assertNotEqual(od1, OrderedDict(pairs[:-1]))
 
     def test_copying(self):
+        OrderedDict = self.OrderedDict
         # Check that ordered dicts are copyable, deepcopyable, picklable,
         # and have a repr/eval round-trip
         pairs = [('c', 1), ('b', 2), ('a', 3), ('d', 4), ('e', 5), ('f', 6)]
@@ -1268,6 +1290,7 @@ class TestOrderedDict(unittest.TestCase):
                 self.assertEqual(dup, od)
 
     def test_yaml_linkage(self):
+        OrderedDict = self.OrderedDict
         # Verify that __reduce__ is setup in a way that supports PyYAML's dump() feature.
         # In yaml, lists are native but tuples are not.
         pairs = [('c', 1), ('b', 2), ('a', 3), ('d', 4), ('e', 5), ('f', 6)]
@@ -1277,6 +1300,7 @@ class TestOrderedDict(unittest.TestCase):
         self.assertTrue(all(type(pair)==list for pair in od.__reduce__()[1]))
 
     def test_reduce_not_too_fat(self):
+        OrderedDict = self.OrderedDict
         # do not save instance dictionary if not needed
         pairs = [('c', 1), ('b', 2), ('a', 3), ('d', 4), ('e', 5), ('f', 6)]
         od = OrderedDict(pairs)
@@ -1285,6 +1309,7 @@ class TestOrderedDict(unittest.TestCase):
         self.assertIsNotNone(od.__reduce__()[2])
 
     def test_pickle_recursive(self):
+        OrderedDict = self.OrderedDict
         od = OrderedDict()
         od[1] = od
         for proto in range(-1, pickle.HIGHEST_PROTOCOL + 1):
@@ -1294,6 +1319,7 @@ class TestOrderedDict(unittest.TestCase):
             self.assertIs(dup[1], dup)
 
     def test_repr(self):
+        OrderedDict = self.OrderedDict
         od = OrderedDict([('c', 1), ('b', 2), ('a', 3), ('d', 4), ('e', 5), ('f', 6)])
         self.assertEqual(repr(od),
             "OrderedDict([('c', 1), ('b', 2), ('a', 3), ('d', 4), ('e', 5), ('f', 6)])")
@@ -1301,6 +1327,7 @@ class TestOrderedDict(unittest.TestCase):
         self.assertEqual(repr(OrderedDict()), "OrderedDict()")
 
     def test_repr_recursive(self):
+        OrderedDict = self.OrderedDict
         # See issue #9826
         od = OrderedDict.fromkeys('abc')
         od['x'] = od
@@ -1308,6 +1335,7 @@ class TestOrderedDict(unittest.TestCase):
             "OrderedDict([('a', None), ('b', None), ('c', None), ('x', ...)])")
 
     def test_setdefault(self):
+        OrderedDict = self.OrderedDict
         pairs = [('c', 1), ('b', 2), ('a', 3), ('d', 4), ('e', 5), ('f', 6)]
         shuffle(pairs)
         od = OrderedDict(pairs)
@@ -1326,6 +1354,7 @@ class TestOrderedDict(unittest.TestCase):
         self.assertEqual(Missing().setdefault(5, 9), 9)
 
     def test_reinsert(self):
+        OrderedDict = self.OrderedDict
         # Given insert a, insert b, delete a, re-insert a,
         # verify that a is now later than b.
         od = OrderedDict()
@@ -1336,6 +1365,7 @@ class TestOrderedDict(unittest.TestCase):
         self.assertEqual(list(od.items()), [('b', 2), ('a', 1)])
 
     def test_move_to_end(self):
+        OrderedDict = self.OrderedDict
         od = OrderedDict.fromkeys('abcde')
         self.assertEqual(list(od), list('abcde'))
         od.move_to_end('c')
@@ -1350,12 +1380,14 @@ class TestOrderedDict(unittest.TestCase):
             od.move_to_end('x')
 
     def test_sizeof(self):
+        OrderedDict = self.OrderedDict
         # Wimpy test: Just verify the reported size is larger than a regular dict
         d = dict(a=1)
         od = OrderedDict(**d)
         self.assertGreater(sys.getsizeof(od), sys.getsizeof(d))
 
     def test_override_update(self):
+        OrderedDict = self.OrderedDict
         # Verify that subclasses can override update() without breaking __init__()
         class MyOD(OrderedDict):
             def update(self, *args, **kwds):
@@ -1363,6 +1395,154 @@ class TestOrderedDict(unittest.TestCase):
         items = [('a', 1), ('c', 3), ('b', 2)]
         self.assertEqual(list(MyOD(items).items()), items)
 
+    def test_views(self):
+        OrderedDict = self.OrderedDict
+        od = OrderedDict.fromkeys('dbca')
+        self.assertEqual(list(od.keys()), list('dbca'))
+        self.assertEqual(od.keys(), set('abcd'))
+        self.assertEqual(od.keys() & {'a', 'x'}, {'a'})
+        self.assertIn('b', od.keys())
+        self.assertIn(('c', None), od.items())
+        self.assertEqual(len(od.values()), 4)
+        self.assertIsInstance(od.keys(), KeysView)
+        self.assertIsInstance(od.items(), ItemsView)
+
+    def test_dict_methods_bypass(self):
+        # Calling the dict methods directly leaves the order inconsistent
+        # but must not crash.
+        OrderedDict = self.OrderedDict
+        od = OrderedDict.fromkeys('abc')
+        dict.__setitem__(od, 'x', 1)
+        dict.__delitem__(od, 'a')
+        self.assertEqual(len(od), 3)
+        keys = list(od)
+        self.assertNotIn('x', keys)
+        with self.assertRaises(KeyError):
+            list(od.values())
+        with self.assertRaises(KeyError):
+            del od['a']
+        od.clear()
+        self.assertEqual(list(od.items()), [])
+
+    def test_key_change_during_lookup(self):
+        # The __eq__() method of a key may modify the OrderedDict.
+        OrderedDict = self.OrderedDict
+        od = OrderedDict()
+        class Key:
+            def __hash__(self):
+                return 1
+            def __eq__(self, other):
+                if od.get('trigger'):
+                    od.clear()
+                return self is other
+        first, second = Key(), Key()
+        od[first] = 1
+        od['trigger'] = True
+        try:
+            od[second] = 2
+        except KeyError:
+            pass
+        od['z'] = 3
+        self.assertEqual(list(od), [k for k in od])
+        self.assertEqual(len(list(od.items())), len(od))
+
+    def test_attributes_and_weakref(self):
+        OrderedDict = self.OrderedDict
+        od = OrderedDict(a=1)
+        od.x = 10
+        self.assertEqual(vars(od)['x'], 10)
+        r = weakref.ref(od)
+        self.assertIs(r(), od)
+        del od
+        gc.collect()
+        self.assertIsNone(r())
+
+    def test_reference_cycle(self):
+        OrderedDict = self.OrderedDict
+        od = OrderedDict()
+        od['self'] = od
+        od[1] = [od]
+        r = weakref.ref(od)
+        del od
+        gc.collect()
+        self.assertIsNone(r())
+
+    def test_subclass_copy_and_pickle(self):
+        OrderedDict = self.OrderedDict
+        global MyOD
+        class MyOD(OrderedDict):
+            pass
+        od = MyOD([('b', 1), ('a', 2)])
+        od.x = 'attr'
+        self.assertIs(type(od.copy()), MyOD)
+        for dup in [copy.copy(od), copy.deepcopy(od)] + [
+                pickle.loads(pickle.dumps(od, proto))
+                for proto in range(pickle.HIGHEST_PROTOCOL + 1)]:
+            self.assertIs(type(dup), MyOD)
+            self.assertEqual(list(dup.items()), [('b', 1), ('a', 2)])
+            self.assertEqual(dup.x, 'attr')
+        del MyOD
+
+class PurePythonOrderedDictTests(OrderedDictTests, unittest.TestCase):
+
+    OrderedDict = py_coll.OrderedDict
+
+    def setUp(self):
+        # Pickle finds the class as collections.OrderedDict.
+        swap = support.swap_item(sys.modules, 'collections', py_coll)
+        swap.__enter__()
+        self.addCleanup(swap.__exit__, None, None, None)
+
+    def test_init_argspec(self):
+        # make sure no positional args conflict with possible kwdargs
+        self.assertEqual(inspect.getargspec(
+            self.OrderedDict.__dict__['__init__']).args, ['self'])
+
+
+@unittest.skipUnless(hasattr(_collections, 'OrderedDict'),
+                     'requires the C implementation of OrderedDict')
+class CPythonOrderedDictTests(OrderedDictTests, unittest.TestCase):
+
+    OrderedDict = getattr(_collections, 'OrderedDict', None)
+
+    def test_is_default(self):
+        self.assertIs(OrderedDict, self.OrderedDict)
+
+    def test_init_self_keyword(self):
+        self.assertEqual(list(self.OrderedDict(self=42).items()),
+                         [('self', 42)])
+
+    def test_mutation_during_iteration(self):
+        od = self.OrderedDict.fromkeys('abc')
+        for key in od:
+            od[key] = 1  # Changing values is allowed.
+        self.assertEqual(list(od.values()), [1, 1, 1])
+        with self.assertRaises(RuntimeError):
+            for key in od:
+                od['x'] = 2
+        with self.assertRaises(RuntimeError):
+            for key in od:
+                od.move_to_end('a')
+
+    def test_iterators_pickling(self):
+        od = self.OrderedDict.fromkeys('abcd')
+        for method in [od.__iter__, od.__reversed__, lambda: iter(od.keys()),
+                       lambda: iter(od.values()), lambda: iter(od.items())]:
+            it = method()
+            next(it)
+            expected = list(method())[1:]
+            for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+                dup = pickle.loads(pickle.dumps(it, proto))
+                self.assertEqual(list(dup), expected)
+            self.assertEqual(list(it), expected)
+
+    def test_sizeof_grows(self):
+        od = self.OrderedDict()
+        size = sys.getsizeof(od)
+        od.update((i, i) for i in range(100))
+        self.assertGreater(sys.getsizeof(od), size)
+
+
 class GeneralMappingTests(mapping_tests.BasicTestMappingProtocol):
     type2test = OrderedDict
 
@@ -1370,6 +1550,9 @@ class GeneralMappingTests(mapping_tests.BasicTestMappingProtocol):
         d = self._empty_mapping()
         self.assertRaises(KeyError, d.popitem)
 
+class PurePythonGeneralMappingTests(GeneralMappingTests):
+    type2test = py_coll.OrderedDict
+
 class MyOrderedDict(OrderedDict):
     pass
 
@@ -1380,6 +1563,12 @@ class SubclassMappingTests(mapping_tests.BasicTestMappingProtocol):
         d = self._empty_mapping()
         self.assertRaises(KeyError, d.popitem)
 
+class PurePythonMyOrderedDict(py_coll.OrderedDict):
+    pass
+
+class PurePythonSubclassMappingTests(SubclassMappingTests):
+    type2test = PurePythonMyOrderedDict
+
 
 ################################################################################
 ### Run tests
@@ -1391,7 +1580,9 @@ def test_main(verbose=None):
     NamedTupleDocs = doctest.DocTestSuite(module=collections)
     test_classes = [TestNamedTuple, NamedTupleDocs, TestOneTrickPonyABCs,
                     TestCollectionABCs, TestCounter, TestChainMap,
-                    TestOrderedDict, GeneralMappingTests, SubclassMappingTests]
+                    PurePythonOrderedDictTests, CPythonOrderedDictTests,
+                    GeneralMappingTests, PurePythonGeneralMappingTests,
+                    SubclassMappingTests, PurePythonSubclassMappingTests]
     support.run_unittest(*test_classes)
     support.run_doctest(collections, verbose)
 
@@ -60,11 +60,13 @@ class MyObject(object):
 
 class ExecutorMixin:
     worker_count = 5
+    executor_kwargs = {}
 
     def setUp(self):
         self.t1 = time.time()
         try:
-            self.executor = self.executor_type(max_workers=self.worker_count)
+            self.executor = self.executor_type(max_workers=self.worker_count,
+                                               **self.executor_kwargs)
         except NotImplementedError as e:
             self.skipTest(str(e))
         self._prime_executor()
@@ -90,6 +92,11 @@ class ThreadPoolMixin(ExecutorMixin):
     executor_type = futures.ThreadPoolExecutor
 
 
+class WorkStealingThreadPoolMixin(ExecutorMixin):
+    executor_type = futures.ThreadPoolExecutor
+    executor_kwargs = {'work_stealing': True}
+
+
 class ProcessPoolMixin(ExecutorMixin):
     executor_type = futures.ProcessPoolExecutor
 
@@ -154,6 +161,41 @@ class ThreadPoolShutdownTest(ThreadPoolMixin, ExecutorShutdownTest, unittest.Tes
             t.join()
 
 
+class WorkStealingShutdownTest(WorkStealingThreadPoolMixin,
+                               ExecutorShutdownTest, unittest.TestCase):
+    def _prime_executor(self):
+        pass
+
+    def test_interpreter_shutdown(self):
+        rc, out, err = assert_python_ok('-c', """if 1:
+            from concurrent.futures import ThreadPoolExecutor
+            from test.test_concurrent_futures import sleep_and_print
+            t = ThreadPoolExecutor(5, work_stealing=True)
+            t.submit(sleep_and_print, 1.0, "apple")
+            t.submit(sleep_and_print, 0.5, "banana")
+            """)
+        self.assertFalse(err)
+        self.assertEqual(sorted(out.split()), [b"apple", b"banana"])
+
+    def test_threads_terminate(self):
+        fs = self.executor.submit_many(mul, [21, 6, 3], [2, 7, 14])
+        self.assertEqual(len(self.executor._threads), 3)
+        self.executor.shutdown()
+        for t in self.executor._threads:
+            t.join()
+        self.assertEqual([f.result() for f in fs], [42, 42, 42])
+
+    def test_del_shutdown(self):
+        executor = futures.ThreadPoolExecutor(max_workers=5,
+                                              work_stealing=True)
+        executor.map(abs, range(-5, 5))
+        threads = executor._threads
+        del executor
+
+        for t in threads:
+            t.join()
+
+
 class ProcessPoolShutdownTest(ProcessPoolMixin, ExecutorShutdownTest, unittest.TestCase):
     def _prime_executor(self):
         pass
@@ -309,6 +351,11 @@ class ThreadPoolWaitTests(ThreadPoolMixin, WaitTests, unittest.TestCase):
             sys.setswitchinterval(oldswitchinterval)
 
 
+class WorkStealingWaitTests(WorkStealingThreadPoolMixin, WaitTests,
+                            unittest.TestCase):
+    pass
+
+
 class ProcessPoolWaitTests(ProcessPoolMixin, WaitTests, unittest.TestCase):
     pass
 
@@ -355,6 +402,11 @@ class ThreadPoolAsCompletedTests(ThreadPoolMixin, AsCompletedTests, unittest.Tes
     pass
 
 
+class WorkStealingAsCompletedTests(WorkStealingThreadPoolMixin,
+                                   AsCompletedTests, unittest.TestCase):
+    pass
+
+
 class ProcessPoolAsCompletedTests(ProcessPoolMixin, AsCompletedTests, unittest.TestCase):
     pass
 
@@ -370,6 +422,11 @@ class ExecutorTest:
         future = self.executor.submit(mul, 2, y=8)
         self.assertEqual(16, future.result())
 
+    def test_submit_many(self):
+        fs = self.executor.submit_many(pow, range(10), range(10))
+        self.assertEqual([f.result() for f in fs],
+                         list(map(pow, range(10), range(10))))
+
     def test_map(self):
         self.assertEqual(
                 list(self.executor.map(pow, range(10), range(10))),
@@ -431,6 +488,48 @@ class ThreadPoolExecutorTest(ThreadPoolMixin, ExecutorTest, unittest.TestCase):
         self.assertCountEqual(finished, range(10))
 
 
+class WorkStealingExecutorTest(WorkStealingThreadPoolMixin, ExecutorTest,
+                               unittest.TestCase):
+    def test_map_submits_without_iteration(self):
+        finished = []
+        def record_finished(n):
+            finished.append(n)
+
+        self.executor.map(record_finished, range(100))
+        self.executor.shutdown(wait=True)
+        self.assertCountEqual(finished, range(100))
+
+    def test_nested_submit(self):
+        def fan_out(n):
+            if n == 0:
+                return 1
+            fs = self.executor.submit_many(fan_out, [n - 1] * 2)
+            return sum(f.result() for f in fs)
+        # All calls but the leaves wait on other calls, so this needs more
+        # threads than there are inner nodes in the tree.
+        self.assertEqual(self.executor.submit(fan_out, 2).result(), 4)
+
+    def test_steal_work(self):
+        # All calls are queued for the thread blocked in the first one; the
+        # other threads have to steal them.
+        event = threading.Event()
+        def submit_and_block():
+            fs = self.executor.submit_many(mul, range(20), range(20))
+            event.wait()
+            return fs
+        blocker = self.executor.submit(submit_and_block)
+        while not blocker.running():
+            time.sleep(0.01)
+        time.sleep(0.1)
+        try:
+            self.assertFalse(blocker.done())
+        finally:
+            event.set()
+        fs = blocker.result()
+        self.assertEqual([f.result() for f in fs],
+                         [i * i for i in range(20)])
+
+
 class ProcessPoolExecutorTest(ProcessPoolMixin, ExecutorTest, unittest.TestCase):
     def test_killed_child(self):
         # When a child process is abruptly terminated, the whole pool gets
@@ -444,6 +543,28 @@ class ProcessPoolExecutorTest(ProcessPoolMixin, ExecutorTest, unittest.TestCase)
         # Submitting other jobs fails as well.
         self.assertRaises(BrokenProcessPool, self.executor.submit, pow, 2, 8)
 
+    def test_map_chunksize(self):
+        def bad_map():
+            list(self.executor.map(pow, range(40), range(40), chunksize=-1))
+
+        ref = list(map(pow, range(40), range(40)))
+        self.assertEqual(
+            list(self.executor.map(pow, range(40), range(40), chunksize=6)),
+            ref)
+        self.assertEqual(
+            list(self.executor.map(pow, range(40), range(40), chunksize=50)),
+            ref)
+        self.assertEqual(
+            list(self.executor.map(pow, range(40), range(40), chunksize=40)),
+            ref)
+        self.assertRaises(ValueError, bad_map)
+
+    def test_map_chunksize_exception(self):
+        i = self.executor.map(divmod, [1, 1, 1, 1], [2, 3, 0, 5], chunksize=2)
+        self.assertEqual(next(i), (0, 1))
+        self.assertEqual(next(i), (0, 1))
+        self.assertRaises(ZeroDivisionError, next, i)
+
 
 class FutureTests(unittest.TestCase):
     def test_done_callback_with_result(self):
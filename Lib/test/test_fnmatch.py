@@ -3,7 +3,9 @@
 from test import support
 import unittest
 
-from fnmatch import fnmatch, fnmatchcase, translate, filter
+import os
+
+from fnmatch import fnmatch, fnmatchcase, translate, filter, MultiPattern
 
 class FnmatchTestCase(unittest.TestCase):
 
@@ -79,10 +81,74 @@ class FilterTestCase(unittest.TestCase):
         self.assertEqual(filter(['a', 'b'], 'a'), ['a'])
 
 
+class MultiPatternTestCase(unittest.TestCase):
+
+    patterns = ['*.py', 'README', 'build*', '*', 'a?c', '[xy]*z', '*b*',
+                'a*c', '?', 'x']
+    names = ['', 'a', 'x', 'abc', 'aXc', 'foo.py', 'README', 'README.txt',
+             'build', 'builder', 'xyz', 'yz', 'z', 'foo\nbar', '[a]', 'b']
+
+    def check(self, patterns, names):
+        mp = MultiPattern(patterns)
+        self.assertEqual(mp.patterns, tuple(patterns))
+        for name in names:
+            expected = None
+            for pattern in patterns:
+                if fnmatch(name, pattern):
+                    expected = pattern
+                    break
+            self.assertEqual(mp.match(name), expected, (patterns, name))
+        self.assertEqual(mp.filter(names),
+                         [n for n in names
+                          if any(fnmatch(n, p) for p in patterns)])
+
+    def test_match(self):
+        for i in range(len(self.patterns)):
+            self.check(self.patterns[i:], self.names)
+            self.check(self.patterns[:i], self.names)
+        self.check(self.patterns[::-1], self.names)
+
+    def test_empty(self):
+        mp = MultiPattern([])
+        self.assertIsNone(mp.match('abc'))
+        self.assertEqual(mp.filter(['a', 'b']), [])
+
+    def test_many(self):
+        # More patterns than groups allowed in a single regular expression.
+        patterns = ['f%d?' % i for i in range(250)]
+        patterns += ['*%d' % i for i in range(5)]
+        mp = MultiPattern(patterns)
+        self.assertEqual(mp.match('f0x'), 'f0?')
+        self.assertEqual(mp.match('f249x'), 'f249?')
+        self.assertEqual(mp.match('f1234'), 'f123?')
+        self.assertEqual(mp.match('f24944'), '*4')
+        self.assertEqual(mp.filter(['f99a', 'f250a', 'g', '3']),
+                         ['f99a', '3'])
+
+    def test_bytes(self):
+        mp = MultiPattern([b'*.py', b'te*\xff', b'[a]b', b'foo'])
+        self.assertEqual(mp.match(b'test\xff'), b'te*\xff')
+        self.assertEqual(mp.match(b'ab'), b'[a]b')
+        self.assertEqual(mp.filter([b'x.py', b'foo', b'bar']),
+                         [b'x.py', b'foo'])
+
+    def test_mix_bytes_str(self):
+        self.assertRaises(TypeError, MultiPattern, ['*', b'*'])
+        self.assertRaises(TypeError, MultiPattern([b'a?c']).match, 'abc')
+
+    @unittest.skipIf(os.path.normcase('A') == 'A',
+                     'case-sensitive file system')
+    def test_normcase(self):
+        mp = MultiPattern(['*.PY', 'abc'])
+        self.assertEqual(mp.match('FOO.py'), '*.PY')
+        self.assertEqual(mp.filter(['ABC', 'x.Py', 'y']), ['ABC', 'x.Py'])
+
+
 def test_main():
     support.run_unittest(FnmatchTestCase,
                          TranslateTestCase,
-                         FilterTestCase)
+                         FilterTestCase,
+                         MultiPatternTestCase)
 
 
 if __name__ == "__main__":
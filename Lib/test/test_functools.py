@@ -1,11 +1,13 @@
 import abc
 import collections
+import copy
 from itertools import permutations
 import pickle
 from random import choice
 import sys
 from test import support
 import unittest
+import weakref
 from weakref import proxy
 
 import functools
@@ -879,12 +881,12 @@ class TestTotalOrdering(unittest.TestCase):
             with self.assertRaises(TypeError):
                 a <= b
 
-class TestLRU(unittest.TestCase):
+class TestLRU:
 
     def test_lru(self):
         def orig(x, y):
             return 3 * x + y
-        f = functools.lru_cache(maxsize=20)(orig)
+        f = self.module.lru_cache(maxsize=20)(orig)
         hits, misses, maxsize, currsize = f.cache_info()
         self.assertEqual(maxsize, 20)
         self.assertEqual(currsize, 0)
@@ -922,7 +924,7 @@ class TestLRU(unittest.TestCase):
         self.assertEqual(currsize, 1)
 
         # test size zero (which means "never-cache")
-        @functools.lru_cache(0)
+        @self.module.lru_cache(0)
         def f():
             nonlocal f_cnt
             f_cnt += 1
@@ -938,7 +940,7 @@ class TestLRU(unittest.TestCase):
         self.assertEqual(currsize, 0)
 
         # test size one
-        @functools.lru_cache(1)
+        @self.module.lru_cache(1)
         def f():
             nonlocal f_cnt
             f_cnt += 1
@@ -954,7 +956,7 @@ class TestLRU(unittest.TestCase):
         self.assertEqual(currsize, 1)
 
         # test size two
-        @functools.lru_cache(2)
+        @self.module.lru_cache(2)
         def f(x):
             nonlocal f_cnt
             f_cnt += 1
@@ -971,7 +973,7 @@ class TestLRU(unittest.TestCase):
         self.assertEqual(currsize, 2)
 
     def test_lru_with_maxsize_none(self):
-        @functools.lru_cache(maxsize=None)
+        @self.module.lru_cache(maxsize=None)
         def fib(n):
             if n < 2:
                 return n
@@ -989,7 +991,7 @@ class TestLRU(unittest.TestCase):
         # creating a hard-to-read chained exception.
         # http://bugs.python.org/issue13177
         for maxsize in (None, 128):
-            @functools.lru_cache(maxsize)
+            @self.module.lru_cache(maxsize)
             def func(i):
                 return 'abc'[i]
             self.assertEqual(func(0), 'a')
@@ -1002,7 +1004,7 @@ class TestLRU(unittest.TestCase):
 
     def test_lru_with_types(self):
         for maxsize in (None, 128):
-            @functools.lru_cache(maxsize=maxsize, typed=True)
+            @self.module.lru_cache(maxsize=maxsize, typed=True)
             def square(x):
                 return x * x
             self.assertEqual(square(3), 9)
@@ -1017,7 +1019,7 @@ class TestLRU(unittest.TestCase):
             self.assertEqual(square.cache_info().misses, 4)
 
     def test_lru_with_keyword_args(self):
-        @functools.lru_cache()
+        @self.module.lru_cache()
         def fib(n):
             if n < 2:
                 return n
@@ -1033,7 +1035,7 @@ class TestLRU(unittest.TestCase):
             functools._CacheInfo(hits=0, misses=0, maxsize=128, currsize=0))
 
     def test_lru_with_keyword_args_maxsize_none(self):
-        @functools.lru_cache(maxsize=None)
+        @self.module.lru_cache(maxsize=None)
         def fib(n):
             if n < 2:
                 return n
@@ -1049,7 +1051,7 @@ class TestLRU(unittest.TestCase):
     def test_need_for_rlock(self):
         # This will deadlock on an LRU cache that uses a regular lock
 
-        @functools.lru_cache(maxsize=10)
+        @self.module.lru_cache(maxsize=10)
         def test_func(x):
             'Used to demonstrate a reentrant lru_cache call within a single thread'
             return x
@@ -1070,6 +1072,239 @@ class TestLRU(unittest.TestCase):
         self.assertEqual(test_func(DoubleEq(2)),    # Trigger a re-entrant __eq__ call
                          DoubleEq(2))               # Verify the correct return value
 
+    def _cached(self, maxsize=128, typed=False, ttl=None, sizeof=None):
+        # Decorator with a fake timer for testing expiry
+        def decorating_function(user_function):
+            return self.module._lru_cache_wrapper(
+                user_function, maxsize, typed, ttl, sizeof,
+                lambda: self.now, functools._CacheInfo)
+        return decorating_function
+
+    def test_lru_with_ttl(self):
+        for maxsize in (None, 2):
+            self.now = 0.0
+            calls = []
+            @self._cached(maxsize=maxsize, ttl=10)
+            def f(x):
+                calls.append(x)
+                return x * 10
+            self.assertEqual(f(1), 10)
+            self.now = 5.0
+            self.assertEqual(f(2), 20)
+            self.now = 9.0
+            self.assertEqual(f(1), 10)
+            self.assertEqual(f(2), 20)
+            self.assertEqual(calls, [1, 2])
+            self.now = 10.0
+            # the result of f(1) expired, the one of f(2) did not
+            self.assertEqual(f(1), 10)
+            self.assertEqual(f(2), 20)
+            self.assertEqual(calls, [1, 2, 1])
+            self.assertEqual(f.cache_info(),
+                functools._CacheInfo(hits=3, misses=3, maxsize=maxsize,
+                                     currsize=2))
+            self.now = 100.0
+            self.assertEqual(f(2), 20)
+            self.assertEqual(calls, [1, 2, 1, 2])
+            self.assertEqual(f.cache_info().currsize, 2)
+
+        with self.assertRaises(ValueError):
+            self.module.lru_cache(ttl=0)
+        f = self.module.lru_cache(ttl=1000)(lambda x: x)
+        self.assertEqual([f(1), f(1)], [1, 1])
+        self.assertEqual(f.cache_info().hits, 1)
+
+    def test_lru_with_sizeof(self):
+        calls = []
+        @self.module.lru_cache(maxsize=10, sizeof=len)
+        def f(n):
+            calls.append(n)
+            return 'x' * n
+        for n in (3, 4, 3, 2):
+            self.assertEqual(f(n), 'x' * n)
+        self.assertEqual(calls, [3, 4, 2])
+        self.assertEqual(f.cache_info(),
+            functools._CacheInfo(hits=1, misses=3, maxsize=10, currsize=9))
+        # evicts 4, the least recently used result, to make room
+        self.assertEqual(f(5), 'xxxxx')
+        self.assertEqual(f.cache_info().currsize, 10)
+        f(3), f(2), f(5)
+        self.assertEqual(calls, [3, 4, 2, 5])
+        f(4)
+        self.assertEqual(calls, [3, 4, 2, 5, 4])
+        self.assertEqual(f.cache_info().currsize, 9)
+        # results larger than maxsize are not cached
+        self.assertEqual(f(11), 'x' * 11)
+        self.assertEqual(f.cache_info().currsize, 9)
+        f.cache_clear()
+        self.assertEqual(f.cache_info(),
+            functools._CacheInfo(hits=0, misses=0, maxsize=10, currsize=0))
+
+        @self.module.lru_cache(maxsize=None, sizeof=len)
+        def g(n):
+            return 'x' * n
+        g(100), g(200), g(100)
+        self.assertEqual(g.cache_info(),
+            functools._CacheInfo(hits=1, misses=2, maxsize=None,
+                                 currsize=300))
+
+        @self.module.lru_cache(sizeof=lambda result: -1)
+        def h():
+            pass
+        self.assertRaises(ValueError, h)
+        self.assertEqual(h.cache_info().misses, 0)
+
+    def test_lru_maxsize_type(self):
+        for maxsize in ('2', [2]):
+            with self.assertRaises(TypeError):
+                self.module.lru_cache(maxsize)(lambda x: x)
+            with self.assertRaises(TypeError):
+                self.module.lru_cache(maxsize, ttl=10)(lambda x: x)
+        f = self.module.lru_cache(2.0)(lambda x: x)
+        f(1), f(2), f(1), f(3), f(2)
+        self.assertEqual(f.cache_info(),
+            functools._CacheInfo(hits=1, misses=4, maxsize=2.0, currsize=2))
+        f = self.module.lru_cache(2 ** 100)(lambda x: x)
+        f(1), f(1)
+        self.assertEqual(f.cache_info().hits, 1)
+        f = self.module.lru_cache(True)(lambda x: x)
+        f(1), f(1), f(2), f(1)
+        self.assertEqual(f.cache_info().hits, 1)
+        f = self.module.lru_cache(-1)(lambda x: x)
+        f(1), f(1)
+        self.assertEqual(f.cache_info(),
+            functools._CacheInfo(hits=0, misses=2, maxsize=-1, currsize=0))
+
+    def test_lru_method(self):
+        class X(int):
+            f_cnt = 0
+            @self.module.lru_cache(2)
+            def f(self, x):
+                self.f_cnt += 1
+                return x*10+self
+        a = X(5)
+        b = X(5)
+        c = X(7)
+        self.assertEqual(X.f.cache_info(), (0, 0, 2, 0))
+
+        for x in 1, 2, 2, 3, 1, 1, 1, 2, 3, 3:
+            self.assertEqual(a.f(x), x*10 + 5)
+        self.assertEqual((a.f_cnt, b.f_cnt, c.f_cnt), (6, 0, 0))
+        self.assertEqual(X.f.cache_info(), (4, 6, 2, 2))
+
+        for x in 1, 2, 1, 1, 1, 1, 3, 2, 2, 2:
+            self.assertEqual(b.f(x), x*10 + 5)
+        self.assertEqual((a.f_cnt, b.f_cnt, c.f_cnt), (6, 4, 0))
+        self.assertEqual(X.f.cache_info(), (10, 10, 2, 2))
+
+    def test_lru_reentrant_eviction(self):
+        # The __eq__ of the keys calls the cached function, which evicts
+        # the results the outer call is working with.
+        @self.module.lru_cache(maxsize=2)
+        def f(x):
+            return x
+
+        class Evil:
+            def __init__(self, x):
+                self.x = x
+            def __hash__(self):
+                return 0
+            def __eq__(self, other):
+                if not isinstance(other, Evil):
+                    return NotImplemented
+                for i in range(3):
+                    f(i)
+                return self.x == other.x
+
+        for i in range(10):
+            self.assertEqual(f(Evil(i)).x, i)
+        self.assertLessEqual(f.cache_info().currsize, 2)
+
+    def test_copy(self):
+        cls = self.__class__
+        def orig(x, y):
+            return 3 * x + y
+        part = self.module.partial(orig, 2)
+        funcs = (cls.cached_func[0], cls.cached_meth, cls.cached_staticmeth,
+                 self.module.lru_cache(2)(part))
+        for f in funcs:
+            with self.subTest(cached=f):
+                f_copy = copy.copy(f)
+                self.assertIs(f_copy, f)
+
+    def test_deepcopy(self):
+        cls = self.__class__
+        def orig(x, y):
+            return 3 * x + y
+        part = self.module.partial(orig, 2)
+        funcs = (cls.cached_func[0], cls.cached_meth, cls.cached_staticmeth,
+                 self.module.lru_cache(2)(part))
+        for f in funcs:
+            with self.subTest(cached=f):
+                f_copy = copy.deepcopy(f)
+                self.assertIs(f_copy, f)
+
+    def test_pickle(self):
+        f = self.cached_func[0]
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(proto=proto):
+                self.assertIs(pickle.loads(pickle.dumps(f, proto)), f)
+
+    def test_gc(self):
+        @self.module.lru_cache(maxsize=2)
+        def f(x):
+            return x
+        # the cached result refers to the cache
+        class A:
+            pass
+        a = A()
+        a.f = f
+        f(a)
+        ref = weakref.ref(f)
+        del a, f
+        support.gc_collect()
+        self.assertIsNone(ref())
+
+
+@py_functools.lru_cache()
+def py_cached_func(x, y):
+    return 3 * x + y
+
+if c_functools:
+    @c_functools.lru_cache()
+    def c_cached_func(x, y):
+        return 3 * x + y
+
+
+class TestLRUPy(TestLRU, unittest.TestCase):
+    module = py_functools
+    cached_func = py_cached_func,
+
+    @module.lru_cache()
+    def cached_meth(self, x, y):
+        return 3 * x + y
+
+    @staticmethod
+    @module.lru_cache()
+    def cached_staticmeth(x, y):
+        return 3 * x + y
+
+
+@unittest.skipUnless(c_functools, 'requires the C _functools module')
+class TestLRUC(TestLRU, unittest.TestCase):
+    if c_functools:
+        module = c_functools
+        cached_func = c_cached_func,
+
+        @module.lru_cache()
+        def cached_meth(self, x, y):
+            return 3 * x + y
+
+        @staticmethod
+        @module.lru_cache()
+        def cached_staticmeth(x, y):
+            return 3 * x + y
+
 
 class TestSingleDispatch(unittest.TestCase):
     def test_simple_overloads(self):
@@ -1558,7 +1793,8 @@ def test_main(verbose=None):
         TestCmpToKeyPy,
         TestWraps,
         TestReduce,
-        TestLRU,
+        TestLRUC,
+        TestLRUPy,
         TestSingleDispatch,
     )
     support.run_unittest(*test_classes)
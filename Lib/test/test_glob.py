@@ -38,19 +38,22 @@ class GlobTests(unittest.TestCase):
     def tearDown(self):
         shutil.rmtree(self.tempdir)
 
-    def glob(self, *parts):
+    def glob(self, *parts, **kwargs):
         if len(parts) == 1:
             pattern = parts[0]
         else:
             pattern = os.path.join(*parts)
         p = os.path.join(self.tempdir, pattern)
-        res = glob.glob(p)
-        self.assertEqual(list(glob.iglob(p)), res)
+        res = glob.glob(p, **kwargs)
+        self.assertEqual(list(glob.iglob(p, **kwargs)), res)
         bres = [os.fsencode(x) for x in res]
-        self.assertEqual(glob.glob(os.fsencode(p)), bres)
-        self.assertEqual(list(glob.iglob(os.fsencode(p))), bres)
+        self.assertEqual(glob.glob(os.fsencode(p), **kwargs), bres)
+        self.assertEqual(list(glob.iglob(os.fsencode(p), **kwargs)), bres)
         return res
 
+    def joins(self, *tuples):
+        return [os.path.join(self.tempdir, *parts) for parts in tuples]
+
     def assertSequencesEqual_noorder(self, l1, l2):
         l1 = list(l1)
         l2 = list(l2)
@@ -169,6 +172,137 @@ class GlobTests(unittest.TestCase):
         eq(glob.glob('\\\\*\\*\\'), [])
         eq(glob.glob(b'\\\\*\\*\\'), [])
 
+    def glob_many(self, *patterns, **kwargs):
+        patterns = [os.path.join(self.tempdir, p) for p in patterns]
+        res = glob.glob(patterns, **kwargs)
+        self.assertEqual(list(glob.iglob(patterns, **kwargs)), res)
+        self.assertEqual(len(set(res)), len(res))
+        bres = [os.fsencode(x) for x in res]
+        self.assertEqual(glob.glob([os.fsencode(p) for p in patterns],
+                                   **kwargs), bres)
+        return res
+
+    def test_glob_many(self):
+        eq = self.assertSequencesEqual_noorder
+        eq(self.glob_many(), [])
+        eq(self.glob_many('a*'), self.glob('a*'))
+        eq(self.glob_many('a*', '*a', 'Z*'),
+           map(self.norm, ['a', 'aab', 'aaa', 'ZZZ']))
+        eq(self.glob_many('a', 'zymurgy', 'aa?'),
+           map(self.norm, ['a', 'aab', 'aaa']))
+        eq(self.glob_many('*', '.*'),
+           map(self.norm, glob.glob1(self.tempdir, '*') +
+                          glob.glob1(self.tempdir, '.*')))
+        eq(self.glob_many('?a?', '.?a'), map(self.norm, ['aab', 'aaa', '.aa']))
+        eq(self.glob_many(os.path.join('a', '*'), os.path.join('*', 'F'),
+                          os.path.join('a', 'bcd', 'E*')),
+           [self.norm('a', 'D'), self.norm('a', 'bcd'), self.norm('aab', 'F'),
+            self.norm('a', 'bcd', 'EF')])
+
+    def rglob(self, *parts):
+        return self.glob(*parts, recursive=True)
+
+    def test_recursive_glob(self):
+        eq = self.assertSequencesEqual_noorder
+        full = [('ZZZ',),
+                ('a',), ('a', 'D'),
+                ('a', 'bcd'),
+                ('a', 'bcd', 'EF'),
+                ('a', 'bcd', 'efg'),
+                ('a', 'bcd', 'efg', 'ha'),
+                ('aaa',), ('aaa', 'zzzF'),
+                ('aab',), ('aab', 'F'),
+               ]
+        if can_symlink():
+            full += [('sym1',), ('sym2',),
+                     ('sym3',),
+                     ('sym3', 'EF'),
+                     ('sym3', 'efg'),
+                     ('sym3', 'efg', 'ha'),
+                    ]
+        eq(self.rglob('**'), self.joins(('',), *full))
+        eq(self.rglob('.', '**'), self.joins(('.', ''),
+            *(('.',) + i for i in full)))
+        dirs = [('a', ''), ('a', 'bcd', ''), ('a', 'bcd', 'efg', ''),
+                ('aaa', ''), ('aab', '')]
+        if can_symlink():
+            dirs += [('sym3', ''), ('sym3', 'efg', '')]
+        eq(self.rglob('**', ''), self.joins(('',), *dirs))
+
+        eq(self.rglob('a', '**'), self.joins(
+            ('a', ''), ('a', 'D'), ('a', 'bcd'), ('a', 'bcd', 'EF'),
+            ('a', 'bcd', 'efg'), ('a', 'bcd', 'efg', 'ha')))
+        eq(self.rglob('a**'), self.joins(('a',), ('aaa',), ('aab',)))
+        expect = [('a', 'bcd', 'EF')]
+        if can_symlink():
+            expect += [('sym3', 'EF')]
+        eq(self.rglob('**', 'EF'), self.joins(*expect))
+        expect = [('a', 'bcd', 'EF'), ('aaa', 'zzzF'), ('aab', 'F')]
+        if can_symlink():
+            expect += [('sym3', 'EF')]
+        eq(self.rglob('**', '*F'), self.joins(*expect))
+        eq(self.rglob('**', '*F', ''), [])
+        eq(self.rglob('**', 'bcd', '*'), self.joins(
+            ('a', 'bcd', 'EF'), ('a', 'bcd', 'efg')))
+        eq(self.rglob('a', '**', 'bcd'), self.joins(('a', 'bcd')))
+        eq(self.rglob('**', '**', 'ha'), self.rglob('**', 'ha'))
+        # Hidden directories are skipped by '**'.
+        self.assertNotIn(self.norm('.aa', 'G'), self.rglob('**', 'G'))
+        eq(self.rglob('.aa', '**'), self.joins(('.aa', ''), ('.aa', 'G')))
+
+        predir = os.path.abspath(os.curdir)
+        try:
+            os.chdir(self.tempdir)
+            join = os.path.join
+            eq(glob.glob('**', recursive=True), [join(*i) for i in full])
+            eq(glob.glob(join('**', ''), recursive=True),
+                [join(*i) for i in dirs])
+            eq(glob.glob(join('**', 'zz*F'), recursive=True),
+                [join('aaa', 'zzzF')])
+            eq(glob.glob('**zz*F', recursive=True), [])
+            expect = [join('a', 'bcd', 'EF')]
+            if can_symlink():
+                expect += [join('sym3', 'EF')]
+            eq(glob.glob(join('**', 'EF'), recursive=True), expect)
+        finally:
+            os.chdir(predir)
+
+    def test_glob_not_recursive(self):
+        # Without recursive, '**' is the same as '*'.
+        eq = self.assertSequencesEqual_noorder
+        eq(self.glob('**', 'EF'), self.glob('*', 'EF'))
+        eq(self.glob('**'), self.glob('*'))
+
+    def test_glob_many_recursive(self):
+        eq = self.assertSequencesEqual_noorder
+        eq(self.glob_many(os.path.join('**', 'F'),
+                          os.path.join('a', '**', 'E*'),
+                          os.path.join('**', 'bcd'),
+                          'Z*', recursive=True),
+           self.joins(('aab', 'F'), ('a', 'bcd', 'EF'), ('a', 'bcd'),
+                      ('ZZZ',)))
+        # 'a' matched by '**' is not repeated as 'a/' for 'a/**'.
+        eq(self.glob_many('**', os.path.join('a', '**'), recursive=True),
+           self.rglob('**'))
+
+    def test_selector_lists_each_directory_once(self):
+        listed = []
+        real_scandir = os.scandir
+        def scandir(path):
+            listed.append(path)
+            return real_scandir(path)
+        patterns = [os.path.join(self.tempdir, *parts) for parts in
+                    [('**', '*F'), ('a', '**', 'h?'), ('*', 'bcd', '*'),
+                     ('a', 'D')]]
+        os.scandir = scandir
+        try:
+            glob.glob(patterns, recursive=True)
+        finally:
+            os.scandir = real_scandir
+        self.assertEqual(len(listed), len(set(listed)))
+        # Directories in which nothing can match are not entered.
+        self.assertNotIn(self.norm('.aa'), listed)
+
     def check_escape(self, arg, expected):
         self.assertEqual(glob.escape(arg), expected)
         self.assertEqual(glob.escape(os.fsencode(arg)), os.fsencode(expected))
@@ -8,6 +8,7 @@ import os
 import io
 import struct
 gzip = support.import_module('gzip')
+zlib = support.import_module('zlib')
 
 data1 = b"""  int length=DEFAULTALLOC, err = Z_OK;
   PyObject *RetVal;
@@ -150,6 +151,36 @@ class TestGzip(BaseTest):
 
         self.assertEqual(lines, 50 * data1.splitlines(keepends=True))
 
+    def test_readinto(self):
+        self.test_write()
+        with gzip.GzipFile(self.filename, 'rb') as f:
+            chunks = []
+            b = bytearray(100)
+            while True:
+                n = f.readinto(b)
+                if not n:
+                    break
+                chunks.append(bytes(b[:n]))
+            self.assertEqual(f.readinto(b), 0)
+        self.assertEqual(b''.join(chunks), data1 * 50)
+        with gzip.GzipFile(self.filename, 'wb') as f:
+            self.assertRaises(OSError, f.readinto, bytearray(10))
+
+    def test_iteration(self):
+        self.test_write()
+        lines = (data1 * 50).splitlines(keepends=True)
+        with gzip.GzipFile(self.filename, 'rb') as f:
+            self.assertIs(iter(f), f)
+            self.assertEqual(next(f), lines[0])
+            self.assertEqual(f.readline(), lines[1])
+            self.assertEqual(f.tell(), len(lines[0] + lines[1]))
+            self.assertEqual(list(f), lines[2:])
+            f.seek(0)
+            self.assertEqual(list(f), lines)
+        self.assertRaises(ValueError, iter, f)
+        with gzip.GzipFile(self.filename, 'wb') as f:
+            self.assertRaises(OSError, list, f)
+
     def test_readline(self):
         self.test_write()
         # Try .readline() with varying line lengths
@@ -422,6 +453,83 @@ class TestGzip(BaseTest):
         with gzip.GzipFile(fileobj=io.BytesIO(gzdata)) as f:
             self.assertEqual(f.read(), b'Test')
 
+    def test_write_threads(self):
+        data = data1 * 500
+        for zlib_mode in (zlib.Z_SYNC_FLUSH, zlib.Z_FULL_FLUSH):
+            b = io.BytesIO()
+            with gzip.GzipFile(fileobj=b, mode='wb', threads=3) as f:
+                f.block_size = 1000
+                for i in range(0, len(data), 700):
+                    f.write(data[i:i+700])
+                    self.assertEqual(f.tell(), min(i + 700, len(data)))
+                    if i % 7000 == 0:
+                        f.flush(zlib_mode)
+            # A single member, which zlib can decompress too.
+            d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            self.assertEqual(d.decompress(b.getvalue()), data)
+            self.assertTrue(d.eof)
+            self.assertEqual(d.unused_data, b'')
+            self.assertEqual(gzip.decompress(b.getvalue()), data)
+
+    def test_threads_dictionary(self):
+        # The blocks use the end of the previous one as a dictionary.
+        b = io.BytesIO()
+        with gzip.GzipFile(fileobj=b, mode='wb', threads=2) as f:
+            f.block_size = len(data1)
+            f.write(data1 * 100)
+        self.assertLess(len(b.getvalue()), len(data1) * 10)
+        self.assertEqual(gzip.decompress(b.getvalue()), data1 * 100)
+
+    def test_bad_threads(self):
+        self.assertRaises(ValueError, gzip.GzipFile, fileobj=io.BytesIO(),
+                          mode='wb', threads=0)
+        self.assertRaises(ValueError, gzip.GzipFile, fileobj=io.BytesIO(),
+                          mode='wb', index_interval=0)
+
+    def test_index(self):
+        data = data1 * 500
+        for threads in (1, 3):
+            b = io.BytesIO()
+            with gzip.GzipFile(fileobj=b, mode='wb', threads=threads,
+                               index_interval=3000) as f:
+                f.block_size = 1000
+                for i in range(0, len(data), 700):
+                    f.write(data[i:i+700])
+            index = f.index
+            self.assertEqual([offset for offset, position in index],
+                             list(range(0, len(data), 3000)))
+            gzdata = b.getvalue()
+            self.assertEqual(gzip.decompress(gzdata), data)
+            with gzip.GzipFile(fileobj=io.BytesIO(gzdata),
+                               index=index) as f:
+                for offset in (10000, 50, 3000, 29999, len(data) - 10, 0):
+                    f.seek(offset)
+                    self.assertEqual(f.read(20), data[offset:offset+20])
+                f.seek(5000)
+                self.assertEqual(f.read(), data[5000:])
+
+            # Seeking jumps over the data before the access point.
+            offset, position = index[-1]
+            gzdata = (gzdata[:20] + bytes(position - 40) +
+                      gzdata[position - 20:])
+            with gzip.GzipFile(fileobj=io.BytesIO(gzdata),
+                               index=index) as f:
+                f.seek(offset + 100)
+                self.assertEqual(f.read(), data[offset+100:])
+
+    def test_index_full_flush(self):
+        b = io.BytesIO()
+        with gzip.GzipFile(fileobj=b, mode='wb', index_interval=10**6) as f:
+            f.write(data1)
+            f.flush(zlib.Z_FULL_FLUSH)
+            f.write(data2)
+        self.assertEqual(len(f.index), 2)
+        self.assertEqual(f.index[1][0], len(data1))
+        with gzip.GzipFile(fileobj=io.BytesIO(b.getvalue()),
+                           index=f.index) as f:
+            f.seek(len(data1) + 5)
+            self.assertEqual(f.read(), data2[5:])
+
 class TestOpen(BaseTest):
     def test_binary_modes(self):
         uncompressed = data1 * 50
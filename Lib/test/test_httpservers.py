@@ -9,6 +9,7 @@ from http.server import BaseHTTPRequestHandler, HTTPServer, \
 from http import server
 
 import os
+import socket
 import sys
 import re
 import base64
@@ -292,6 +293,26 @@ class SimpleHTTPServerTestCase(BaseTestCase):
                 self.check_status_and_reason(response, 404)
                 os.chmod(self.tempdir, 0o755)
 
+    def test_get_uses_sendfile(self):
+        data = os.urandom(1024 * 1024)
+        with open(os.path.join(self.tempdir, 'large'), 'wb') as temp:
+            temp.write(data)
+        calls = []
+        orig_sendfile = socket.socket.sendfile
+        def sendfile(sock, file, *args):
+            calls.append(getattr(file, 'name', None))
+            return orig_sendfile(sock, file, *args)
+        with support.swap_attr(socket.socket, 'sendfile', sendfile):
+            response = self.request(self.tempdir_name + '/large')
+            self.check_status_and_reason(response, 200, data=data)
+            # Directory listings are sent from memory.
+            response = self.request(self.tempdir_name + '/')
+            self.check_status_and_reason(response, 200)
+        self.assertEqual(len(calls), 2)
+        self.assertTrue(calls[0].endswith(
+            os.path.join(self.tempdir_name, 'large')))
+        self.assertIsNone(calls[1])
+
     def test_head(self):
         response = self.request(
             self.tempdir_name + '/test', method='HEAD')
@@ -9,6 +9,18 @@ class TestDump:
         self.json.dump({}, sio)
         self.assertEqual(sio.getvalue(), '{}')
 
+    def test_dump_batches_writes(self):
+        class Writer(StringIO):
+            def write(self, s):
+                self.writes += 1
+                return super().write(s)
+        obj = [{'a': [i, str(i), None]} for i in range(1000)]
+        sio = Writer()
+        sio.writes = 0
+        self.json.dump(obj, sio)
+        self.assertEqual(sio.getvalue(), self.dumps(obj))
+        self.assertLess(sio.writes, 50)
+
     def test_dumps(self):
         self.assertEqual(self.dumps({}), '{}')
 
@@ -0,0 +1,118 @@
+from io import StringIO, BytesIO
+from collections import OrderedDict
+from test.test_json import PyTest, CTest
+
+
+def chunked(s, size):
+    return [s[i:i + size] for i in range(0, len(s), size)]
+
+
+class TestIterload:
+    docs = [{'a': [1, 2.5, -3e10], 'b': 'x\\"€'}, 12, -0.5, 'str',
+            True, None, [], {}, [[{'c': []}]], 123456789012345678901234]
+
+    def iterdecode(self, chunks, items=False):
+        return list(self.json.JSONDecoder().iterdecode(chunks, items=items))
+
+    def test_json_lines(self):
+        text = '\n'.join(self.dumps(doc) for doc in self.docs) + '\n'
+        for size in (1, 2, 3, 7, 1000):
+            self.assertEqual(self.iterdecode(chunked(text, size)), self.docs)
+
+    def test_items(self):
+        text = self.dumps(self.docs, indent=2)
+        for size in (1, 2, 3, 7, 1000):
+            self.assertEqual(self.iterdecode(chunked(text, size), True),
+                             self.docs)
+
+    def test_whitespace(self):
+        for size in (1, 1000):
+            self.assertEqual(self.iterdecode(chunked(' 1 2\t3\r\n[]{}"a"',
+                                                     size)),
+                             [1, 2, 3, [], {}, 'a'])
+            self.assertEqual(self.iterdecode(chunked(' [ ] ', size), True),
+                             [])
+            self.assertEqual(self.iterdecode(chunked(' \n ', size)), [])
+        self.assertEqual(self.iterdecode([]), [])
+
+    def test_truncated_numbers(self):
+        for text in ('1.5 -2e+10 300', '[1.5,-2e+10,300]'):
+            for size in (1, 2, 3):
+                self.assertEqual(self.iterdecode(chunked(text, size),
+                                                 text[0] == '['),
+                                 [1.5, -2e+10, 300])
+
+    def test_errors(self):
+        for text, items in [('[1,]', True), ('[1 2]', True), ('[1', True),
+                            ('[,1]', True), ('[1] 2', True), ('1', True),
+                            ('', True), ('{"a"', False), ('1 x', False),
+                            ('[1', False), ('"abc', False)]:
+            for size in (1, 1000):
+                with self.assertRaises(ValueError):
+                    self.iterdecode(chunked(text, size), items)
+        with self.assertRaises(TypeError):
+            self.iterdecode([b'1'])
+
+    def test_error_position(self):
+        # The positions are relative to the whole data, not to the part
+        # left after the documents already decoded
+        text = '1\n[2,\n 3]\n"a"  {"b": [1, x]}'
+        start = text.index('{')
+        with self.assertRaises(ValueError) as cm:
+            self.json.JSONDecoder().raw_decode(text, start)
+        expected = str(cm.exception)
+        self.assertIn('line 4 column 16 (char 25)', expected)
+        for size in (1, 3, 1000):
+            with self.assertRaises(ValueError) as cm:
+                self.iterdecode(chunked(text, size))
+            self.assertEqual(str(cm.exception), expected)
+        for text, msg in [
+                ('[1,\n 2, \n 3 4]', "line 3 column 4 (char 12)"),
+                ('[1,\n 2, \n 3,]', "line 3 column 4 (char 12)"),
+                ('[1,\n 2] 3', "line 2 column 5 - line 2 column 6 "
+                               "(char 8 - 9)")]:
+            for size in (1, 3, 1000):
+                with self.assertRaises(ValueError) as cm:
+                    self.iterdecode(chunked(text, size), True)
+                self.assertIn(msg, str(cm.exception))
+
+    def test_error_lazy(self):
+        # An invalid document is reported without reading the rest of the
+        # data, unless the error may come from the end of the data read
+        def chunks(text):
+            yield from chunked(text + '0\n' * 100, 4)
+            raise AssertionError('read too far')
+        for text in ('1\n[1, x, 2]\n', '1\n{"a" 1}\n', '"a"\n"\\q"\n',
+                     '1 2 [1, 2 3] 4\n', '1\ntrue false nul\n'):
+            with self.assertRaises(ValueError):
+                list(self.json.JSONDecoder().iterdecode(chunks(text)))
+        # Truncated strings and literals are read to their end
+        text = '"{}" true "\\ud834\\udd1e" -Infinity'.format('x' * 1000)
+        self.assertEqual(self.iterdecode(chunked(text, 3)),
+                         ['x' * 1000, True, '\U0001d11e', float('-inf')])
+
+    def test_lazy(self):
+        def chunks():
+            yield '1\n'
+            yield '2\n'
+            raise AssertionError('read too far')
+        it = self.json.JSONDecoder().iterdecode(chunks())
+        self.assertEqual(next(it), 1)
+
+    def test_iterload(self):
+        text = '\n'.join(self.dumps(doc) for doc in self.docs)
+        self.assertEqual(list(self.json.iterload(StringIO(text))), self.docs)
+        text = self.dumps(self.docs)
+        self.assertEqual(list(self.json.iterload(StringIO(text), items=True)),
+                         self.docs)
+        self.assertEqual(
+            list(self.json.iterload(StringIO('{"b": 1, "a": 2} 3'),
+                                    object_pairs_hook=OrderedDict,
+                                    parse_int=float)),
+            [OrderedDict([('b', 1.0), ('a', 2.0)]), 3.0])
+        with self.assertRaises(TypeError):
+            list(self.json.iterload(BytesIO(b'1')))
+
+
+class TestPyIterload(TestIterload, PyTest): pass
+class TestCIterload(TestIterload, CTest): pass
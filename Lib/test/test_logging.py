@@ -660,6 +660,38 @@ class StreamHandlerTest(BaseTest):
             logging.raiseExceptions = old_raise
             sys.stderr = old_stderr
 
+    def test_handle_batch(self):
+        class CountingStream(io.StringIO):
+            writes = 0
+            def write(self, s):
+                self.writes += 1
+                return super().write(s)
+        records = [logging.makeLogRecord({'msg': 'msg %d', 'args': (i,)})
+                   for i in range(5)]
+        stream = CountingStream()
+        h = logging.StreamHandler(stream)
+        h.addFilter(lambda record: record.args[0] != 2)
+        handled = h.handleBatch(records)
+        self.assertEqual(handled, records[:2] + records[3:])
+        self.assertEqual(stream.getvalue(), 'msg 0\nmsg 1\nmsg 3\nmsg 4\n')
+        self.assertEqual(stream.writes, 1)
+        self.assertEqual(h.handleBatch([]), [])
+
+        # An overridden emit() is not bypassed.
+        class PrefixHandler(logging.StreamHandler):
+            def emit(self, record):
+                self.stream.write('> ')
+                logging.StreamHandler.emit(self, record)
+        stream = CountingStream()
+        PrefixHandler(stream).handleBatch(records[:2])
+        self.assertEqual(stream.getvalue(), '> msg 0\n> msg 1\n')
+
+    def test_handle_batch_error(self):
+        h = TestStreamHandler(BadStream())
+        records = [logging.makeLogRecord({}) for i in range(3)]
+        h.handleBatch(records)
+        self.assertIs(h.error_record, records[-1])
+
 # -- The following section could be moved into a server_helper.py module
 # -- if it proves to be of wider utility than just test_logging
 
@@ -3035,6 +3067,179 @@ class QueueHandlerTest(BaseTest):
         self.assertTrue(handler.matches(levelno=logging.ERROR, message='2'))
         self.assertTrue(handler.matches(levelno=logging.CRITICAL, message='3'))
 
+
+@unittest.skipUnless(threading, 'Threading required for this test.')
+class AsyncHandlerTest(BaseTest):
+
+    class BlockingHandler(logging.Handler):
+        def __init__(self):
+            logging.Handler.__init__(self)
+            self.records = []
+            self.batches = 0
+            self.started = threading.Event()
+            self.go = threading.Event()
+
+        def emitBatch(self, records):
+            self.started.set()
+            self.go.wait(5.0)
+            self.batches += 1
+            self.records.extend(records)
+
+    def record(self, msg):
+        return logging.makeLogRecord({'msg': msg, 'levelno': logging.INFO})
+
+    def test_async_handler(self):
+        handler = TestHandler(Matcher())
+        handler.setLevel(logging.ERROR)
+        stream = io.StringIO()
+        stream_handler = logging.StreamHandler(stream)
+        h = logging.handlers.AsyncHandler(handler, stream_handler)
+        logger = logging.getLogger('async')
+        logger.propagate = False
+        logger.addHandler(h)
+        try:
+            logger.warning('one')
+            logger.error('two')
+        finally:
+            logger.removeHandler(h)
+            h.close()
+        self.assertFalse(h._thread.is_alive())
+        self.assertEqual(h.pending, 0)
+        self.assertEqual(stream.getvalue(), 'one\ntwo\n')
+        self.assertEqual(len(handler.buffer), 1)
+        self.assertTrue(handler.matches(levelno=logging.ERROR, message='two'))
+        # Once closed, records are handled synchronously.
+        h.handle(self.record('three'))
+        self.assertEqual(stream.getvalue(), 'one\ntwo\nthree\n')
+
+    def test_batches(self):
+        target = self.BlockingHandler()
+        h = logging.handlers.AsyncHandler(target, batch_size=3)
+        try:
+            h.handle(self.record(0))
+            self.assertTrue(target.started.wait(5.0))
+            for i in range(1, 8):
+                h.handle(self.record(i))
+            self.assertEqual(h.pending, 8)
+            self.assertEqual(h.max_pending, 7)
+            target.go.set()
+            h.flush()
+            self.assertEqual(h.pending, 0)
+        finally:
+            h.close()
+        self.assertEqual([r.msg for r in target.records], list(range(8)))
+        # One record, then two batches of three and one of one.
+        self.assertEqual(target.batches, 4)
+        self.assertEqual(h.dropped, 0)
+
+    def test_overflow_drop(self):
+        target = self.BlockingHandler()
+        h = logging.handlers.AsyncHandler(target, capacity=2,
+                                          overflow='drop')
+        try:
+            h.handle(self.record(0))
+            self.assertTrue(target.started.wait(5.0))
+            for i in range(1, 6):
+                h.handle(self.record(i))
+            self.assertEqual(h.dropped, 3)
+            target.go.set()
+        finally:
+            h.close()
+        self.assertEqual([r.msg for r in target.records], [0, 1, 2])
+
+    def test_overflow_block(self):
+        target = self.BlockingHandler()
+        h = logging.handlers.AsyncHandler(target, capacity=1)
+        try:
+            h.handle(self.record(0))
+            self.assertTrue(target.started.wait(5.0))
+            h.handle(self.record(1))
+            t = threading.Thread(target=h.handle,
+                                 args=(self.record(2),))
+            t.start()
+            t.join(0.1)
+            # The buffer is full.
+            self.assertTrue(t.is_alive())
+            target.go.set()
+            t.join(5.0)
+            self.assertFalse(t.is_alive())
+        finally:
+            h.close()
+        self.assertEqual([r.msg for r in target.records], [0, 1, 2])
+        self.assertEqual(h.dropped, 0)
+
+    def test_flush_while_logging(self):
+        # flush() only waits for the records logged before it is called
+        class RelogHandler(logging.Handler):
+            def emitBatch(self, records):
+                if relog:
+                    h.handle(records[-1])
+        relog = True
+        h = logging.handlers.AsyncHandler(RelogHandler())
+        try:
+            h.handle(self.record(0))
+            h.flush()
+            relog = False
+        finally:
+            h.close()
+        self.assertEqual(h.pending, 0)
+
+    def test_overflow_block_from_handler(self):
+        # Records logged by a handler while the buffer is full are handled
+        # by the worker thread itself, instead of waiting for it
+        class LoggingHandler(logging.Handler):
+            def __init__(self):
+                logging.Handler.__init__(self)
+                self.records = []
+                self.done = threading.Event()
+            def emitBatch(self, records):
+                for record in records:
+                    self.records.append(record.msg)
+                    if record.msg == 0:
+                        for i in range(1, 4):
+                            h.handle(test.record(i))
+                        self.done.set()
+        test = self
+        target = LoggingHandler()
+        h = logging.handlers.AsyncHandler(target, capacity=1)
+        try:
+            h.handle(self.record(0))
+            self.assertTrue(target.done.wait(5.0))
+            h.flush()
+        finally:
+            h.close()
+        self.assertEqual(target.records, [0, 2, 3, 1])
+
+    def test_flush_dead_worker(self):
+        # flush() doesn't wait forever if the worker thread died
+        class ExitHandler(self.BlockingHandler):
+            def emitBatch(self, records):
+                self.started.set()
+                self.go.wait(5.0)
+                raise SystemExit
+        target = ExitHandler()
+        h = logging.handlers.AsyncHandler(target)
+        try:
+            h.handle(self.record(0))
+            self.assertTrue(target.started.wait(5.0))
+            h.handle(self.record(1))
+            target.go.set()
+            h._thread.join(5.0)
+            self.assertFalse(h._thread.is_alive())
+            h.flush()
+            self.assertEqual(h.pending, 1)
+        finally:
+            h.close()
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, logging.handlers.AsyncHandler,
+                          overflow='spill')
+        self.assertRaises(ValueError, logging.handlers.AsyncHandler,
+                          capacity=0)
+        self.assertRaises(ValueError, logging.handlers.AsyncHandler,
+                          batch_size=0)
+
+
 ZERO = datetime.timedelta(0)
 
 class UTC(datetime.tzinfo):
@@ -3435,6 +3640,45 @@ class LogRecordTest(BaseTest):
         r.removeHandler(h)
         h.close()
 
+    def test_lazy_attributes(self):
+        r = logging.LogRecord('name', logging.INFO,
+                              os.path.join('path', 'to', 'spam.py'), 42,
+                              'msg', (), None)
+        for name in ('filename', 'module', 'msecs', 'relativeCreated'):
+            self.assertNotIn(name, r.__dict__)
+        self.assertEqual(r.filename, 'spam.py')
+        self.assertIn('filename', r.__dict__)
+        self.assertEqual(r.module, 'spam')
+        self.assertEqual(r.msecs, (r.created - int(r.created)) * 1000)
+        self.assertGreaterEqual(r.relativeCreated, 0)
+        self.assertRaises(AttributeError, getattr, r, 'spam')
+        r = logging.LogRecord('name', logging.INFO, None, 42, 'msg', (), None)
+        self.assertIsNone(r.filename)
+        self.assertEqual(r.module, 'Unknown module')
+
+    def test_lazy_attributes_formatting(self):
+        r = logging.LogRecord('name', logging.INFO,
+                              os.path.join('path', 'to', 'spam.py'), 42,
+                              'msg', (), None)
+        for fmt, style in (('%(module)s:%(filename)s', '%'),
+                           ('{module}:{filename}', '{'),
+                           ('${module}:${filename}', '$')):
+            f = logging.Formatter(fmt, style=style)
+            self.assertEqual(f.format(r), 'spam:spam.py')
+        r = logging.LogRecord('name', logging.INFO, 'spam.py', 42, 'msg', (),
+                              None)
+        f = logging.Formatter('%(message)s')
+        self.assertEqual(f.format(r), 'msg')
+        self.assertNotIn('module', r.__dict__)
+
+    def test_lazy_attributes_pickle(self):
+        r = logging.LogRecord('name', logging.INFO, 'spam.py', 42, 'msg', (),
+                              None)
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            r2 = pickle.loads(pickle.dumps(r, proto))
+            self.assertEqual(r2.__dict__['module'], 'spam')
+            self.assertEqual(r2.relativeCreated, r.relativeCreated)
+
     def test_multiprocessing(self):
         r = logging.makeLogRecord({})
         self.assertEqual(r.processName, 'MainProcess')
@@ -3782,7 +4026,8 @@ class LoggerTest(BaseTest):
         rv = logging._logRecordFactory(name, level, fn, lno, msg, args,
                                        exc_info, func, sinfo)
 
-        for key in ('message', 'asctime') + tuple(rv.__dict__.keys()):
+        for key in (('message', 'asctime', 'filename', 'module') +
+                    tuple(rv.__dict__.keys())):
             extra = {key: 'some value'}
             self.assertRaises(KeyError, self.logger.makeRecord, name, level,
                               fn, lno, msg, args, exc_info,
@@ -3815,6 +4060,78 @@ class LoggerTest(BaseTest):
         self.addCleanup(setattr, self.logger.manager, 'disable', old_disable)
         self.assertFalse(self.logger.isEnabledFor(22))
 
+    def test_caching(self):
+        root = self.root_logger
+        logger1 = logging.getLogger("abc")
+        logger2 = logging.getLogger("abc.def")
+
+        # Set root logger level and ensure cache is empty
+        root.setLevel(logging.ERROR)
+        self.assertEqual(logger2.getEffectiveLevel(), logging.ERROR)
+        self.assertEqual(logger2._cache, {})
+
+        # Ensure cache is populated and calls are consistent
+        self.assertTrue(logger2.isEnabledFor(logging.ERROR))
+        self.assertFalse(logger2.isEnabledFor(logging.DEBUG))
+        self.assertEqual(logger2._cache, {logging.ERROR: True,
+                                          logging.DEBUG: False})
+        self.assertEqual(root._cache, {})
+        self.assertTrue(logger2.isEnabledFor(logging.ERROR))
+
+        # Ensure root cache gets populated
+        self.assertEqual(root._cache, {})
+        self.assertTrue(root.isEnabledFor(logging.ERROR))
+        self.assertEqual(root._cache, {logging.ERROR: True})
+
+        # Set parent logger level and ensure caches are emptied
+        logger1.setLevel(logging.CRITICAL)
+        self.assertEqual(logger2.getEffectiveLevel(), logging.CRITICAL)
+        self.assertEqual(logger2._cache, {})
+
+        # Ensure logger2 uses parent logger's effective level
+        self.assertFalse(logger2.isEnabledFor(logging.ERROR))
+
+        # Set level to NOTSET and ensure caches are empty
+        logger2.setLevel(logging.NOTSET)
+        self.assertEqual(logger2.getEffectiveLevel(), logging.CRITICAL)
+        self.assertEqual(logger2._cache, {})
+        self.assertEqual(logger1._cache, {})
+        self.assertEqual(root._cache, {})
+
+        # Verify logger2 follows parent and not root
+        self.assertFalse(logger2.isEnabledFor(logging.ERROR))
+        self.assertTrue(logger2.isEnabledFor(logging.CRITICAL))
+        self.assertFalse(logger1.isEnabledFor(logging.ERROR))
+        self.assertTrue(logger1.isEnabledFor(logging.CRITICAL))
+        self.assertTrue(root.isEnabledFor(logging.ERROR))
+
+        # Disable logging in manager and ensure caches are clear
+        logging.disable(logging.CRITICAL)
+        self.assertEqual(logger2.getEffectiveLevel(), logging.CRITICAL)
+        self.assertEqual(logger2._cache, {})
+        self.assertEqual(logger1._cache, {})
+        self.assertEqual(root._cache, {})
+
+        # Ensure no loggers are enabled
+        self.assertFalse(logger1.isEnabledFor(logging.CRITICAL))
+        self.assertFalse(logger2.isEnabledFor(logging.CRITICAL))
+        self.assertFalse(root.isEnabledFor(logging.CRITICAL))
+
+        # Re-enable logging and ensure the levels are used again
+        logging.disable(logging.NOTSET)
+        self.assertTrue(logger2.isEnabledFor(logging.CRITICAL))
+
+    def test_caching_placeholder(self):
+        # A logger replacing a placeholder gives its level to the loggers
+        # below it.
+        self.root_logger.setLevel(logging.WARNING)
+        child = logging.getLogger("ghi.jkl.mno")
+        self.assertFalse(child.isEnabledFor(logging.INFO))
+        parent = logging.getLogger("ghi.jkl")
+        self.assertEqual(child._cache, {})
+        parent.setLevel(logging.INFO)
+        self.assertTrue(child.isEnabledFor(logging.INFO))
+
     def test_root_logger_aliases(self):
         root = logging.getLogger()
         self.assertIs(root, logging.root)
@@ -4146,7 +4463,7 @@ def test_main():
                  MemoryTest, EncodingTest, WarningsTest, ConfigDictTest,
                  ManagerTest, FormatterTest, BufferingFormatterTest,
                  StreamHandlerTest, LogRecordFactoryTest, ChildLoggerTest,
-                 QueueHandlerTest, ShutdownTest, ModuleLevelMiscTest,
+                 QueueHandlerTest, AsyncHandlerTest, ShutdownTest, ModuleLevelMiscTest,
                  BasicConfigTest, LoggerAdapterTest, LoggerTest,
                  SMTPHandlerTest, FileHandlerTest, RotatingFileHandlerTest,
                  LastResortTest, LogRecordTest, ExceptionTest,
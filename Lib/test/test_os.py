@@ -848,6 +848,26 @@ class FwalkTests(WalkTests):
                 # check that listdir() returns consistent information
                 self.assertEqual(set(os.listdir(rootfd)), set(dirs) | set(files))
 
+    @support.skip_unless_symlink
+    def test_vanished_entries(self):
+        # Entries removed between the listing and their stat() are skipped
+        real_scandir = os.scandir
+        class scandir:
+            def __init__(self, fd):
+                with real_scandir(fd) as it:
+                    self.entries = list(it)
+                for entry in self.entries:
+                    if entry.name in ('link', 'broken_link'):
+                        os.unlink(entry.name, dir_fd=fd)
+            def __enter__(self):
+                return iter(self.entries)
+            def __exit__(self, *args):
+                pass
+        sub2_path = os.path.join(support.TESTFN, "TEST1", "SUB2")
+        with support.swap_attr(os, 'scandir', scandir):
+            for root, dirs, files, rootfd in os.fwalk(sub2_path):
+                self.assertEqual((root, dirs, files), (sub2_path, [], ["tmp3"]))
+
     def test_fd_leak(self):
         # Since we're opening a lot of FDs, we must be careful to avoid leaks:
         # we both check that calling fwalk() a large number of times doesn't
@@ -875,6 +895,207 @@ class FwalkTests(WalkTests):
         os.rmdir(support.TESTFN)
 
 
+class TestScandir(unittest.TestCase):
+    """Tests for os.scandir()."""
+
+    def setUp(self):
+        self.path = os.path.realpath(support.TESTFN)
+        os.mkdir(self.path)
+        self.addCleanup(support.rmtree, self.path)
+
+    def create_file(self, name="file.txt"):
+        filename = os.path.join(self.path, name)
+        with open(filename, "wb") as fp:
+            fp.write(b'python')
+        return filename
+
+    def get_entries(self, names):
+        entries = dict((entry.name, entry)
+                       for entry in os.scandir(self.path))
+        self.assertEqual(sorted(entries.keys()), names)
+        return entries
+
+    def check_entry(self, entry, name, is_dir, is_file, is_symlink):
+        self.assertEqual(entry.name, name)
+        self.assertEqual(entry.path, os.path.join(self.path, name))
+        self.assertEqual(entry.inode(),
+                         os.stat(entry.path, follow_symlinks=False).st_ino)
+
+        entry_stat = os.stat(entry.path)
+        self.assertEqual(entry.is_dir(),
+                         stat.S_ISDIR(entry_stat.st_mode))
+        self.assertEqual(entry.is_file(),
+                         stat.S_ISREG(entry_stat.st_mode))
+        self.assertEqual(entry.is_symlink(),
+                         os.path.islink(entry.path))
+
+        entry_lstat = os.stat(entry.path, follow_symlinks=False)
+        self.assertEqual(entry.is_dir(follow_symlinks=False),
+                         stat.S_ISDIR(entry_lstat.st_mode))
+        self.assertEqual(entry.is_file(follow_symlinks=False),
+                         stat.S_ISREG(entry_lstat.st_mode))
+
+        self.assertEqual(entry.is_dir(), is_dir)
+        self.assertEqual(entry.is_file(), is_file)
+        self.assertEqual(entry.is_symlink(), is_symlink)
+
+        self.assertEqual(entry.stat().st_mode, entry_stat.st_mode)
+        self.assertEqual(entry.stat(follow_symlinks=False).st_mode,
+                         entry_lstat.st_mode)
+        if os.name != 'nt':
+            self.assertEqual(entry.stat().st_ino, entry_stat.st_ino)
+            self.assertEqual(entry.stat(follow_symlinks=False).st_ino,
+                             entry_lstat.st_ino)
+
+    def test_attributes(self):
+        link = hasattr(os, 'link')
+        symlink = support.can_symlink()
+
+        dirname = os.path.join(self.path, "dir")
+        os.mkdir(dirname)
+        filename = self.create_file("file.txt")
+        if link:
+            os.link(filename, os.path.join(self.path, "link_file.txt"))
+        if symlink:
+            os.symlink(dirname, os.path.join(self.path, "symlink_dir"),
+                       target_is_directory=True)
+            os.symlink(filename, os.path.join(self.path, "symlink_file.txt"))
+
+        names = ['dir', 'file.txt']
+        if link:
+            names.append('link_file.txt')
+        if symlink:
+            names.extend(('symlink_dir', 'symlink_file.txt'))
+        entries = self.get_entries(names)
+
+        entry = entries['dir']
+        self.check_entry(entry, 'dir', True, False, False)
+
+        entry = entries['file.txt']
+        self.check_entry(entry, 'file.txt', False, True, False)
+
+        if link:
+            entry = entries['link_file.txt']
+            self.check_entry(entry, 'link_file.txt', False, True, False)
+
+        if symlink:
+            entry = entries['symlink_dir']
+            self.check_entry(entry, 'symlink_dir', True, False, True)
+
+            entry = entries['symlink_file.txt']
+            self.check_entry(entry, 'symlink_file.txt', False, True, True)
+
+    @support.skip_unless_symlink
+    def test_broken_symlink(self):
+        filename = self.create_file("file.txt")
+        os.symlink(filename, os.path.join(self.path, "symlink.txt"))
+        entries = self.get_entries(['file.txt', 'symlink.txt'])
+        entry = entries['symlink.txt']
+        os.unlink(filename)
+
+        self.assertGreater(entry.inode(), 0)
+        self.assertFalse(entry.is_dir())
+        self.assertFalse(entry.is_file())  # broken symlink returns False
+        self.assertFalse(entry.is_dir(follow_symlinks=False))
+        self.assertFalse(entry.is_file(follow_symlinks=False))
+        self.assertTrue(entry.is_symlink())
+        self.assertRaises(FileNotFoundError, entry.stat)
+        # don't fail
+        entry.stat(follow_symlinks=False)
+
+    def test_stat_cached(self):
+        self.create_file("file.txt")
+        entry = self.get_entries(['file.txt'])['file.txt']
+        st = entry.stat()
+        self.assertIs(entry.stat(), st)
+        self.assertIs(entry.stat(follow_symlinks=False), st)
+
+    def test_current_directory(self):
+        filename = self.create_file()
+        old_dir = os.getcwd()
+        try:
+            os.chdir(self.path)
+            entries = list(os.scandir())
+        finally:
+            os.chdir(old_dir)
+        self.assertEqual([entry.name for entry in entries],
+                         [os.path.basename(filename)])
+        self.assertEqual(entries[0].path,
+                         os.path.join(os.curdir, 'file.txt'))
+
+    def test_repr(self):
+        entry = next(os.scandir(os.path.dirname(self.create_file())))
+        self.assertEqual(repr(entry), "<DirEntry 'file.txt'>")
+
+    @unittest.skipUnless(os.name != 'nt', "bytes paths not supported on Windows")
+    def test_bytes(self):
+        self.create_file("file.txt")
+        path_bytes = os.fsencode(self.path)
+        entries = list(os.scandir(path_bytes))
+        self.assertEqual(len(entries), 1)
+        entry = entries[0]
+        self.assertEqual(entry.name, b'file.txt')
+        self.assertEqual(entry.path,
+                         os.fsencode(os.path.join(self.path, 'file.txt')))
+        self.assertTrue(entry.is_file())
+
+    @unittest.skipUnless(os.scandir in os.supports_fd,
+                         'fd support for os.scandir() required')
+    def test_fd(self):
+        self.create_file("file.txt")
+        os.mkdir(os.path.join(self.path, "dir"))
+        fd = os.open(self.path, os.O_RDONLY)
+        try:
+            entries = dict((entry.name, entry) for entry in os.scandir(fd))
+            self.assertEqual(sorted(entries), ['dir', 'file.txt'])
+            entry = entries['file.txt']
+            self.assertEqual(entry.path, 'file.txt')
+            self.assertTrue(entry.is_file())
+            self.assertEqual(entry.stat(),
+                             os.stat('file.txt', dir_fd=fd))
+            self.assertTrue(entries['dir'].is_dir())
+            # The directory can be listed again from the same fd.
+            self.assertEqual(sorted(os.listdir(fd)), ['dir', 'file.txt'])
+        finally:
+            os.close(fd)
+
+    def test_empty_path(self):
+        self.assertRaises(FileNotFoundError, os.scandir, '')
+
+    def test_consume_iterator_twice(self):
+        self.create_file("file.txt")
+        iterator = os.scandir(self.path)
+
+        entries = list(iterator)
+        self.assertEqual(len(entries), 1, entries)
+
+        # check than consuming the iterator twice doesn't raise exception
+        entries2 = list(iterator)
+        self.assertEqual(len(entries2), 0, entries2)
+
+    def test_close(self):
+        self.create_file("file.txt")
+        self.create_file("file2.txt")
+        with os.scandir(self.path) as iterator:
+            next(iterator)
+        self.assertEqual(list(iterator), [])
+        iterator = os.scandir(self.path)
+        iterator.close()
+        self.assertEqual(list(iterator), [])
+
+    def test_bad_path_type(self):
+        for obj in [1234, 1.234, {}, []]:
+            if obj == 1234 and os.scandir in os.supports_fd:
+                continue
+            self.assertRaises(TypeError, os.scandir, obj)
+
+    def test_error(self):
+        path = os.path.join(self.path, 'missing')
+        with self.assertRaises(FileNotFoundError) as cm:
+            os.scandir(path)
+        self.assertEqual(cm.exception.filename, path)
+
+
 class MakedirTests(unittest.TestCase):
     def setUp(self):
         os.mkdir(support.TESTFN)
@@ -2476,6 +2697,7 @@ def test_main():
         EnvironTests,
         WalkTests,
         FwalkTests,
+        TestScandir,
         MakedirTests,
         DevNullTests,
         URandomTests,
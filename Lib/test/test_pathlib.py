@@ -1321,6 +1321,32 @@ class _BasePathTest(object):
         _check(p.rglob("file*"), ["dirC/fileC", "dirC/dirD/fileD"])
         _check(p.rglob("*/*"), ["dirC/dirD/fileD"])
 
+    def test_glob_recursive_dirs(self):
+        # A trailing '**' only matches directories, including the starting
+        # one, and wildcards match names starting with a dot.
+        P = self.cls
+        p = P(BASE, "dirC")
+        with open(join('dirC', 'dirD', '.hidden'), 'wb'):
+            pass
+        self.assertEqual(set(p.glob("**")), { p, P(BASE, "dirC/dirD") })
+        self.assertEqual(set(p.glob("**/dirD/**")), { P(BASE, "dirC/dirD") })
+        self.assertEqual(set(p.rglob(".*")), { P(BASE, "dirC/dirD/.hidden") })
+        self.assertEqual(set(p.glob("**/*D")), { P(BASE, "dirC/dirD"),
+                                                 P(BASE, "dirC/dirD/fileD") })
+        self.assertRaises(ValueError, list, p.glob(""))
+        self.assertRaises(ValueError, list, p.glob("dir**"))
+
+    @with_symlinks
+    def test_glob_broken_symlink(self):
+        # A literal name doesn't match a dangling symlink, a wildcard does
+        P = self.cls
+        p = P(BASE, "dirC")
+        os.symlink('non-existing', join('dirC', 'dirD', 'brokenLinkD'))
+        self.assertEqual(list(p.rglob("brokenLinkD")), [])
+        self.assertEqual(list(p.glob("dirD/brokenLinkD")), [])
+        self.assertEqual(list(p.rglob("broken*")),
+                         [P(BASE, "dirC/dirD/brokenLinkD")])
+
     def test_glob_dotdot(self):
         # ".." is not special in globs
         P = self.cls
@@ -219,6 +219,66 @@ class BaseQueueTestMixin(BlockingTestMixin):
         with self.assertRaises(queue.Empty):
             q.get_nowait()
 
+    def test_put_get_many(self):
+        q = self.type2test()
+        q.put_many([111, 333, 222])
+        q.put_many(iter([444]))
+        q.put_many([])
+        self.assertEqual(q.qsize(), 4)
+        target_order = dict(Queue = [111, 333, 222, 444],
+                            LifoQueue = [444, 222, 333, 111],
+                            PriorityQueue = [111, 222, 333, 444])
+        expected = target_order[q.__class__.__name__]
+        self.assertEqual(q.get_many(3), expected[:3])
+        self.assertEqual(q.get_many(3), expected[3:])
+        with self.assertRaises(queue.Empty):
+            q.get_many(3, block=False)
+        with self.assertRaises(queue.Empty):
+            q.get_many(3, timeout=0.01)
+        with self.assertRaises(ValueError):
+            q.get_many(0)
+        with self.assertRaises(ValueError):
+            q.get_many(1, timeout=-1)
+        with self.assertRaises(ValueError):
+            q.put_many([1], timeout=-1)
+
+    def test_put_many_full(self):
+        q = self.type2test(QUEUE_SIZE)
+        with self.assertRaises(queue.Full):
+            q.put_many(range(QUEUE_SIZE + 2), block=False)
+        self.assertEqual(q.qsize(), QUEUE_SIZE)
+        with self.assertRaises(queue.Full):
+            q.put_many([1], timeout=0.01)
+        self.assertEqual(sorted(q.get_many(QUEUE_SIZE + 1)),
+                         list(range(QUEUE_SIZE)))
+        self.assertEqual(q.unfinished_tasks, QUEUE_SIZE)
+
+    def test_blocking_put_get_many(self):
+        # put_many() blocks until the consumer made room for all the items
+        q = self.type2test(QUEUE_SIZE)
+        items = list(range(QUEUE_SIZE * 3))
+        got = []
+        def consume():
+            while len(got) < len(items):
+                got.extend(q.get_many(2, timeout=10))
+        self.do_blocking_test(q.put_many, (items,), consume, ())
+        self.assertEqual(sorted(got), items)
+        # get_many() blocks until an item is put
+        self.assertEqual(sorted(
+            self.do_blocking_test(q.get_many, (5,), q.put_many, ([1, 2],))),
+            [1, 2])
+        self.assertEqual(
+            self.do_blocking_test(q.get_many, (1, True, 10), q.put, (3,)),
+            [3])
+
+    def test_many_join(self):
+        q = self.type2test()
+        q.put_many(range(5))
+        self.assertEqual(q.unfinished_tasks, 5)
+        for item in q.get_many(10):
+            q.task_done()
+        q.join()
+
     def test_shrinking_queue(self):
         # issue 10110
         q = self.type2test(3)
@@ -176,6 +176,40 @@ class BaseSelectorTestCase(unittest.TestCase):
         self.assertFalse(s.register.called)
         self.assertFalse(s.unregister.called)
 
+    def test_modify_events(self):
+        s = self.SELECTOR()
+        self.addCleanup(s.close)
+
+        rd, wr = self.make_socketpair()
+        d = object()
+        s.register(wr, selectors.EVENT_READ, d)
+        self.assertEqual([], s.select(0))
+
+        # the registration is changed in place
+        s.register = unittest.mock.Mock()
+        s.unregister = unittest.mock.Mock()
+        key = s.modify(wr, selectors.EVENT_WRITE, d)
+        self.assertFalse(s.register.called)
+        self.assertFalse(s.unregister.called)
+        self.assertEqual(key, s.get_key(wr))
+        self.assertEqual(selectors.EVENT_WRITE, key.events)
+        self.assertIs(key.data, d)
+        self.assertEqual([(key, selectors.EVENT_WRITE)], s.select(0))
+
+        key = s.modify(wr, selectors.EVENT_READ | selectors.EVENT_WRITE)
+        self.assertIsNone(key.data)
+        self.assertEqual([(key, selectors.EVENT_WRITE)], s.select(0))
+
+        key = s.modify(wr, selectors.EVENT_READ)
+        self.assertEqual([], s.select(0))
+        wr.send(b'x')
+        rd.send(b'y')
+        self.assertEqual([(key, selectors.EVENT_READ)], s.select(0))
+
+        self.assertRaises(ValueError, s.modify, wr, 0)
+        self.assertRaises(ValueError, s.modify, wr, 999999)
+        self.assertEqual(key, s.get_key(wr))
+
     def test_close(self):
         s = self.SELECTOR()
         self.addCleanup(s.close)
@@ -410,6 +444,42 @@ class ScalableSelectorMixIn:
         self.assertEqual(NUM_FDS // 2, len(s.select()))
 
 
+class EdgeTriggeredMixIn:
+
+    def test_edge_triggered(self):
+        s = self.SELECTOR(edge_triggered=True)
+        self.addCleanup(s.close)
+        self.assertTrue(s.edge_triggered)
+
+        rd, wr = self.make_socketpair()
+        key = s.register(rd, selectors.EVENT_READ)
+        self.assertEqual([], s.select(0))
+
+        wr.send(b'x')
+        self.assertEqual([(key, selectors.EVENT_READ)], s.select(0))
+        # no new data arrived
+        self.assertEqual([], s.select(0))
+        wr.send(b'y')
+        self.assertEqual([(key, selectors.EVENT_READ)], s.select(0))
+
+        # modify() keeps the edge-triggered mode
+        key = s.modify(rd, selectors.EVENT_READ | selectors.EVENT_WRITE)
+        self.assertEqual([(key, selectors.EVENT_READ | selectors.EVENT_WRITE)],
+                         s.select(0))
+        self.assertEqual([], s.select(0))
+
+    def test_level_triggered(self):
+        s = self.SELECTOR()
+        self.addCleanup(s.close)
+        self.assertFalse(s.edge_triggered)
+
+        rd, wr = self.make_socketpair()
+        key = s.register(rd, selectors.EVENT_READ)
+        wr.send(b'x')
+        self.assertEqual([(key, selectors.EVENT_READ)], s.select(0))
+        self.assertEqual([(key, selectors.EVENT_READ)], s.select(0))
+
+
 class DefaultSelectorTestCase(BaseSelectorTestCase):
 
     SELECTOR = selectors.DefaultSelector
@@ -429,14 +499,16 @@ class PollSelectorTestCase(BaseSelectorTestCase, ScalableSelectorMixIn):
 
 @unittest.skipUnless(hasattr(selectors, 'EpollSelector'),
                      "Test needs selectors.EpollSelector")
-class EpollSelectorTestCase(BaseSelectorTestCase, ScalableSelectorMixIn):
+class EpollSelectorTestCase(BaseSelectorTestCase, ScalableSelectorMixIn,
+                            EdgeTriggeredMixIn):
 
     SELECTOR = getattr(selectors, 'EpollSelector', None)
 
 
 @unittest.skipUnless(hasattr(selectors, 'KqueueSelector'),
                      "Test needs selectors.KqueueSelector)")
-class KqueueSelectorTestCase(BaseSelectorTestCase, ScalableSelectorMixIn):
+class KqueueSelectorTestCase(BaseSelectorTestCase, ScalableSelectorMixIn,
+                             EdgeTriggeredMixIn):
 
     SELECTOR = getattr(selectors, 'KqueueSelector', None)
 
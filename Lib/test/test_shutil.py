@@ -1,6 +1,7 @@
 # Copyright (C) 2003 Python Software Foundation
 
 import unittest
+import unittest.mock
 import shutil
 import tempfile
 import sys
@@ -589,7 +590,7 @@ class TestShutil(unittest.TestCase):
     def test_rmtree_uses_safe_fd_version_if_available(self):
         _use_fd_functions = ({os.open, os.stat, os.unlink, os.rmdir} <=
                              os.supports_dir_fd and
-                             os.listdir in os.supports_fd and
+                             os.scandir in os.supports_fd and
                              os.stat in os.supports_follow_symlinks)
         if _use_fd_functions:
             self.assertTrue(shutil._use_fd_functions)
@@ -1704,6 +1705,67 @@ class TestCopyFile(unittest.TestCase):
         finally:
             os.rmdir(dst_dir)
 
+
+@unittest.skipUnless(shutil._USE_CP_SENDFILE, 'requires sendfile() copies')
+class TestCopyFileSendfile(unittest.TestCase):
+    # copyfile() copies between regular files with os.sendfile().
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.src = os.path.join(self.tmp_dir, 'src')
+        self.dst = os.path.join(self.tmp_dir, 'dst')
+        self.data = os.urandom(3 * 1024 * 1024 + 7)
+        write_file(self.src, self.data, binary=True)
+
+    def test_copyfile(self):
+        orig_sendfile = os.sendfile
+        calls = []
+        def sendfile(*args):
+            calls.append(args)
+            return orig_sendfile(*args)
+        with unittest.mock.patch('os.sendfile', sendfile):
+            shutil.copyfile(self.src, self.dst)
+        self.assertTrue(calls)
+        self.assertEqual(read_file(self.dst, binary=True), self.data)
+
+    def test_empty_file(self):
+        write_file(self.src, b'', binary=True)
+        shutil.copyfile(self.src, self.dst)
+        self.assertEqual(read_file(self.dst, binary=True), b'')
+
+    def test_fallback(self):
+        # When the first sendfile() call fails, the file is copied with
+        # read() and write() instead.
+        err = OSError(errno.EINVAL, 'Invalid argument')
+        with unittest.mock.patch('os.sendfile', side_effect=err) as m:
+            shutil.copyfile(self.src, self.dst)
+        self.assertTrue(m.called)
+        self.assertEqual(read_file(self.dst, binary=True), self.data)
+        self.assertTrue(shutil._USE_CP_SENDFILE)
+
+    def test_enotsock(self):
+        # sendfile() only supports sockets as destination: it is not
+        # tried again.
+        err = OSError(errno.ENOTSOCK, 'Socket operation on non-socket')
+        self.addCleanup(setattr, shutil, '_USE_CP_SENDFILE', True)
+        with unittest.mock.patch('os.sendfile', side_effect=err) as m:
+            shutil.copyfile(self.src, self.dst)
+            self.assertFalse(shutil._USE_CP_SENDFILE)
+            shutil.copyfile(self.src, self.dst)
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(read_file(self.dst, binary=True), self.data)
+
+    def test_enospc(self):
+        err = OSError(errno.ENOSPC, 'No space left on device')
+        with unittest.mock.patch('os.sendfile', side_effect=err):
+            with self.assertRaises(OSError) as cm:
+                shutil.copyfile(self.src, self.dst)
+        self.assertEqual(cm.exception.errno, errno.ENOSPC)
+        self.assertEqual(cm.exception.filename, self.src)
+        self.assertEqual(cm.exception.filename2, self.dst)
+
+
 class TermsizeTests(unittest.TestCase):
     def test_does_not_crash(self):
         """Check if get_terminal_size() returns a meaningful value.
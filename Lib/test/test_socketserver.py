@@ -10,7 +10,10 @@ import signal
 import socket
 import select
 import errno
+import http.client
+import http.server
 import tempfile
+import time
 import unittest
 import socketserver
 
@@ -222,6 +225,166 @@ class SocketServerTest(unittest.TestCase):
                             socketserver.DatagramRequestHandler,
                             self.dgram_examine)
 
+    def test_ThreadPoolTCPServer(self):
+        self.run_server(socketserver.ThreadPoolTCPServer,
+                        socketserver.StreamRequestHandler,
+                        self.stream_examine)
+
+    def test_ThreadPoolUDPServer(self):
+        self.run_server(socketserver.ThreadPoolUDPServer,
+                        socketserver.DatagramRequestHandler,
+                        self.dgram_examine)
+
+    @requires_forking
+    def test_PreForkingTCPServer(self):
+        self.run_server(socketserver.PreForkingTCPServer,
+                        socketserver.StreamRequestHandler,
+                        self.stream_examine)
+
+    @requires_forking
+    def test_PreForkingUDPServer(self):
+        self.run_server(socketserver.PreForkingUDPServer,
+                        socketserver.DatagramRequestHandler,
+                        self.dgram_examine)
+
+    @requires_forking
+    def test_PreForkingThreadPoolTCPServer(self):
+        class MyServer(socketserver.PreForkingMixIn,
+                       socketserver.ThreadPoolMixIn,
+                       socketserver.TCPServer):
+            pass
+        self.run_server(MyServer,
+                        socketserver.StreamRequestHandler,
+                        self.stream_examine)
+
+    @reap_threads
+    def test_thread_pool_bounded(self):
+        started = threading.Semaphore(0)
+        release = threading.Event()
+        handled = []
+
+        class MyServer(socketserver.ThreadPoolTCPServer):
+            max_threads = 2
+
+        class MyHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                started.release()
+                release.wait()
+                handled.append(threading.get_ident())
+                self.wfile.write(self.rfile.readline())
+
+        server = MyServer((HOST, 0), MyHandler)
+        t = threading.Thread(target=server.serve_forever,
+                             kwargs={'poll_interval': 0.01})
+        t.daemon = True
+        t.start()
+        clients = []
+        try:
+            for i in range(5):
+                s = socket.create_connection(server.server_address)
+                s.sendall(TEST_STR)
+                clients.append(s)
+            started.acquire()
+            started.acquire()
+            self.assertFalse(started.acquire(timeout=0.1))
+            self.assertEqual(len(server._workers), 2)
+            release.set()
+            for s in clients:
+                self.assertEqual(receive(s, 100), TEST_STR)
+        finally:
+            release.set()
+            for s in clients:
+                s.close()
+            server.shutdown()
+            t.join()
+            server.server_close()
+        self.assertEqual(len(handled), 5)
+        self.assertEqual(len(set(handled)), 2)
+        self.assertIsNone(server._workers)
+
+    @requires_forking
+    @reap_threads
+    def test_prefork_replaces_children(self):
+        class MyServer(socketserver.PreForkingTCPServer):
+            num_children = 2
+
+        class MyHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                self.wfile.write(str(os.getpid()).encode() + b'\n')
+
+        server = MyServer((HOST, 0), MyHandler)
+        t = threading.Thread(target=server.serve_forever,
+                             kwargs={'poll_interval': 0.01})
+        t.daemon = True
+        t.start()
+        try:
+            for i in range(100):
+                if server.active_children and \
+                   len(server.active_children) == 2:
+                    break
+                time.sleep(0.01)
+            children = list(server.active_children)
+            self.assertEqual(len(children), 2)
+            pids = set()
+            for i in range(10):
+                with socket.create_connection(server.server_address) as s:
+                    pids.add(int(receive(s, 100)))
+            self.assertLessEqual(pids, set(children))
+            os.kill(children[0], signal.SIGKILL)
+            for i in range(500):
+                if children[0] not in server.active_children and \
+                   len(server.active_children) == 2:
+                    break
+                time.sleep(0.01)
+            self.assertNotIn(children[0], server.active_children)
+            self.assertEqual(len(server.active_children), 2)
+        finally:
+            server.shutdown()
+            t.join()
+            server.server_close()
+        self.assertEqual(server.active_children, [])
+
+    @requires_forking
+    @reap_threads
+    def test_prefork_http_server(self):
+        class MyServer(socketserver.PreForkingMixIn,
+                       socketserver.ThreadPoolMixIn,
+                       http.server.HTTPServer):
+            num_children = 2
+            max_threads = 2
+
+        class MyHandler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                body = self.path.encode()
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = MyServer((HOST, 0), MyHandler)
+        t = threading.Thread(target=server.serve_forever,
+                             kwargs={'poll_interval': 0.01})
+        t.daemon = True
+        t.start()
+        try:
+            conn = http.client.HTTPConnection(HOST, server.server_port,
+                                              timeout=20)
+            for path in ('/a', '/b', '/c'):
+                conn.request('GET', path)
+                response = conn.getresponse()
+                self.assertEqual(response.status, 200)
+                self.assertEqual(response.read(), path.encode())
+            conn.close()
+        finally:
+            server.shutdown()
+            t.join()
+            server.server_close()
+
     @contextlib.contextmanager
     def mocked_select_module(self):
         """Mocks the select.select() call to raise EINTR for first call"""
@@ -115,6 +115,36 @@ class AbstractTestsWithSourceFile:
         for f in get_files(self):
             self.zip_test(f, self.compression)
 
+    def test_open_write(self):
+        for f in get_files(self):
+            with zipfile.ZipFile(f, "w", self.compression) as zipfp:
+                with zipfp.open("lines", "w") as zipopen:
+                    for line in self.line_gen:
+                        zipopen.write(line)
+                with zipfp.open("forced", "w", force_zip64=True) as zipopen:
+                    zipopen.write(memoryview(self.data))
+                zipfp.writestr("strfile", self.data)
+
+            with zipfile.ZipFile(f, "r") as zipfp:
+                self.assertEqual(zipfp.namelist(),
+                                 ["lines", "forced", "strfile"])
+                for name in zipfp.namelist():
+                    info = zipfp.getinfo(name)
+                    self.assertEqual(info.compress_type, self.compression)
+                    self.assertEqual(info.file_size, len(self.data))
+                    self.assertEqual(zipfp.read(name), self.data)
+                self.assertIsNone(zipfp.testzip())
+
+    def test_mmap(self):
+        self.make_test_archive(TESTFN2, self.compression)
+        with zipfile.ZipFile(TESTFN2, "r", use_mmap=True) as zipfp:
+            self.assertEqual(zipfp.read(TESTFN), self.data)
+            self.assertEqual(zipfp.read("another.name"), self.data)
+            with zipfp.open("strfile") as zipopen:
+                self.assertEqual(zipopen.read(100), self.data[:100])
+                self.assertEqual(zipopen.read(), self.data[100:])
+            self.assertIsNone(zipfp.testzip())
+
     def zip_open_test(self, f, compression):
         self.make_test_archive(f, compression)
 
@@ -787,6 +817,24 @@ class ExtractTests(unittest.TestCase):
         # remove the test file subdirectories
         shutil.rmtree(os.path.join(os.getcwd(), 'ziptest2dir'))
 
+    def test_extract_all_workers(self):
+        with zipfile.ZipFile(TESTFN2, "w", zipfile.ZIP_STORED) as zipfp:
+            zipfp.writestr('emptydir/', '')
+            for fpath, fdata in SMALL_TEST_DATA:
+                zipfp.writestr(fpath, fdata * 100)
+
+        for use_mmap in (False, True):
+            with zipfile.ZipFile(TESTFN2, "r", use_mmap=use_mmap) as zipfp:
+                zipfp.extractall(TESTFNDIR, workers=4)
+            try:
+                self.assertTrue(os.path.isdir(
+                    os.path.join(TESTFNDIR, 'emptydir')))
+                for fpath, fdata in SMALL_TEST_DATA:
+                    self.check_file(os.path.join(TESTFNDIR, fpath),
+                                    fdata.encode() * 100)
+            finally:
+                shutil.rmtree(TESTFNDIR)
+
     def check_file(self, filename, content):
         self.assertTrue(os.path.isfile(filename))
         with open(filename, 'rb') as f:
@@ -1134,6 +1182,74 @@ class OtherTests(unittest.TestCase):
             zipf.read("foo.txt")
             self.assertRaises(RuntimeError, zipf.open, "foo.txt", "q")
 
+    def test_open_write_errors(self):
+        """Check that nothing else is written while a member is open for
+        writing."""
+        with zipfile.ZipFile(TESTFN, mode="w") as zipf:
+            self.assertRaises(ValueError, zipf.open, "foo.txt", "w",
+                              pwd=b"pwd")
+            with zipf.open("foo.txt", "w") as zopen:
+                zopen.write(b"O, for a Muse of Fire!")
+                self.assertRaises(RuntimeError, zipf.writestr, "bar", "")
+                self.assertRaises(RuntimeError, zipf.open, "bar", "w")
+                self.assertRaises(RuntimeError, zipf.close)
+                self.assertRaises(RuntimeError, zipf.read, "bar")
+                self.assertRaises(TypeError, zopen.write, "text")
+            self.assertRaises(ValueError, zopen.write, b"")
+            zipf.writestr("bar", "")
+        self.assertRaises(RuntimeError, zipf.open, "baz", "w")
+
+        with zipfile.ZipFile(TESTFN, mode="r") as zipf:
+            self.assertEqual(zipf.read("foo.txt"), b"O, for a Muse of Fire!")
+            self.assertRaises(RuntimeError, zipf.open, "baz", "w")
+
+    def test_open_write_no_read(self):
+        """Check that the archive can't be read while a member is open for
+        writing, since reading would move the shared file position."""
+        self.addCleanup(shutil.rmtree, TESTFNDIR, True)
+        data = io.BytesIO()
+        with zipfile.ZipFile(data, mode="w") as zipf:
+            zipf.writestr("a.txt", "O, for a Muse of Fire!")
+            with zipf.open("b.txt", "w") as zopen:
+                zopen.write(b"that would ascend")
+                self.assertRaises(RuntimeError, zipf.read, "a.txt")
+                self.assertRaises(RuntimeError, zipf.open, "a.txt")
+                self.assertRaises(RuntimeError, zipf.testzip)
+                self.assertRaises(RuntimeError, zipf.extract, "a.txt",
+                                  TESTFNDIR)
+                zopen.write(b" the brightest heaven of invention")
+        self.assertFalse(os.path.exists(os.path.join(TESTFNDIR, "a.txt")))
+        with zipfile.ZipFile(data, mode="r") as zipf:
+            self.assertIsNone(zipf.testzip())
+            self.assertEqual(zipf.read("a.txt"), b"O, for a Muse of Fire!")
+            self.assertEqual(zipf.read("b.txt"), b"that would ascend"
+                             b" the brightest heaven of invention")
+
+    def test_open_write_force_zip64(self):
+        with zipfile.ZipFile(TESTFN, mode="w") as zipf:
+            with zipf.open("foo.txt", "w", force_zip64=True) as zopen:
+                zopen.write(b"O, for a Muse of Fire!")
+        with open(TESTFN, "rb") as f:
+            header = f.read(zipfile.sizeFileHeader)
+            fheader = struct.unpack(zipfile.structFileHeader, header)
+            extra = f.read(fheader[zipfile._FH_FILENAME_LENGTH] +
+                           fheader[zipfile._FH_EXTRA_FIELD_LENGTH])[7:]
+        # The local header has a ZIP64 extra field with the actual sizes.
+        self.assertEqual(struct.unpack('<HHQQ', extra), (1, 16, 22, 22))
+        with zipfile.ZipFile(TESTFN, mode="r") as zipf:
+            self.assertEqual(zipf.read("foo.txt"), b"O, for a Muse of Fire!")
+
+    def test_bad_use_mmap(self):
+        """Check that use_mmap is only accepted for a file in mode "r"."""
+        self.assertRaises(ValueError, zipfile.ZipFile, TESTFN, "w",
+                          use_mmap=True)
+        with zipfile.ZipFile(TESTFN, mode="w") as zipf:
+            zipf.writestr("foo.txt", "O, for a Muse of Fire!")
+        with open(TESTFN, "rb") as fp:
+            data = io.BytesIO(fp.read())
+        self.assertRaises(io.UnsupportedOperation, zipfile.ZipFile, data,
+                          use_mmap=True)
+
     def test_read0(self):
         """Check that calling read(0) on a ZipExtFile object returns an empty
         string and doesn't advance file pointer."""
@@ -1598,6 +1714,41 @@ class TestsWithMultipleOpens(unittest.TestCase):
             self.assertEqual(data1, b'1'*FIXEDTEST_SIZE)
             self.assertEqual(data2, b'2'*FIXEDTEST_SIZE)
 
+    def test_mmap_threads(self):
+        # Verify that threads can read the members of a memory-mapped
+        # archive at the same time.
+        import threading
+        results = []
+        def read(zipf, name):
+            with zipf.open(name) as zopen:
+                data = b''
+                while True:
+                    chunk = zopen.read(100)
+                    if not chunk:
+                        break
+                    data += chunk
+            results.append((name, data))
+        with zipfile.ZipFile(TESTFN2, mode="r", use_mmap=True) as zipf:
+            threads = [threading.Thread(target=read, args=(zipf, name))
+                       for name in ['ones', 'twos'] * 4]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        self.assertEqual(len(results), 8)
+        for name, data in results:
+            char = b'1' if name == 'ones' else b'2'
+            self.assertEqual(data, char*FIXEDTEST_SIZE)
+
+    def test_mmap_read_after_close(self):
+        # A member opened before the archive is closed can still be read.
+        with zipfile.ZipFile(TESTFN2, mode="r", use_mmap=True) as zipf:
+            zopen = zipf.open('ones')
+            data = zopen.read(500)
+        with zopen:
+            data += zopen.read()
+        self.assertEqual(data, b'1'*FIXEDTEST_SIZE)
+
     def tearDown(self):
         unlink(TESTFN2)
 
@@ -32,6 +32,11 @@ try:
 except ImportError:
     lzma = None
 
+try:
+    import mmap # For ZipFile(..., use_mmap=True)
+except ImportError:
+    mmap = None
+
 __all__ = ["BadZipFile", "BadZipfile", "error",
            "ZIP_STORED", "ZIP_DEFLATED", "ZIP_BZIP2", "ZIP_LZMA",
            "is_zipfile", "ZipInfo", "ZipFile", "PyZipFile", "LargeZipFile"]
@@ -624,6 +629,40 @@ def _get_decompressor(compress_type):
             raise NotImplementedError("compression type %d" % (compress_type,))
 
 
+class _MappedFile:
+    """Read-only file object over a memory-mapped archive.
+
+    Each instance has its own position, so that members can be read
+    concurrently from several threads.  The data is copied out of the map
+    by slicing, which does not export its buffer: the map stays valid as
+    long as a reader references it, even after the ZipFile is closed.
+    """
+
+    def __init__(self, map):
+        self._map = map
+        self._pos = 0
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=0):
+        if whence == 1:
+            offset += self._pos
+        elif whence == 2:
+            offset += len(self._map)
+        self._pos = offset
+        return offset
+
+    def read(self, n=-1):
+        end = len(self._map) if n is None or n < 0 else self._pos + n
+        data = self._map[self._pos:end]
+        self._pos += len(data)
+        return data
+
+    def close(self):
+        self._map = None
+
+
 class ZipExtFile(io.BufferedIOBase):
     """File-like object for reading an archive member.
        Is returned by ZipFile.open().
@@ -877,10 +916,86 @@ class ZipExtFile(io.BufferedIOBase):
             super().close()
 
 
+class _ZipWriteFile(io.BufferedIOBase):
+    """File-like object for writing an archive member.
+       Is returned by ZipFile.open() in mode "w".
+    """
+
+    def __init__(self, zf, zinfo, zip64):
+        self._zipfile = zf
+        self._zinfo = zinfo
+        self._zip64 = zip64
+        self._compressor = _get_compressor(zinfo.compress_type)
+        self._file_size = 0
+        self._compress_size = 0
+        self._crc = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+        if isinstance(data, (bytes, bytearray)):
+            nbytes = len(data)
+        else:
+            data = memoryview(data)
+            nbytes = data.nbytes
+        self._file_size += nbytes
+        self._crc = crc32(data, self._crc) & 0xffffffff
+        if self._compressor:
+            data = self._compressor.compress(data)
+            self._compress_size += len(data)
+        self._zipfile.fp.write(data)
+        return nbytes
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            super().close()
+            zinfo = self._zinfo
+            fp = self._zipfile.fp
+            if self._compressor:
+                buf = self._compressor.flush()
+                self._compress_size += len(buf)
+                fp.write(buf)
+                zinfo.compress_size = self._compress_size
+            else:
+                zinfo.compress_size = self._file_size
+            zinfo.CRC = self._crc
+            zinfo.file_size = self._file_size
+            if not self._zip64 and (zinfo.file_size > ZIP64_LIMIT or
+                                    zinfo.compress_size > ZIP64_LIMIT):
+                if not self._zipfile._allowZip64:
+                    raise LargeZipFile(
+                        "Filesize would require ZIP64 extensions")
+                raise RuntimeError(
+                    'File size unexpectedly exceeded ZIP64 limit, '
+                    'use force_zip64')
+            if zinfo.flag_bits & 0x08:
+                # Write CRC and file sizes after the file data
+                fmt = '<LQQ' if self._zip64 else '<LLL'
+                fp.write(struct.pack(fmt, zinfo.CRC, zinfo.compress_size,
+                                     zinfo.file_size))
+            else:
+                # Seek backwards and write file header (which will now
+                # include correct CRC and file sizes)
+                position = fp.tell()    # Preserve current position in file
+                fp.seek(zinfo.header_offset, 0)
+                fp.write(zinfo.FileHeader(self._zip64))
+                fp.seek(position, 0)
+            self._zipfile.filelist.append(zinfo)
+            self._zipfile.NameToInfo[zinfo.filename] = zinfo
+        finally:
+            self._zipfile._writing = False
+
+
 class ZipFile:
     """ Class with methods to open, read, write, close, list zip files.
 
-    z = ZipFile(file, mode="r", compression=ZIP_STORED, allowZip64=True)
+    z = ZipFile(file, mode="r", compression=ZIP_STORED, allowZip64=True,
+                use_mmap=False)
 
     file: Either the path to the file, or a file-like object.
           If it is a path, the file will be opened and closed by ZipFile.
@@ -890,18 +1005,30 @@ class ZipFile:
     allowZip64: if True ZipFile will create files with ZIP64 extensions when
                 needed, otherwise it will raise an exception when this would
                 be necessary.
+    use_mmap: if True (mode "r" only) the archive is memory-mapped and the
+              members are read from the map, so that several threads can
+              read members at the same time.
 
     """
 
     fp = None                   # Set here since __del__ checks it
+    _mmap = None
+    _writing = False            # Whether a member is open for writing
     _windows_illegal_name_trans_table = None
 
-    def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True):
+    def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True,
+                 use_mmap=False):
         """Open the ZIP file with mode read "r", write "w" or append "a"."""
         if mode not in ("r", "w", "a"):
             raise RuntimeError('ZipFile() requires mode "r", "w", or "a"')
 
         _check_compression(compression)
+        if use_mmap:
+            if mode != "r":
+                raise ValueError('use_mmap requires mode "r"')
+            if mmap is None:
+                raise RuntimeError(
+                    "use_mmap requires the (missing) mmap module")
 
         self._allowZip64 = allowZip64
         self._didModify = False
@@ -935,6 +1062,9 @@ class ZipFile:
         try:
             if key == 'r':
                 self._RealGetContents()
+                if use_mmap:
+                    self._mmap = mmap.mmap(self.fp.fileno(), 0,
+                                           access=mmap.ACCESS_READ)
             elif key == 'w':
                 # set the modified flag so central directory gets written
                 # even if no files are added to the archive
@@ -1117,23 +1247,49 @@ class ZipFile:
         with self.open(name, "r", pwd) as fp:
             return fp.read()
 
-    def open(self, name, mode="r", pwd=None):
-        """Return file-like object for 'name'."""
-        if mode not in ("r", "U", "rU"):
-            raise RuntimeError('open() requires mode "r", "U", or "rU"')
+    def open(self, name, mode="r", pwd=None, *, force_zip64=False):
+        """Return file-like object for 'name'.
+
+        With mode "w", return a writable file object adding the member
+        'name' to the archive; its data is compressed as it is written.
+        force_zip64 must be true if the member may grow beyond 2 GiB.
+        """
+        if mode not in ("r", "w", "U", "rU"):
+            raise RuntimeError('open() requires mode "r", "w", "U", or "rU"')
         if 'U' in mode:
             import warnings
             warnings.warn("'U' mode is deprecated",
                           DeprecationWarning, 2)
         if pwd and not isinstance(pwd, bytes):
             raise TypeError("pwd: expected bytes, got %s" % type(pwd))
+        if mode == "w":
+            if pwd:
+                raise ValueError("pwd is only supported for reading files")
+            if not self.fp:
+                raise RuntimeError(
+                    "Attempt to write to ZIP archive that was already closed")
+            if isinstance(name, ZipInfo):
+                zinfo = name
+            else:
+                zinfo = ZipInfo(filename=name,
+                                date_time=time.localtime(time.time())[:6])
+                zinfo.compress_type = self.compression
+                zinfo.external_attr = 0o600 << 16
+            zinfo.file_size = 0
+            return self._open_to_write(zinfo, force_zip64)
         if not self.fp:
             raise RuntimeError(
                 "Attempt to read ZIP archive that was already closed")
-
-        # Only open a new file for instances where we were not
-        # given a file object in the constructor
-        if self._filePassed:
+        if self._writing:
+            raise RuntimeError("Can't read from the ZIP archive while a "
+                               "member opened for writing is not closed")
+
+        # Read from the map if there is one, else only open a new file for
+        # instances where we were not given a file object in the
+        # constructor
+        if self._mmap is not None:
+            zef_file = _MappedFile(self._mmap)
+        elif self._filePassed:
             zef_file = self.fp
         else:
             zef_file = io.open(self.filename, 'rb')
@@ -1207,9 +1363,9 @@ class ZipFile:
                     raise RuntimeError("Bad password for file", name)
 
             return ZipExtFile(zef_file, mode, zinfo, zd,
-                              close_fileobj=not self._filePassed)
+                              close_fileobj=zef_file is not self.fp)
         except:
-            if not self._filePassed:
+            if zef_file is not self.fp:
                 zef_file.close()
             raise
 
@@ -1227,17 +1383,44 @@ class ZipFile:
 
         return self._extract_member(member, path, pwd)
 
-    def extractall(self, path=None, members=None, pwd=None):
+    def extractall(self, path=None, members=None, pwd=None, workers=1):
         """Extract all members from the archive to the current working
            directory. `path' specifies a different directory to extract to.
            `members' is optional and must be a subset of the list returned
-           by namelist().
+           by namelist(). If `workers' is greater than 1, the files are
+           extracted by that many threads, unless the archive was given as a
+           file object that is not memory-mapped.
         """
         if members is None:
             members = self.namelist()
 
+        if workers <= 1 or (self._filePassed and self._mmap is None):
+            for zipinfo in members:
+                self.extract(zipinfo, path, pwd)
+            return
+
+        if path is None:
+            path = os.getcwd()
+        # Create the directories first so that the threads don't race to
+        # create them.
+        files = []
         for zipinfo in members:
-            self.extract(zipinfo, path, pwd)
+            if not isinstance(zipinfo, ZipInfo):
+                zipinfo = self.getinfo(zipinfo)
+            if zipinfo.filename[-1] == '/':
+                self._extract_member(zipinfo, path, pwd)
+            else:
+                upperdirs = os.path.dirname(self._member_path(zipinfo, path))
+                if upperdirs and not os.path.exists(upperdirs):
+                    os.makedirs(upperdirs)
+                files.append(zipinfo)
+
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(workers) as executor:
+            futures = [executor.submit(self._extract_member, zipinfo, path, pwd)
+                       for zipinfo in files]
+        for future in futures:
+            future.result()
 
     @classmethod
     def _sanitize_windows_name(cls, arcname, pathsep):
@@ -1254,9 +1437,9 @@ class ZipFile:
         arcname = pathsep.join(x for x in arcname if x)
         return arcname
 
-    def _extract_member(self, member, targetpath, pwd):
-        """Extract the ZipInfo object 'member' to a physical
-           file on the path targetpath.
+    def _member_path(self, member, targetpath):
+        """Return the path to which the ZipInfo object 'member' is
+           extracted under targetpath.
         """
         # build the destination pathname, replacing
         # forward slashes to platform specific separators.
@@ -1275,7 +1458,13 @@ class ZipFile:
             arcname = self._sanitize_windows_name(arcname, os.path.sep)
 
         targetpath = os.path.join(targetpath, arcname)
-        targetpath = os.path.normpath(targetpath)
+        return os.path.normpath(targetpath)
+
+    def _extract_member(self, member, targetpath, pwd):
+        """Extract the ZipInfo object 'member' to a physical
+           file on the path targetpath.
+        """
+        targetpath = self._member_path(member, targetpath)
 
         # Create all upper directories if necessary.
         upperdirs = os.path.dirname(targetpath)
@@ -1295,6 +1484,9 @@ class ZipFile:
 
     def _writecheck(self, zinfo):
         """Check for errors before writing a file to the archive."""
+        if self._writing:
+            raise RuntimeError("Can't write to the ZIP archive while a "
+                               "member opened for writing is not closed")
         if zinfo.filename in self.NameToInfo:
             if self.debug:      # Warning for duplicate names
                 print("Duplicate name:", zinfo.filename)
@@ -1340,15 +1532,14 @@ class ZipFile:
 
         zinfo.file_size = st.st_size
         zinfo.flag_bits = 0x00
-        zinfo.header_offset = self.fp.tell()    # Start of header bytes
-        if zinfo.compress_type == ZIP_LZMA:
-            # Compressed data includes an end-of-stream (EOS) marker
-            zinfo.flag_bits |= 0x02
-
-        self._writecheck(zinfo)
-        self._didModify = True
 
         if isdir:
+            zinfo.header_offset = self.fp.tell()    # Start of header bytes
+            if zinfo.compress_type == ZIP_LZMA:
+                # Compressed data includes an end-of-stream (EOS) marker
+                zinfo.flag_bits |= 0x02
+            self._writecheck(zinfo)
+            self._didModify = True
             zinfo.file_size = 0
             zinfo.compress_size = 0
             zinfo.CRC = 0
@@ -1357,48 +1548,31 @@ class ZipFile:
             self.fp.write(zinfo.FileHeader(False))
             return
 
-        cmpr = _get_compressor(zinfo.compress_type)
-        with open(filename, "rb") as fp:
-            # Must overwrite CRC and sizes with correct data later
-            zinfo.CRC = CRC = 0
-            zinfo.compress_size = compress_size = 0
-            # Compressed size can be larger than uncompressed size
-            zip64 = self._allowZip64 and \
-                zinfo.file_size * 1.05 > ZIP64_LIMIT
-            self.fp.write(zinfo.FileHeader(zip64))
-            file_size = 0
-            while 1:
-                buf = fp.read(1024 * 8)
-                if not buf:
-                    break
-                file_size = file_size + len(buf)
-                CRC = crc32(buf, CRC) & 0xffffffff
-                if cmpr:
-                    buf = cmpr.compress(buf)
-                    compress_size = compress_size + len(buf)
-                self.fp.write(buf)
-        if cmpr:
-            buf = cmpr.flush()
-            compress_size = compress_size + len(buf)
-            self.fp.write(buf)
-            zinfo.compress_size = compress_size
-        else:
-            zinfo.compress_size = file_size
-        zinfo.CRC = CRC
-        zinfo.file_size = file_size
-        if not zip64 and self._allowZip64:
-            if file_size > ZIP64_LIMIT:
-                raise RuntimeError('File size has increased during compressing')
-            if compress_size > ZIP64_LIMIT:
-                raise RuntimeError('Compressed size larger than uncompressed size')
-        # Seek backwards and write file header (which will now include
-        # correct CRC and file sizes)
-        position = self.fp.tell()       # Preserve current position in file
-        self.fp.seek(zinfo.header_offset, 0)
+        with open(filename, "rb") as src, \
+             self._open_to_write(zinfo) as dest:
+            shutil.copyfileobj(src, dest, 1024 * 8)
+
+    def _open_to_write(self, zinfo, force_zip64=False):
+        """Write the header of the ZipInfo object 'zinfo' and return a
+           _ZipWriteFile for its data.  zinfo.file_size is the expected size.
+        """
+        # Must overwrite CRC and sizes with correct data later
+        zinfo.CRC = 0
+        zinfo.compress_size = 0
+        zinfo.header_offset = self.fp.tell()    # Start of header bytes
+        if zinfo.compress_type == ZIP_LZMA:
+            # Compressed data includes an end-of-stream (EOS) marker
+            zinfo.flag_bits |= 0x02
+
+        self._writecheck(zinfo)
+        self._didModify = True
+
+        # Compressed size can be larger than uncompressed size
+        zip64 = self._allowZip64 and \
+            (force_zip64 or zinfo.file_size * 1.05 > ZIP64_LIMIT)
         self.fp.write(zinfo.FileHeader(zip64))
-        self.fp.seek(position, 0)
-        self.filelist.append(zinfo)
-        self.NameToInfo[zinfo.filename] = zinfo
+        self._writing = True
+        return _ZipWriteFile(self, zinfo, zip64)
 
     def writestr(self, zinfo_or_arcname, data, compress_type=None):
         """Write a file into the archive.  The contents is 'data', which
@@ -1461,6 +1635,9 @@ class ZipFile:
         records."""
         if self.fp is None:
             return
+        if self._writing:
+            raise RuntimeError("Can't close the ZIP archive while a member "
+                               "opened for writing is not closed")
 
         try:
             if self.mode in ("w", "a") and self._didModify: # write ending records
@@ -1561,6 +1738,8 @@ class ZipFile:
         finally:
             fp = self.fp
             self.fp = None
+            # The readers still using the map keep it alive.
+            self._mmap = None
             if not self._filePassed:
                 fp.close()
 
@@ -1753,6 +1753,1209 @@ static PyTypeObject defdict_type = {
     PyObject_GC_Del,                    /* tp_free */
 };
 
+/* OrderedDict type *********************************************************/
+
+/* OrderedDict is a dict subclass which keeps its keys in a doubly linked
+ * list of nodes, in insertion order.  The inherited dict maps keys to
+ * values, so lookups are as fast as with a regular dict.  od_nodes is a
+ * second dict mapping each key to its node, which gives the node to
+ * unlink or move in constant time.
+ *
+ * The nodes are only referenced by od_nodes: the prev and next pointers
+ * of the list and od_first and od_last are borrowed, and so is the key
+ * of a node, which is owned by od_nodes as well.  Since looking a key up
+ * may call its __eq__() method, which may in turn modify the
+ * OrderedDict, no node pointer is kept across a dict operation.
+ * Iterators hold the next key instead of the next node, and od_state,
+ * which is changed whenever a node is added, removed or moved, lets
+ * them detect that the OrderedDict was modified.
+ */
+
+typedef struct _odictnode {
+    PyObject_HEAD
+    struct _odictnode *prev;
+    struct _odictnode *next;
+    PyObject *key;                      /* borrowed from od_nodes */
+} odictnode;
+
+typedef struct {
+    PyDictObject od_dict;               /* the underlying dict */
+    PyObject *od_nodes;                 /* key -> odictnode */
+    odictnode *od_first;
+    odictnode *od_last;
+    size_t od_state;                    /* incremented by changes in order */
+    PyObject *od_inst_dict;             /* the instance __dict__ */
+    PyObject *od_weakreflist;
+} odictobject;
+
+static PyTypeObject odict_type;
+static PyTypeObject odictnode_type;
+static PyTypeObject odictiter_type;
+static PyTypeObject odictkeys_type;
+static PyTypeObject odictvalues_type;
+static PyTypeObject odictitems_type;
+
+#define odict_Check(op) PyObject_TypeCheck(op, &odict_type)
+#define odict_CheckExact(op) (Py_TYPE(op) == &odict_type)
+
+static void
+odictnode_dealloc(odictnode *node)
+{
+    PyObject_Del(node);
+}
+
+static PyTypeObject odictnode_type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "collections._odict_node",          /* tp_name */
+    sizeof(odictnode),                  /* tp_basicsize */
+    0,                                  /* tp_itemsize */
+    (destructor)odictnode_dealloc,      /* tp_dealloc */
+    0,                                  /* tp_print */
+    0,                                  /* tp_getattr */
+    0,                                  /* tp_setattr */
+    0,                                  /* tp_reserved */
+    0,                                  /* tp_repr */
+    0,                                  /* tp_as_number */
+    0,                                  /* tp_as_sequence */
+    0,                                  /* tp_as_mapping */
+    0,                                  /* tp_hash */
+    0,                                  /* tp_call */
+    0,                                  /* tp_str */
+    0,                                  /* tp_getattro */
+    0,                                  /* tp_setattro */
+    0,                                  /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT,                 /* tp_flags */
+};
+
+static void
+odict_link_last(odictobject *od, odictnode *node)
+{
+    node->prev = od->od_last;
+    node->next = NULL;
+    if (od->od_last == NULL)
+        od->od_first = node;
+    else
+        od->od_last->next = node;
+    od->od_last = node;
+    od->od_state++;
+}
+
+static void
+odict_link_first(odictobject *od, odictnode *node)
+{
+    node->prev = NULL;
+    node->next = od->od_first;
+    if (od->od_first == NULL)
+        od->od_last = node;
+    else
+        od->od_first->prev = node;
+    od->od_first = node;
+    od->od_state++;
+}
+
+static void
+odict_unlink(odictobject *od, odictnode *node)
+{
+    if (node->prev == NULL && od->od_first != node)
+        return;     /* Already unlinked */
+    if (node->prev == NULL)
+        od->od_first = node->next;
+    else
+        node->prev->next = node->next;
+    if (node->next == NULL)
+        od->od_last = node->prev;
+    else
+        node->next->prev = node->prev;
+    node->prev = node->next = NULL;
+    od->od_state++;
+}
+
+/* Forget all the nodes.  The list is emptied before od_nodes, since
+   releasing the keys may run arbitrary code. */
+static void
+odict_clear_nodes(odictobject *od)
+{
+    od->od_first = od->od_last = NULL;
+    od->od_state++;
+    if (od->od_nodes != NULL)
+        PyDict_Clear(od->od_nodes);
+}
+
+/* Append a node for key, unless it already has one.  Return 1 if a
+   node was added, 0 if not and -1 on error. */
+static int
+odict_add_node(odictobject *od, PyObject *key, Py_hash_t hash)
+{
+    odictnode *node;
+    PyObject *found;
+
+    found = _PyDict_GetItem_KnownHash(od->od_nodes, key, hash);
+    if (found != NULL)
+        return 0;
+    if (PyErr_Occurred())
+        return -1;
+
+    node = PyObject_New(odictnode, &odictnode_type);
+    if (node == NULL)
+        return -1;
+    node->prev = node->next = NULL;
+    node->key = key;
+    /* Unlike PyDict_SetItem(), PyDict_SetDefault() never replaces a node
+       which could have been added by the __eq__() method of a key. */
+    found = PyDict_SetDefault(od->od_nodes, key, (PyObject *)node);
+    Py_DECREF(node);
+    if (found == NULL)
+        return -1;
+    if (found != (PyObject *)node)
+        return 0;
+    odict_link_last(od, node);
+    return 1;
+}
+
+/* Remove the node of key.  Raise KeyError if it has none. */
+static int
+odict_remove_node(odictobject *od, PyObject *key, Py_hash_t hash)
+{
+    odictnode *node;
+
+    node = (odictnode *)_PyDict_GetItem_KnownHash(od->od_nodes, key, hash);
+    if (node == NULL) {
+        if (!PyErr_Occurred())
+            _PyErr_SetKeyError(key);
+        return -1;
+    }
+    odict_unlink(od, node);
+    return _PyDict_DelItem_KnownHash(od->od_nodes, key, hash);
+}
+
+static int
+odict_setitem(odictobject *od, PyObject *key, PyObject *value)
+{
+    Py_hash_t hash;
+    int added;
+
+    hash = PyObject_Hash(key);
+    if (hash == -1)
+        return -1;
+    added = odict_add_node(od, key, hash);
+    if (added < 0)
+        return -1;
+    if (_PyDict_SetItem_KnownHash((PyObject *)od, key, value, hash) < 0) {
+        if (added) {
+            PyObject *type, *val, *tb;
+            PyErr_Fetch(&type, &val, &tb);
+            if (odict_remove_node(od, key, hash) < 0)
+                PyErr_Clear();
+            PyErr_Restore(type, val, tb);
+        }
+        return -1;
+    }
+    return 0;
+}
+
+static int
+odict_delitem(odictobject *od, PyObject *key)
+{
+    Py_hash_t hash;
+
+    hash = PyObject_Hash(key);
+    if (hash == -1)
+        return -1;
+    if (_PyDict_DelItem_KnownHash((PyObject *)od, key, hash) < 0)
+        return -1;
+    return odict_remove_node(od, key, hash);
+}
+
+static int
+odict_ass_sub(odictobject *od, PyObject *key, PyObject *value)
+{
+    if (value == NULL)
+        return odict_delitem(od, key);
+    return odict_setitem(od, key, value);
+}
+
+static PyMappingMethods odict_as_mapping = {
+    0,                                  /* mp_length */
+    0,                                  /* mp_subscript */
+    (objobjargproc)odict_ass_sub,       /* mp_ass_subscript */
+};
+
+/* The update() of MutableMapping: self[key] = value for all the items of
+   the positional argument, then for the keyword arguments. */
+static int
+mutablemapping_update(PyObject *self, PyObject *other, PyObject *kwds)
+{
+    _Py_IDENTIFIER(keys);
+    PyObject *it, *key, *value, *item, *fast;
+    Py_ssize_t pos;
+    int res;
+
+    if (other != NULL && PyDict_CheckExact(other)) {
+        pos = 0;
+        while (PyDict_Next(other, &pos, &key, &value)) {
+            Py_INCREF(key);
+            Py_INCREF(value);
+            res = PyObject_SetItem(self, key, value);
+            Py_DECREF(key);
+            Py_DECREF(value);
+            if (res < 0)
+                return -1;
+        }
+    }
+    else if (other != NULL) {
+        if (PyDict_Check(other))
+            it = PyObject_GetIter(other);
+        else if (_PyObject_HasAttrId(other, &PyId_keys)) {
+            PyObject *keys = _PyObject_CallMethodId(other, &PyId_keys, NULL);
+            if (keys == NULL)
+                return -1;
+            it = PyObject_GetIter(keys);
+            Py_DECREF(keys);
+        }
+        else
+            it = NULL;
+
+        if (it != NULL) {
+            while ((key = PyIter_Next(it)) != NULL) {
+                value = PyObject_GetItem(other, key);
+                if (value == NULL) {
+                    Py_DECREF(key);
+                    break;
+                }
+                res = PyObject_SetItem(self, key, value);
+                Py_DECREF(key);
+                Py_DECREF(value);
+                if (res < 0)
+                    break;
+            }
+            Py_DECREF(it);
+            if (PyErr_Occurred())
+                return -1;
+        }
+        else if (PyErr_Occurred())
+            return -1;
+        else {
+            /* An iterable of (key, value) pairs. */
+            it = PyObject_GetIter(other);
+            if (it == NULL)
+                return -1;
+            while ((item = PyIter_Next(it)) != NULL) {
+                fast = PySequence_Fast(item, "cannot convert dictionary "
+                                             "update sequence element "
+                                             "to a sequence");
+                Py_DECREF(item);
+                if (fast == NULL)
+                    break;
+                if (PySequence_Fast_GET_SIZE(fast) != 2) {
+                    PyErr_Format(PyExc_ValueError,
+                                 "dictionary update sequence element has "
+                                 "length %zd; 2 is required",
+                                 PySequence_Fast_GET_SIZE(fast));
+                    Py_DECREF(fast);
+                    break;
+                }
+                res = PyObject_SetItem(self,
+                                       PySequence_Fast_GET_ITEM(fast, 0),
+                                       PySequence_Fast_GET_ITEM(fast, 1));
+                Py_DECREF(fast);
+                if (res < 0)
+                    break;
+            }
+            Py_DECREF(it);
+            if (PyErr_Occurred())
+                return -1;
+        }
+    }
+
+    if (kwds != NULL) {
+        pos = 0;
+        while (PyDict_Next(kwds, &pos, &key, &value)) {
+            Py_INCREF(key);
+            Py_INCREF(value);
+            res = PyObject_SetItem(self, key, value);
+            Py_DECREF(key);
+            Py_DECREF(value);
+            if (res < 0)
+                return -1;
+        }
+    }
+    return 0;
+}
+
+static PyObject *
+odict_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    odictobject *od;
+
+    od = (odictobject *)PyDict_Type.tp_new(type, args, kwds);
+    if (od == NULL)
+        return NULL;
+    od->od_nodes = PyDict_New();
+    if (od->od_nodes == NULL) {
+        Py_DECREF(od);
+        return NULL;
+    }
+    return (PyObject *)od;
+}
+
+static int
+odict_init(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    Py_ssize_t nargs = PyTuple_GET_SIZE(args);
+
+    if (nargs > 1) {
+        PyErr_Format(PyExc_TypeError,
+                     "expected at most 1 arguments, got %zd", nargs);
+        return -1;
+    }
+    return mutablemapping_update(self,
+                                 nargs ? PyTuple_GET_ITEM(args, 0) : NULL,
+                                 kwds);
+}
+
+static void
+odict_dealloc(odictobject *od)
+{
+    PyObject_GC_UnTrack(od);
+    if (od->od_weakreflist != NULL)
+        PyObject_ClearWeakRefs((PyObject *)od);
+    Py_CLEAR(od->od_inst_dict);
+    odict_clear_nodes(od);
+    Py_CLEAR(od->od_nodes);
+    PyDict_Type.tp_dealloc((PyObject *)od);
+}
+
+static int
+odict_traverse(odictobject *od, visitproc visit, void *arg)
+{
+    Py_VISIT(od->od_inst_dict);
+    Py_VISIT(od->od_nodes);
+    return PyDict_Type.tp_traverse((PyObject *)od, visit, arg);
+}
+
+static int
+odict_tp_clear(odictobject *od)
+{
+    Py_CLEAR(od->od_inst_dict);
+    odict_clear_nodes(od);
+    return PyDict_Type.tp_clear((PyObject *)od);
+}
+
+static PyObject *
+odict_iter_new(odictobject *od, int kind);
+
+#define ODICT_ITER_REVERSED 1
+#define ODICT_ITER_KEYS 2
+#define ODICT_ITER_VALUES 4
+#define ODICT_ITER_ITEMS (ODICT_ITER_KEYS | ODICT_ITER_VALUES)
+
+static PyObject *
+odict_iter(odictobject *od)
+{
+    return odict_iter_new(od, ODICT_ITER_KEYS);
+}
+
+PyDoc_STRVAR(odict_reversed_doc,
+"od.__reversed__() <==> reversed(od)");
+
+static PyObject *
+odict_reversed(odictobject *od)
+{
+    return odict_iter_new(od, ODICT_ITER_KEYS | ODICT_ITER_REVERSED);
+}
+
+PyDoc_STRVAR(odict_keys_doc,
+"D.keys() -> a set-like object providing a view on D's keys");
+
+static PyObject *
+odict_keys(odictobject *od)
+{
+    return _PyDictView_New((PyObject *)od, &odictkeys_type);
+}
+
+PyDoc_STRVAR(odict_values_doc,
+"D.values() -> an object providing a view on D's values");
+
+static PyObject *
+odict_values(odictobject *od)
+{
+    return _PyDictView_New((PyObject *)od, &odictvalues_type);
+}
+
+PyDoc_STRVAR(odict_items_doc,
+"D.items() -> a set-like object providing a view on D's items");
+
+static PyObject *
+odict_items(odictobject *od)
+{
+    return _PyDictView_New((PyObject *)od, &odictitems_type);
+}
+
+PyDoc_STRVAR(odict_update_doc,
+"D.update([E, ]**F) -> None.  Update D from mapping/iterable E and F.\n\
+If E present and has a .keys() method, does:     for k in E: D[k] = E[k]\n\
+If E present and lacks .keys() method, does:     for (k, v) in E: D[k] = v\n\
+In either case, this is followed by: for k, v in F.items(): D[k] = v");
+
+static PyObject *
+odict_update(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    Py_ssize_t nargs = PyTuple_GET_SIZE(args);
+
+    if (nargs > 1) {
+        PyErr_Format(PyExc_TypeError,
+                     "update() takes at most 2 positional arguments "
+                     "(%zd given)", nargs + 1);
+        return NULL;
+    }
+    if (mutablemapping_update(self,
+                              nargs ? PyTuple_GET_ITEM(args, 0) : NULL,
+                              kwds) < 0)
+        return NULL;
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(odict_clear_doc,
+"od.clear() -> None.  Remove all items from od.");
+
+static PyObject *
+odict_clear(odictobject *od)
+{
+    odict_clear_nodes(od);
+    PyDict_Clear((PyObject *)od);
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(odict_popitem_doc,
+"od.popitem() -> (k, v), return and remove a (key, value) pair.\n\
+Pairs are returned in LIFO order if last is true or FIFO order if false.");
+
+static PyObject *
+odict_popitem(odictobject *od, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"last", NULL};
+    int last = 1;
+    odictnode *node;
+    PyObject *key, *value, *result;
+    Py_hash_t hash;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|p:popitem", kwlist,
+                                     &last))
+        return NULL;
+
+    node = last ? od->od_last : od->od_first;
+    if (node == NULL) {
+        PyErr_SetString(PyExc_KeyError, "dictionary is empty");
+        return NULL;
+    }
+    key = node->key;
+    Py_INCREF(key);
+    odict_unlink(od, node);
+    hash = PyObject_Hash(key);
+    if (hash == -1 ||
+        _PyDict_DelItem_KnownHash(od->od_nodes, key, hash) < 0) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    value = _PyDict_GetItem_KnownHash((PyObject *)od, key, hash);
+    if (value == NULL) {
+        if (!PyErr_Occurred())
+            _PyErr_SetKeyError(key);
+        Py_DECREF(key);
+        return NULL;
+    }
+    Py_INCREF(value);
+    if (_PyDict_DelItem_KnownHash((PyObject *)od, key, hash) < 0) {
+        Py_DECREF(key);
+        Py_DECREF(value);
+        return NULL;
+    }
+    result = PyTuple_Pack(2, key, value);
+    Py_DECREF(key);
+    Py_DECREF(value);
+    return result;
+}
+
+PyDoc_STRVAR(odict_move_to_end_doc,
+"Move an existing element to the end (or beginning if last==False).\n\
+\n\
+        Raises KeyError if the element does not exist.\n\
+        When last=True, acts like a fast version of self[key]=self.pop(key).\n\
+");
+
+static PyObject *
+odict_move_to_end(odictobject *od, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"key", "last", NULL};
+    PyObject *key;
+    int last = 1;
+    odictnode *node;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|p:move_to_end", kwlist,
+                                     &key, &last))
+        return NULL;
+
+    node = (odictnode *)PyDict_GetItemWithError(od->od_nodes, key);
+    if (node == NULL) {
+        if (!PyErr_Occurred())
+            _PyErr_SetKeyError(key);
+        return NULL;
+    }
+    odict_unlink(od, node);
+    if (last)
+        odict_link_last(od, node);
+    else
+        odict_link_first(od, node);
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(odict_pop_doc,
+"od.pop(k[,d]) -> v, remove specified key and return the corresponding\n\
+        value.  If key is not found, d is returned if given, otherwise KeyError\n\
+        is raised.\n\
+\n\
+        ");
+
+static PyObject *
+odict_pop(PyObject *od, PyObject *args)
+{
+    PyObject *key, *deflt = NULL, *value;
+    int found;
+
+    if (!PyArg_UnpackTuple(args, "pop", 1, 2, &key, &deflt))
+        return NULL;
+
+    found = PySequence_Contains(od, key);
+    if (found < 0)
+        return NULL;
+    if (found) {
+        value = PyObject_GetItem(od, key);
+        if (value != NULL && PyObject_DelItem(od, key) < 0)
+            Py_CLEAR(value);
+        return value;
+    }
+    if (deflt == NULL) {
+        _PyErr_SetKeyError(key);
+        return NULL;
+    }
+    Py_INCREF(deflt);
+    return deflt;
+}
+
+PyDoc_STRVAR(odict_setdefault_doc,
+"od.setdefault(k[,d]) -> od.get(k,d), also set od[k]=d if k not in od");
+
+static PyObject *
+odict_setdefault(PyObject *od, PyObject *args)
+{
+    PyObject *key, *deflt = Py_None;
+    int found;
+
+    if (!PyArg_UnpackTuple(args, "setdefault", 1, 2, &key, &deflt))
+        return NULL;
+
+    found = PySequence_Contains(od, key);
+    if (found < 0)
+        return NULL;
+    if (found)
+        return PyObject_GetItem(od, key);
+    if (PyObject_SetItem(od, key, deflt) < 0)
+        return NULL;
+    Py_INCREF(deflt);
+    return deflt;
+}
+
+PyDoc_STRVAR(odict_copy_doc, "od.copy() -> a shallow copy of od");
+
+static PyObject *
+odict_copy(PyObject *od)
+{
+    return PyObject_CallFunctionObjArgs((PyObject *)Py_TYPE(od), od, NULL);
+}
+
+PyDoc_STRVAR(odict_fromkeys_doc,
+"OD.fromkeys(S[, v]) -> New ordered dictionary with keys from S.\n\
+        If not specified, the value defaults to None.\n\
+\n\
+        ");
+
+static PyObject *
+odict_fromkeys(PyObject *cls, PyObject *args)
+{
+    PyObject *seq, *value = Py_None, *od, *it, *key;
+
+    if (!PyArg_UnpackTuple(args, "fromkeys", 1, 2, &seq, &value))
+        return NULL;
+
+    od = PyObject_CallObject(cls, NULL);
+    if (od == NULL)
+        return NULL;
+    it = PyObject_GetIter(seq);
+    if (it == NULL) {
+        Py_DECREF(od);
+        return NULL;
+    }
+    while ((key = PyIter_Next(it)) != NULL) {
+        int res = PyObject_SetItem(od, key, value);
+        Py_DECREF(key);
+        if (res < 0)
+            break;
+    }
+    Py_DECREF(it);
+    if (PyErr_Occurred()) {
+        Py_DECREF(od);
+        return NULL;
+    }
+    return od;
+}
+
+PyDoc_STRVAR(odict_sizeof_doc,
+"D.__sizeof__() -> size of D in memory, in bytes");
+
+static PyObject *
+odict_sizeof(odictobject *od)
+{
+    Py_ssize_t res;
+
+    res = _PyDict_SizeOf((PyDictObject *)od);
+    res += Py_TYPE(od)->tp_basicsize - sizeof(PyDictObject);
+    res += _PyDict_SizeOf((PyDictObject *)od->od_nodes);
+    res += PyDict_Size(od->od_nodes) * sizeof(odictnode);
+    return PyLong_FromSsize_t(res);
+}
+
+PyDoc_STRVAR(odict_reduce_doc, "Return state information for pickling");
+
+static PyObject *
+odict_reduce(odictobject *od)
+{
+    _Py_IDENTIFIER(items);
+    PyObject *state, *items, *it, *result;
+
+    if (od->od_inst_dict != NULL && PyDict_Size(od->od_inst_dict) > 0) {
+        state = PyDict_Copy(od->od_inst_dict);
+        if (state == NULL)
+            return NULL;
+    }
+    else {
+        state = Py_None;
+        Py_INCREF(state);
+    }
+    items = _PyObject_CallMethodId((PyObject *)od, &PyId_items, NULL);
+    if (items == NULL) {
+        Py_DECREF(state);
+        return NULL;
+    }
+    it = PyObject_GetIter(items);
+    Py_DECREF(items);
+    if (it == NULL) {
+        Py_DECREF(state);
+        return NULL;
+    }
+    result = Py_BuildValue("O()NON", Py_TYPE(od), state, Py_None, it);
+    return result;
+}
+
+static PyObject *
+odict_repr(odictobject *od)
+{
+    _Py_IDENTIFIER(items);
+    _Py_IDENTIFIER(__name__);
+    PyObject *name, *items, *pieces, *result = NULL;
+    int status;
+
+    status = Py_ReprEnter((PyObject *)od);
+    if (status != 0) {
+        if (status < 0)
+            return NULL;
+        return PyUnicode_FromString("...");
+    }
+
+    name = _PyObject_GetAttrId((PyObject *)Py_TYPE(od), &PyId___name__);
+    if (name == NULL)
+        goto done;
+    if (PyDict_Size((PyObject *)od) == 0) {
+        result = PyUnicode_FromFormat("%S()", name);
+        Py_DECREF(name);
+        goto done;
+    }
+    items = _PyObject_CallMethodId((PyObject *)od, &PyId_items, NULL);
+    if (items == NULL) {
+        Py_DECREF(name);
+        goto done;
+    }
+    pieces = PySequence_List(items);
+    Py_DECREF(items);
+    if (pieces != NULL) {
+        result = PyUnicode_FromFormat("%S(%R)", name, pieces);
+        Py_DECREF(pieces);
+    }
+    Py_DECREF(name);
+
+done:
+    Py_ReprLeave((PyObject *)od);
+    return result;
+}
+
+/* Compare the keys of two OrderedDicts of the same size, in order. */
+static int
+odict_keys_equal(PyObject *a, PyObject *b)
+{
+    PyObject *ita, *itb, *ka, *kb;
+    int eq = 1;
+
+    ita = PyObject_GetIter(a);
+    if (ita == NULL)
+        return -1;
+    itb = PyObject_GetIter(b);
+    if (itb == NULL) {
+        Py_DECREF(ita);
+        return -1;
+    }
+    while (eq > 0 && (ka = PyIter_Next(ita)) != NULL) {
+        kb = PyIter_Next(itb);
+        if (kb == NULL) {
+            Py_DECREF(ka);
+            break;
+        }
+        eq = PyObject_RichCompareBool(ka, kb, Py_EQ);
+        Py_DECREF(ka);
+        Py_DECREF(kb);
+    }
+    Py_DECREF(ita);
+    Py_DECREF(itb);
+    if (PyErr_Occurred())
+        return -1;
+    return eq;
+}
+
+/* Comparison to another OrderedDict is order-sensitive while comparison
+   to a regular mapping is order-insensitive. */
+static PyObject *
+odict_richcompare(PyObject *v, PyObject *w, int op)
+{
+    PyObject *res;
+    int eq;
+
+    if (!odict_Check(v) || !PyDict_Check(w) || (op != Py_EQ && op != Py_NE))
+        Py_RETURN_NOTIMPLEMENTED;
+
+    res = PyDict_Type.tp_richcompare(v, w, op);
+    if (res == NULL || !odict_Check(w) ||
+        res != (op == Py_EQ ? Py_True : Py_False))
+        return res;
+    Py_DECREF(res);
+
+    eq = odict_keys_equal(v, w);
+    if (eq < 0)
+        return NULL;
+    res = (eq == (op == Py_EQ)) ? Py_True : Py_False;
+    Py_INCREF(res);
+    return res;
+}
+
+static PyMethodDef odict_methods[] = {
+    {"__reversed__", (PyCFunction)odict_reversed, METH_NOARGS,
+     odict_reversed_doc},
+    {"__sizeof__", (PyCFunction)odict_sizeof, METH_NOARGS,
+     odict_sizeof_doc},
+    {"__reduce__", (PyCFunction)odict_reduce, METH_NOARGS,
+     odict_reduce_doc},
+    {"keys", (PyCFunction)odict_keys, METH_NOARGS,
+     odict_keys_doc},
+    {"values", (PyCFunction)odict_values, METH_NOARGS,
+     odict_values_doc},
+    {"items", (PyCFunction)odict_items, METH_NOARGS,
+     odict_items_doc},
+    {"update", (PyCFunction)odict_update, METH_VARARGS | METH_KEYWORDS,
+     odict_update_doc},
+    {"clear", (PyCFunction)odict_clear, METH_NOARGS,
+     odict_clear_doc},
+    {"popitem", (PyCFunction)odict_popitem, METH_VARARGS | METH_KEYWORDS,
+     odict_popitem_doc},
+    {"move_to_end", (PyCFunction)odict_move_to_end,
+     METH_VARARGS | METH_KEYWORDS, odict_move_to_end_doc},
+    {"pop", (PyCFunction)odict_pop, METH_VARARGS,
+     odict_pop_doc},
+    {"setdefault", (PyCFunction)odict_setdefault, METH_VARARGS,
+     odict_setdefault_doc},
+    {"copy", (PyCFunction)odict_copy, METH_NOARGS,
+     odict_copy_doc},
+    {"fromkeys", (PyCFunction)odict_fromkeys, METH_VARARGS | METH_CLASS,
+     odict_fromkeys_doc},
+    {NULL}
+};
+
+static PyGetSetDef odict_getset[] = {
+    {"__dict__", PyObject_GenericGetDict, PyObject_GenericSetDict},
+    {NULL}
+};
+
+PyDoc_STRVAR(odict_doc,
+"Dictionary that remembers insertion order");
+
+static PyTypeObject odict_type = {
+    PyVarObject_HEAD_INIT(DEFERRED_ADDRESS(&PyType_Type), 0)
+    "collections.OrderedDict",          /* tp_name */
+    sizeof(odictobject),                /* tp_basicsize */
+    0,                                  /* tp_itemsize */
+    /* methods */
+    (destructor)odict_dealloc,          /* tp_dealloc */
+    0,                                  /* tp_print */
+    0,                                  /* tp_getattr */
+    0,                                  /* tp_setattr */
+    0,                                  /* tp_reserved */
+    (reprfunc)odict_repr,               /* tp_repr */
+    0,                                  /* tp_as_number */
+    0,                                  /* tp_as_sequence */
+    &odict_as_mapping,                  /* tp_as_mapping */
+    PyObject_HashNotImplemented,        /* tp_hash */
+    0,                                  /* tp_call */
+    0,                                  /* tp_str */
+    PyObject_GenericGetAttr,            /* tp_getattro */
+    0,                                  /* tp_setattro */
+    0,                                  /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC,
+                                        /* tp_flags */
+    odict_doc,                          /* tp_doc */
+    (traverseproc)odict_traverse,       /* tp_traverse */
+    (inquiry)odict_tp_clear,            /* tp_clear */
+    odict_richcompare,                  /* tp_richcompare */
+    offsetof(odictobject, od_weakreflist), /* tp_weaklistoffset */
+    (getiterfunc)odict_iter,            /* tp_iter */
+    0,                                  /* tp_iternext */
+    odict_methods,                      /* tp_methods */
+    0,                                  /* tp_members */
+    odict_getset,                       /* tp_getset */
+    DEFERRED_ADDRESS(&PyDict_Type),     /* tp_base */
+    0,                                  /* tp_dict */
+    0,                                  /* tp_descr_get */
+    0,                                  /* tp_descr_set */
+    offsetof(odictobject, od_inst_dict), /* tp_dictoffset */
+    odict_init,                         /* tp_init */
+    PyType_GenericAlloc,                /* tp_alloc */
+    odict_new,                          /* tp_new */
+    PyObject_GC_Del,                    /* tp_free */
+};
+
+/*********************** OrderedDict Iterator **************************/
+
+typedef struct {
+    PyObject_HEAD
+    int kind;
+    odictobject *di_odict;
+    PyObject *di_current;               /* the next key to return */
+    size_t di_state;
+    Py_ssize_t di_len;                  /* estimate of the keys left */
+} odictiterobject;
+
+static PyObject *
+odict_iter_new(odictobject *od, int kind)
+{
+    odictiterobject *di;
+    odictnode *node;
+
+    di = PyObject_GC_New(odictiterobject, &odictiter_type);
+    if (di == NULL)
+        return NULL;
+    di->kind = kind;
+    Py_INCREF(od);
+    di->di_odict = od;
+    node = (kind & ODICT_ITER_REVERSED) ? od->od_last : od->od_first;
+    di->di_current = node != NULL ? node->key : NULL;
+    Py_XINCREF(di->di_current);
+    di->di_state = od->od_state;
+    di->di_len = PyDict_Size((PyObject *)od);
+    PyObject_GC_Track(di);
+    return (PyObject *)di;
+}
+
+static void
+odictiter_dealloc(odictiterobject *di)
+{
+    PyObject_GC_UnTrack(di);
+    Py_XDECREF(di->di_odict);
+    Py_XDECREF(di->di_current);
+    PyObject_GC_Del(di);
+}
+
+static int
+odictiter_traverse(odictiterobject *di, visitproc visit, void *arg)
+{
+    Py_VISIT(di->di_odict);
+    Py_VISIT(di->di_current);
+    return 0;
+}
+
+/* Return the next key as a new reference, or NULL when the iterator is
+   exhausted or an error occurred. */
+static PyObject *
+odictiter_nextkey(odictiterobject *di)
+{
+    odictobject *od = di->di_odict;
+    odictnode *node;
+    PyObject *key;
+
+    if (od == NULL)
+        return NULL;
+    if (di->di_current == NULL)
+        goto done;
+    if (od->od_state != di->di_state)
+        goto mutated;
+    node = (odictnode *)PyDict_GetItemWithError(od->od_nodes,
+                                                di->di_current);
+    if (node == NULL) {
+        if (PyErr_Occurred())
+            goto done;
+        goto mutated;
+    }
+    /* The lookup may have run the __eq__() method of another key. */
+    if (od->od_state != di->di_state)
+        goto mutated;
+
+    key = di->di_current;
+    node = (di->kind & ODICT_ITER_REVERSED) ? node->prev : node->next;
+    di->di_current = node != NULL ? node->key : NULL;
+    Py_XINCREF(di->di_current);
+    if (di->di_len > 0)
+        di->di_len--;
+    return key;
+
+mutated:
+    PyErr_SetString(PyExc_RuntimeError,
+                    "OrderedDict mutated during iteration");
+done:
+    Py_CLEAR(di->di_current);
+    Py_CLEAR(di->di_odict);
+    return NULL;
+}
+
+static PyObject *
+odictiter_iternext(odictiterobject *di)
+{
+    PyObject *key, *value, *result;
+
+    key = odictiter_nextkey(di);
+    if (key == NULL || !(di->kind & ODICT_ITER_VALUES))
+        return key;
+
+    if (odict_CheckExact(di->di_odict)) {
+        value = PyDict_GetItemWithError((PyObject *)di->di_odict, key);
+        if (value == NULL && !PyErr_Occurred())
+            _PyErr_SetKeyError(key);
+        Py_XINCREF(value);
+    }
+    else
+        value = PyObject_GetItem((PyObject *)di->di_odict, key);
+    if (value == NULL) {
+        Py_DECREF(key);
+        Py_CLEAR(di->di_current);
+        Py_CLEAR(di->di_odict);
+        return NULL;
+    }
+
+    if (!(di->kind & ODICT_ITER_KEYS)) {
+        Py_DECREF(key);
+        return value;
+    }
+    result = PyTuple_Pack(2, key, value);
+    Py_DECREF(key);
+    Py_DECREF(value);
+    return result;
+}
+
+static PyObject *
+odictiter_len(odictiterobject *di)
+{
+    Py_ssize_t len = 0;
+    if (di->di_odict != NULL && di->di_odict->od_state == di->di_state)
+        len = di->di_len;
+    return PyLong_FromSsize_t(len);
+}
+
+static PyObject *
+odictiter_reduce(odictiterobject *di)
+{
+    odictiterobject tmp;
+    PyObject *list, *item;
+
+    list = PyList_New(0);
+    if (list == NULL)
+        return NULL;
+
+    /* Iterate a copy of the iterator, leaving the iterator itself alone. */
+    tmp = *di;
+    Py_XINCREF(tmp.di_odict);
+    Py_XINCREF(tmp.di_current);
+    while ((item = odictiter_iternext(&tmp)) != NULL) {
+        if (PyList_Append(list, item) < 0) {
+            Py_DECREF(item);
+            break;
+        }
+        Py_DECREF(item);
+    }
+    Py_XDECREF(tmp.di_odict);
+    Py_XDECREF(tmp.di_current);
+    if (PyErr_Occurred()) {
+        Py_DECREF(list);
+        return NULL;
+    }
+    return Py_BuildValue("N(N)", _PyObject_GetBuiltin("iter"), list);
+}
+
+static PyMethodDef odictiter_methods[] = {
+    {"__length_hint__", (PyCFunction)odictiter_len, METH_NOARGS,
+     length_hint_doc},
+    {"__reduce__", (PyCFunction)odictiter_reduce, METH_NOARGS,
+     reduce_doc},
+    {NULL,              NULL}           /* sentinel */
+};
+
+static PyTypeObject odictiter_type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "odict_iterator",                   /* tp_name */
+    sizeof(odictiterobject),            /* tp_basicsize */
+    0,                                  /* tp_itemsize */
+    /* methods */
+    (destructor)odictiter_dealloc,      /* tp_dealloc */
+    0,                                  /* tp_print */
+    0,                                  /* tp_getattr */
+    0,                                  /* tp_setattr */
+    0,                                  /* tp_reserved */
+    0,                                  /* tp_repr */
+    0,                                  /* tp_as_number */
+    0,                                  /* tp_as_sequence */
+    0,                                  /* tp_as_mapping */
+    0,                                  /* tp_hash */
+    0,                                  /* tp_call */
+    0,                                  /* tp_str */
+    PyObject_GenericGetAttr,            /* tp_getattro */
+    0,                                  /* tp_setattro */
+    0,                                  /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,/* tp_flags */
+    0,                                  /* tp_doc */
+    (traverseproc)odictiter_traverse,   /* tp_traverse */
+    0,                                  /* tp_clear */
+    0,                                  /* tp_richcompare */
+    0,                                  /* tp_weaklistoffset */
+    PyObject_SelfIter,                  /* tp_iter */
+    (iternextfunc)odictiter_iternext,   /* tp_iternext */
+    odictiter_methods,                  /* tp_methods */
+    0,
+};
+
+/*********************** OrderedDict Views **************************/
+
+/* The views are subclasses of the dict views which iterate in order. */
+
+static PyObject *
+odictkeys_iter(_PyDictViewObject *dv)
+{
+    return odict_iter_new((odictobject *)dv->dv_dict, ODICT_ITER_KEYS);
+}
+
+static PyObject *
+odictvalues_iter(_PyDictViewObject *dv)
+{
+    return odict_iter_new((odictobject *)dv->dv_dict, ODICT_ITER_VALUES);
+}
+
+static PyObject *
+odictitems_iter(_PyDictViewObject *dv)
+{
+    return odict_iter_new((odictobject *)dv->dv_dict, ODICT_ITER_ITEMS);
+}
+
+static PyTypeObject odictkeys_type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "odict_keys",                       /* tp_name */
+    0,                                  /* tp_basicsize */
+    0,                                  /* tp_itemsize */
+    0,                                  /* tp_dealloc */
+    0,                                  /* tp_print */
+    0,                                  /* tp_getattr */
+    0,                                  /* tp_setattr */
+    0,                                  /* tp_reserved */
+    0,                                  /* tp_repr */
+    0,                                  /* tp_as_number */
+    0,                                  /* tp_as_sequence */
+    0,                                  /* tp_as_mapping */
+    0,                                  /* tp_hash */
+    0,                                  /* tp_call */
+    0,                                  /* tp_str */
+    0,                                  /* tp_getattro */
+    0,                                  /* tp_setattro */
+    0,                                  /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT,                 /* tp_flags */
+    0,                                  /* tp_doc */
+    0,                                  /* tp_traverse */
+    0,                                  /* tp_clear */
+    0,                                  /* tp_richcompare */
+    0,                                  /* tp_weaklistoffset */
+    (getiterfunc)odictkeys_iter,        /* tp_iter */
+    0,                                  /* tp_iternext */
+};
+
+static PyTypeObject odictvalues_type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "odict_values",                     /* tp_name */
+    0,                                  /* tp_basicsize */
+    0,                                  /* tp_itemsize */
+    0,                                  /* tp_dealloc */
+    0,                                  /* tp_print */
+    0,                                  /* tp_getattr */
+    0,                                  /* tp_setattr */
+    0,                                  /* tp_reserved */
+    0,                                  /* tp_repr */
+    0,                                  /* tp_as_number */
+    0,                                  /* tp_as_sequence */
+    0,                                  /* tp_as_mapping */
+    0,                                  /* tp_hash */
+    0,                                  /* tp_call */
+    0,                                  /* tp_str */
+    0,                                  /* tp_getattro */
+    0,                                  /* tp_setattro */
+    0,                                  /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT,                 /* tp_flags */
+    0,                                  /* tp_doc */
+    0,                                  /* tp_traverse */
+    0,                                  /* tp_clear */
+    0,                                  /* tp_richcompare */
+    0,                                  /* tp_weaklistoffset */
+    (getiterfunc)odictvalues_iter,      /* tp_iter */
+    0,                                  /* tp_iternext */
+};
+
+static PyTypeObject odictitems_type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "odict_items",                      /* tp_name */
+    0,                                  /* tp_basicsize */
+    0,                                  /* tp_itemsize */
+    0,                                  /* tp_dealloc */
+    0,                                  /* tp_print */
+    0,                                  /* tp_getattr */
+    0,                                  /* tp_setattr */
+    0,                                  /* tp_reserved */
+    0,                                  /* tp_repr */
+    0,                                  /* tp_as_number */
+    0,                                  /* tp_as_sequence */
+    0,                                  /* tp_as_mapping */
+    0,                                  /* tp_hash */
+    0,                                  /* tp_call */
+    0,                                  /* tp_str */
+    0,                                  /* tp_getattro */
+    0,                                  /* tp_setattro */
+    0,                                  /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT,                 /* tp_flags */
+    0,                                  /* tp_doc */
+    0,                                  /* tp_traverse */
+    0,                                  /* tp_clear */
+    0,                                  /* tp_richcompare */
+    0,                                  /* tp_weaklistoffset */
+    (getiterfunc)odictitems_iter,       /* tp_iter */
+    0,                                  /* tp_iternext */
+};
+
 /* helper function for Counter  *********************************************/
 
 PyDoc_STRVAR(_count_elements_doc,
@@ -1860,6 +3063,7 @@ PyDoc_STRVAR(module_doc,
 "High performance data structures.\n\
 - deque:        ordered collection accessible from endpoints only\n\
 - defaultdict:  dict subclass with a default value factory\n\
+- OrderedDict:  dict subclass that remembers insertion order\n\
 ");
 
 static struct PyMethodDef module_functions[] = {
@@ -1899,6 +3103,26 @@ PyInit__collections(void)
     Py_INCREF(&defdict_type);
     PyModule_AddObject(m, "defaultdict", (PyObject *)&defdict_type);
 
+    odict_type.tp_base = &PyDict_Type;
+    if (PyType_Ready(&odict_type) < 0)
+        return NULL;
+    Py_INCREF(&odict_type);
+    PyModule_AddObject(m, "OrderedDict", (PyObject *)&odict_type);
+
+    if (PyType_Ready(&odictnode_type) < 0)
+        return NULL;
+    if (PyType_Ready(&odictiter_type) < 0)
+        return NULL;
+    odictkeys_type.tp_base = &PyDictKeys_Type;
+    if (PyType_Ready(&odictkeys_type) < 0)
+        return NULL;
+    odictvalues_type.tp_base = &PyDictValues_Type;
+    if (PyType_Ready(&odictvalues_type) < 0)
+        return NULL;
+    odictitems_type.tp_base = &PyDictItems_Type;
+    if (PyType_Ready(&odictitems_type) < 0)
+        return NULL;
+
     if (PyType_Ready(&dequeiter_type) < 0)
         return NULL;
     Py_INCREF(&dequeiter_type);
@@ -540,6 +540,703 @@ For example, reduce(lambda x, y: x+y, [1, 2, 3, 4, 5]) calculates\n\
 of the sequence in the calculation, and serves as a default when the\n\
 sequence is empty.");
 
+/* lru_cache object **********************************************************/
+
+/* The results of a bounded cache are kept in links of a circular doubly
+   linked list ordered from the least to the most recently used.  Both the
+   cache dict, which maps the keys to the links, and the list own a reference
+   to each link: a reentrant call (through the __eq__ or __del__ methods of
+   the keys and results) may remove a link from one of them while the other
+   still uses it.  The prev and next fields of a link which is not in the list
+   are NULL. */
+
+typedef struct lru_list_elem {
+    PyObject_HEAD
+    struct lru_list_elem *prev, *next;
+    Py_hash_t hash;
+    PyObject *key, *result;
+    Py_ssize_t size;
+    double expires;
+} lru_list_elem;
+
+static void
+lru_list_elem_dealloc(lru_list_elem *link)
+{
+    Py_XDECREF(link->key);
+    Py_XDECREF(link->result);
+    PyObject_Del(link);
+}
+
+static PyTypeObject lru_list_elem_type = {
+    PyVarObject_HEAD_INIT(&PyType_Type, 0)
+    "functools._lru_list_elem",         /* tp_name */
+    sizeof(lru_list_elem),              /* tp_basicsize */
+    0,                                  /* tp_itemsize */
+    /* methods */
+    (destructor)lru_list_elem_dealloc,  /* tp_dealloc */
+    0,                                  /* tp_print */
+    0,                                  /* tp_getattr */
+    0,                                  /* tp_setattr */
+    0,                                  /* tp_reserved */
+    0,                                  /* tp_repr */
+    0,                                  /* tp_as_number */
+    0,                                  /* tp_as_sequence */
+    0,                                  /* tp_as_mapping */
+    0,                                  /* tp_hash */
+    0,                                  /* tp_call */
+    0,                                  /* tp_str */
+    0,                                  /* tp_getattro */
+    0,                                  /* tp_setattro */
+    0,                                  /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT,                 /* tp_flags */
+};
+
+
+struct lru_cache_object;
+
+typedef PyObject *(*lru_cache_ternaryfunc)(struct lru_cache_object *,
+                                           PyObject *, PyObject *);
+
+typedef struct lru_cache_object {
+    PyObject_HEAD
+    lru_list_elem root;         /* only the prev and next fields are used */
+    lru_cache_ternaryfunc wrapper;
+    PyObject *func;
+    PyObject *maxsize_O;
+    Py_ssize_t maxsize;
+    Py_ssize_t currsize;        /* total size of the links in the list */
+    Py_ssize_t hits, misses;
+    int typed;
+    double ttl;                 /* negative if the results do not expire */
+    PyObject *sizeof_func;      /* NULL if the size of each result is 1 */
+    PyObject *timer;
+    PyObject *cache;
+    PyObject *cache_info_type;
+    PyObject *dict;
+    PyObject *weakreflist;
+} lru_cache_object;
+
+static PyTypeObject lru_cache_type;
+
+static PyObject *kwd_mark = NULL;
+
+static PyObject *
+lru_cache_make_key(PyObject *args, PyObject *kwds, int typed)
+{
+    PyObject *key, *item, *sorted_items = NULL;
+    Py_ssize_t key_size, nargs, nkwds = 0, pos, key_pos = 0;
+
+    /* The key of a call with positional arguments only is their tuple */
+    if (!typed && (kwds == NULL || PyDict_Size(kwds) == 0)) {
+        Py_INCREF(args);
+        return args;
+    }
+
+    if (kwds != NULL && PyDict_Size(kwds) > 0) {
+        sorted_items = PyDict_Items(kwds);
+        if (sorted_items == NULL)
+            return NULL;
+        if (PyList_Sort(sorted_items) < 0) {
+            Py_DECREF(sorted_items);
+            return NULL;
+        }
+        nkwds = PyList_GET_SIZE(sorted_items);
+    }
+
+    nargs = PyTuple_GET_SIZE(args);
+    key_size = nargs + nkwds;
+    if (typed)
+        key_size *= 2;
+    if (nkwds)
+        key_size++;
+
+    key = PyTuple_New(key_size);
+    if (key == NULL)
+        goto done;
+    for (pos = 0; pos < nargs; ++pos) {
+        item = PyTuple_GET_ITEM(args, pos);
+        Py_INCREF(item);
+        PyTuple_SET_ITEM(key, key_pos++, item);
+    }
+    if (nkwds) {
+        Py_INCREF(kwd_mark);
+        PyTuple_SET_ITEM(key, key_pos++, kwd_mark);
+        for (pos = 0; pos < nkwds; ++pos) {
+            item = PyList_GET_ITEM(sorted_items, pos);
+            Py_INCREF(item);
+            PyTuple_SET_ITEM(key, key_pos++, item);
+        }
+    }
+    if (typed) {
+        for (pos = 0; pos < nargs; ++pos) {
+            item = (PyObject *)Py_TYPE(PyTuple_GET_ITEM(args, pos));
+            Py_INCREF(item);
+            PyTuple_SET_ITEM(key, key_pos++, item);
+        }
+        for (pos = 0; pos < nkwds; ++pos) {
+            item = PyTuple_GET_ITEM(PyList_GET_ITEM(sorted_items, pos), 1);
+            item = (PyObject *)Py_TYPE(item);
+            Py_INCREF(item);
+            PyTuple_SET_ITEM(key, key_pos++, item);
+        }
+    }
+    assert(key_pos == key_size);
+
+done:
+    Py_XDECREF(sorted_items);
+    return key;
+}
+
+/* Append link to the most recently used end of the list, stealing a
+   reference to it. */
+static void
+lru_cache_append_link(lru_cache_object *self, lru_list_elem *link)
+{
+    lru_list_elem *root = &self->root;
+    lru_list_elem *last = root->prev;
+
+    last->next = root->prev = link;
+    link->prev = last;
+    link->next = root;
+    self->currsize += link->size;
+}
+
+/* Remove link from the list, the caller gets the list's reference to it. */
+static void
+lru_cache_extract_link(lru_cache_object *self, lru_list_elem *link)
+{
+    lru_list_elem *link_prev = link->prev;
+    lru_list_elem *link_next = link->next;
+
+    link_prev->next = link_next;
+    link_next->prev = link_prev;
+    link->prev = link->next = NULL;
+    self->currsize -= link->size;
+}
+
+/* Remove the link extracted from the list from the cache dict, unless a
+   reentrant call already replaced or removed it. */
+static int
+lru_cache_forget_link(lru_cache_object *self, lru_list_elem *link)
+{
+    PyObject *value;
+
+    value = _PyDict_GetItem_KnownHash(self->cache, link->key, link->hash);
+    if (value != (PyObject *)link)
+        return PyErr_Occurred() ? -1 : 0;
+    if (_PyDict_DelItem_KnownHash(self->cache, link->key, link->hash) < 0) {
+        if (!PyErr_ExceptionMatches(PyExc_KeyError))
+            return -1;
+        PyErr_Clear();
+    }
+    return 0;
+}
+
+/* Detach all the links from the list and return them as a NULL terminated
+   chain, so that they can be released once the cache is consistent. */
+static lru_list_elem *
+lru_cache_unlink_list(lru_cache_object *self)
+{
+    lru_list_elem *root = &self->root;
+    lru_list_elem *link = root->next, *first;
+
+    if (link == root)
+        return NULL;
+    root->prev->next = NULL;
+    root->next = root->prev = root;
+    self->currsize = 0;
+    for (first = link; link != NULL; link = link->next)
+        link->prev = NULL;
+    return first;
+}
+
+static void
+lru_cache_clear_list(lru_list_elem *link)
+{
+    while (link != NULL) {
+        lru_list_elem *next = link->next;
+        link->next = NULL;
+        Py_DECREF(link);
+        link = next;
+    }
+}
+
+static int
+lru_cache_now(lru_cache_object *self, double *now)
+{
+    PyObject *now_O = PyObject_CallObject(self->timer, NULL);
+
+    if (now_O == NULL)
+        return -1;
+    *now = PyFloat_AsDouble(now_O);
+    Py_DECREF(now_O);
+    if (*now == -1.0 && PyErr_Occurred())
+        return -1;
+    return 0;
+}
+
+static PyObject *
+uncached_lru_cache_wrapper(lru_cache_object *self,
+                           PyObject *args, PyObject *kwds)
+{
+    PyObject *result = PyObject_Call(self->func, args, kwds);
+
+    if (result == NULL)
+        return NULL;
+    self->misses++;
+    return result;
+}
+
+static PyObject *
+infinite_lru_cache_wrapper(lru_cache_object *self,
+                           PyObject *args, PyObject *kwds)
+{
+    PyObject *result;
+    Py_hash_t hash;
+    PyObject *key = lru_cache_make_key(args, kwds, self->typed);
+
+    if (key == NULL)
+        return NULL;
+    hash = PyObject_Hash(key);
+    if (hash == -1) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    result = _PyDict_GetItem_KnownHash(self->cache, key, hash);
+    if (result != NULL) {
+        Py_INCREF(result);
+        self->hits++;
+        Py_DECREF(key);
+        return result;
+    }
+    if (PyErr_Occurred()) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    result = PyObject_Call(self->func, args, kwds);
+    if (result == NULL) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    if (_PyDict_SetItem_KnownHash(self->cache, key, result, hash) < 0) {
+        Py_DECREF(result);
+        Py_DECREF(key);
+        return NULL;
+    }
+    Py_DECREF(key);
+    self->misses++;
+    return result;
+}
+
+static PyObject *
+bounded_lru_cache_wrapper(lru_cache_object *self,
+                          PyObject *args, PyObject *kwds)
+{
+    lru_list_elem *link;
+    PyObject *key, *result, *testresult;
+    Py_hash_t hash;
+    Py_ssize_t size = 1;
+    double now = 0.0;
+
+    key = lru_cache_make_key(args, kwds, self->typed);
+    if (key == NULL)
+        return NULL;
+    hash = PyObject_Hash(key);
+    if (hash == -1 || (self->ttl >= 0.0 && lru_cache_now(self, &now) < 0)) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    link = (lru_list_elem *)_PyDict_GetItem_KnownHash(self->cache, key, hash);
+    if (link != NULL && link->prev != NULL) {
+        lru_cache_extract_link(self, link);
+        if (self->ttl < 0.0 || now < link->expires) {
+            /* Move the link to the most recently used end of the list */
+            lru_cache_append_link(self, link);
+            result = link->result;
+            Py_INCREF(result);
+            self->hits++;
+            Py_DECREF(key);
+            return result;
+        }
+        /* The result expired: drop it and call the function again */
+        if (lru_cache_forget_link(self, link) < 0) {
+            Py_DECREF(link);
+            Py_DECREF(key);
+            return NULL;
+        }
+        Py_DECREF(link);
+    }
+    else if (link == NULL && PyErr_Occurred()) {
+        Py_DECREF(key);
+        return NULL;
+    }
+
+    result = PyObject_Call(self->func, args, kwds);
+    if (result == NULL) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    if (self->sizeof_func != NULL) {
+        PyObject *size_O;
+
+        size_O = PyObject_CallFunctionObjArgs(self->sizeof_func, result, NULL);
+        if (size_O == NULL)
+            goto error;
+        size = PyNumber_AsSsize_t(size_O, PyExc_OverflowError);
+        Py_DECREF(size_O);
+        if (size == -1 && PyErr_Occurred())
+            goto error;
+        if (size < 0) {
+            PyErr_SetString(PyExc_ValueError,
+                            "sizeof() returned a negative size");
+            goto error;
+        }
+    }
+    self->misses++;
+    if (size > self->maxsize) {
+        /* Caching the result would evict everything else */
+        Py_DECREF(key);
+        return result;
+    }
+    if (self->ttl >= 0.0 && lru_cache_now(self, &now) < 0)
+        goto error;
+    testresult = _PyDict_GetItem_KnownHash(self->cache, key, hash);
+    if (testresult != NULL) {
+        /* Getting here means that this same key was added to the cache
+           during the call.  Simply return the computed result. */
+        Py_DECREF(key);
+        return result;
+    }
+    if (PyErr_Occurred())
+        goto error;
+
+    link = PyObject_New(lru_list_elem, &lru_list_elem_type);
+    if (link == NULL)
+        goto error;
+    link->prev = link->next = NULL;
+    link->hash = hash;
+    link->key = key;
+    link->result = result;
+    Py_INCREF(result);
+    link->size = size;
+    link->expires = now + self->ttl;
+    if (_PyDict_SetItem_KnownHash(self->cache, key, (PyObject *)link,
+                                  hash) < 0) {
+        Py_DECREF(link);
+        Py_DECREF(result);
+        return NULL;
+    }
+    lru_cache_append_link(self, link);
+
+    /* Evict the least recently used results until the cache fits */
+    while (self->currsize > self->maxsize) {
+        lru_list_elem *oldest = self->root.next;
+
+        assert(oldest != &self->root);
+        lru_cache_extract_link(self, oldest);
+        if (lru_cache_forget_link(self, oldest) < 0) {
+            Py_DECREF(oldest);
+            Py_DECREF(result);
+            return NULL;
+        }
+        Py_DECREF(oldest);
+    }
+    return result;
+
+error:
+    Py_DECREF(key);
+    Py_DECREF(result);
+    return NULL;
+}
+
+static PyObject *
+lru_cache_new(PyTypeObject *type, PyObject *args, PyObject *kw)
+{
+    PyObject *func, *maxsize_O, *ttl_O, *sizeof_func, *timer, *cache_info_type;
+    int typed;
+    lru_cache_object *obj;
+    Py_ssize_t maxsize = PY_SSIZE_T_MAX;
+    double ttl = -1.0;
+    lru_cache_ternaryfunc wrapper;
+    static char *keywords[] = {"user_function", "maxsize", "typed", "ttl",
+                               "sizeof", "timer", "cache_info_type", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kw, "OOpOOOO:lru_cache", keywords,
+                                     &func, &maxsize_O, &typed, &ttl_O,
+                                     &sizeof_func, &timer, &cache_info_type))
+        return NULL;
+
+    if (!PyCallable_Check(func)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "the first argument must be callable");
+        return NULL;
+    }
+    if (ttl_O != Py_None) {
+        ttl = PyFloat_AsDouble(ttl_O);
+        if (ttl == -1.0 && PyErr_Occurred())
+            return NULL;
+        if (ttl <= 0.0) {
+            PyErr_SetString(PyExc_ValueError, "ttl must be positive");
+            return NULL;
+        }
+    }
+    if (sizeof_func == Py_None)
+        sizeof_func = NULL;
+
+    if (maxsize_O == Py_None && ttl < 0.0 && sizeof_func == NULL) {
+        wrapper = infinite_lru_cache_wrapper;
+    }
+    else {
+        if (maxsize_O != Py_None) {
+            /* Like the Python version, accept any number, e.g. 128.0 */
+            PyObject *size_O;
+
+            if (!PyNumber_Check(maxsize_O)) {
+                PyErr_SetString(PyExc_TypeError,
+                                "maxsize should be a number or None");
+                return NULL;
+            }
+            size_O = PyNumber_Long(maxsize_O);
+            if (size_O == NULL)
+                return NULL;
+            /* Clip huge sizes: they are as good as no limit */
+            maxsize = PyNumber_AsSsize_t(size_O, NULL);
+            Py_DECREF(size_O);
+            if (maxsize == -1 && PyErr_Occurred())
+                return NULL;
+        }
+        if (maxsize <= 0)
+            wrapper = uncached_lru_cache_wrapper;
+        else
+            wrapper = bounded_lru_cache_wrapper;
+    }
+
+    obj = (lru_cache_object *)type->tp_alloc(type, 0);
+    if (obj == NULL)
+        return NULL;
+    obj->cache = PyDict_New();
+    if (obj->cache == NULL) {
+        Py_DECREF(obj);
+        return NULL;
+    }
+    obj->root.prev = obj->root.next = &obj->root;
+    obj->wrapper = wrapper;
+    Py_INCREF(func);
+    obj->func = func;
+    Py_INCREF(maxsize_O);
+    obj->maxsize_O = maxsize_O;
+    obj->maxsize = maxsize;
+    obj->typed = typed;
+    obj->ttl = ttl;
+    Py_XINCREF(sizeof_func);
+    obj->sizeof_func = sizeof_func;
+    Py_INCREF(timer);
+    obj->timer = timer;
+    Py_INCREF(cache_info_type);
+    obj->cache_info_type = cache_info_type;
+    return (PyObject *)obj;
+}
+
+static void
+lru_cache_dealloc(lru_cache_object *obj)
+{
+    lru_list_elem *list = lru_cache_unlink_list(obj);
+
+    PyObject_GC_UnTrack(obj);
+    if (obj->weakreflist != NULL)
+        PyObject_ClearWeakRefs((PyObject *)obj);
+    Py_XDECREF(obj->func);
+    Py_XDECREF(obj->maxsize_O);
+    Py_XDECREF(obj->sizeof_func);
+    Py_XDECREF(obj->timer);
+    Py_XDECREF(obj->cache);
+    Py_XDECREF(obj->cache_info_type);
+    Py_XDECREF(obj->dict);
+    lru_cache_clear_list(list);
+    Py_TYPE(obj)->tp_free(obj);
+}
+
+static PyObject *
+lru_cache_call(lru_cache_object *self, PyObject *args, PyObject *kwds)
+{
+    return self->wrapper(self, args, kwds);
+}
+
+static PyObject *
+lru_cache_descr_get(PyObject *self, PyObject *obj, PyObject *type)
+{
+    if (obj == Py_None || obj == NULL) {
+        Py_INCREF(self);
+        return self;
+    }
+    return PyMethod_New(self, obj);
+}
+
+static PyObject *
+lru_cache_cache_info(lru_cache_object *self, PyObject *unused)
+{
+    Py_ssize_t currsize = self->currsize;
+
+    if (self->wrapper != bounded_lru_cache_wrapper)
+        currsize = PyDict_Size(self->cache);
+    return PyObject_CallFunction(self->cache_info_type, "nnOn",
+                                 self->hits, self->misses, self->maxsize_O,
+                                 currsize);
+}
+
+static PyObject *
+lru_cache_cache_clear(lru_cache_object *self, PyObject *unused)
+{
+    lru_list_elem *list = lru_cache_unlink_list(self);
+
+    self->hits = self->misses = 0;
+    PyDict_Clear(self->cache);
+    lru_cache_clear_list(list);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+lru_cache_reduce(PyObject *self, PyObject *unused)
+{
+    return PyObject_GetAttrString(self, "__qualname__");
+}
+
+static PyObject *
+lru_cache_copy(PyObject *self, PyObject *unused)
+{
+    Py_INCREF(self);
+    return self;
+}
+
+static PyObject *
+lru_cache_deepcopy(PyObject *self, PyObject *unused)
+{
+    Py_INCREF(self);
+    return self;
+}
+
+static int
+lru_cache_tp_traverse(lru_cache_object *self, visitproc visit, void *arg)
+{
+    lru_list_elem *link = self->root.next;
+
+    while (link != &self->root) {
+        lru_list_elem *next = link->next;
+        Py_VISIT(link->key);
+        Py_VISIT(link->result);
+        link = next;
+    }
+    Py_VISIT(self->func);
+    Py_VISIT(self->maxsize_O);
+    Py_VISIT(self->sizeof_func);
+    Py_VISIT(self->timer);
+    Py_VISIT(self->cache);
+    Py_VISIT(self->cache_info_type);
+    Py_VISIT(self->dict);
+    return 0;
+}
+
+static int
+lru_cache_tp_clear(lru_cache_object *self)
+{
+    lru_list_elem *list = lru_cache_unlink_list(self);
+
+    Py_CLEAR(self->func);
+    Py_CLEAR(self->sizeof_func);
+    Py_CLEAR(self->timer);
+    Py_CLEAR(self->cache);
+    Py_CLEAR(self->cache_info_type);
+    Py_CLEAR(self->dict);
+    lru_cache_clear_list(list);
+    return 0;
+}
+
+
+PyDoc_STRVAR(lru_cache_doc,
+"_lru_cache_wrapper(user_function, maxsize, typed, ttl, sizeof, timer,\n\
+                   cache_info_type)\n\
+\n\
+Create a cached callable that wraps another function.\n\
+\n\
+user_function:   the function being cached\n\
+\n\
+maxsize:  0         for no caching\n\
+          None      for unlimited cache size\n\
+          n         for a bounded cache\n\
+\n\
+typed:    False     cache f(3) and f(3.0) as identical calls\n\
+          True      cache f(3) and f(3.0) as distinct calls\n\
+\n\
+ttl:      None      for results which do not expire\n\
+          t         for results expiring t seconds after being computed\n\
+\n\
+sizeof:   None      to bound the number of results\n\
+          f         to bound the total f(result) of the results\n\
+\n\
+timer:    function returning the current time in seconds\n\
+\n\
+cache_info_type:    namedtuple class with the fields:\n\
+                        hits misses maxsize currsize\n"
+);
+
+static PyMethodDef lru_cache_methods[] = {
+    {"cache_info", (PyCFunction)lru_cache_cache_info, METH_NOARGS},
+    {"cache_clear", (PyCFunction)lru_cache_cache_clear, METH_NOARGS},
+    {"__reduce__", (PyCFunction)lru_cache_reduce, METH_NOARGS},
+    {"__copy__", (PyCFunction)lru_cache_copy, METH_VARARGS},
+    {"__deepcopy__", (PyCFunction)lru_cache_deepcopy, METH_VARARGS},
+    {NULL}
+};
+
+static PyGetSetDef lru_cache_getsetlist[] = {
+    {"__dict__", PyObject_GenericGetDict, PyObject_GenericSetDict},
+    {NULL}
+};
+
+static PyTypeObject lru_cache_type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "functools._lru_cache_wrapper",     /* tp_name */
+    sizeof(lru_cache_object),           /* tp_basicsize */
+    0,                                  /* tp_itemsize */
+    /* methods */
+    (destructor)lru_cache_dealloc,      /* tp_dealloc */
+    0,                                  /* tp_print */
+    0,                                  /* tp_getattr */
+    0,                                  /* tp_setattr */
+    0,                                  /* tp_reserved */
+    0,                                  /* tp_repr */
+    0,                                  /* tp_as_number */
+    0,                                  /* tp_as_sequence */
+    0,                                  /* tp_as_mapping */
+    0,                                  /* tp_hash */
+    (ternaryfunc)lru_cache_call,        /* tp_call */
+    0,                                  /* tp_str */
+    0,                                  /* tp_getattro */
+    0,                                  /* tp_setattro */
+    0,                                  /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC,
+                                        /* tp_flags */
+    lru_cache_doc,                      /* tp_doc */
+    (traverseproc)lru_cache_tp_traverse,/* tp_traverse */
+    (inquiry)lru_cache_tp_clear,        /* tp_clear */
+    0,                                  /* tp_richcompare */
+    offsetof(lru_cache_object, weakreflist),
+                                        /* tp_weaklistoffset */
+    0,                                  /* tp_iter */
+    0,                                  /* tp_iternext */
+    lru_cache_methods,                  /* tp_methods */
+    0,                                  /* tp_members */
+    lru_cache_getsetlist,               /* tp_getset */
+    0,                                  /* tp_base */
+    0,                                  /* tp_dict */
+    lru_cache_descr_get,                /* tp_descr_get */
+    0,                                  /* tp_descr_set */
+    offsetof(lru_cache_object, dict),   /* tp_dictoffset */
+    0,                                  /* tp_init */
+    0,                                  /* tp_alloc */
+    lru_cache_new,                      /* tp_new */
+};
+
 /* module level code ********************************************************/
 
 PyDoc_STRVAR(module_doc,
@@ -573,6 +1270,7 @@ PyInit__functools(void)
     char *name;
     PyTypeObject *typelist[] = {
         &partial_type,
+        &lru_cache_type,
         NULL
     };
 
@@ -580,6 +1278,19 @@ PyInit__functools(void)
     if (m == NULL)
         return NULL;
 
+    if (kwd_mark == NULL) {
+        kwd_mark = PyObject_CallObject((PyObject *)&PyBaseObject_Type, NULL);
+        if (kwd_mark == NULL) {
+            Py_DECREF(m);
+            return NULL;
+        }
+    }
+
+    if (PyType_Ready(&lru_list_elem_type) < 0) {
+        Py_DECREF(m);
+        return NULL;
+    }
+
     for (i=0 ; typelist[i] != NULL ; i++) {
         if (PyType_Ready(typelist[i]) < 0) {
             Py_DECREF(m);
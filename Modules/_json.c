@@ -221,23 +221,23 @@ ascii_escape_unicode(PyObject *pystr)
 static void
 raise_errmsg(char *msg, PyObject *s, Py_ssize_t end)
 {
-    /* Use the Python function json.decoder.errmsg to raise a nice
-    looking ValueError exception */
-    static PyObject *errmsg_fn = NULL;
-    PyObject *pymsg;
-    if (errmsg_fn == NULL) {
+    /* Use the Python class json.decoder._DecodeError to raise a nice
+    looking ValueError exception, which knows the position of the error */
+    static PyObject *DecodeError = NULL;
+    PyObject *exc;
+    if (DecodeError == NULL) {
         PyObject *decoder = PyImport_ImportModule("json.decoder");
         if (decoder == NULL)
             return;
-        errmsg_fn = PyObject_GetAttrString(decoder, "errmsg");
+        DecodeError = PyObject_GetAttrString(decoder, "_DecodeError");
         Py_DECREF(decoder);
-        if (errmsg_fn == NULL)
+        if (DecodeError == NULL)
             return;
     }
-    pymsg = PyObject_CallFunction(errmsg_fn, "(zOn)", msg, s, end);
-    if (pymsg) {
-        PyErr_SetObject(PyExc_ValueError, pymsg);
-        Py_DECREF(pymsg);
+    exc = PyObject_CallFunction(DecodeError, "(zOn)", msg, s, end);
+    if (exc) {
+        PyErr_SetObject(DecodeError, exc);
+        Py_DECREF(exc);
     }
 }
 
@@ -25,6 +25,7 @@
 #define PY_SSIZE_T_CLEAN
 
 #include "Python.h"
+#include "structmember.h"
 #ifndef MS_WINDOWS
 #include "posixmodule.h"
 #endif
@@ -3848,6 +3849,902 @@ posix_listdir(PyObject *self, PyObject *args, PyObject *kwargs)
     return return_value;
 }
 
+/* scandir(): an iterator over the entries of a directory which keeps
+   the file type reported by the directory listing (d_type on POSIX,
+   the find data on Windows), so that is_dir() and friends usually
+   need no system call, and fetches stat() results lazily. */
+
+#if defined(HAVE_DIRENT_H) && defined(DT_UNKNOWN)
+#define HAVE_DIRENT_D_TYPE 1
+#endif
+
+#if defined(HAVE_FDOPENDIR) && defined(HAVE_FSTATAT)
+#define SCANDIR_HAVE_FD 1
+#endif
+
+typedef struct {
+    PyObject_HEAD
+    PyObject *name;
+    PyObject *path;
+    PyObject *stat;
+    PyObject *lstat;
+#ifdef MS_WINDOWS
+    struct win32_stat win32_lstat;
+    __int64 win32_file_index;
+    int got_file_index;
+#else /* POSIX */
+#ifdef HAVE_DIRENT_D_TYPE
+    unsigned char d_type;
+#endif
+    ino_t d_ino;
+    int dir_fd;
+#endif
+} DirEntry;
+
+static void
+DirEntry_dealloc(DirEntry *entry)
+{
+    Py_XDECREF(entry->name);
+    Py_XDECREF(entry->path);
+    Py_XDECREF(entry->stat);
+    Py_XDECREF(entry->lstat);
+    Py_TYPE(entry)->tp_free((PyObject *)entry);
+}
+
+/* Call stat() or lstat() on the entry, bypassing the cache. */
+static PyObject *
+DirEntry_fetch_stat(DirEntry *self, int follow_symlinks)
+{
+    int result;
+    STRUCT_STAT st;
+
+#ifdef MS_WINDOWS
+    wchar_t *path;
+
+    path = PyUnicode_AsUnicode(self->path);
+    if (!path)
+        return NULL;
+
+    Py_BEGIN_ALLOW_THREADS
+    if (follow_symlinks)
+        result = win32_stat_w(path, &st);
+    else
+        result = win32_lstat_w(path, &st);
+    Py_END_ALLOW_THREADS
+
+    if (result != 0)
+        return PyErr_SetExcFromWindowsErrWithFilenameObject(PyExc_OSError,
+                                                            0, self->path);
+#else /* POSIX */
+    PyObject *bytes;
+    char *path;
+
+#ifdef SCANDIR_HAVE_FD
+    if (self->dir_fd != DEFAULT_DIR_FD) {
+        if (!PyUnicode_FSConverter(self->name, &bytes))
+            return NULL;
+        path = PyBytes_AS_STRING(bytes);
+        Py_BEGIN_ALLOW_THREADS
+        result = fstatat(self->dir_fd, path, &st,
+                         follow_symlinks ? 0 : AT_SYMLINK_NOFOLLOW);
+        Py_END_ALLOW_THREADS
+    }
+    else
+#endif
+    {
+        if (PyBytes_Check(self->path)) {
+            bytes = self->path;
+            Py_INCREF(bytes);
+        }
+        else if (!PyUnicode_FSConverter(self->path, &bytes))
+            return NULL;
+        path = PyBytes_AS_STRING(bytes);
+        Py_BEGIN_ALLOW_THREADS
+#ifdef HAVE_LSTAT
+        if (!follow_symlinks)
+            result = LSTAT(path, &st);
+        else
+#endif
+            result = STAT(path, &st);
+        Py_END_ALLOW_THREADS
+    }
+    Py_DECREF(bytes);
+
+    if (result != 0)
+        return PyErr_SetFromErrnoWithFilenameObject(PyExc_OSError,
+                                                    self->path);
+#endif
+
+    return _pystat_fromstructstat(&st);
+}
+
+static PyObject *
+DirEntry_get_lstat(DirEntry *self)
+{
+    if (!self->lstat) {
+#ifdef MS_WINDOWS
+        self->lstat = _pystat_fromstructstat(&self->win32_lstat);
+#else /* POSIX */
+        self->lstat = DirEntry_fetch_stat(self, 0);
+#endif
+    }
+    Py_XINCREF(self->lstat);
+    return self->lstat;
+}
+
+static int DirEntry_test_mode(DirEntry *self, int follow_symlinks,
+                              unsigned short mode_bits);
+
+static PyObject *
+DirEntry_get_stat(DirEntry *self)
+{
+    int is_symlink;
+
+    if (!self->stat) {
+        is_symlink = DirEntry_test_mode(self, 0, S_IFLNK);
+        if (is_symlink == -1)
+            return NULL;
+        if (is_symlink)
+            self->stat = DirEntry_fetch_stat(self, 1);
+        else
+            self->stat = DirEntry_get_lstat(self);
+    }
+    Py_XINCREF(self->stat);
+    return self->stat;
+}
+
+/* Return 1 if the entry (or its target if follow_symlinks is true)
+   has the file type mode_bits, 0 if it has not or doesn't exist, and
+   -1 on error. */
+static int
+DirEntry_test_mode(DirEntry *self, int follow_symlinks,
+                   unsigned short mode_bits)
+{
+    PyObject *stat = NULL;
+    PyObject *st_mode = NULL;
+    long mode;
+    int result;
+    int is_symlink;
+    int need_stat;
+    _Py_IDENTIFIER(st_mode);
+
+#ifdef MS_WINDOWS
+    is_symlink = (self->win32_lstat.st_mode & S_IFMT) == S_IFLNK;
+    need_stat = follow_symlinks && is_symlink;
+#elif defined(HAVE_DIRENT_D_TYPE)
+    is_symlink = self->d_type == DT_LNK;
+    need_stat = self->d_type == DT_UNKNOWN ||
+                (follow_symlinks && is_symlink);
+#else
+    is_symlink = 0;
+    need_stat = 1;
+#endif
+
+    if (need_stat) {
+        if (follow_symlinks)
+            stat = DirEntry_get_stat(self);
+        else
+            stat = DirEntry_get_lstat(self);
+        if (!stat) {
+            if (PyErr_ExceptionMatches(PyExc_FileNotFoundError)) {
+                /* A broken symlink, or the entry was removed. */
+                PyErr_Clear();
+                return 0;
+            }
+            return -1;
+        }
+        st_mode = _PyObject_GetAttrId(stat, &PyId_st_mode);
+        Py_DECREF(stat);
+        if (!st_mode)
+            return -1;
+        mode = PyLong_AsLong(st_mode);
+        Py_DECREF(st_mode);
+        if (mode == -1 && PyErr_Occurred())
+            return -1;
+        result = (mode & S_IFMT) == mode_bits;
+    }
+    else if (mode_bits == S_IFLNK)
+        result = is_symlink;
+    else if (is_symlink)
+        result = 0;
+    else {
+#ifdef MS_WINDOWS
+        result = (self->win32_lstat.st_mode & S_IFMT) == mode_bits;
+#else /* POSIX */
+        if (mode_bits == S_IFDIR)
+            result = self->d_type == DT_DIR;
+        else
+            result = self->d_type == DT_REG;
+#endif
+    }
+
+    return result;
+}
+
+static PyObject *
+DirEntry_py_test_mode(DirEntry *self, PyObject *args, PyObject *kwargs,
+                      const char *format, unsigned short mode_bits)
+{
+    int result;
+    int follow_symlinks = 1;
+    static char *keywords[] = {"follow_symlinks", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, format, keywords,
+                                     &follow_symlinks))
+        return NULL;
+
+    result = DirEntry_test_mode(self, follow_symlinks, mode_bits);
+    if (result == -1)
+        return NULL;
+    return PyBool_FromLong(result);
+}
+
+static PyObject *
+DirEntry_is_dir(DirEntry *self, PyObject *args, PyObject *kwargs)
+{
+    return DirEntry_py_test_mode(self, args, kwargs, "|$p:is_dir", S_IFDIR);
+}
+
+static PyObject *
+DirEntry_is_file(DirEntry *self, PyObject *args, PyObject *kwargs)
+{
+    return DirEntry_py_test_mode(self, args, kwargs, "|$p:is_file", S_IFREG);
+}
+
+static PyObject *
+DirEntry_is_symlink(DirEntry *self)
+{
+    int result;
+
+    result = DirEntry_test_mode(self, 0, S_IFLNK);
+    if (result == -1)
+        return NULL;
+    return PyBool_FromLong(result);
+}
+
+static PyObject *
+DirEntry_stat(DirEntry *self, PyObject *args, PyObject *kwargs)
+{
+    int follow_symlinks = 1;
+    static char *keywords[] = {"follow_symlinks", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|$p:stat", keywords,
+                                     &follow_symlinks))
+        return NULL;
+
+    if (follow_symlinks)
+        return DirEntry_get_stat(self);
+    return DirEntry_get_lstat(self);
+}
+
+static PyObject *
+DirEntry_inode(DirEntry *self)
+{
+#ifdef MS_WINDOWS
+    if (!self->got_file_index) {
+        wchar_t *path;
+        struct win32_stat stat;
+
+        path = PyUnicode_AsUnicode(self->path);
+        if (!path)
+            return NULL;
+
+        if (win32_lstat_w(path, &stat) != 0) {
+            return PyErr_SetExcFromWindowsErrWithFilenameObject(PyExc_OSError,
+                                                                0, self->path);
+        }
+
+        self->win32_file_index = stat.st_ino;
+        self->got_file_index = 1;
+    }
+    return PyLong_FromLongLong((PY_LONG_LONG)self->win32_file_index);
+#else /* POSIX */
+#ifdef HAVE_LARGEFILE_SUPPORT
+    return PyLong_FromLongLong((PY_LONG_LONG)self->d_ino);
+#else
+    return PyLong_FromLong((long)self->d_ino);
+#endif
+#endif
+}
+
+static PyObject *
+DirEntry_repr(DirEntry *self)
+{
+    return PyUnicode_FromFormat("<DirEntry %R>", self->name);
+}
+
+static PyMemberDef DirEntry_members[] = {
+    {"name", T_OBJECT_EX, offsetof(DirEntry, name), READONLY,
+     "the entry's base filename, relative to scandir() \"path\" argument"},
+    {"path", T_OBJECT_EX, offsetof(DirEntry, path), READONLY,
+     "the entry's full path name; equivalent to os.path.join(scandir_path, entry.name)"},
+    {NULL}
+};
+
+static PyMethodDef DirEntry_methods[] = {
+    {"is_dir", (PyCFunction)DirEntry_is_dir, METH_VARARGS | METH_KEYWORDS,
+     "is_dir(*, follow_symlinks=True) -> bool\n\n"
+     "Return True if the entry is a directory; cached per entry."
+    },
+    {"is_file", (PyCFunction)DirEntry_is_file, METH_VARARGS | METH_KEYWORDS,
+     "is_file(*, follow_symlinks=True) -> bool\n\n"
+     "Return True if the entry is a file; cached per entry."
+    },
+    {"is_symlink", (PyCFunction)DirEntry_is_symlink, METH_NOARGS,
+     "is_symlink() -> bool\n\n"
+     "Return True if the entry is a symbolic link; cached per entry."
+    },
+    {"stat", (PyCFunction)DirEntry_stat, METH_VARARGS | METH_KEYWORDS,
+     "stat(*, follow_symlinks=True) -> stat_result\n\n"
+     "Return stat_result object for the entry; cached per entry."
+    },
+    {"inode", (PyCFunction)DirEntry_inode, METH_NOARGS,
+     "inode() -> int\n\n"
+     "Return inode of the entry; cached per entry.",
+    },
+    {NULL}
+};
+
+static PyTypeObject DirEntryType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "os.DirEntry",                          /* tp_name */
+    sizeof(DirEntry),                       /* tp_basicsize */
+    0,                                      /* tp_itemsize */
+    /* methods */
+    (destructor)DirEntry_dealloc,           /* tp_dealloc */
+    0,                                      /* tp_print */
+    0,                                      /* tp_getattr */
+    0,                                      /* tp_setattr */
+    0,                                      /* tp_compare */
+    (reprfunc)DirEntry_repr,                /* tp_repr */
+    0,                                      /* tp_as_number */
+    0,                                      /* tp_as_sequence */
+    0,                                      /* tp_as_mapping */
+    0,                                      /* tp_hash */
+    0,                                      /* tp_call */
+    0,                                      /* tp_str */
+    0,                                      /* tp_getattro */
+    0,                                      /* tp_setattro */
+    0,                                      /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT,                     /* tp_flags */
+    0,                                      /* tp_doc */
+    0,                                      /* tp_traverse */
+    0,                                      /* tp_clear */
+    0,                                      /* tp_richcompare */
+    0,                                      /* tp_weaklistoffset */
+    0,                                      /* tp_iter */
+    0,                                      /* tp_iternext */
+    DirEntry_methods,                       /* tp_methods */
+    DirEntry_members,                       /* tp_members */
+};
+
+#ifdef MS_WINDOWS
+
+static wchar_t *
+join_path_filenameW(wchar_t *path_wide, wchar_t* filename)
+{
+    Py_ssize_t path_len;
+    Py_ssize_t size;
+    wchar_t *result;
+    wchar_t ch;
+
+    if (!path_wide) { /* Default arg: "." */
+        path_wide = L".";
+        path_len = 1;
+    }
+    else {
+        path_len = wcslen(path_wide);
+    }
+
+    /* The +1's are for the path separator and the NUL */
+    size = path_len + 1 + wcslen(filename) + 1;
+    result = PyMem_New(wchar_t, size);
+    if (!result) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+    wcscpy(result, path_wide);
+    if (path_len > 0) {
+        ch = result[path_len - 1];
+        if (ch != SEP && ch != ALTSEP && ch != L':')
+            result[path_len++] = SEP;
+        wcscpy(result + path_len, filename);
+    }
+    return result;
+}
+
+static void
+find_data_to_file_info_w(WIN32_FIND_DATAW *pFileData,
+                         BY_HANDLE_FILE_INFORMATION *info,
+                         ULONG *reparse_tag)
+{
+    memset(info, 0, sizeof(*info));
+    info->dwFileAttributes = pFileData->dwFileAttributes;
+    info->ftCreationTime   = pFileData->ftCreationTime;
+    info->ftLastAccessTime = pFileData->ftLastAccessTime;
+    info->ftLastWriteTime  = pFileData->ftLastWriteTime;
+    info->nFileSizeHigh    = pFileData->nFileSizeHigh;
+    info->nFileSizeLow     = pFileData->nFileSizeLow;
+/*  info->nNumberOfLinks   = 1; */
+    if (pFileData->dwFileAttributes & FILE_ATTRIBUTE_REPARSE_POINT)
+        *reparse_tag = pFileData->dwReserved0;
+    else
+        *reparse_tag = 0;
+}
+
+static PyObject *
+DirEntry_from_find_data(path_t *path, WIN32_FIND_DATAW *dataW)
+{
+    DirEntry *entry;
+    BY_HANDLE_FILE_INFORMATION file_info;
+    ULONG reparse_tag;
+    wchar_t *joined_path;
+
+    entry = PyObject_New(DirEntry, &DirEntryType);
+    if (!entry)
+        return NULL;
+    entry->name = NULL;
+    entry->path = NULL;
+    entry->stat = NULL;
+    entry->lstat = NULL;
+    entry->got_file_index = 0;
+
+    entry->name = PyUnicode_FromWideChar(dataW->cFileName, -1);
+    if (!entry->name)
+        goto error;
+
+    joined_path = join_path_filenameW(path->wide, dataW->cFileName);
+    if (!joined_path)
+        goto error;
+
+    entry->path = PyUnicode_FromWideChar(joined_path, -1);
+    PyMem_Free(joined_path);
+    if (!entry->path)
+        goto error;
+
+    find_data_to_file_info_w(dataW, &file_info, &reparse_tag);
+    attribute_data_to_stat(&file_info, reparse_tag, &entry->win32_lstat);
+
+    return (PyObject *)entry;
+
+error:
+    Py_DECREF(entry);
+    return NULL;
+}
+
+#else /* POSIX */
+
+static char *
+join_path_filename(char *path_narrow, char* filename, Py_ssize_t filename_len)
+{
+    Py_ssize_t path_len;
+    Py_ssize_t size;
+    char *result;
+
+    if (!path_narrow) { /* Default arg: "." */
+        path_narrow = ".";
+        path_len = 1;
+    }
+    else {
+        path_len = strlen(path_narrow);
+    }
+
+    if (filename_len == -1)
+        filename_len = strlen(filename);
+
+    /* The +1's are for the path separator and the NUL */
+    size = path_len + 1 + filename_len + 1;
+    result = PyMem_New(char, size);
+    if (!result) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+    strcpy(result, path_narrow);
+    if (path_len > 0 && result[path_len - 1] != '/')
+        result[path_len++] = '/';
+    strcpy(result + path_len, filename);
+    return result;
+}
+
+static PyObject *
+DirEntry_from_posix_info(path_t *path, char *name, Py_ssize_t name_len,
+                         ino_t d_ino
+#ifdef HAVE_DIRENT_D_TYPE
+                         , unsigned char d_type
+#endif
+                         )
+{
+    DirEntry *entry;
+    char *joined_path;
+    int return_str;
+
+    entry = PyObject_New(DirEntry, &DirEntryType);
+    if (!entry)
+        return NULL;
+    entry->name = NULL;
+    entry->path = NULL;
+    entry->stat = NULL;
+    entry->lstat = NULL;
+    entry->dir_fd = DEFAULT_DIR_FD;
+
+    /* only return bytes if they specified a bytes object */
+    return_str = !(path->narrow && PyBytes_Check(path->object));
+
+    if (return_str)
+        entry->name = PyUnicode_DecodeFSDefaultAndSize(name, name_len);
+    else
+        entry->name = PyBytes_FromStringAndSize(name, name_len);
+    if (!entry->name)
+        goto error;
+
+#ifdef SCANDIR_HAVE_FD
+    if (path->fd != -1) {
+        /* Entries are relative to the directory file descriptor. */
+        entry->dir_fd = path->fd;
+        Py_INCREF(entry->name);
+        entry->path = entry->name;
+    }
+    else
+#endif
+    {
+        joined_path = join_path_filename(path->narrow, name, name_len);
+        if (!joined_path)
+            goto error;
+
+        if (return_str)
+            entry->path = PyUnicode_DecodeFSDefault(joined_path);
+        else
+            entry->path = PyBytes_FromString(joined_path);
+        PyMem_Free(joined_path);
+        if (!entry->path)
+            goto error;
+    }
+
+#ifdef HAVE_DIRENT_D_TYPE
+    entry->d_type = d_type;
+#endif
+    entry->d_ino = d_ino;
+
+    return (PyObject *)entry;
+
+error:
+    Py_XDECREF(entry);
+    return NULL;
+}
+
+#endif
+
+
+typedef struct {
+    PyObject_HEAD
+    path_t path;
+#ifdef MS_WINDOWS
+    HANDLE handle;
+    WIN32_FIND_DATAW file_data;
+    int first_time;
+#else /* POSIX */
+    DIR *dirp;
+#ifdef SCANDIR_HAVE_FD
+    int fd;
+#endif
+#endif
+} ScandirIterator;
+
+#ifdef MS_WINDOWS
+
+static void
+ScandirIterator_closedir(ScandirIterator *iterator)
+{
+    HANDLE handle = iterator->handle;
+
+    if (handle == INVALID_HANDLE_VALUE)
+        return;
+
+    iterator->handle = INVALID_HANDLE_VALUE;
+    Py_BEGIN_ALLOW_THREADS
+    FindClose(handle);
+    Py_END_ALLOW_THREADS
+}
+
+static PyObject *
+ScandirIterator_iternext(ScandirIterator *iterator)
+{
+    WIN32_FIND_DATAW *file_data = &iterator->file_data;
+    BOOL success;
+
+    /* Happens if the iterator is iterated twice, or closed explicitly */
+    if (iterator->handle == INVALID_HANDLE_VALUE)
+        return NULL;
+
+    while (1) {
+        if (!iterator->first_time) {
+            Py_BEGIN_ALLOW_THREADS
+            success = FindNextFileW(iterator->handle, file_data);
+            Py_END_ALLOW_THREADS
+            if (!success) {
+                /* Error or no more files */
+                if (GetLastError() != ERROR_NO_MORE_FILES)
+                    path_error(&iterator->path);
+                break;
+            }
+        }
+        iterator->first_time = 0;
+
+        /* Skip over . and .. */
+        if (wcscmp(file_data->cFileName, L".") != 0 &&
+            wcscmp(file_data->cFileName, L"..") != 0)
+            return DirEntry_from_find_data(&iterator->path, file_data);
+
+        /* Loop till we get a non-dot directory or finish iterating */
+    }
+
+    ScandirIterator_closedir(iterator);
+    return NULL;
+}
+
+#else /* POSIX */
+
+static void
+ScandirIterator_closedir(ScandirIterator *iterator)
+{
+    DIR *dirp = iterator->dirp;
+
+    if (!dirp)
+        return;
+
+    iterator->dirp = NULL;
+    Py_BEGIN_ALLOW_THREADS
+#ifdef SCANDIR_HAVE_FD
+    if (iterator->fd != -1)
+        rewinddir(dirp);
+#endif
+    closedir(dirp);
+    Py_END_ALLOW_THREADS
+}
+
+static PyObject *
+ScandirIterator_iternext(ScandirIterator *iterator)
+{
+    struct dirent *direntp;
+    Py_ssize_t name_len;
+    int is_dot;
+
+    /* Happens if the iterator is iterated twice, or closed explicitly */
+    if (!iterator->dirp)
+        return NULL;
+
+    while (1) {
+        errno = 0;
+        Py_BEGIN_ALLOW_THREADS
+        direntp = readdir(iterator->dirp);
+        Py_END_ALLOW_THREADS
+
+        if (!direntp) {
+            /* Error or no more files */
+            if (errno != 0)
+                path_error(&iterator->path);
+            break;
+        }
+
+        /* Skip over . and .. */
+        name_len = NAMLEN(direntp);
+        is_dot = direntp->d_name[0] == '.' &&
+                 (name_len == 1 || (direntp->d_name[1] == '.' && name_len == 2));
+        if (!is_dot) {
+            return DirEntry_from_posix_info(&iterator->path, direntp->d_name,
+                                            name_len, direntp->d_ino
+#ifdef HAVE_DIRENT_D_TYPE
+                                            , direntp->d_type
+#endif
+                                            );
+        }
+
+        /* Loop till we get a non-dot directory or finish iterating */
+    }
+
+    ScandirIterator_closedir(iterator);
+    return NULL;
+}
+
+#endif
+
+static PyObject *
+ScandirIterator_close(ScandirIterator *self, PyObject *args)
+{
+    ScandirIterator_closedir(self);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+ScandirIterator_enter(PyObject *self, PyObject *args)
+{
+    Py_INCREF(self);
+    return self;
+}
+
+static PyObject *
+ScandirIterator_exit(ScandirIterator *self, PyObject *args)
+{
+    ScandirIterator_closedir(self);
+    Py_RETURN_NONE;
+}
+
+static void
+ScandirIterator_dealloc(ScandirIterator *iterator)
+{
+    ScandirIterator_closedir(iterator);
+    Py_XDECREF(iterator->path.object);
+    path_cleanup(&iterator->path);
+    Py_TYPE(iterator)->tp_free((PyObject *)iterator);
+}
+
+static PyMethodDef ScandirIterator_methods[] = {
+    {"__enter__", (PyCFunction)ScandirIterator_enter, METH_NOARGS},
+    {"__exit__", (PyCFunction)ScandirIterator_exit, METH_VARARGS},
+    {"close", (PyCFunction)ScandirIterator_close, METH_NOARGS,
+     "close()\n\n"
+     "Close the directory; the iterator is then exhausted."},
+    {NULL}
+};
+
+static PyTypeObject ScandirIteratorType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "os.ScandirIterator",                   /* tp_name */
+    sizeof(ScandirIterator),                /* tp_basicsize */
+    0,                                      /* tp_itemsize */
+    /* methods */
+    (destructor)ScandirIterator_dealloc,    /* tp_dealloc */
+    0,                                      /* tp_print */
+    0,                                      /* tp_getattr */
+    0,                                      /* tp_setattr */
+    0,                                      /* tp_compare */
+    0,                                      /* tp_repr */
+    0,                                      /* tp_as_number */
+    0,                                      /* tp_as_sequence */
+    0,                                      /* tp_as_mapping */
+    0,                                      /* tp_hash */
+    0,                                      /* tp_call */
+    0,                                      /* tp_str */
+    0,                                      /* tp_getattro */
+    0,                                      /* tp_setattro */
+    0,                                      /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT,                     /* tp_flags */
+    0,                                      /* tp_doc */
+    0,                                      /* tp_traverse */
+    0,                                      /* tp_clear */
+    0,                                      /* tp_richcompare */
+    0,                                      /* tp_weaklistoffset */
+    PyObject_SelfIter,                      /* tp_iter */
+    (iternextfunc)ScandirIterator_iternext, /* tp_iternext */
+    ScandirIterator_methods,                /* tp_methods */
+};
+
+PyDoc_STRVAR(posix_scandir__doc__,
+"scandir(path='.') -> iterator of DirEntry objects for given path\n\n\
+Return an iterator of DirEntry objects for the entries in the\n\
+directory given by path, in arbitrary order.  The special entries\n\
+'.' and '..' are not included.\n\
+\n\
+DirEntry objects have name and path attributes, and is_dir(),\n\
+is_file(), is_symlink(), stat() and inode() methods.  They use the\n\
+file type returned by the operating system while reading the\n\
+directory when possible, and cache the results of system calls.\n\
+\n\
+path can be specified as either str or bytes.  If path is bytes,\n\
+  the names and paths of the entries will also be bytes.\n\
+On some platforms, path may also be specified as an open file descriptor;\n\
+  the file descriptor must refer to a directory, and the path of each\n\
+  entry is then its name, relative to that directory.\n\
+  If this functionality is unavailable, using it raises NotImplementedError.");
+
+static PyObject *
+posix_scandir(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    ScandirIterator *iterator;
+    static char *keywords[] = {"path", NULL};
+#ifdef MS_WINDOWS
+    wchar_t *path_strW;
+#else /* POSIX */
+    char *path_str;
+#endif
+
+    iterator = PyObject_New(ScandirIterator, &ScandirIteratorType);
+    if (!iterator)
+        return NULL;
+    memset(&iterator->path, 0, sizeof(path_t));
+    iterator->path.function_name = "scandir";
+    iterator->path.nullable = 1;
+#ifdef MS_WINDOWS
+    iterator->handle = INVALID_HANDLE_VALUE;
+#else /* POSIX */
+    iterator->dirp = NULL;
+#ifdef SCANDIR_HAVE_FD
+    iterator->path.allow_fd = 1;
+    iterator->path.fd = -1;
+    iterator->fd = -1;
+#endif
+#endif
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|O&:scandir", keywords,
+                                     path_converter, &iterator->path))
+        goto error;
+
+    /* path_converter doesn't keep path.object around, so do it
+       manually for the lifetime of the iterator here (the refcount
+       is decremented in ScandirIterator_dealloc)
+    */
+    Py_XINCREF(iterator->path.object);
+
+#ifdef MS_WINDOWS
+    if (iterator->path.narrow) {
+        PyErr_SetString(PyExc_TypeError,
+                        "os.scandir() doesn't support bytes path on Windows, "
+                        "use Unicode instead");
+        goto error;
+    }
+
+    iterator->first_time = 1;
+
+    path_strW = join_path_filenameW(iterator->path.wide, L"*.*");
+    if (!path_strW)
+        goto error;
+
+    Py_BEGIN_ALLOW_THREADS
+    iterator->handle = FindFirstFileW(path_strW, &iterator->file_data);
+    Py_END_ALLOW_THREADS
+
+    PyMem_Free(path_strW);
+
+    if (iterator->handle == INVALID_HANDLE_VALUE) {
+        path_error(&iterator->path);
+        goto error;
+    }
+#else /* POSIX */
+    errno = 0;
+#ifdef SCANDIR_HAVE_FD
+    if (iterator->path.fd != -1) {
+        /* closedir() closes the FD, so we duplicate it */
+        iterator->fd = _Py_dup(iterator->path.fd);
+        if (iterator->fd == -1)
+            goto error;
+
+        Py_BEGIN_ALLOW_THREADS
+        iterator->dirp = fdopendir(iterator->fd);
+        Py_END_ALLOW_THREADS
+    }
+    else
+#endif
+    {
+        if (iterator->path.narrow)
+            path_str = iterator->path.narrow;
+        else
+            path_str = ".";
+
+        Py_BEGIN_ALLOW_THREADS
+        iterator->dirp = opendir(path_str);
+        Py_END_ALLOW_THREADS
+    }
+
+    if (!iterator->dirp) {
+        path_error(&iterator->path);
+#ifdef SCANDIR_HAVE_FD
+        if (iterator->fd != -1) {
+            Py_BEGIN_ALLOW_THREADS
+            close(iterator->fd);
+            Py_END_ALLOW_THREADS
+        }
+#endif
+        goto error;
+    }
+#endif
+
+    return (PyObject *)iterator;
+
+error:
+    Py_DECREF(iterator);
+    return NULL;
+}
+
 #ifdef MS_WINDOWS
 /* A helper function for abspath on win32 */
 static PyObject *
@@ -11174,6 +12071,9 @@ static PyMethodDef posix_methods[] = {
     {"listdir",         (PyCFunction)posix_listdir,
                         METH_VARARGS | METH_KEYWORDS,
                         posix_listdir__doc__},
+    {"scandir",         (PyCFunction)posix_scandir,
+                        METH_VARARGS | METH_KEYWORDS,
+                        posix_scandir__doc__},
     {"lstat",           (PyCFunction)posix_lstat,
                         METH_VARARGS | METH_KEYWORDS,
                         posix_lstat__doc__},
@@ -12240,6 +13140,11 @@ INITFUNC(void)
         if (PyStructSequence_InitType2(&TerminalSizeType,
                                        &TerminalSize_desc) < 0)
             return NULL;
+
+        if (PyType_Ready(&ScandirIteratorType) < 0)
+            return NULL;
+        if (PyType_Ready(&DirEntryType) < 0)
+            return NULL;
     }
 #if defined(HAVE_WAITID) && !defined(__APPLE__)
     Py_INCREF((PyObject*) &WaitidResultType);
@@ -0,0 +1,88 @@
+"""Benchmark asyncio timer scheduling under timeout churn.
+
+Simulates many connections, each of which keeps a timeout scheduled
+with call_later() and cancels and reschedules it whenever it sees
+activity.  The event loop is run with and without the removal of
+cancelled timers from its heap, and the run time and the size of the
+heap are reported for both.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from asyncio import base_events
+
+
+class Connection:
+
+    def __init__(self, loop, timeout):
+        self.loop = loop
+        self.timeout = timeout
+        self.handle = loop.call_later(timeout, self.timed_out)
+
+    def activity(self):
+        self.handle.cancel()
+        self.handle = self.loop.call_later(self.timeout, self.timed_out)
+
+    def timed_out(self):
+        pass
+
+
+def run(connections, events, timeout, compact):
+    saved = base_events._MIN_SCHEDULED_TIMER_HANDLES
+    if not compact:
+        # Never rebuild the heap: only cancelled handles that reach its
+        # head are removed.
+        base_events._MIN_SCHEDULED_TIMER_HANDLES = float('inf')
+    loop = asyncio.new_event_loop()
+    conns = []
+    try:
+        rnd = random.Random(0)
+        conns = [Connection(loop, timeout) for i in range(connections)]
+        max_heap = 0
+
+        def churn(remaining):
+            nonlocal max_heap
+            for i in range(min(remaining, 1000)):
+                rnd.choice(conns).activity()
+            max_heap = max(max_heap, len(loop._scheduled))
+            remaining -= 1000
+            if remaining > 0:
+                loop.call_soon(churn, remaining)
+            else:
+                loop.stop()
+
+        t0 = time.perf_counter()
+        loop.call_soon(churn, events)
+        loop.run_forever()
+        elapsed = time.perf_counter() - t0
+        return elapsed, max_heap
+    finally:
+        for conn in conns:
+            conn.handle.cancel()
+        loop.close()
+        base_events._MIN_SCHEDULED_TIMER_HANDLES = saved
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-c', '--connections', type=int, default=100000,
+                        help='number of connections (default: %(default)s)')
+    parser.add_argument('-e', '--events', type=int, default=1000000,
+                        help='number of reschedules (default: %(default)s)')
+    parser.add_argument('-t', '--timeout', type=float, default=60.0,
+                        help='connection timeout (default: %(default)s)')
+    args = parser.parse_args()
+
+    for compact in (False, True):
+        elapsed, max_heap = run(args.connections, args.events,
+                                args.timeout, compact)
+        print('%-26s %8.3f s   max heap size %d' % (
+            'with heap compaction:' if compact else 'without heap compaction:',
+            elapsed, max_heap))
+
+
+if __name__ == '__main__':
+    main()